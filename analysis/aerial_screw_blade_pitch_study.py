@@ -58,6 +58,8 @@ TAPER_RATIO = 0.7  # Tip chord / Root chord
 # Performance coefficients
 PROFILE_DRAG_COEFFICIENT = 0.015  # Modern airfoil profile drag
 TIP_LOSS_FACTOR = 0.95  # Prandtl tip loss correction
+BLADE_ELEMENT_WIDTH = 0.01  # meters - Effective element width at the default resolution
+DEFAULT_NUM_ELEMENTS = 25  # Blade elements at the default radial resolution
 GROUND_EFFECT_FACTOR = 1.0  # Hover out of ground effect
 
 # Human and machine constraints
@@ -66,6 +68,75 @@ MULTI_OPERATOR_POWER = 250.0  # watts - 4 operators coordinated
 TARGET_PAYLOAD_MASS = 180.0  # kg - Pilot + structure mass
 
 
+def airfoil_coefficients(alpha):
+    """
+    Lift and drag coefficients for arrays of angle of attack.
+
+    Uses thin airfoil theory with realistic stall characteristics
+    appropriate for Leonardo's blade shapes.
+
+    Args:
+        alpha: Angle of attack in radians (scalar or array)
+
+    Returns:
+        Tuple of (lift_coefficient, drag_coefficient)
+    """
+    alpha = np.asarray(alpha, dtype=float)
+
+    # Stall characteristics for historical airfoil shapes
+    alpha_stall = np.radians(12.0)  # Stall angle for thin airfoils
+    cl_alpha = 2.0 * np.pi * 0.85  # Lift curve slope (reduced from ideal)
+    excess = np.abs(alpha) - alpha_stall
+    attached = excess <= 0.0
+
+    # Pre-stall: linear lift curve with drag polar (profile + induced drag)
+    # Post-stall: flow separation with high drag
+    cl_max = cl_alpha * alpha_stall * np.sign(alpha)
+    cl = np.where(attached, cl_alpha * alpha, cl_max * (1.0 - 0.3 * excess / alpha_stall))
+    cd = np.where(attached, PROFILE_DRAG_COEFFICIENT + 0.05 * alpha**2, 0.02 + 0.5 * excess**2)
+
+    return cl[()], cd[()]
+
+
+def element_forces(rpm, radius, chord, twist, collective_pitch,
+                   induced_velocity, tangential_induced, width=BLADE_ELEMENT_WIDTH):
+    """
+    Thrust and torque of blade elements for broadcastable arrays of conditions.
+
+    Passing ``rpm[:, None]`` against per-element ``radius``, ``chord`` and
+    ``twist`` rows evaluates a whole RPM x radius grid in one call.
+
+    Returns:
+        Tuple of (thrust, torque, angle_of_attack, resultant_velocity, lift, drag)
+    """
+    # Convert RPM to angular velocity
+    omega = 2.0 * np.pi * np.asarray(rpm, dtype=float) / 60.0  # rad/s
+
+    # Local velocity components
+    tangential_velocity = omega * radius + tangential_induced
+    axial_velocity = induced_velocity
+
+    # Resultant velocity and inflow angle (relative to the rotation plane)
+    local_velocity = np.sqrt(tangential_velocity**2 + axial_velocity**2)
+    inflow_angle = np.arctan2(axial_velocity, tangential_velocity)
+
+    # Angle of attack from blade geometric angle (twist + collective pitch)
+    angle_of_attack = twist + collective_pitch - inflow_angle
+    cl, cd = airfoil_coefficients(angle_of_attack)
+
+    # Aerodynamic forces on the element area (chord * radial width)
+    dynamic_pressure = 0.5 * RHO_AIR * local_velocity**2
+    element_area = chord * width
+    lift = dynamic_pressure * element_area * cl
+    drag = dynamic_pressure * element_area * cd
+
+    # Thrust is normal to the rotation plane; torque is the in-plane force times radius
+    thrust = lift * np.cos(inflow_angle) - drag * np.sin(inflow_angle)
+    torque = (lift * np.sin(inflow_angle) + drag * np.cos(inflow_angle)) * radius
+
+    return thrust, torque, angle_of_attack, local_velocity, lift, drag
+
+
 class HelicalBladeElement:
     """
     Individual blade element for BEMT analysis.
@@ -74,10 +145,12 @@ class HelicalBladeElement:
     thrust and torque through aerodynamic forces.
     """
 
-    def __init__(self, radius: float, chord: float, twist: float):
+    def __init__(self, radius: float, chord: float, twist: float,
+                 width: float = BLADE_ELEMENT_WIDTH):
         self.radius = radius  # meters - Radial position
         self.chord = chord    # meters - Local chord length
         self.twist = twist    # radians - Local blade twist angle
+        self.width = width    # meters - Radial element width
 
         # Aerodynamic state variables
         self.angle_of_attack = 0.0  # radians
@@ -101,87 +174,25 @@ class HelicalBladeElement:
         Returns:
             Tuple of (thrust_contribution, torque_contribution)
         """
-        # Convert RPM to angular velocity
-        omega = 2.0 * np.pi * rpm / 60.0  # rad/s
-
-        # Local velocity components
-        tangential_velocity = omega * self.radius + tangential_induced
-        axial_velocity = induced_velocity
-
-        # Resultant velocity at blade element
-        self.local_velocity = np.sqrt(tangential_velocity**2 + axial_velocity**2)
-
-        # Inflow angle (angle between resultant velocity and rotation plane)
-        inflow_angle = np.arctan2(axial_velocity, tangential_velocity)
-
-        # Blade geometric angle (twist + collective pitch)
-        geometric_angle = self.twist + collective_pitch
-
-        # Angle of attack
-        self.angle_of_attack = geometric_angle - inflow_angle
-
-        # Lift and drag coefficients (thin airfoil theory with corrections)
-        cl, cd = self._get_airfoil_coefficients(self.angle_of_attack)
-
-        # Dynamic pressure
-        dynamic_pressure = 0.5 * RHO_AIR * self.local_velocity**2
-
-        # Element area (chord * radial width)
-        dr = 0.01  # meters - radial element width
-        element_area = self.chord * dr
-
-        # Aerodynamic forces
-        lift = dynamic_pressure * element_area * cl
-        drag = dynamic_pressure * element_area * cd
-
-        # Convert to thrust and torque contributions
-        # Thrust is component perpendicular to rotation plane
-        thrust = lift * np.cos(inflow_angle) - drag * np.sin(inflow_angle)
-
-        # Torque is force component in rotation plane times radius
-        torque = (lift * np.sin(inflow_angle) + drag * np.cos(inflow_angle)) * self.radius
+        thrust, torque, alpha, velocity, lift, drag = element_forces(
+            rpm, self.radius, self.chord, self.twist, collective_pitch,
+            induced_velocity, tangential_induced, self.width
+        )
 
         # Store for analysis
-        self.local_lift = lift
-        self.local_drag = drag
+        self.angle_of_attack = float(alpha)
+        self.local_velocity = float(velocity)
+        self.local_lift = float(lift)
+        self.local_drag = float(drag)
         self.induced_velocity = induced_velocity
         self.tangential_induced = tangential_induced
 
-        return thrust, torque
+        return float(thrust), float(torque)
 
     def _get_airfoil_coefficients(self, alpha: float) -> Tuple[float, float]:
-        """
-        Calculate lift and drag coefficients for the blade element.
-
-        Uses thin airfoil theory with realistic stall characteristics
-        appropriate for Leonardo's blade shapes.
-
-        Args:
-            alpha: Angle of attack in radians
-
-        Returns:
-            Tuple of (lift_coefficient, drag_coefficient)
-        """
-        # Stall characteristics for historical airfoil shapes
-        alpha_stall = np.radians(12.0)  # Stall angle for thin airfoils
-        cl_alpha = 2.0 * np.pi * 0.85  # Lift curve slope (reduced from ideal)
-
-        if abs(alpha) <= alpha_stall:
-            # Pre-stall: linear lift curve
-            cl = cl_alpha * alpha
-
-            # Drag polar (profile + induced drag)
-            cd0 = PROFILE_DRAG_COEFFICIENT
-            cd = cd0 + 0.05 * alpha**2
-        else:
-            # Post-stall: flow separation
-            cl_max = cl_alpha * alpha_stall * np.sign(alpha)
-            cl = cl_max * (1.0 - 0.3 * (abs(alpha) - alpha_stall) / alpha_stall)
-
-            # High drag in stall
-            cd = 0.02 + 0.5 * (abs(alpha) - alpha_stall)**2
-
-        return cl, cd
+        """Lift and drag coefficients for the blade element (see ``airfoil_coefficients``)."""
+        cl, cd = airfoil_coefficients(alpha)
+        return float(cl), float(cd)
 
 
 class HelicalRotorAnalysis:
@@ -194,12 +205,14 @@ class HelicalRotorAnalysis:
     3. Iterative solution for convergence between the two theories
     """
 
-    def __init__(self, helix_angle_deg: float):
+    def __init__(self, helix_angle_deg: float, num_elements: int = DEFAULT_NUM_ELEMENTS):
         """
         Initialize rotor analysis with specified helix angle.
 
         Args:
             helix_angle_deg: Helix angle in degrees (15° to 45° range)
+            num_elements: Blade elements along the span; the element width
+                shrinks with the count so refined grids keep the same blade area
         """
         self.helix_angle_deg = helix_angle_deg
         self.helix_angle_rad = np.radians(helix_angle_deg)
@@ -210,28 +223,39 @@ class HelicalRotorAnalysis:
         self.helical_pitch = 2.0 * np.pi * average_radius * np.tan(self.helix_angle_rad)
 
         # Create blade elements along the span
-        self.num_elements = 25
+        self.num_elements = num_elements
+        self.element_width = BLADE_ELEMENT_WIDTH * DEFAULT_NUM_ELEMENTS / num_elements
         self.radial_positions = np.linspace(INNER_RADIUS, ROTOR_RADIUS, self.num_elements)
-        self.blade_elements = []
 
-        for _i, r in enumerate(self.radial_positions):
-            # Linear taper from root to tip
-            r_norm = (r - INNER_RADIUS) / (ROTOR_RADIUS - INNER_RADIUS)
-            chord = BLADE_CHORD * (1.0 - (1.0 - TAPER_RATIO) * r_norm)
+        # Linear taper from root to tip
+        r_norm = (self.radial_positions - INNER_RADIUS) / (ROTOR_RADIUS - INNER_RADIUS)
+        self.chords = BLADE_CHORD * (1.0 - (1.0 - TAPER_RATIO) * r_norm)
 
-            # Twist distribution optimized for helical rotor
-            # At root: more aggressive angle, at tip: reduced angle
-            root_twist = self.helix_angle_rad * 1.15
-            tip_twist = self.helix_angle_rad * 0.85
-            twist = root_twist + (tip_twist - root_twist) * r_norm
+        # Twist distribution optimized for helical rotor
+        # At root: more aggressive angle, at tip: reduced angle
+        root_twist = self.helix_angle_rad * 1.15
+        tip_twist = self.helix_angle_rad * 0.85
+        self.twists = root_twist + (tip_twist - root_twist) * r_norm
 
-            element = HelicalBladeElement(r, chord, twist)
-            self.blade_elements.append(element)
+        self.blade_elements = [
+            HelicalBladeElement(r, chord, twist, self.element_width)
+            for r, chord, twist in zip(self.radial_positions, self.chords, self.twists)
+        ]
 
         # Convergence parameters for iterative solution
         self.tolerance = 1e-6
         self.max_iterations = 100
 
+    def _element_forces(self, rpm: np.ndarray, collective_pitch_rad: float,
+                        induced_velocities: np.ndarray,
+                        tangential_velocities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Element thrust and torque on an (n_rpm, num_elements) grid."""
+        thrust, torque, *_ = element_forces(
+            rpm[:, None], self.radial_positions, self.chords, self.twists,
+            collective_pitch_rad, induced_velocities, tangential_velocities, self.element_width
+        )
+        return thrust, torque
+
     def compute_performance(self, rpm: float, collective_pitch_deg: float = 0.0) -> Dict[str, float]:
         """
         Compute complete rotor performance at specified conditions.
@@ -246,67 +270,67 @@ class HelicalRotorAnalysis:
         Returns:
             Dictionary of performance metrics
         """
-        collective_pitch_rad = np.radians(collective_pitch_deg)
-        omega = 2.0 * np.pi * rpm / 60.0
-
-        # Initialize induced velocities (momentum theory first guess)
-        induced_velocities = np.full(self.num_elements, 0.1)  # m/s initial guess
-        tangential_velocities = np.zeros(self.num_elements)
-
-        # Iterative BEMT solution
-        for _iteration in range(self.max_iterations):
-            # Store old values for convergence check
-            old_induced = induced_velocities.copy()
+        sweep = self.compute_performance_sweep([rpm], collective_pitch_deg)
+        return {key: float(values[0]) for key, values in sweep.items()}
 
-            # Update induced velocities using momentum theory
-            new_induced = np.zeros(self.num_elements)
-            new_tangential = np.zeros(self.num_elements)
+    def compute_performance_sweep(self, rpm_values, collective_pitch_deg: float = 0.0) -> Dict[str, np.ndarray]:
+        """
+        Compute rotor performance for a whole array of rotor speeds at once.
 
-            for i, element in enumerate(self.blade_elements):
-                # Compute forces with current induced velocities
-                thrust, torque = element.compute_local_forces(
-                    rpm, collective_pitch_rad,
-                    induced_velocities[i], tangential_velocities[i]
-                )
+        The BEMT fixed-point iteration runs on an RPM x radius array; each
+        rotor speed stops updating as soon as its own induced velocities
+        converge, so every entry matches a single-RPM solve.
 
-                # Momentum theory update
-                dr = (ROTOR_RADIUS - INNER_RADIUS) / self.num_elements
-                r = element.radius
+        Args:
+            rpm_values: Rotor speeds in revolutions per minute, shape (n_rpm,)
+            collective_pitch_deg: Collective pitch adjustment in degrees
 
-                # Annular area for this element
-                annular_area = 2.0 * np.pi * r * dr
+        Returns:
+            Dictionary of performance metric arrays, each of shape (n_rpm,)
+        """
+        rpm = np.atleast_1d(np.asarray(rpm_values, dtype=float))
+        collective_pitch_rad = np.radians(collective_pitch_deg)
+        omega = 2.0 * np.pi * rpm / 60.0
 
-                # Induced velocity from momentum theory: T = 2ρAv²
-                if thrust > 0:
-                    v_induced_new = np.sqrt(thrust / (2.0 * RHO_AIR * annular_area))
-                    # Relaxation for stability
-                    new_induced[i] = 0.7 * induced_velocities[i] + 0.3 * v_induced_new
+        # Initialize induced velocities (momentum theory first guess)
+        induced_velocities = np.full((len(rpm), self.num_elements), 0.1)  # m/s initial guess
+        tangential_velocities = np.zeros((len(rpm), self.num_elements))
 
-                # Tangential induced velocity from torque balance
-                if torque > 0 and induced_velocities[i] > 0:
-                    v_tangential_new = torque / (2.0 * RHO_AIR * annular_area * r * induced_velocities[i])
-                    new_tangential[i] = 0.7 * tangential_velocities[i] + 0.3 * v_tangential_new
+        # Annular area of each element for the momentum update
+        dr = (ROTOR_RADIUS - INNER_RADIUS) / self.num_elements
+        annular_area = 2.0 * np.pi * self.radial_positions * dr
 
-            # Check convergence
-            error = np.max(np.abs(new_induced - old_induced))
-            if error < self.tolerance:
+        # Iterative BEMT solution on the rotor speeds that have not converged yet
+        active = np.arange(len(rpm))
+        for _iteration in range(self.max_iterations):
+            if active.size == 0:
                 break
-
-            induced_velocities = new_induced
-            tangential_velocities = new_tangential
+            induced = induced_velocities[active]
+            tangential = tangential_velocities[active]
+            thrust, torque = self._element_forces(rpm[active], collective_pitch_rad, induced, tangential)
+
+            # Induced velocity from momentum theory: T = 2ρAv², relaxed for stability
+            v_induced_new = np.sqrt(np.maximum(thrust, 0.0) / (2.0 * RHO_AIR * annular_area))
+            new_induced = np.where(thrust > 0, 0.7 * induced + 0.3 * v_induced_new, 0.0)
+
+            # Tangential induced velocity from torque balance
+            swirling = (torque > 0) & (induced > 0)
+            v_tangential_new = torque / (2.0 * RHO_AIR * annular_area * self.radial_positions
+                                         * np.where(swirling, induced, 1.0))
+            new_tangential = np.where(swirling, 0.7 * tangential + 0.3 * v_tangential_new, 0.0)
+
+            # Check convergence per rotor speed
+            converged = np.max(np.abs(new_induced - induced), axis=1) < self.tolerance
+            updating = active[~converged]
+            induced_velocities[updating] = new_induced[~converged]
+            tangential_velocities[updating] = new_tangential[~converged]
+            active = updating
 
         # Final performance calculation with converged solution
-        total_thrust = 0.0
-        total_torque = 0.0
-
-        for i, element in enumerate(self.blade_elements):
-            thrust, torque = element.compute_local_forces(
-                rpm, collective_pitch_rad,
-                induced_velocities[i], tangential_velocities[i]
-            )
-
-            total_thrust += thrust
-            total_torque += torque
+        thrust, torque = self._element_forces(rpm, collective_pitch_rad,
+                                              induced_velocities, tangential_velocities)
+        total_thrust = thrust.sum(axis=1)
+        total_torque = torque.sum(axis=1)
 
         # Power required
         total_power = total_torque * omega
@@ -319,12 +343,12 @@ class HelicalRotorAnalysis:
         power_coefficient = total_power / (RHO_AIR * disk_area * tip_speed**3)
 
         # Figure of merit (hover efficiency)
-        if total_power > 0 and total_thrust > 0:
-            ideal_induced_velocity = np.sqrt(total_thrust / (2.0 * RHO_AIR * disk_area))
-            ideal_power = total_thrust * ideal_induced_velocity
-            figure_of_merit = min(ideal_power / total_power, 0.85)  # Practical limit
-        else:
-            figure_of_merit = 0.0
+        loaded = (total_power > 0) & (total_thrust > 0)
+        ideal_induced_velocity = np.sqrt(np.maximum(total_thrust, 0.0) / (2.0 * RHO_AIR * disk_area))
+        ideal_power = total_thrust * ideal_induced_velocity
+        figure_of_merit = np.where(
+            loaded, np.minimum(ideal_power / np.where(loaded, total_power, 1.0), 0.85), 0.0
+        )  # Practical limit
 
         # Apply tip loss correction
         figure_of_merit *= TIP_LOSS_FACTOR
@@ -338,8 +362,8 @@ class HelicalRotorAnalysis:
             'figure_of_merit': figure_of_merit,
             'tip_speed_ms': tip_speed,
             'tip_mach': tip_speed / SPEED_OF_SOUND,
-            'helical_pitch_m': self.helical_pitch,
-            'helix_angle_deg': self.helix_angle_deg
+            'helical_pitch_m': np.full_like(rpm, self.helical_pitch),
+            'helix_angle_deg': np.full_like(rpm, self.helix_angle_deg)
         }
 
     def compute_blade_loading(self, rpm: float, collective_pitch_deg: float = 0.0) -> Dict[str, np.ndarray]:
@@ -415,13 +439,22 @@ class BladePitchStudy:
     identifying optimal configurations, and creating detailed visualizations.
     """
 
-    def __init__(self):
-        """Initialize the blade pitch parametric study."""
+    def __init__(self, num_rpm: int = 50, num_elements: int = DEFAULT_NUM_ELEMENTS,
+                 helix_step_deg: float = 2.0):
+        """
+        Initialize the blade pitch parametric study.
+
+        Args:
+            num_rpm: Rotor speeds sampled between 50 and 300 RPM
+            num_elements: Blade elements along the span of each rotor
+            helix_step_deg: Helix angle increment in degrees
+        """
         # Helix angle range (15° to 45° in 2° increments as requested)
-        self.helix_angles = np.arange(15, 46, 2)  # degrees
+        self.helix_angles = np.arange(15, 45 + 0.5 * helix_step_deg, helix_step_deg)  # degrees
 
         # RPM range for analysis (50 to 300 RPM - realistic for human-powered systems)
-        self.rpm_range = np.linspace(50, 300, 50)
+        self.rpm_range = np.linspace(50, 300, num_rpm)
+        self.num_elements = num_elements
 
         # Results storage
         self.performance_data = {}
@@ -440,8 +473,9 @@ class BladePitchStudy:
         print("Leonardo's Aerial Screw - Blade Pitch Investigation")
         print("=" * 60)
         print("Executing comprehensive parametric study...")
-        print(f"Helix angles: {self.helix_angles[0]}° to {self.helix_angles[-1]}°")
-        print(f"RPM range: {self.rpm_range[0]:.0f} to {self.rpm_range[-1]:.0f}")
+        print(f"Helix angles: {self.helix_angles[0]:g}° to {self.helix_angles[-1]:g}°")
+        print(f"RPM range: {self.rpm_range[0]:.0f} to {self.rpm_range[-1]:.0f} ({len(self.rpm_range)} points)")
+        print(f"Blade elements: {self.num_elements}")
         print()
 
         # Initialize result arrays
@@ -452,24 +486,22 @@ class BladePitchStudy:
 
         # Performance for each helix angle and RPM
         for i, helix_angle in enumerate(self.helix_angles):
-            print(f"Analyzing helix angle: {helix_angle:2.0f}° ", end="")
+            print(f"Analyzing helix angle: {helix_angle:4g}° ", end="")
 
-            # Create rotor analysis for this helix angle
-            rotor = HelicalRotorAnalysis(helix_angle)
+            # Create rotor analysis for this helix angle and sweep every RPM at once
+            rotor = HelicalRotorAnalysis(helix_angle, self.num_elements)
+            sweep = rotor.compute_performance_sweep(self.rpm_range, collective_pitch_deg=0.0)
 
-            for j, rpm in enumerate(self.rpm_range):
-                # Compute performance at this condition
-                performance = rotor.compute_performance(rpm, collective_pitch_deg=0.0)
+            # Store results
+            thrust_surface[i] = sweep['thrust_N']
+            power_surface[i] = sweep['power_W']
+            efficiency_surface[i] = sweep['figure_of_merit']
+            torque_surface[i] = sweep['torque_Nm']
 
-                # Store results
-                thrust_surface[i, j] = performance['thrust_N']
-                power_surface[i, j] = performance['power_W']
-                efficiency_surface[i, j] = performance['figure_of_merit']
-                torque_surface[i, j] = performance['torque_Nm']
-
-                # Store individual performance for later analysis
+            # Store individual performance for later analysis
+            for j, rpm in enumerate(self.rpm_range):
                 key = f"{helix_angle:2.0f}deg_{rpm:3.0f}rpm"
-                self.performance_data[key] = performance
+                self.performance_data[key] = {name: float(values[j]) for name, values in sweep.items()}
 
             print("✓")
 
@@ -539,7 +571,7 @@ class BladePitchStudy:
         score_surface[optimal_idx]
 
         # Get performance at optimal point
-        rotor = HelicalRotorAnalysis(optimal_angle)
+        rotor = HelicalRotorAnalysis(optimal_angle, self.num_elements)
         optimal_performance = rotor.compute_performance(optimal_rpm)
 
         print("Optimal Configuration:")
@@ -691,7 +723,7 @@ class BladePitchStudy:
         optimal = self.identify_optimal_configuration()
 
         # Create rotor for detailed analysis
-        rotor = HelicalRotorAnalysis(optimal['optimal_angle_deg'])
+        rotor = HelicalRotorAnalysis(optimal['optimal_angle_deg'], self.num_elements)
 
         # Blade loading at optimal conditions
         loading_data = rotor.compute_blade_loading(optimal['optimal_rpm'])
@@ -809,12 +841,15 @@ class BladePitchStudy:
         ])
 
 
-def main():
+def main(num_rpm: int = 50, num_elements: int = DEFAULT_NUM_ELEMENTS, helix_step_deg: float = 2.0):
     """
     Execute Leonardo's blade pitch investigation.
 
     This is the main function that orchestrates the complete analysis
     as requested by Leonardo da Vinci for his aerial screw design.
+    Each helix angle is solved as one RPM x radius batch, so dense grids
+    (e.g. ``main(num_rpm=500, num_elements=200, helix_step_deg=0.5)``)
+    remain practical.
     """
     print("╔════════════════════════════════════════════════════════════════╗")
     print("║     LEONARDO DA VINCI'S AERIAL SCREW - BLADE PITCH STUDY      ║")
@@ -823,7 +858,7 @@ def main():
     print()
 
     # Initialize the comprehensive study
-    study = BladePitchStudy()
+    study = BladePitchStudy(num_rpm=num_rpm, num_elements=num_elements, helix_step_deg=helix_step_deg)
 
     # Execute parametric analysis
     surface_data = study.run_parametric_study()
@@ -1,12 +1,30 @@
-"""Helpers for storing deterministic, reproducible artifacts."""
+"""Helpers for storing deterministic, reproducible artifacts.
+
+When ``ARTIFACTS_ROOT`` is redirected away from ``./artifacts`` every file is
+mirrored back under ``./artifacts``.  :class:`ArtifactStore` serialises and
+writes each payload exactly once, then materialises the mirror as a hardlink,
+reflink or symlink, copying only as a last resort.
+"""
 
 from __future__ import annotations
 
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
 
 ARTIFACTS_ROOT = Path("artifacts")
 
+_DEFAULT_ALIAS_ROOT = Path("artifacts").resolve()
+_FICLONE = 0x40049409  # Linux ioctl: share extents with another file (reflink)
+
 
 def ensure_artifact_dir(slug: str, *, subdir: Optional[str] = None) -> Path:
     """Return (and create) an artifact directory for the given invention slug."""
@@ -15,3 +33,157 @@ def ensure_artifact_dir(slug: str, *, subdir: Optional[str] = None) -> Path:
         target /= subdir
     target.mkdir(parents=True, exist_ok=True)
     return target
+
+
+def alias_path(path: Path, *, root: Optional[Path] = None) -> Optional[Path]:
+    """Return the mirror of ``path`` under ``./artifacts``, if one is needed."""
+    resolved_root = (root if root is not None else ARTIFACTS_ROOT).resolve()
+    if resolved_root == _DEFAULT_ALIAS_ROOT:
+        return None
+    try:
+        relative = path.resolve().relative_to(resolved_root)
+    except ValueError:
+        return None
+    return Path("artifacts") / relative
+
+
+def _reflink(source: Path, target: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink unsupported on this platform")
+    import fcntl  # local import: POSIX only
+
+    with source.open("rb") as src, target.open("wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            target.unlink()
+            raise
+
+
+def _symlink(source: Path, target: Path) -> None:
+    os.symlink(source.resolve(), target)
+
+
+def _copy(source: Path, target: Path) -> None:
+    shutil.copyfile(source, target)
+
+
+_ALIAS_STRATEGIES: Dict[str, Callable[[Path, Path], None]] = {
+    "hardlink": os.link,
+    "reflink": _reflink,
+    "symlink": _symlink,
+    "copy": _copy,
+}
+
+
+@dataclass
+class ArtifactStore:
+    """Write-once artifact writer with linked mirrors and byte accounting."""
+
+    files_written: int = 0
+    bytes_written: int = 0
+    aliases: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(_ALIAS_STRATEGIES, 0))
+
+    @contextmanager
+    def open_write(self, path: Path, *, alias_root: Optional[Path] = None) -> Iterator[IO[bytes]]:
+        """Atomically write ``path`` through a binary handle held open by the caller.
+
+        The file only appears (and is counted) once the ``with`` block exits
+        cleanly, so tables appended row by row are never left half written.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with tmp_path.open("wb") as stream:
+                yield stream
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        size = path.stat().st_size
+        self.files_written += 1
+        self.bytes_written += size
+
+        alias = alias_path(path, root=alias_root)
+        if alias is not None:
+            self._materialise_alias(path, alias)
+
+    def write_with(
+        self,
+        path: Path,
+        writer: Callable[[IO[bytes]], None],
+        *,
+        alias_root: Optional[Path] = None,
+    ) -> int:
+        """Atomically write ``path`` by calling ``writer`` on a binary handle.
+
+        Returns the number of bytes written (mirrors cost no extra writes
+        unless the copy fallback is needed).
+        """
+        with self.open_write(path, alias_root=alias_root) as stream:
+            writer(stream)
+        return Path(path).stat().st_size
+
+    def write_bytes(self, path: Path, data: bytes, *, alias_root: Optional[Path] = None) -> int:
+        def write(stream: IO[bytes]) -> None:
+            stream.write(data)
+
+        return self.write_with(path, write, alias_root=alias_root)
+
+    def write_text(self, path: Path, text: str, *, alias_root: Optional[Path] = None) -> int:
+        return self.write_bytes(path, text.encode("utf-8"), alias_root=alias_root)
+
+    def write_json(
+        self,
+        path: Path,
+        payload: Any,
+        *,
+        alias_root: Optional[Path] = None,
+        **dump_kwargs: Any,
+    ) -> int:
+        """Encode ``payload`` once (``indent=2, sort_keys=True`` by default)."""
+        dump_kwargs.setdefault("indent", 2)
+        dump_kwargs.setdefault("sort_keys", True)
+        return self.write_text(path, json.dumps(payload, **dump_kwargs), alias_root=alias_root)
+
+    def _materialise_alias(self, path: Path, alias: Path) -> None:
+        if alias.resolve() == path.resolve():
+            return
+        alias.parent.mkdir(parents=True, exist_ok=True)
+        for name, strategy in _ALIAS_STRATEGIES.items():
+            try:
+                alias.unlink(missing_ok=True)
+                strategy(path, alias)
+            except OSError:
+                continue
+            self.aliases[name] += 1
+            if name == "copy":
+                self.bytes_written += path.stat().st_size
+            return
+        raise OSError(f"Unable to mirror {path} to {alias}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "files_written": self.files_written,
+            "bytes_written": self.bytes_written,
+            "aliases": dict(self.aliases),
+        }
+
+    def reset(self) -> None:
+        self.files_written = 0
+        self.bytes_written = 0
+        self.aliases = dict.fromkeys(_ALIAS_STRATEGIES, 0)
+
+
+ARTIFACT_STORE = ArtifactStore()
+
+
+def write_csv_artifact(path: Path, fieldnames: Sequence[str], rows: Iterable[Dict[str, Any]]) -> int:
+    """Write a CSV table through the shared :data:`ARTIFACT_STORE`."""
+    buffer = io.StringIO(newline="")
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
+    return ARTIFACT_STORE.write_text(path, buffer.getvalue())
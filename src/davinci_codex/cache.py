@@ -1,31 +1,48 @@
-"""Artifact caching utilities for deterministic simulation outputs."""
+"""Artifact caching utilities for deterministic simulation outputs.
+
+Cache keys are content addressed: besides the caller's payload they can fold
+in a fingerprint of the invention module source, the first-party modules and
+packaged data it depends on, the YAML inputs it reads and the package version
+(see :func:`invention_fingerprint`), so editing any of those yields a fresh
+key instead of a stale hit.  Entries are evicted least
+recently used first by :func:`prune_cache`.
+"""
 
 from __future__ import annotations
 
+import ast
+import contextlib
 import hashlib
+import importlib.util
 import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Tuple
-
-from .artifacts import ARTIFACTS_ROOT
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-_DEFAULT_ALIAS_ROOT = Path("artifacts").resolve()
+from . import __version__
+from .artifacts import ARTIFACT_STORE, ARTIFACTS_ROOT, alias_path
 
 _CACHE_DIR_NAME = "cache"
 _DEFAULT_LABEL = "default"
+_FIRST_PARTY = ("davinci_codex", "multiphysics")
+_INPUT_SUFFIXES = (".yaml", ".yml")
+_MAX_BYTES_ENV = "DAVINCI_CACHE_MAX_BYTES"
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+# (path, mtime_ns, size) -> sha256, so unchanged inputs are hashed once per process.
+_FILE_DIGESTS: Dict[Tuple[str, int, int], str] = {}
+# Same key -> first-party module names the source file imports.
+_FILE_IMPORTS: Dict[Tuple[str, int, int], List[str]] = {}
 
 
 def _alias_path(path: Path) -> Path | None:
-    resolved_root = ARTIFACTS_ROOT.resolve()
-    if resolved_root == _DEFAULT_ALIAS_ROOT:
-        return None
-    try:
-        relative = path.resolve().relative_to(resolved_root)
-    except ValueError:
-        return None
-    alias = Path("artifacts") / relative
-    alias.parent.mkdir(parents=True, exist_ok=True)
-    return alias
+    return alias_path(path, root=ARTIFACTS_ROOT)
 
 
 class CacheEntry:
@@ -49,14 +66,9 @@ class CacheEntry:
             return None
         return self.alias_path / "metadata.json"
 
-    def write_metadata(self, metadata: Dict[str, Any]) -> None:
-        with self.metadata_path.open("w", encoding="utf-8") as handle:
-            json.dump(metadata, handle, indent=2, sort_keys=True)
-        alias = self.alias_metadata_path
-        if alias is not None:
-            alias.parent.mkdir(parents=True, exist_ok=True)
-            with alias.open("w", encoding="utf-8") as handle:
-                json.dump(metadata, handle, indent=2, sort_keys=True)
+    def write_metadata(self, metadata: Dict[str, Any]) -> int:
+        """Write metadata once (mirrored via a link); returns bytes written."""
+        return ARTIFACT_STORE.write_json(self.metadata_path, metadata, alias_root=ARTIFACTS_ROOT)
 
     def read_metadata(self) -> Dict[str, Any] | None:
         if not self.metadata_path.exists():
@@ -104,9 +116,316 @@ def ensure_cached_result(
 ) -> Tuple[CacheEntry, bool]:
     """Return cache entry and whether matching metadata already exists."""
     entry = resolve_cache_entry(slug, payload, label=label)
-    return entry, entry.metadata_path.exists()
+    hit = entry.metadata_path.exists()
+    if hit:
+        _touch(entry.path)
+    return entry, hit
 
 
 def alias_output_path(path: Path) -> Path | None:
     """Return companion path under default ./artifacts for mirrored writes."""
     return _alias_path(path)
+
+
+def _file_digest(path: Path) -> str:
+    stat = path.stat()
+    token = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    digest = _FILE_DIGESTS.get(token)
+    if digest is None:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        _FILE_DIGESTS[token] = digest
+    return digest
+
+
+def _module_input_files(module: ModuleType, slug: str) -> List[Path]:
+    """YAML inputs referenced by module-level paths or stored under ``sims/<slug>``."""
+    candidates = {
+        value.resolve()
+        for value in vars(module).values()
+        if isinstance(value, Path) and value.suffix in _INPUT_SUFFIXES
+    }
+    sims_dir = _REPO_ROOT / "sims" / slug
+    if sims_dir.is_dir():
+        candidates.update(
+            path.resolve() for path in sims_dir.rglob("*") if path.suffix in _INPUT_SUFFIXES
+        )
+    return sorted((path for path in candidates if path.is_file()), key=str)
+
+
+def _input_label(path: Path) -> str:
+    """Name an input by its repository-relative path, independent of the CWD."""
+    try:
+        return path.relative_to(_REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _is_type_checking(test: ast.expr) -> bool:
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+        isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+    )
+
+
+def _import_nodes(nodes: List[ast.AST], *, functions: bool) -> Iterator[ast.AST]:
+    """Import statements that can run, skipping ``TYPE_CHECKING`` blocks (and function bodies)."""
+    for node in nodes:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        elif isinstance(node, ast.If) and _is_type_checking(node.test):
+            yield from _import_nodes(list(node.orelse), functions=functions)
+        elif functions or not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield from _import_nodes(list(ast.iter_child_nodes(node)), functions=functions)
+
+
+def _imported_names(path: Path, package: str) -> List[str]:
+    """Absolute names of the first-party modules (or their attributes) ``path`` imports.
+
+    Package ``__init__`` files run implicitly whenever a submodule is imported,
+    so only their module-level imports are followed; lazy imports inside their
+    functions count once a module names the target itself.
+    """
+    stat = path.stat()
+    token = (str(path), stat.st_mtime_ns, stat.st_size)
+    names = _FILE_IMPORTS.get(token)
+    if names is None:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+        found: Set[str] = set()
+        for node in _import_nodes(list(tree.body), functions=path.name != "__init__.py"):
+            if isinstance(node, ast.Import):
+                found.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    parts = package.split(".")
+                    base = ".".join(parts[: len(parts) - node.level + 1] + ([base] if base else []))
+                found.add(base)
+                found.update(f"{base}.{alias.name}" for alias in node.names)
+        names = sorted(name for name in found if name.split(".", 1)[0] in _FIRST_PARTY)
+        _FILE_IMPORTS[token] = names
+    return names
+
+
+def _module_source(name: str) -> Path | None:
+    """Locate a first-party module's source without importing it (``None`` for attributes)."""
+    top, _, rest = name.partition(".")
+    origin = getattr(sys.modules.get(top), "__file__", None)
+    if origin is None:
+        spec = importlib.util.find_spec(top)
+        origin = spec.origin if spec is not None else None
+    if not origin:
+        return None
+    location = Path(origin).resolve().parent.joinpath(*rest.split(".")) if rest else Path(origin).resolve().parent
+    for candidate in (location / "__init__.py", location.with_suffix(".py")):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _first_party_sources(module: ModuleType) -> List[Path]:
+    """Source files of the first-party modules ``module`` imports, followed transitively."""
+    source = getattr(module, "__file__", None)
+    if not source:
+        return []
+    root = Path(source).resolve()
+    seen = {module.__name__}
+    sources: Dict[Path, str] = {}
+    pending = [(module.__name__, root)]
+
+    def visit(imported: str) -> None:
+        parts = imported.split(".")
+        # Importing a submodule runs every parent package's __init__ as well
+        for depth in range(1, len(parts) + 1):
+            dotted = ".".join(parts[:depth])
+            if dotted in seen or parts[0] not in _FIRST_PARTY:
+                continue
+            seen.add(dotted)
+            dependency = _module_source(dotted)
+            if dependency is None or dependency == root or dependency in sources:
+                continue
+            sources[dependency] = dotted
+            pending.append((dotted, dependency))
+
+    visit(module.__name__.rpartition(".")[0])
+    while pending:
+        name, path = pending.pop()
+        package = name if path.name == "__init__.py" else name.rpartition(".")[0]
+        for imported in _imported_names(path, package):
+            visit(imported)
+    return sorted(sources, key=str)
+
+
+def _package_data_files(sources: List[Path]) -> List[Path]:
+    """Packaged tables (``data/`` beside a module, e.g. airfoil polars) the sources can load."""
+    directories = {path.parent / "data" for path in sources}
+    return sorted(
+        (
+            path
+            for directory in directories
+            if directory.is_dir()
+            for path in directory.rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        ),
+        key=str,
+    )
+
+
+def invention_fingerprint(module: ModuleType, slug: Optional[str] = None) -> Dict[str, str]:
+    """Digest the code and input files that determine an invention's outputs.
+
+    ``dependencies`` covers the first-party (``davinci_codex`` and
+    ``multiphysics``) modules the invention imports, directly or through one
+    another, together with the packaged data files beside them.
+    """
+    name = slug or str(getattr(module, "SLUG", module.__name__.rsplit(".", 1)[-1]))
+    source = getattr(module, "__file__", None)
+    inputs = hashlib.sha256()
+    for path in _module_input_files(module, name):
+        inputs.update(_input_label(path).encode("utf-8"))
+        inputs.update(_file_digest(path).encode("ascii"))
+    dependencies = hashlib.sha256()
+    sources = _first_party_sources(module)
+    for path in [*sources, *_package_data_files(sources)]:
+        dependencies.update(_input_label(path).encode("utf-8"))
+        dependencies.update(_file_digest(path).encode("ascii"))
+    return {
+        "version": __version__,
+        "module": _file_digest(Path(source))[:16] if source else "",
+        "dependencies": dependencies.hexdigest()[:16],
+        "inputs": inputs.hexdigest()[:16],
+    }
+
+
+def _touch(path: Path) -> None:
+    with contextlib.suppress(OSError):  # entry removed concurrently
+        os.utime(path)
+
+
+@dataclass
+class CacheRecord:
+    """Disk usage and recency of a single cache entry."""
+
+    slug: str
+    label: str
+    cache_key: str
+    path: Path
+    size_bytes: int
+    last_access: float
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:  # pragma: no cover - file removed while walking
+                continue
+    return total
+
+
+def iter_cache_entries(slug: Optional[str] = None) -> Iterator[CacheRecord]:
+    """Yield every cache entry below ``ARTIFACTS_ROOT``."""
+    if not ARTIFACTS_ROOT.exists():
+        return
+    slug_dirs = [ARTIFACTS_ROOT / slug] if slug else sorted(ARTIFACTS_ROOT.iterdir())
+    for slug_dir in slug_dirs:
+        cache_root = slug_dir / _CACHE_DIR_NAME
+        if not cache_root.is_dir():
+            continue
+        for label_dir in sorted(p for p in cache_root.iterdir() if p.is_dir()):
+            for entry_dir in sorted(p for p in label_dir.iterdir() if p.is_dir()):
+                yield CacheRecord(
+                    slug=slug_dir.name,
+                    label=label_dir.name,
+                    cache_key=entry_dir.name,
+                    path=entry_dir,
+                    size_bytes=_directory_size(entry_dir),
+                    last_access=entry_dir.stat().st_mtime,
+                )
+
+
+def cache_stats(slug: Optional[str] = None) -> Dict[str, Any]:
+    """Summarise cache entry counts and sizes per slug and label."""
+    groups: Dict[str, Dict[str, int]] = {}
+    total_entries = 0
+    total_bytes = 0
+    for record in iter_cache_entries(slug):
+        group = groups.setdefault(f"{record.slug}/{record.label}", {"entries": 0, "bytes": 0})
+        group["entries"] += 1
+        group["bytes"] += record.size_bytes
+        total_entries += 1
+        total_bytes += record.size_bytes
+    return {
+        "root": str(ARTIFACTS_ROOT),
+        "entries": total_entries,
+        "bytes": total_bytes,
+        "groups": groups,
+    }
+
+
+def prune_cache(
+    *,
+    max_bytes: Optional[int] = None,
+    max_age_days: Optional[float] = None,
+    slug: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Evict expired entries, then least recently used ones until under budget.
+
+    Entries untouched for more than ``max_age_days`` are always removed; the
+    rest are removed oldest-access first while the total exceeds ``max_bytes``.
+    """
+    records = sorted(iter_cache_entries(slug), key=lambda record: record.last_access)
+    total = sum(record.size_bytes for record in records)
+    cutoff = time.time() - max_age_days * 86400.0 if max_age_days is not None else None
+
+    evicted: List[CacheRecord] = []
+    for record in records:
+        expired = cutoff is not None and record.last_access < cutoff
+        over_budget = max_bytes is not None and total > max_bytes
+        if not (expired or over_budget):
+            continue
+        evicted.append(record)
+        total -= record.size_bytes
+        if not dry_run:
+            shutil.rmtree(record.path, ignore_errors=True)
+            alias = _alias_path(record.path)
+            if alias is not None:
+                shutil.rmtree(alias, ignore_errors=True)
+
+    return {
+        "dry_run": dry_run,
+        "evicted": [f"{record.slug}/{record.label}/{record.cache_key}" for record in evicted],
+        "freed_bytes": sum(record.size_bytes for record in evicted),
+        "remaining_bytes": total,
+    }
+
+
+def parse_size(value: str) -> int:
+    """Parse sizes such as ``500M`` or ``2G`` (binary units) into bytes."""
+    text = value.strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1:] if text[-1:] in _SIZE_UNITS else ""
+    number = text[: len(text) - len(unit)]
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except ValueError as exc:
+        raise ValueError(f"Invalid size '{value}'. Use e.g. 500M or 2G.") from exc
+
+
+def cache_budget() -> Optional[int]:
+    """Return the ``DAVINCI_CACHE_MAX_BYTES`` size bound in bytes, if configured."""
+    limit = os.getenv(_MAX_BYTES_ENV)
+    if not limit:
+        return None
+    try:
+        return parse_size(limit)
+    except ValueError as exc:
+        raise ValueError(f"{_MAX_BYTES_ENV}: {exc}") from exc
+
+
+def enforce_cache_budget(max_bytes: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Apply ``max_bytes``, or the ``DAVINCI_CACHE_MAX_BYTES`` bound, if configured."""
+    limit = max_bytes if max_bytes is not None else cache_budget()
+    if limit is None:
+        return None
+    return prune_cache(max_bytes=limit)
@@ -11,10 +11,9 @@ import numpy as np
 import typer
 
 from . import __version__
-from .artifacts import ensure_artifact_dir
-from .inventions import mechanical_ensemble as mechanical_ensemble_module
-from .pipelines import run_ornithopter_pipeline
-from .registry import InventionSpec, get_invention, list_inventions
+from .artifacts import ARTIFACT_STORE, ensure_artifact_dir
+from .cache import cache_stats, parse_size, prune_cache
+from .registry import InventionSpec, get_invention, list_inventions, load_manifest
 from .sweeps import run_parameter_sweep
 
 
@@ -34,6 +33,8 @@ class NumpyEncoder(json.JSONEncoder):
 
 
 app = typer.Typer(help="Interact with da Vinci Codex invention modules.")
+cache_app = typer.Typer(help="Inspect and prune cached simulation results.")
+app.add_typer(cache_app, name="cache")
 
 
 def _validation_root() -> Path:
@@ -137,7 +138,8 @@ def list_command(
     )
 ) -> None:
     """List available inventions."""
-    specs = list_inventions()
+    # Listing only needs metadata, so read the manifest instead of importing modules.
+    specs = sorted(load_manifest().values(), key=lambda entry: entry.slug)
     if not specs:
         typer.echo("No inventions registered yet.")
         raise typer.Exit(code=1)
@@ -169,12 +171,13 @@ def simulate(
     slug: Optional[str] = typer.Option(None, help="Slug of the invention to simulate."),
     seed: int = typer.Option(0, help="Random seed for deterministic simulations."),
     fidelity: Optional[str] = typer.Option(None, help="Optional fidelity level (e.g. educational, advanced)."),
+    render: bool = typer.Option(True, help="Render figures and animations alongside the metrics."),
 ) -> None:
     """Run simulations and persist artifacts for the selected inventions."""
     specs = _resolve_inventions(slug, all_flag=slug is None)
     for spec in specs:
         typer.echo(f"# Simulating {spec.title} ({spec.slug})")
-        kwargs: Dict[str, object] = {"seed": seed}
+        kwargs: Dict[str, object] = {"seed": seed, "render": render}
         if fidelity:
             kwargs["fidelity"] = fidelity
         try:
@@ -238,6 +241,9 @@ def sweep(
     fidelity: Optional[str] = typer.Option(None, help="Optional fidelity level."),
     label: Optional[str] = typer.Option(None, help="Optional label used for cache grouping."),
     reuse_cache: bool = typer.Option(True, help="Skip reruns when cached results are available."),
+    workers: int = typer.Option(1, "--workers", min=1, help="Worker processes for uncached seeds."),
+    store: str = typer.Option("json", "--store", help="Run result backend: json or npz (columnar)."),
+    render: bool = typer.Option(False, help="Render each run's figures (headless by default)."),
 ) -> None:
     """Run repeated simulations and summarise aggregated statistics."""
     if not slug:
@@ -256,8 +262,17 @@ def sweep(
         seeds=seeds,
         label=label,
         reuse_cache=reuse_cache,
+        workers=workers,
+        store=store,
+        render=render,
     )
     typer.echo(json.dumps(summary, indent=2, sort_keys=True, cls=NumpyEncoder))
+    io_stats = ARTIFACT_STORE.stats()
+    typer.echo(
+        f"# wrote {io_stats['bytes_written']} bytes in {io_stats['files_written']} files "
+        f"(aliases: {io_stats['aliases']})",
+        err=True,
+    )
 
 
 @app.command()
@@ -326,6 +341,8 @@ def pipeline_command(
     duration: float = typer.Option(20.0, help="Simulation duration in seconds for synthesis stage."),
 ) -> None:
     """Run multi-stage pipelines (currently ornithopter-only)."""
+    from .pipelines import run_ornithopter_pipeline
+
     specs = _resolve_inventions(slug, all_flag=slug is None)
     for spec in specs:
         typer.echo(f"# Pipeline {spec.title} ({spec.slug})")
@@ -367,11 +384,43 @@ def ensemble_demo_command(
     measures: int = typer.Option(4, "--measures", help="Number of measures to generate."),
 ) -> None:
     """Generate a pseudo-score for the full mechanical ensemble."""
+    from .inventions import mechanical_ensemble as mechanical_ensemble_module
 
     result = mechanical_ensemble_module.demo(seed=seed, tempo_bpm=tempo, measures=measures)
     typer.echo(json.dumps(result, indent=2, sort_keys=True, cls=NumpyEncoder))
 
 
+@cache_app.command("stats")
+def cache_stats_command(
+    slug: Optional[str] = typer.Option(None, help="Restrict to a single invention."),
+) -> None:
+    """Report cache entry counts and disk usage."""
+    typer.echo(json.dumps(cache_stats(slug), indent=2, sort_keys=True))
+
+
+@cache_app.command("prune")
+def cache_prune_command(
+    max_size: Optional[str] = typer.Option(None, "--max-size", help="Size budget, e.g. 500M or 2G."),
+    max_age_days: Optional[float] = typer.Option(None, "--max-age-days", help="Evict entries unused for this long."),
+    slug: Optional[str] = typer.Option(None, help="Restrict to a single invention."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would be evicted."),
+) -> None:
+    """Evict least recently used cache entries."""
+    if max_size is None and max_age_days is None:
+        raise typer.BadParameter("Provide --max-size and/or --max-age-days.")
+    try:
+        max_bytes = parse_size(max_size) if max_size is not None else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    report = prune_cache(
+        max_bytes=max_bytes,
+        max_age_days=max_age_days,
+        slug=slug,
+        dry_run=dry_run,
+    )
+    typer.echo(json.dumps(report, indent=2, sort_keys=True))
+
+
 @app.command("validation-status")
 def validation_status() -> None:
     """Summarise validation evidence across cases."""
@@ -36,6 +36,7 @@ import csv
 import importlib.util
 import math
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -46,6 +47,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import animation, patches
 
+from multiphysics.airfoil_polar import AirfoilPolar
+
 from ..artifacts import ensure_artifact_dir
 
 # Module metadata
@@ -100,6 +103,27 @@ MULTI_OPERATOR_POWER = 250.0  # watts (4 operators coordinated)
 GEAR_RATIO = 15.0  # mechanical advantage
 GEAR_EFFICIENCY = 0.85  # historical gear systems
 
+# Blade section polar: thin-airfoil lift below stall, flat-plate lift and drag beyond
+BLADE_STALL_ANGLE = math.radians(15.0)
+_BLADE_POLAR_ALPHA = np.union1d(
+    np.radians(np.arange(-180.0, 180.25, 0.25)),
+    [-BLADE_STALL_ANGLE + 1e-9, BLADE_STALL_ANGLE - 1e-9],  # second node at the stall jump
+)
+
+
+def _blade_section_coefficients(alpha, _reynolds):
+    """Closed-form blade section model tabulated by :func:`blade_section_polar`."""
+    attached = np.abs(alpha) < BLADE_STALL_ANGLE
+    cl = np.where(attached, 2.0 * np.pi * alpha, 0.8 * np.sin(2.0 * alpha))
+    cd = np.where(attached, PROFILE_DRAG_COEFFICIENT + 0.01 * alpha**2, 0.02 + 0.1 * np.abs(np.sin(alpha)))
+    return cl, cd
+
+
+@lru_cache(maxsize=1)
+def blade_section_polar() -> AirfoilPolar:
+    """Aerial screw blade section polar, tabulated once."""
+    return AirfoilPolar.from_function(_blade_section_coefficients, _BLADE_POLAR_ALPHA, name="helical_blade")
+
 
 def _cad_module():
     root = Path(__file__).resolve().parents[3]
@@ -322,7 +346,8 @@ class HelicalRotorAnalysis:
     """
 
     def __init__(self, radius: float, inner_radius: float, pitch: float,
-                 num_blades: int = 1, air_density: float = RHO_AIR):
+                 num_blades: int = 1, air_density: float = RHO_AIR,
+                 polar: Optional[AirfoilPolar] = None):
         self.radius = radius
         self.inner_radius = inner_radius
         self.pitch = pitch
@@ -333,25 +358,29 @@ class HelicalRotorAnalysis:
         self.solidity = (num_blades * ROOT_CHORD * (radius - inner_radius)) / (math.pi * radius**2)
         self.tip_loss_factor = 1.0  # Prandtl tip loss
         self.ground_effect = 1.0    # Ground proximity factor
+        self.polar = polar if polar is not None else blade_section_polar()
 
-    def compute_blade_geometry(self, r: float) -> Tuple[float, float, float]:
+    def compute_blade_geometry(self, r) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Compute local blade geometry at radius r.
 
+        ``r`` may be a scalar or an array of radial positions.
+
         Returns:
             chord: Local blade chord [m]
             twist: Local twist angle [rad]
             thickness: Local thickness ratio [-]
         """
+        r = np.asarray(r, dtype=float)
+
         # Non-dimensional radius
-        r_norm = (r - self.inner_radius) / (self.radius - self.inner_radius)
-        r_norm = max(0.0, min(1.0, r_norm))
+        r_norm = np.clip((r - self.inner_radius) / (self.radius - self.inner_radius), 0.0, 1.0)
 
         # Linear taper
         chord = ROOT_CHORD * (1.0 - (1.0 - TAPER_RATIO) * r_norm)
 
         # Optimal twist for helicopter rotor (simplified)
-        geometric_twist = math.atan2(self.pitch, 2.0 * math.pi * r)
+        geometric_twist = np.arctan2(self.pitch, 2.0 * math.pi * r)
         optimal_twist = geometric_twist * 0.7  # Reduced for efficiency
 
         # Linear twist distribution from root to tip
@@ -362,30 +391,27 @@ class HelicalRotorAnalysis:
         # Thickness ratio (decreases toward tip)
         thickness_ratio = 0.12 * (1.0 - 0.4 * r_norm)
 
-        return chord, twist, thickness_ratio
+        return chord[()], twist[()], thickness_ratio[()]
 
-    def compute_induced_velocity(self, rpm: float, r: float) -> float:
+    def compute_induced_velocity(self, rpm, r) -> np.ndarray:
         """
         Compute induced velocity at radius r using momentum theory.
 
         Args:
-            rpm: Rotor speed [RPM]
-            r: Radial position [m]
+            rpm: Rotor speed [RPM], scalar or array
+            r: Radial position [m], scalar or array broadcastable with ``rpm``
 
         Returns:
             Induced velocity [m/s]
         """
-        omega = rpm * 2.0 * math.pi / 60.0
+        omega = np.asarray(rpm, dtype=float) * 2.0 * math.pi / 60.0
 
         # Disk loading estimate
         disk_area = math.pi * self.radius**2
         thrust_estimate = 2.0 * self.air_density * disk_area * (SLIP_FACTOR * self.pitch * omega / (2.0 * math.pi))**2
 
-        # Momentum theory induced velocity
-        if thrust_estimate > 0:
-            v_induced = math.sqrt(thrust_estimate / (2.0 * self.air_density * disk_area))
-        else:
-            v_induced = 0.0
+        # Momentum theory induced velocity (zero when the rotor is unloaded)
+        v_induced = np.sqrt(np.maximum(thrust_estimate, 0.0) / (2.0 * self.air_density * disk_area))
 
         # Apply tip loss correction
         v_induced *= self.tip_loss_factor
@@ -393,12 +419,15 @@ class HelicalRotorAnalysis:
         # Ground effect enhancement
         v_induced *= self.ground_effect
 
-        return v_induced
+        return np.broadcast_to(v_induced, np.broadcast_shapes(omega.shape, np.shape(r)))[()]
 
-    def compute_element_forces(self, rpm: float, r: float) -> Tuple[float, float, float]:
+    def compute_element_forces(self, rpm, r) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Compute aerodynamic forces on blade element at radius r.
 
+        ``rpm`` and ``r`` broadcast against each other, so ``rpm[:, None]``
+        with ``r[None, :]`` evaluates a whole RPM x radius grid at once.
+
         Args:
             rpm: Rotor speed [RPM]
             r: Radial position [m]
@@ -408,29 +437,26 @@ class HelicalRotorAnalysis:
             dQ: Element torque [Nm]
             dP: Element power [W]
         """
+        r = np.asarray(r, dtype=float)
+
         # Local blade geometry
         chord, twist, thickness = self.compute_blade_geometry(r)
 
         # Kinematics
-        omega = rpm * 2.0 * math.pi / 60.0
+        omega = np.asarray(rpm, dtype=float) * 2.0 * math.pi / 60.0
         v_tangential = omega * r
         v_induced = self.compute_induced_velocity(rpm, r)
 
         # Local velocity components
         v_axial = SLIP_FACTOR * self.pitch * omega / (2.0 * math.pi)
-        v_total = math.sqrt(v_tangential**2 + (v_axial + v_induced)**2)
+        v_total = np.sqrt(v_tangential**2 + (v_axial + v_induced)**2)
 
         # Angle of attack
-        inflow_angle = math.atan2(v_axial + v_induced, v_tangential)
+        inflow_angle = np.arctan2(v_axial + v_induced, v_tangential)
         alpha = twist - inflow_angle
 
-        # Lift and drag coefficients (simplified airfoil model)
-        if abs(alpha) < math.radians(15):  # Stall angle
-            cl = 2.0 * math.pi * alpha  # Thin airfoil theory
-            cd = PROFILE_DRAG_COEFFICIENT + 0.01 * alpha**2
-        else:  # Stalled
-            cl = 0.8 * math.sin(2.0 * alpha)
-            cd = 0.02 + 0.1 * abs(math.sin(alpha))
+        # Lift and drag coefficients from the blade section polar
+        cl, cd = self.polar.coefficients(alpha)
 
         # Dynamic pressure
         q = 0.5 * self.air_density * v_total**2
@@ -441,11 +467,10 @@ class HelicalRotorAnalysis:
 
         # Convert to thrust and torque with positive orientation
         dr = 0.01  # Radial element width [m]
-        chord * dr
 
         # Ensure positive thrust contribution
-        dT = abs(lift_per_span * dr * math.cos(inflow_angle) - drag_per_span * dr * math.sin(inflow_angle))
-        dQ = abs((lift_per_span * math.sin(inflow_angle) + drag_per_span * math.cos(inflow_angle)) * dr * r)
+        dT = np.abs(lift_per_span * dr * np.cos(inflow_angle) - drag_per_span * dr * np.sin(inflow_angle))
+        dQ = np.abs((lift_per_span * np.sin(inflow_angle) + drag_per_span * np.cos(inflow_angle)) * dr * r)
         dP = dQ * omega
 
         # Scale by number of blades
@@ -453,7 +478,7 @@ class HelicalRotorAnalysis:
         dQ *= self.num_blades
         dP *= self.num_blades
 
-        return dT, dQ, dP
+        return dT[()], dQ[()], dP[()]
 
     def compute_performance(self, rpm: float) -> Dict[str, float]:
         """
@@ -465,20 +490,34 @@ class HelicalRotorAnalysis:
         Returns:
             Performance metrics dictionary
         """
-        # Integrate forces along blade span
-        total_thrust = 0.0
-        total_torque = 0.0
-        total_power = 0.0
+        sweep = self.compute_performance_sweep([rpm])
+        return {key: float(values[0]) for key, values in sweep.items()}
+
+    def compute_performance_sweep(self, rpm, num_radial_points: int = 50) -> Dict[str, np.ndarray]:
+        """
+        Compute rotor performance for a whole array of rotor speeds at once.
+
+        Blade elements are evaluated on an RPM x radius grid by broadcasting,
+        so dense sweeps cost a handful of array operations instead of a
+        Python call per (RPM, radius) pair.
 
-        # Radial integration points
-        r_points = np.linspace(self.inner_radius, self.radius, 50)
+        Args:
+            rpm: Rotor speeds [RPM], shape (n_rpm,)
+            num_radial_points: Radial integration points along the blade
 
-        for r in r_points:
-            dT, dQ, dP = self.compute_element_forces(rpm, r)
+        Returns:
+            Performance metrics dictionary with one array of length n_rpm per
+            key of :meth:`compute_performance`
+        """
+        rpm = np.atleast_1d(np.asarray(rpm, dtype=float))
 
-            total_thrust += dT * (self.radius - self.inner_radius) / len(r_points)
-            total_torque += dQ * (self.radius - self.inner_radius) / len(r_points)
-            total_power += dP * (self.radius - self.inner_radius) / len(r_points)
+        # Integrate forces along blade span
+        r_points = np.linspace(self.inner_radius, self.radius, num_radial_points)
+        dT, dQ, dP = self.compute_element_forces(rpm[:, None], r_points[None, :])
+        weight = (self.radius - self.inner_radius) / num_radial_points
+        total_thrust = dT.sum(axis=1) * weight
+        total_torque = dQ.sum(axis=1) * weight
+        total_power = dP.sum(axis=1) * weight
 
         # Additional losses
         omega = rpm * 2.0 * math.pi / 60.0
@@ -486,16 +525,16 @@ class HelicalRotorAnalysis:
 
         # Compressibility correction (subsonic approximation)
         mach = tip_speed / SPEED_OF_SOUND
-        if mach > 0.3:  # Compressibility effects become significant
-            compressibility_factor = 1.0 + 0.2 * mach**2
-            total_power *= compressibility_factor
+        compressible = mach > 0.3  # Compressibility effects become significant
+        total_power = np.where(compressible, total_power * (1.0 + 0.2 * mach**2), total_power)
 
         # Figure of merit (hover efficiency)
-        if total_thrust > 0 and total_power > 0:
-            induced_power_ideal = total_thrust * math.sqrt(total_thrust / (2.0 * self.air_density * math.pi * self.radius**2))
-            figure_of_merit = min(induced_power_ideal / total_power, 0.85)  # Practical limit
-        else:
-            figure_of_merit = 0.0
+        loaded = (total_thrust > 0) & (total_power > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            induced_power_ideal = total_thrust * np.sqrt(
+                np.maximum(total_thrust, 0.0) / (2.0 * self.air_density * math.pi * self.radius**2))
+            figure_of_merit = np.where(loaded, np.minimum(induced_power_ideal / total_power, 0.85), 0.0)
+            power_loading = np.where(total_power > 0, total_thrust / total_power, np.inf)
 
         return {
             'thrust': total_thrust,
@@ -503,21 +542,25 @@ class HelicalRotorAnalysis:
             'power': total_power,
             'tip_speed': tip_speed,
             'tip_mach': mach,
-            'figure_of_merit': min(figure_of_merit, 0.85),  # Practical limit
+            'figure_of_merit': figure_of_merit,  # Practical limit applied above
             'disk_loading': total_thrust / (math.pi * self.radius**2),
-            'power_loading': total_thrust / total_power if total_power > 0 else float('inf')
+            'power_loading': power_loading
         }
 
 
-def _performance_curve() -> Dict[str, np.ndarray]:
+def _performance_curve(num_rpm: int = 60, num_radial_points: int = 50) -> Dict[str, np.ndarray]:
     """
     Generate comprehensive performance curves for the aerial screw.
 
+    Args:
+        num_rpm: Number of rotor speeds between 10 and 200 RPM
+        num_radial_points: Radial integration points along the blade
+
     Returns:
         Dictionary containing performance data arrays
     """
     # RPM range for analysis
-    rpm = np.linspace(10.0, 200.0, 60)
+    rpm = np.linspace(10.0, 200.0, num_rpm)
 
     # Initialize rotor analysis
     rotor = HelicalRotorAnalysis(
@@ -527,25 +570,8 @@ def _performance_curve() -> Dict[str, np.ndarray]:
         num_blades=1
     )
 
-    # Compute performance at each RPM
-    thrust = np.zeros_like(rpm)
-    torque = np.zeros_like(rpm)
-    power = np.zeros_like(rpm)
-    tip_speed = np.zeros_like(rpm)
-    tip_mach = np.zeros_like(rpm)
-    figure_of_merit = np.zeros_like(rpm)
-    disk_loading = np.zeros_like(rpm)
-
-    for i, omega_rpm in enumerate(rpm):
-        perf = rotor.compute_performance(omega_rpm)
-
-        thrust[i] = perf['thrust']
-        torque[i] = perf['torque']
-        power[i] = perf['power']
-        tip_speed[i] = perf['tip_speed']
-        tip_mach[i] = perf['tip_mach']
-        figure_of_merit[i] = perf['figure_of_merit']
-        disk_loading[i] = perf['disk_loading']
+    # Compute performance at every RPM in one broadcast pass
+    perf = rotor.compute_performance_sweep(rpm, num_radial_points=num_radial_points)
 
     # Add historical comparison data
     leonardo_rpm = np.array([20.0, 40.0, 60.0, 80.0])
@@ -553,13 +579,13 @@ def _performance_curve() -> Dict[str, np.ndarray]:
 
     return {
         "rpm": rpm,
-        "thrust": thrust,
-        "torque": torque,
-        "power": power,
-        "tip_speed": tip_speed,
-        "tip_mach": tip_mach,
-        "figure_of_merit": figure_of_merit,
-        "disk_loading": disk_loading,
+        "thrust": perf['thrust'],
+        "torque": perf['torque'],
+        "power": perf['power'],
+        "tip_speed": perf['tip_speed'],
+        "tip_mach": perf['tip_mach'],
+        "figure_of_merit": perf['figure_of_merit'],
+        "disk_loading": perf['disk_loading'],
         "leonardo_rpm": leonardo_rpm,
         "leonardo_power": leonardo_power
     }
@@ -836,7 +862,7 @@ def _create_vortex_visualization(path: Path, data: Dict[str, np.ndarray]) -> str
     return str(path)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     """
     Comprehensive simulation of Leonardo's Aerial Screw with detailed analysis.
 
@@ -847,6 +873,8 @@ def simulate(seed: int = 0) -> Dict[str, object]:
 
     Args:
         seed: Random seed for reproducibility (unused in deterministic analysis)
+        render: Produce figures and animations; ``False`` returns the same
+            results with only the CSV data artifact.
 
     Returns:
         Dictionary containing comprehensive simulation results, analysis artifacts,
@@ -863,19 +891,22 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     # Create analysis artifacts
     csv_path = artifacts_dir / "performance.csv"
     _write_csv(csv_path, data)
+    artifacts = [str(csv_path)]
 
-    plot_path = artifacts_dir / "performance.png"
-    _plot_performance(plot_path, data)
+    if render:
+        plot_path = artifacts_dir / "performance.png"
+        _plot_performance(plot_path, data)
 
-    gif_path = artifacts_dir / "rotor_demo.gif"
-    _render_animation(gif_path)
+        gif_path = artifacts_dir / "rotor_demo.gif"
+        _render_animation(gif_path)
 
-    # Create new vortex visualization
-    vortex_gif_path = artifacts_dir / "vortex_visualization.gif"
-    vortex_artifact = _create_vortex_visualization(vortex_gif_path, data)
+        # Create new vortex visualization
+        vortex_gif_path = artifacts_dir / "vortex_visualization.gif"
+        vortex_artifact = _create_vortex_visualization(vortex_gif_path, data)
 
-    # Additional educational visualizations
-    educational_plots = _create_educational_plots(artifacts_dir / "educational_analysis.png", data)
+        # Additional educational visualizations
+        educational_plots = _create_educational_plots(artifacts_dir / "educational_analysis.png", data)
+        artifacts += [str(plot_path), str(gif_path)] + educational_plots + [vortex_artifact]
 
     # Performance analysis
     thrust = data["thrust"]
@@ -1030,7 +1061,7 @@ def simulate(seed: int = 0) -> Dict[str, object]:
         },
 
         # Generated artifacts
-        "artifacts": [str(csv_path), str(plot_path), str(gif_path)] + educational_plots + [vortex_artifact],
+        "artifacts": artifacts,
 
         # Summary and conclusions
         "summary": {
@@ -150,7 +150,7 @@ def _plot_profiles(path: Path, result: Dict, params: WalkerParameters) -> None:
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     """Simulation for the Armored Walker."""
     spring_props = SpringProperties(
         k_linear=500.0, max_theta=150.0, material="advanced_renaissance_alloy"
@@ -172,13 +172,16 @@ def simulate(seed: int = 0) -> Dict[str, object]:
 
     sim_results = _simulate_dynamics(params)
 
-    artifacts_dir = ensure_artifact_dir(SLUG, subdir="sim")
-    plot_path = artifacts_dir / "armored_walker_final_dynamics.png"
-    _plot_profiles(plot_path, sim_results, params)
+    artifacts: List[str] = []
+    if render:
+        artifacts_dir = ensure_artifact_dir(SLUG, subdir="sim")
+        plot_path = artifacts_dir / "armored_walker_final_dynamics.png"
+        _plot_profiles(plot_path, sim_results, params)
+        artifacts.append(str(plot_path))
 
     return {
         "status": "final_simulation_complete",
-        "artifacts": [str(plot_path)],
+        "artifacts": artifacts,
         "results": {
             "travel_distance_m": sim_results["position"][-1],
             "constant_speed_ms": sim_results["velocity"][-1],
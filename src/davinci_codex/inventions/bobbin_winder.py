@@ -211,7 +211,13 @@ class BobbinWinder:
     def __init__(self, params: Optional[BobbinWinderParameters] = None) -> None:
         self.params = params or _load_parameters()
 
-    def simulate(self, cam_type: str = "compound", thread_tension_N: Optional[float] = None) -> Dict[str, object]:
+    def simulate(
+        self,
+        cam_type: str = "compound",
+        thread_tension_N: Optional[float] = None,
+        *,
+        render: bool = True,
+    ) -> Dict[str, object]:
         if cam_type not in PROFILE_GENERATORS:
             raise ValueError(f"Unknown cam type '{cam_type}'. Expected one of {CAM_TYPES}.")
 
@@ -352,7 +358,7 @@ class BobbinWinder:
             cam_displacement_m=follower_radius,
         )
 
-        artifacts = self._record_artifacts(results, cam_type)
+        artifacts = self._record_artifacts(results, cam_type, render=render)
 
         summary = results.summary()
         total_length = summary.get("total_thread_length_m", 0.0)
@@ -431,7 +437,7 @@ class BobbinWinder:
             "references": plan()["origin"],
         }
 
-    def _record_artifacts(self, results: SimulationOutputs, cam_type: str) -> Dict[str, str]:
+    def _record_artifacts(self, results: SimulationOutputs, cam_type: str, *, render: bool = True) -> Dict[str, str]:
         artifacts_dir = ensure_artifact_dir(SLUG, subdir="sim")
         csv_path = artifacts_dir / f"{cam_type}_simulation.csv"
         with csv_path.open("w", newline="") as handle:
@@ -456,6 +462,9 @@ class BobbinWinder:
             ):
                 writer.writerow([f"{value:.6f}" for value in row])
 
+        if not render:
+            return {"simulation_csv": str(csv_path)}
+
         profiles_path = artifacts_dir / f"{cam_type}_cam_profile.png"
         tension_path = artifacts_dir / f"{cam_type}_tension.png"
         distribution_path = artifacts_dir / f"{cam_type}_distribution.png"
@@ -589,8 +598,13 @@ class BobbinWinder:
 _winder_singleton = BobbinWinder()
 
 
-def simulate(cam_type: str = "compound", thread_tension_N: Optional[float] = None) -> Dict[str, object]:
-    return _winder_singleton.simulate(cam_type=cam_type, thread_tension_N=thread_tension_N)
+def simulate(
+    cam_type: str = "compound",
+    thread_tension_N: Optional[float] = None,
+    *,
+    render: bool = True,
+) -> Dict[str, object]:
+    return _winder_singleton.simulate(cam_type=cam_type, thread_tension_N=thread_tension_N, render=render)
 
 
 def build() -> None:
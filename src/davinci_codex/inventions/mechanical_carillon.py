@@ -157,7 +157,7 @@ def _plot_sequence(path: Path, data: Dict[str, np.ndarray]) -> None:
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     params = _load_params()
     data = _simulate(params, seed)
     artifacts_dir = ensure_artifact_dir(SLUG, subdir="sim")
@@ -166,8 +166,10 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     artifacts: List[str] = []
     if data["time_s"].size:
         _write_csv(csv_path, data)
-        _plot_sequence(plot_path, data)
-        artifacts = [str(csv_path), str(plot_path)]
+        artifacts = [str(csv_path)]
+        if render:
+            _plot_sequence(plot_path, data)
+            artifacts.append(str(plot_path))
     mean_energy = float(np.mean(data["impact_energy_j"])) if data["impact_energy_j"].size else 0.0
     timing_std = float(np.std(data["time_s"])) if data["time_s"].size else 0.0
     return {
@@ -152,7 +152,7 @@ def _plot_rhythm(path: Path, data: Dict[str, np.ndarray]) -> None:
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     params = _load_params()
     data = _simulate(params, seed)
     artifacts_dir = ensure_artifact_dir(SLUG, subdir="sim")
@@ -160,8 +160,10 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     plot_path = artifacts_dir / "rhythm_plot.png"
     if data["ideal_times_s"].size:
         _write_csv(csv_path, data)
-        _plot_rhythm(plot_path, data)
-        artifacts = [str(csv_path), str(plot_path)]
+        artifacts = [str(csv_path)]
+        if render:
+            _plot_rhythm(plot_path, data)
+            artifacts.append(str(plot_path))
     else:
         artifacts = []
     mean_interval = float(np.mean(data["ideal_intervals_s"])) if data["ideal_intervals_s"].size else 0.0
@@ -967,7 +967,7 @@ def plan() -> Dict[str, object]:
         ]
     }
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     """
     Comprehensive simulation of Leonardo's Mechanical Lion walking mechanism.
 
@@ -977,6 +977,8 @@ def simulate(seed: int = 0) -> Dict[str, object]:
 
     Args:
         seed: Random seed for reproducibility
+        render: Produce the gait plot and walking animation; ``False``
+            returns the same results with only the cam profile data.
 
     Returns:
         Dictionary containing simulation results, analysis artifacts,
@@ -1048,13 +1050,16 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     cam_dir = artifacts_dir / "cam_profiles"
     cam_profiles = cam_designer.export_cam_profiles(cam_dir)
 
-    # Create visualization artifacts
-    plot_path = artifacts_dir / "gait_analysis.png"
-    _create_gait_analysis_plot(plot_path, gait_data)
+    artifacts = [str(cam_dir / f"{profile}.csv") for profile in cam_profiles]
+    if render:
+        # Create visualization artifacts
+        plot_path = artifacts_dir / "gait_analysis.png"
+        _create_gait_analysis_plot(plot_path, gait_data)
 
-    # Generate walking animation
-    animation_path = artifacts_dir / "walking_animation.gif"
-    _create_walking_animation(animation_path, gait_data)
+        # Generate walking animation
+        animation_path = artifacts_dir / "walking_animation.gif"
+        _create_walking_animation(animation_path, gait_data)
+        artifacts = [str(plot_path), str(animation_path)] + artifacts
 
     # Structural analysis
     structural_results = _perform_structural_analysis()
@@ -1171,8 +1176,7 @@ def simulate(seed: int = 0) -> Dict[str, object]:
         "educational_insights": educational_insights,
 
         # Generated artifacts
-        "artifacts": [str(plot_path), str(animation_path)] +
-                    [str(cam_dir / f"{profile}.csv") for profile in cam_profiles],
+        "artifacts": artifacts,
 
         # Validation results
         "validation": {
@@ -454,7 +454,7 @@ def _plot_calibration_guide(path: Path, params: OdometerParameters, data: Dict[s
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     """Enhanced simulation with comprehensive output and educational content."""
     params = _load_params()
     data = _simulate(params, seed)
@@ -466,8 +466,11 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     calibration_path = artifacts_dir / "calibration_guide.png"
 
     _write_csv(csv_path, data)
-    _plot_error(plot_path, data)
-    _plot_calibration_guide(calibration_path, params, data)
+    artifacts = [str(csv_path)]
+    if render:
+        _plot_error(plot_path, data)
+        _plot_calibration_guide(calibration_path, params, data)
+        artifacts += [str(plot_path), str(calibration_path)]
 
     # Calculate comprehensive metrics
     max_error = float(np.abs(data["error_percent"]).max())
@@ -492,7 +495,7 @@ def simulate(seed: int = 0) -> Dict[str, object]:
         performance_grade = "Needs Improvement"
 
     return {
-        "artifacts": [str(csv_path), str(plot_path), str(calibration_path)],
+        "artifacts": artifacts,
         "performance_metrics": {
             "max_error_percent": max_error,
             "mean_error_percent": mean_error,
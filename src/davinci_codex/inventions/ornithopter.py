@@ -33,8 +33,9 @@ import csv
 import importlib.util
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union, cast
+from typing import Any, Dict, List, Optional, Sequence, TypeVar, Union, cast
 
 import matplotlib
 
@@ -44,6 +45,8 @@ import numpy as np
 import yaml
 from scipy import special
 
+from multiphysics.airfoil_polar import AirfoilPolar
+
 from ..artifacts import ensure_artifact_dir
 
 SLUG = "ornithopter"
@@ -57,6 +60,9 @@ RHO_AIR = 1.225  # kg/m^3 at sea level
 GRAVITY = 9.80665  # m/s^2
 KINEMATIC_VISCOSITY = 1.5e-5  # m^2/s at sea level
 
+# Time, or a whole array of times for the vectorised integrator
+TimeLike = TypeVar("TimeLike", float, np.ndarray)
+
 
 @dataclass
 class WingKinematics:
@@ -112,6 +118,7 @@ class OrnithopterParameters:
     structure: WingStructure
     unsteady_aero: UnsteadyAeroParams
     acceptance_targets: Dict[str, Union[float, bool, int]]
+    airfoil_polar: Optional[str] = None  # packaged airfoil table name; None = linear to cl_max
 
 
 @dataclass
@@ -155,7 +162,7 @@ def _theodorsen_function(k: float) -> complex:
     return C
 
 
-def _calculate_wing_kinematics(t: float, params: OrnithopterParameters) -> Dict[str, float]:
+def _calculate_wing_kinematics(t: TimeLike, params: OrnithopterParameters) -> Dict[str, TimeLike]:
     """
     Calculate bio-inspired wing kinematics with figure-8 motion.
 
@@ -202,9 +209,9 @@ def _calculate_wing_kinematics(t: float, params: OrnithopterParameters) -> Dict[
     }
 
 
-def _calculate_membrane_deformation(kinematics: Dict[str, float],
+def _calculate_membrane_deformation(kinematics: Dict[str, TimeLike],
                                   params: OrnithopterParameters,
-                                  t: float) -> float:
+                                  t: TimeLike) -> TimeLike:
     """
     Calculate elastic membrane deformation based on aerodynamic loading.
 
@@ -246,7 +253,8 @@ def _calculate_membrane_deformation(kinematics: Dict[str, float],
 
     deformation = deformation_amplitude * amplification * np.sin(omega * t - phase_lag)
 
-    return np.clip(deformation, -params.mean_chord_m * 0.1, params.mean_chord_m * 0.1)
+    clipped: TimeLike = np.clip(deformation, -params.mean_chord_m * 0.1, params.mean_chord_m * 0.1)
+    return clipped
 
 
 def _clap_and_fling_lift(kinematics: Dict[str, float],
@@ -341,6 +349,27 @@ def _calculate_porosity_factor(stroke_velocity: float) -> float:
         # Feathers are sealed
         return 0.1
 
+
+@lru_cache(maxsize=8)
+def _linear_wing_polar(cl_alpha_per_rad: float, cl_max: float) -> AirfoilPolar:
+    """Quasi-steady lift linear in alpha up to +/- cl_max, tabulated with nodes at the breaks."""
+    alpha_break = cl_max / cl_alpha_per_rad
+    alpha = np.union1d(np.radians(np.arange(-180.0, 181.0, 1.0)), [-alpha_break, alpha_break])
+    cl = np.clip(cl_alpha_per_rad * alpha, -cl_max, cl_max)
+    return AirfoilPolar(alpha, [0.0], cl, 0.02 + 0.05 * cl**2, name="linear_wing")
+
+
+@lru_cache(maxsize=8)
+def _tabulated_wing_polar(name: str) -> AirfoilPolar:
+    return AirfoilPolar.load(name)
+
+
+def _wing_polar(params: OrnithopterParameters) -> AirfoilPolar:
+    if params.airfoil_polar:
+        return _tabulated_wing_polar(params.airfoil_polar)
+    return _linear_wing_polar(params.cl_alpha_per_rad, params.cl_max)
+
+
 def _calculate_unsteady_forces(kinematics: Dict[str, float],
                               membrane_def: float,
                               circulation_history: np.ndarray,
@@ -390,9 +419,8 @@ def _calculate_unsteady_forces(kinematics: Dict[str, float],
     C_k = _theodorsen_function(k)
     C_k_real = C_k.real
 
-    # Quasi-steady lift coefficient
-    cl_qs = params.cl_alpha_per_rad * alpha_total
-    cl_qs = np.clip(cl_qs, -params.cl_max, params.cl_max)
+    # Quasi-steady lift coefficient from the wing section polar
+    cl_qs = _wing_polar(params).coefficients(alpha_total, Re)[0]
 
     # Unsteady lift modification
     cl_unsteady = cl_qs * C_k_real
@@ -452,6 +480,68 @@ def _calculate_unsteady_forces(kinematics: Dict[str, float],
     }
 
 
+def _wake_independent_aero(kinematics: Dict[str, np.ndarray],
+                           membrane_def: np.ndarray,
+                           params: OrnithopterParameters,
+                           t: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Array form of the parts of :func:`_calculate_unsteady_forces` that do not
+    depend on the wake-capture velocity.
+
+    Returns the onset velocity and the factors that turn dynamic pressure into
+    lift/drag and lift into thrust, so the wake-coupled terms can be applied
+    afterwards.
+    """
+    base_alpha = math.radians(params.base_alpha_deg)
+    alpha_amp = math.radians(params.alpha_amplitude_deg)
+    alpha_total = (base_alpha + alpha_amp * np.sin(2 * np.pi * params.flap_frequency_hz * t) +
+                   kinematics['rotation'] + membrane_def / params.mean_chord_m)
+
+    v_stroke = np.abs(kinematics['stroke_velocity']) * params.wing_span_m / 2
+    v_forward = params.forward_speed_ms
+    v_total = np.sqrt(v_stroke**2 + v_forward**2)
+    Re = v_total * params.mean_chord_m / KINEMATIC_VISCOSITY
+
+    if v_forward > 0.1:
+        k = np.pi * params.flap_frequency_hz * params.mean_chord_m / v_forward
+    else:
+        k = 2.0
+    C_k_real = _theodorsen_function(k).real
+
+    cl_qs = _wing_polar(params).coefficients(alpha_total, Re)[0]
+    cl_unsteady = cl_qs * C_k_real
+
+    added_mass_factor = np.pi / 4 * params.mean_chord_m**2 * RHO_AIR
+    cl_added_mass = (added_mass_factor * kinematics['stroke_acceleration'] *
+                     params.wing_span_m / (0.5 * RHO_AIR * v_total**2 * params.wing_area_m2))
+
+    cl_clap_fling = np.zeros_like(t)
+    if params.unsteady_aero.clap_fling_enabled:
+        stroke_position = kinematics['stroke_angle'] / params.kinematics.stroke_amplitude
+        separation_angle = 2 * (1 - np.abs(stroke_position)) * params.kinematics.stroke_amplitude
+        cl_clap_fling = np.where(
+            (np.abs(stroke_position) > 0.8) & (separation_angle < 0.1),
+            0.3 * np.exp(-separation_angle / 0.05),
+            0.0,
+        )
+
+    cl_total = np.clip(cl_unsteady + cl_added_mass + cl_clap_fling,
+                       -params.cl_max * 1.5, params.cl_max * 1.5)
+    porosity = np.where(kinematics['stroke_velocity'] > 0, 0.7, 0.1)
+    open_area = params.wing_area_m2 * (1.0 - porosity)
+
+    stroke_sign = np.sign(kinematics['stroke_velocity'])
+    thrust_per_lift = (np.sin(params.kinematics.stroke_plane_angle) * stroke_sign +
+                       0.1 * kinematics['rotation_velocity'] * stroke_sign)
+
+    return {
+        'v_total': v_total,
+        'lift_per_q': open_area * cl_total,
+        'drag_per_q': open_area * (0.02 + 0.05 * np.abs(cl_total)**2),
+        'thrust_per_lift': thrust_per_lift,
+    }
+
+
 def _load_parameters() -> OrnithopterParameters:
     """Load and enhance parameters with bio-inspired defaults."""
     with PARAM_FILE.open("r", encoding="utf-8") as stream:
@@ -514,7 +604,8 @@ def _load_parameters() -> OrnithopterParameters:
         kinematics=kinematics,
         structure=structure,
         unsteady_aero=unsteady_aero,
-        acceptance_targets=acceptance_targets
+        acceptance_targets=acceptance_targets,
+        airfoil_polar=raw.get('airfoil_polar'),
     )
 
 
@@ -699,7 +790,28 @@ def plan() -> Dict[str, object]:
     }
 
 
-def _simulate_profile(params: OrnithopterParameters, seed: int, duration_s: float = 30.0, dt: float = 0.02) -> FlightSimulation:
+def _simulate_profile(
+    params: OrnithopterParameters,
+    seed: int,
+    duration_s: float = 30.0,
+    dt: float = 0.02,
+    engine: str = "vectorized",
+) -> FlightSimulation:
+    """
+    Run the flight simulation with the selected integration engine.
+
+    ``engine="vectorized"`` (default) precomputes everything that depends only
+    on time as arrays; ``engine="reference"`` is the original per-step loop,
+    kept for verification.
+    """
+    if engine == "vectorized":
+        return _simulate_profile_vectorized(params, seed, duration_s, dt)
+    if engine == "reference":
+        return _simulate_profile_reference(params, seed, duration_s, dt)
+    raise ValueError(f"Unknown ornithopter engine '{engine}'. Use 'vectorized' or 'reference'.")
+
+
+def _simulate_profile_reference(params: OrnithopterParameters, seed: int, duration_s: float = 30.0, dt: float = 0.02) -> FlightSimulation:
     """
     Enhanced flight simulation with bio-inspired flapping aerodynamics.
 
@@ -811,6 +923,191 @@ def _simulate_profile(params: OrnithopterParameters, seed: int, duration_s: floa
     )
 
 
+def _deterministic_profile(params: OrnithopterParameters, duration_s: float, dt: float) -> Dict[str, Any]:
+    """
+    Evaluate every seed-independent quantity of the flight profile as arrays.
+
+    Kinematics, membrane deformation, the wake-independent part of the force
+    model and power depend only on ``t``.  Wake capture couples circulation to
+    its value one flap period earlier, so circulation is resolved in
+    period-sized blocks whose inputs are already known.  Lift and thrust are
+    returned before turbulence, which is the only seed-dependent term.
+    """
+    steps = int(duration_s / dt) + 1
+    time = np.linspace(0.0, duration_s, steps)
+    t = time[1:]  # step 0 holds the initial state
+
+    kin = _calculate_wing_kinematics(t, params)
+    membrane_def = _calculate_membrane_deformation(kin, params, t)
+    aero = _wake_independent_aero(kin, membrane_def, params, t)
+
+    # Circulation at step i feeds the wake-capture velocity at i + period.
+    period_steps = int(1.0 / params.flap_frequency_hz / 0.02)  # dt = 0.02s, as in _wake_capture_effect
+    wake_scale = params.unsteady_aero.wake_capture_factor * np.exp(-0.5) / (2 * np.pi * params.mean_chord_m)
+    circulation = np.zeros(steps)
+    v_effective = np.zeros(steps)
+    block = max(period_steps, 1)
+    for start in range(1, steps, block):
+        idx = np.arange(start, min(start + block, steps))
+        if period_steps > 0:
+            prev_idx = np.maximum(idx - period_steps, 0)
+            v_wake = np.where(idx < 10, 0.0, wake_scale * circulation[prev_idx])
+        else:
+            v_wake = np.zeros(idx.size)
+        v_eff = aero["v_total"][idx - 1] + v_wake
+        lift_block = 0.5 * RHO_AIR * v_eff**2 * aero["lift_per_q"][idx - 1]
+        v_effective[idx] = v_eff
+        with np.errstate(divide="ignore", invalid="ignore"):
+            circulation[idx] = np.where(
+                v_eff > 0.1, lift_block / (RHO_AIR * v_eff * params.wing_span_m), 0.0
+            )
+
+    q = 0.5 * RHO_AIR * v_effective[1:] ** 2
+    lift = np.zeros(steps)
+    thrust = np.zeros(steps)
+    drag = np.zeros(steps)
+    lift[1:] = q * aero["lift_per_q"]
+    drag[1:] = q * aero["drag_per_q"]
+    thrust[1:] = lift[1:] * aero["thrust_per_lift"]
+
+    wing_positions = np.zeros((steps, 3))
+    wing_positions[1:, 0] = kin["lateral_motion"]
+    wing_positions[1:, 1] = kin["stroke_angle"] * params.wing_span_m / 2
+    wing_positions[1:, 2] = kin["deviation"] * params.wing_span_m / 4
+
+    membrane_deformation = np.zeros(steps)
+    membrane_deformation[1:] = membrane_def
+
+    phase = 2.0 * np.pi * params.flap_frequency_hz * t
+    power = np.zeros(steps)
+    power[1:] = (
+        params.base_power_w * 0.5 * (1.0 + np.cos(phase))
+        + params.power_variation_w * 0.3 * np.abs(np.sin(2 * phase))
+        + 0.5 * params.structure.membrane_stiffness_n_m * membrane_def**2 * np.abs(kin["stroke_velocity"])
+        + params.controller_power_w
+    )
+    avg_power = float(np.mean(power)) if steps > 0 else params.base_power_w
+
+    return {
+        "time": time,
+        "lift": lift,
+        "thrust": thrust,
+        "drag": drag,
+        "power": power,
+        "energy_used_wh": float(np.sum(power[1:] * dt / 3600.0)),
+        "endurance_hours": params.battery_capacity_wh / avg_power,
+        "wing_positions": wing_positions,
+        "circulation": circulation,
+        "membrane_deformation": membrane_deformation,
+    }
+
+
+def _turbulence(seed: int, steps: int) -> np.ndarray:
+    """Per-step lift/thrust turbulence factors (index 0 is the initial state)."""
+    factors = np.ones(steps)
+    factors[1:] += np.random.default_rng(seed).normal(0.0, 0.015, size=steps - 1)
+    return factors
+
+
+def _simulate_profile_vectorized(params: OrnithopterParameters, seed: int, duration_s: float = 30.0, dt: float = 0.02) -> FlightSimulation:
+    """
+    Array-based equivalent of :func:`_simulate_profile_reference`.
+
+    Only the heave/forward-velocity recurrence (with its ground constraint)
+    remains a scalar loop, run on plain floats.
+    """
+    profile = _deterministic_profile(params, duration_s, dt)
+    steps = profile["time"].size
+    turbulence = _turbulence(seed, steps)
+    lift = profile["lift"] * turbulence
+    thrust = profile["thrust"] * turbulence
+
+    gross_weight = params.total_mass_kg * GRAVITY
+    damping = 0.55
+    mass = params.total_mass_kg
+    v_cruise = params.forward_speed_ms
+    accel_vertical = ((lift - gross_weight) / mass).tolist()
+    accel_horizontal = ((thrust - profile["drag"]) / mass).tolist()
+    altitude_list = [0.0] * steps
+    vertical_list = [0.0] * steps
+    horizontal_list = [v_cruise] * steps
+    vz = 0.0
+    vx = v_cruise
+    z = 0.0
+    for i in range(1, steps):
+        vz = vz + (accel_vertical[i] - damping * vz) * dt
+        vx = vx + (accel_horizontal[i] - 0.1 * (vx - v_cruise)) * dt
+        z = max(z + vz * dt, 0.0)
+        vertical_list[i] = vz
+        horizontal_list[i] = vx
+        altitude_list[i] = z
+
+    return FlightSimulation(
+        time=profile["time"],
+        altitude=np.asarray(altitude_list),
+        vertical_velocity=np.asarray(vertical_list),
+        horizontal_velocity=np.asarray(horizontal_list),
+        lift=lift,
+        thrust=thrust,
+        drag=profile["drag"],
+        power=profile["power"],
+        energy_used_wh=profile["energy_used_wh"],
+        endurance_hours=profile["endurance_hours"],
+        wing_positions=profile["wing_positions"],
+        circulation=profile["circulation"],
+        membrane_deformation=profile["membrane_deformation"]
+    )
+
+
+def _simulate_profile_batch(params: OrnithopterParameters, seeds: Sequence[int], duration_s: float = 30.0, dt: float = 0.02) -> List[FlightSimulation]:
+    """
+    Advance several seeds together with a ``(n_seeds, steps)`` state.
+
+    The deterministic profile is computed once and shared; each seed only
+    contributes its turbulence row.  The recurrence steps all seeds at once.
+    """
+    profile = _deterministic_profile(params, duration_s, dt)
+    steps = profile["time"].size
+    turbulence = np.stack([_turbulence(seed, steps) for seed in seeds]) if seeds else np.ones((0, steps))
+    lift = profile["lift"] * turbulence
+    thrust = profile["thrust"] * turbulence
+
+    gross_weight = params.total_mass_kg * GRAVITY
+    damping = 0.55
+    mass = params.total_mass_kg
+    v_cruise = params.forward_speed_ms
+    accel_vertical = (lift - gross_weight) / mass
+    accel_horizontal = (thrust - profile["drag"]) / mass
+    altitude = np.zeros_like(lift)
+    vertical_velocity = np.zeros_like(lift)
+    horizontal_velocity = np.full_like(lift, v_cruise)
+    for i in range(1, steps):
+        vz = vertical_velocity[:, i - 1]
+        vx = horizontal_velocity[:, i - 1]
+        vertical_velocity[:, i] = vz + (accel_vertical[:, i] - damping * vz) * dt
+        horizontal_velocity[:, i] = vx + (accel_horizontal[:, i] - 0.1 * (vx - v_cruise)) * dt
+        altitude[:, i] = np.maximum(altitude[:, i - 1] + vertical_velocity[:, i] * dt, 0.0)
+
+    return [
+        FlightSimulation(
+            time=profile["time"],
+            altitude=altitude[row],
+            vertical_velocity=vertical_velocity[row],
+            horizontal_velocity=horizontal_velocity[row],
+            lift=lift[row],
+            thrust=thrust[row],
+            drag=profile["drag"],
+            power=profile["power"],
+            energy_used_wh=profile["energy_used_wh"],
+            endurance_hours=profile["endurance_hours"],
+            wing_positions=profile["wing_positions"],
+            circulation=profile["circulation"],
+            membrane_deformation=profile["membrane_deformation"]
+        )
+        for row in range(len(seeds))
+    ]
+
+
 def _write_csv(path: Path, result: FlightSimulation) -> None:
     """Write enhanced simulation data to CSV with bio-inspired metrics."""
     with path.open("w", newline="") as fh:
@@ -1025,12 +1322,13 @@ def _plot_wing_kinematics_3d(path: Path, result: FlightSimulation) -> None:
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     """
     Enhanced simulation with comprehensive bio-inspired flapping flight analysis.
 
     Generates multiple educational outputs showing the complex interplay between
     unsteady aerodynamics, wing kinematics, and elastic membrane dynamics.
+    ``render=False`` skips the figures and keeps the flight profile CSV.
     """
     params = _load_parameters()
     result = _simulate_profile(params, seed)
@@ -1042,9 +1340,37 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     kinematics_3d_path = artifacts / "wing_kinematics_3d.png"
 
     _write_csv(csv_path, result)
-    _plot_profiles(plot_path, result, params.total_mass_kg * GRAVITY)
-    _plot_wing_kinematics_3d(kinematics_3d_path, result)
+    artifact_paths = {"bio_inspired_profile_csv": str(csv_path)}
+    if render:
+        _plot_profiles(plot_path, result, params.total_mass_kg * GRAVITY)
+        _plot_wing_kinematics_3d(kinematics_3d_path, result)
+        artifact_paths["comprehensive_dynamics_plot"] = str(plot_path)
+        artifact_paths["wing_kinematics_3d"] = str(kinematics_3d_path)
+
+    return _flight_payload(result, params, artifacts=artifact_paths)
+
+
+def simulate_batch(seeds: Sequence[int], *, duration_s: float = 30.0, dt: float = 0.02) -> List[Dict[str, object]]:
+    """
+    Run several seeds in one vectorised pass and return their metric payloads.
 
+    The seed-independent aerodynamics are evaluated once and every seed's
+    flight state advances together, so a sweep pays for one profile instead
+    of one per seed.  Payloads match :func:`simulate` minus ``"artifacts"``;
+    no files are written.
+    """
+    params = _load_parameters()
+    seeds = [int(seed) for seed in seeds]
+    results = _simulate_profile_batch(params, seeds, duration_s, dt)
+    return [_flight_payload(result, params) for result in results]
+
+
+def _flight_payload(
+    result: FlightSimulation,
+    params: OrnithopterParameters,
+    artifacts: Dict[str, str] | None = None,
+) -> Dict[str, object]:
+    """Summarise one flight profile into the ``simulate`` payload."""
     gross_weight = params.total_mass_kg * GRAVITY
 
     # Enhanced performance metrics
@@ -1133,12 +1459,9 @@ def simulate(seed: int = 0) -> Dict[str, object]:
                 "Bio-inspired design principles"
             ],
         },
-        "artifacts": {
-            "bio_inspired_profile_csv": str(csv_path),
-            "comprehensive_dynamics_plot": str(plot_path),
-            "wing_kinematics_3d": str(kinematics_3d_path),
-        },
     }
+    if artifacts is not None:
+        payload["artifacts"] = artifacts
 
     payload.update(
         {
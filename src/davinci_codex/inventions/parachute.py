@@ -22,6 +22,7 @@ from __future__ import annotations
 import csv
 import importlib.util
 import math
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, cast
 
@@ -83,6 +84,10 @@ NATURAL_FREQUENCY = 0.3   # Hz (pyramid natural sway frequency)
 DAMPING_RATIO = 0.15      # Underdamped system (some oscillation)
 MAX_SWAY_ANGLE = math.radians(15)  # Maximum safe sway angle
 
+# Descent integration
+REPORTING_DT = 0.05  # seconds; Euler step and reporting grid spacing
+MAX_DESCENT_TIME = 300.0  # seconds (longer for high altitude descents)
+
 SCENARIO_FILE = Path(__file__).resolve().parents[3] / "sims" / SLUG / "scenarios.yaml"
 
 
@@ -252,6 +257,214 @@ def _calculate_stability_metrics(angles: List[float], velocities: List[float]) -
     }
 
 
+@dataclass
+class DescentTrajectory:
+    """Descent history sampled on the reporting grid plus solver statistics."""
+
+    times: np.ndarray
+    altitudes: np.ndarray
+    vertical_velocities: np.ndarray
+    horizontal_velocities: np.ndarray
+    sway_angles: np.ndarray
+    drag_forces: np.ndarray
+    reynolds_numbers: np.ndarray
+    atmospheric_densities: np.ndarray
+    temperatures: np.ndarray
+    gust_factors: np.ndarray
+    statistics: Dict[str, Any]
+
+
+def _system_properties() -> Dict[str, float]:
+    """Geometry and mass of the modern-material pyramid parachute system."""
+    base_area = CANOPY_SIZE ** 2
+    pyramid_height = CANOPY_SIZE * 0.8660254
+    slant_height = math.sqrt((CANOPY_SIZE/2)**2 + pyramid_height**2)
+    canopy_area = 2 * CANOPY_SIZE * slant_height
+
+    # Modern materials (using the same constants as in plan())
+    canopy_mass = canopy_area * MODERN_NYLON_DENSITY
+    frame_length = 4 * CANOPY_SIZE + 4 * math.sqrt(2) * (CANOPY_SIZE/2)
+    frame_mass = frame_length * MODERN_CARBON_DENSITY
+    return {
+        "base_area": base_area,
+        "pyramid_height": pyramid_height,
+        "suspension_length": pyramid_height + 2.0,  # Approximate suspension line length
+        "total_mass": PAYLOAD_MASS + canopy_mass + frame_mass,
+    }
+
+
+def _drag_coefficients(reynolds_numbers: np.ndarray, base_coeff: float = DRAG_COEFFICIENT_BASE) -> np.ndarray:
+    """Array form of :func:`_calculate_drag_coefficient`."""
+    re = np.asarray(reynolds_numbers, dtype=float)
+    transition = DRAG_COEFFICIENT_MAX - (re - 1e4) / 9e4 * (DRAG_COEFFICIENT_MAX - base_coeff)
+    return np.select(
+        [re < 1e4, re < 1e5, re < 1e6],
+        [DRAG_COEFFICIENT_MAX, transition, base_coeff],
+        default=max(DRAG_COEFFICIENT_MIN, base_coeff * 0.95),
+    )
+
+
+def _gust_multipliers(gust_profile: List[Dict[str, float]], times: np.ndarray) -> np.ndarray:
+    """Array form of :func:`_gust_multiplier` (piecewise linear, held at the ends)."""
+    times = np.asarray(times, dtype=float)
+    if not gust_profile:
+        return np.ones_like(times)
+    knots = np.array([point["time_s"] for point in gust_profile])
+    deltas = np.array([point["delta_drag"] for point in gust_profile])
+    return np.asarray(1.0 + np.interp(times, knots, deltas))
+
+
+def _draw_forcing(rng: np.random.Generator, turbulence_sigma: float, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-step drag turbulence factors and horizontal gust accelerations.
+
+    Draws the same stream the original loop consumed one scalar at a time
+    (turbulence, then horizontal gust, for each step).
+    """
+    draws = rng.standard_normal((steps, 2))
+    return 1.0 + turbulence_sigma * draws[:, 0], turbulence_sigma * 0.5 * draws[:, 1]
+
+
+def _integrate_euler(
+    system: Dict[str, float],
+    forcing: Tuple[np.ndarray, np.ndarray],
+    gust_profile: List[Dict[str, float]],
+    sway_angle: float,
+    dt: float = REPORTING_DT,
+    max_time: float = MAX_DESCENT_TIME,
+) -> DescentTrajectory:
+    """Fixed-step explicit Euler integration (the original scheme).
+
+    Only the state-dependent terms are evaluated per step.  The gust factors
+    depend on time alone and are tabulated on the step grid up front; the
+    recorded Reynolds numbers, densities and temperatures are evaluated on the
+    whole trajectory once it is known.
+    """
+    turbulence_factors, horizontal_gusts = forcing
+    base_area = system["base_area"]
+    total_mass = system["total_mass"]
+    suspension_length = system["suspension_length"]
+    weight = total_mass * GRAVITY
+
+    capacity = turbulence_factors.size + 1
+    # Same running sum as ``time += dt`` in the loop, so the grids agree exactly
+    step_times = np.concatenate(([0.0], np.cumsum(np.full(capacity - 1, dt))))
+    gust_factors = _gust_multipliers(gust_profile, step_times)
+    gust_list = gust_factors.tolist()
+    turbulence_list = turbulence_factors.tolist()
+    horizontal_gust_list = horizontal_gusts.tolist()
+
+    altitudes = np.zeros(capacity)
+    vertical_velocities = np.zeros(capacity)
+    horizontal_velocities = np.zeros(capacity)
+    sway_angles = np.zeros(capacity)
+    drag_forces = np.zeros(capacity)
+
+    altitude = DEPLOYMENT_ALTITUDE
+    vertical_velocity = 0.0  # Start from rest (just deployed)
+    horizontal_velocity = 0.0
+    sway_velocity = 0.0  # Angular velocity
+    time = 0.0
+    altitudes[0] = altitude
+    sway_angles[0] = sway_angle
+
+    step = 0
+    while altitude > 0 and time < max_time:
+        # Air density at current altitude (barometric model, as in _atmospheric_density)
+        air_density = RHO_AIR_SEA_LEVEL * math.exp(-altitude / AIR_SCALE_HEIGHT)
+
+        # Calculate Reynolds number and corresponding drag coefficient
+        reynolds_number = abs(vertical_velocity) * CANOPY_SIZE / KINEMATIC_VISCOSITY
+        drag_coefficient = _calculate_drag_coefficient(reynolds_number)
+
+        # Apply turbulence and gust effects
+        effective_drag_coeff = drag_coefficient * turbulence_list[step] * gust_list[step]
+
+        # Drag force (opposes motion direction)
+        total_velocity = math.sqrt(vertical_velocity**2 + horizontal_velocity**2)
+        if total_velocity > 0:
+            drag_force = 0.5 * air_density * effective_drag_coeff * base_area * total_velocity**2
+            drag_vertical = drag_force * (vertical_velocity / total_velocity)
+            drag_horizontal = drag_force * (horizontal_velocity / total_velocity)
+        else:
+            drag_force = 0
+            drag_vertical = 0
+            drag_horizontal = 0
+
+        # Pendulum dynamics for sway (restoring force toward vertical)
+        restoring_torque = -(GRAVITY / suspension_length) * math.sin(sway_angle)
+        sway_acceleration = restoring_torque - DAMPING_RATIO * sway_velocity
+
+        # Wind gusts add horizontal forces (reduced for realistic behavior)
+        horizontal_acceleration = (drag_horizontal / total_mass) + horizontal_gust_list[step]
+        vertical_acceleration = (weight - drag_vertical) / total_mass
+
+        # Update state using Euler integration with velocity limiting
+        vertical_velocity += vertical_acceleration * dt
+        horizontal_velocity += horizontal_acceleration * dt
+        sway_velocity += sway_acceleration * dt
+        sway_angle += sway_velocity * dt
+        vertical_velocity = -100.0 if vertical_velocity < -100 else 100.0 if vertical_velocity > 100 else vertical_velocity
+        horizontal_velocity = -20.0 if horizontal_velocity < -20 else 20.0 if horizontal_velocity > 20 else horizontal_velocity
+        sway_angle = -MAX_SWAY_ANGLE if sway_angle < -MAX_SWAY_ANGLE else MAX_SWAY_ANGLE if sway_angle > MAX_SWAY_ANGLE else sway_angle
+
+        altitude -= vertical_velocity * dt
+        time += dt
+        step += 1
+
+        altitudes[step] = altitude if altitude > 0 else 0.0
+        vertical_velocities[step] = vertical_velocity
+        horizontal_velocities[step] = horizontal_velocity
+        sway_angles[step] = sway_angle
+        drag_forces[step] = drag_force
+
+    size = step + 1
+    # Conditions each step was evaluated at: the state at the start of the step
+    reynolds_numbers = np.zeros(size)
+    reynolds_numbers[1:] = np.abs(vertical_velocities[: size - 1]) * CANOPY_SIZE / KINEMATIC_VISCOSITY
+    atmospheric_densities = np.full(size, RHO_AIR_SEA_LEVEL)
+    atmospheric_densities[1:] = RHO_AIR_SEA_LEVEL * np.exp(-altitudes[: size - 1] / AIR_SCALE_HEIGHT)
+    temperatures = np.full(size, AIR_TEMPERATURE_SEA_LEVEL)
+    temperatures[1:] = np.maximum(
+        AIR_TEMPERATURE_SEA_LEVEL - TEMPERATURE_LAPSE_RATE * altitudes[: size - 1], 216.65
+    )
+    recorded_gusts = np.ones(size)
+    recorded_gusts[1:] = gust_factors[: size - 1]
+
+    return DescentTrajectory(
+        times=step_times[:size],
+        altitudes=altitudes[:size],
+        vertical_velocities=vertical_velocities[:size],
+        horizontal_velocities=horizontal_velocities[:size],
+        sway_angles=sway_angles[:size],
+        drag_forces=drag_forces[:size],
+        reynolds_numbers=reynolds_numbers,
+        atmospheric_densities=atmospheric_densities,
+        temperatures=temperatures,
+        gust_factors=recorded_gusts,
+        statistics={
+            "steps": step,
+            "rhs_evaluations": step,
+            "ground_contact": bool(altitude <= 0),
+            # Euler stops on the first step below ground; the overshoot is its
+            # error in locating touchdown.
+            "ground_contact_error_m": max(0.0, -float(altitude)),
+        },
+    )
+
+
+def _integrate_descent(
+    system: Dict[str, float],
+    rng: np.random.Generator,
+    turbulence_sigma: float,
+    gust_profile: List[Dict[str, float]],
+) -> DescentTrajectory:
+    sway_angle = rng.uniform(-0.05, 0.05)  # Small initial angle from vertical
+    # Time accumulates in floating point, so allow a spare step past max_time.
+    steps = int(math.ceil(MAX_DESCENT_TIME / REPORTING_DT)) + 2
+    forcing = _draw_forcing(rng, turbulence_sigma, steps)
+    return _integrate_euler(system, forcing, gust_profile, sway_angle)
+
+
 def _cad_module():
     root = Path(__file__).resolve().parents[2]
     module_path = root / "cad" / SLUG / "model.py"
@@ -399,146 +612,23 @@ def plan() -> Dict[str, Any]:
     }
 
 
-def simulate(seed: int | None = None, scenario: str | None = None) -> Dict[str, Any]:
-    """Run comprehensive descent simulation with advanced physics and stability analysis.
-
-    Educational Note:
-    This simulation demonstrates the complex dynamics of parachute descent including:
-    - Reynolds number effects on drag coefficient
-    - Atmospheric density variation with altitude
-    - Pendulum-like oscillation and sway dynamics
-    - Turbulence and wind gust effects
-    """
-    scenario_name = scenario or _DEFAULT_SCENARIO
-    if scenario and (scenario_name not in _SCENARIOS):
-        raise ValueError(f"Unknown parachute scenario: {scenario}")
-
-    if scenario_name and scenario_name in _SCENARIOS:
-        config = _SCENARIOS[scenario_name]
-    else:
-        config = {
-            "description": "custom seed run",
-            "seed": seed if seed is not None else 0,
-            "turbulence_sigma": 0.05,
-            "gust_profile": [],
-        }
-
-    rng_seed = seed if seed is not None else int(config.get("seed", 0))
-    turbulence_sigma = float(config.get("turbulence_sigma", 0.05))
-    gust_profile = cast(List[Dict[str, float]], config.get("gust_profile", []))
-    rng = np.random.default_rng(rng_seed)
-
-    # Simulation parameters with higher precision
-    dt = 0.05  # seconds (smaller for better accuracy)
-    max_time = 300.0  # seconds (longer for high altitude descents)
-
-    # Calculate system parameters
-    base_area = CANOPY_SIZE ** 2
-    pyramid_height = CANOPY_SIZE * 0.8660254
-    slant_height = math.sqrt((CANOPY_SIZE/2)**2 + pyramid_height**2)
-    canopy_area = 2 * CANOPY_SIZE * slant_height
-
-    # Modern materials (using the same constants as in plan())
-    canopy_mass = canopy_area * MODERN_NYLON_DENSITY
-    frame_length = 4 * CANOPY_SIZE + 4 * math.sqrt(2) * (CANOPY_SIZE/2)
-    frame_mass = frame_length * MODERN_CARBON_DENSITY
-    total_mass = PAYLOAD_MASS + canopy_mass + frame_mass
-
-    # Initialize state variables
-    altitude = DEPLOYMENT_ALTITUDE
-    vertical_velocity = 0.0  # Start from rest (just deployed)
-    horizontal_velocity = 0.0
-    sway_angle = rng.uniform(-0.05, 0.05)  # Small initial angle from vertical
-    sway_velocity = 0.0  # Angular velocity
-    time = 0.0
-
-    # Storage for comprehensive trajectory data
-    times = [time]
-    altitudes = [altitude]
-    vertical_velocities = [vertical_velocity]
-    horizontal_velocities = [horizontal_velocity]
-    sway_angles = [sway_angle]
-    drag_forces = [0.0]
-    reynolds_numbers = [0.0]
-    atmospheric_densities = [RHO_AIR_SEA_LEVEL]
-    temperatures = [AIR_TEMPERATURE_SEA_LEVEL]
-    gust_factors = [1.0]
-
-    # Enhanced descent simulation with full physics
-    while altitude > 0 and time < max_time:
-        # Calculate atmospheric conditions at current altitude
-        air_density, temperature = _atmospheric_density(altitude)
-
-        # Calculate Reynolds number and corresponding drag coefficient
-        reynolds_number = _calculate_reynolds_number(abs(vertical_velocity), CANOPY_SIZE)
-        drag_coefficient = _calculate_drag_coefficient(reynolds_number)
-
-        # Apply turbulence and gust effects
-        turbulence = 1.0 + turbulence_sigma * rng.normal()
-        gust_factor = _gust_multiplier(gust_profile, time)
-        effective_drag_coeff = drag_coefficient * turbulence * gust_factor
-
-        # Calculate forces
-        weight = total_mass * GRAVITY
-        total_velocity = math.sqrt(vertical_velocity**2 + horizontal_velocity**2)
-
-        # Drag force (opposes motion direction)
-        if total_velocity > 0:
-            drag_force = 0.5 * air_density * effective_drag_coeff * base_area * total_velocity**2
-            drag_vertical = drag_force * (vertical_velocity / total_velocity)
-            drag_horizontal = drag_force * (horizontal_velocity / total_velocity)
-        else:
-            drag_force = 0
-            drag_vertical = 0
-            drag_horizontal = 0
-
-        # Pendulum dynamics for sway (restoring force toward vertical)
-        suspension_length = pyramid_height + 2.0  # Approximate suspension line length
-        restoring_torque = -(GRAVITY / suspension_length) * math.sin(sway_angle)
-        sway_acceleration = restoring_torque - DAMPING_RATIO * sway_velocity
-
-        # Wind gusts add horizontal forces (reduced for realistic behavior)
-        horizontal_gust = rng.normal(0, turbulence_sigma * 0.5)  # m/s horizontal gusts
-        horizontal_acceleration = (drag_horizontal / total_mass) + horizontal_gust
-
-        # Vertical dynamics
-        vertical_acceleration = (weight - drag_vertical) / total_mass
-
-        # Update state using Euler integration with velocity limiting
-        vertical_velocity += vertical_acceleration * dt
-        horizontal_velocity += horizontal_acceleration * dt
-        sway_velocity += sway_acceleration * dt
-        sway_angle += sway_velocity * dt
-
-        # Limit velocities to prevent numerical instability
-        vertical_velocity = max(-100, min(100, vertical_velocity))
-        horizontal_velocity = max(-20, min(20, horizontal_velocity))
-
-        # Limit sway angle to realistic values
-        sway_angle = max(-MAX_SWAY_ANGLE, min(MAX_SWAY_ANGLE, sway_angle))
-
-        # Update position
-        altitude -= vertical_velocity * dt
-        horizontal_velocity * dt
-        time += dt
-
-        # Store comprehensive data
-        times.append(time)
-        altitudes.append(max(0, altitude))
-        vertical_velocities.append(vertical_velocity)
-        horizontal_velocities.append(horizontal_velocity)
-        sway_angles.append(sway_angle)
-        drag_forces.append(drag_force)
-        reynolds_numbers.append(reynolds_number)
-        atmospheric_densities.append(air_density)
-        temperatures.append(temperature)
-        gust_factors.append(gust_factor)
-
-    # Calculate stability metrics
-    stability_metrics = _calculate_stability_metrics(sway_angles, vertical_velocities)
-
-    # Generate comprehensive visualization
-    artifact_dir = ensure_artifact_dir(SLUG)
+def _plot_descent_analysis(
+    path: Path,
+    scenario_name: str | None,
+    trajectory: DescentTrajectory,
+    total_mass: float,
+    pyramid_height: float,
+    dt: float,
+) -> None:
+    """Render the 2x3 descent analysis figure."""
+    times = trajectory.times.tolist()
+    altitudes = trajectory.altitudes.tolist()
+    vertical_velocities = trajectory.vertical_velocities.tolist()
+    sway_angles = trajectory.sway_angles.tolist()
+    drag_forces = trajectory.drag_forces.tolist()
+    reynolds_numbers = trajectory.reynolds_numbers.tolist()
+    atmospheric_densities = trajectory.atmospheric_densities.tolist()
+    temperatures = trajectory.temperatures.tolist()
 
     # Create 2x3 subplot layout for comprehensive analysis
     fig = plt.figure(figsize=(16, 12))
@@ -703,10 +793,76 @@ def simulate(seed: int | None = None, scenario: str | None = None) -> Dict[str,
     ax6.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plot_path = artifact_dir / "enhanced_descent_analysis.png"
-    plt.savefig(plot_path, dpi=150, bbox_inches="tight")
+    plt.savefig(path, dpi=150, bbox_inches="tight")
     plt.close()
 
+
+def simulate(
+    seed: int | None = None,
+    scenario: str | None = None,
+    *,
+    render: bool = True,
+) -> Dict[str, Any]:
+    """Run comprehensive descent simulation with advanced physics and stability analysis.
+
+    The descent is integrated with explicit Euler at fixed 0.05 s steps.
+    Step counts and the touchdown error are reported under
+    ``integration_statistics``.  ``render=False`` skips the
+    analysis figure; the trajectory CSV and every metric are still produced.
+
+    Educational Note:
+    This simulation demonstrates the complex dynamics of parachute descent including:
+    - Reynolds number effects on drag coefficient
+    - Atmospheric density variation with altitude
+    - Pendulum-like oscillation and sway dynamics
+    - Turbulence and wind gust effects
+    """
+    scenario_name = scenario or _DEFAULT_SCENARIO
+    if scenario and (scenario_name not in _SCENARIOS):
+        raise ValueError(f"Unknown parachute scenario: {scenario}")
+
+    if scenario_name and scenario_name in _SCENARIOS:
+        config = _SCENARIOS[scenario_name]
+    else:
+        config = {
+            "description": "custom seed run",
+            "seed": seed if seed is not None else 0,
+            "turbulence_sigma": 0.05,
+            "gust_profile": [],
+        }
+
+    rng_seed = seed if seed is not None else int(config.get("seed", 0))
+    turbulence_sigma = float(config.get("turbulence_sigma", 0.05))
+    gust_profile = cast(List[Dict[str, float]], config.get("gust_profile", []))
+    rng = np.random.default_rng(rng_seed)
+    dt = REPORTING_DT
+
+    system = _system_properties()
+    pyramid_height = system["pyramid_height"]
+    total_mass = system["total_mass"]
+    trajectory = _integrate_descent(system, rng, turbulence_sigma, gust_profile)
+
+    times = trajectory.times.tolist()
+    altitudes = trajectory.altitudes.tolist()
+    vertical_velocities = trajectory.vertical_velocities.tolist()
+    horizontal_velocities = trajectory.horizontal_velocities.tolist()
+    sway_angles = trajectory.sway_angles.tolist()
+    drag_forces = trajectory.drag_forces.tolist()
+    reynolds_numbers = trajectory.reynolds_numbers.tolist()
+    atmospheric_densities = trajectory.atmospheric_densities.tolist()
+    temperatures = trajectory.temperatures.tolist()
+    gust_factors = trajectory.gust_factors.tolist()
+
+    # Calculate stability metrics
+    stability_metrics = _calculate_stability_metrics(sway_angles, vertical_velocities)
+
+    artifact_dir = ensure_artifact_dir(SLUG)
+    artifacts: Dict[str, str] = {}
+    if render:
+        plot_path = artifact_dir / "enhanced_descent_analysis.png"
+        _plot_descent_analysis(plot_path, scenario_name, trajectory, total_mass, pyramid_height, dt)
+        artifacts["comprehensive_plot"] = str(plot_path)
+
     # Save comprehensive trajectory data
     csv_path = artifact_dir / "comprehensive_trajectory.csv"
     with open(csv_path, "w", newline="") as f:
@@ -716,20 +872,21 @@ def simulate(seed: int | None = None, scenario: str | None = None) -> Dict[str,
             "sway_angle_rad", "sway_angle_deg", "drag_force_N", "reynolds_number",
             "air_density_kg_m3", "temperature_K", "gust_factor"
         ])
-        for i in range(len(times)):
-            writer.writerow([
-                times[i], altitudes[i], vertical_velocities[i], horizontal_velocities[i],
-                sway_angles[i], math.degrees(sway_angles[i]), drag_forces[i],
-                reynolds_numbers[i], atmospheric_densities[i], temperatures[i], gust_factors[i]
-            ])
+        writer.writerows(zip(
+            times, altitudes, vertical_velocities, horizontal_velocities,
+            sway_angles, np.degrees(trajectory.sway_angles).tolist(), drag_forces,
+            reynolds_numbers, atmospheric_densities, temperatures, gust_factors
+        ))
+    artifacts["trajectory_csv"] = str(csv_path)
 
     # Calculate comprehensive performance metrics
     weight = total_mass * GRAVITY
     max_drag = max(drag_forces)
+    drag_coefficients = _drag_coefficients(trajectory.reynolds_numbers)
     landing_velocity = vertical_velocities[-1]
     kinetic_energy_landing = 0.5 * total_mass * landing_velocity**2
 
-    payload = {
+    payload: Dict[str, Any] = {
         "performance_metrics": {
             "descent_time_s": times[-1],
             "landing_velocity_ms": landing_velocity,
@@ -744,7 +901,7 @@ def simulate(seed: int | None = None, scenario: str | None = None) -> Dict[str,
             "max_reynolds_number": max(reynolds_numbers),
             "min_reynolds_number": min(r for r in reynolds_numbers if r > 0),
             "avg_reynolds_number": np.mean([r for r in reynolds_numbers if r > 0]),
-            "drag_coefficient_range": f"{min(_calculate_drag_coefficient(r) for r in reynolds_numbers if r > 0):.3f} - {max(_calculate_drag_coefficient(r) for r in reynolds_numbers):.3f}",
+            "drag_coefficient_range": f"{drag_coefficients[trajectory.reynolds_numbers > 0].min():.3f} - {drag_coefficients.max():.3f}",
             "weight_to_drag_ratio": weight / max_drag if max_drag > 0 else float("inf")
         },
         "stability_assessment": {
@@ -771,6 +928,7 @@ def simulate(seed: int | None = None, scenario: str | None = None) -> Dict[str,
             "integration_dt": dt,
             "initial_altitude_m": DEPLOYMENT_ALTITUDE
         },
+        "integration_statistics": trajectory.statistics,
         "educational_summary": {
             "key_physics_demonstrated": [
                 "Terminal velocity achieved when drag equals weight",
@@ -782,10 +940,7 @@ def simulate(seed: int | None = None, scenario: str | None = None) -> Dict[str,
             "historical_significance": "Leonardo's concept validated by modern physics",
             "engineering_achievements": "Modern materials enable 400-year-old vision"
         },
-        "artifacts": {
-            "comprehensive_plot": str(plot_path),
-            "trajectory_csv": str(csv_path)
-        }
+        "artifacts": artifacts
     }
 
     payload.update(
@@ -629,7 +629,7 @@ def _render_animation(path: Path) -> None:
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     """Generate structural curves, CSV data, and rotation animation."""
     del seed  # deterministic simulation
     sim_dir = ensure_artifact_dir(SLUG, subdir="sim")
@@ -639,10 +639,12 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     csv_path = sim_dir / "rotation_metrics.csv"
     _write_rotation_csv(csv_path, rotation)
 
-    artifacts = _render_plots(sim_dir, rotation, load_curve)
-    animation_path = sim_dir / "rotation_animation.gif"
-    _render_animation(animation_path)
-    artifacts.append(animation_path)
+    artifacts: List[Path] = []
+    if render:
+        artifacts = _render_plots(sim_dir, rotation, load_curve)
+        animation_path = sim_dir / "rotation_animation.gif"
+        _render_animation(animation_path)
+        artifacts.append(animation_path)
     artifacts.append(csv_path)
 
     stress_peak = float(rotation["stress_Pa"].max() / 1e6)
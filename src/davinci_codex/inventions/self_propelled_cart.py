@@ -699,7 +699,7 @@ def _render_motion(path: Path, result: SimulationResult) -> None:
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     """Enhanced simulation with comprehensive analysis and educational insights."""
     del seed
     params = _load_parameters()
@@ -711,8 +711,11 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     plot_path = artifacts_dir / "comprehensive_analysis.png"
     motion_gif = artifacts_dir / "enhanced_motion.gif"
     _write_csv(csv_path, result)
-    _plot_profiles(plot_path, result)
-    _render_motion(motion_gif, result)
+    artifacts = [str(csv_path)]
+    if render:
+        _plot_profiles(plot_path, result)
+        _render_motion(motion_gif, result)
+        artifacts += [str(plot_path), str(motion_gif)]
 
     # Calculate comprehensive performance metrics
     travel_distance = float(result.position[-1])
@@ -746,7 +749,7 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     ]
 
     payload = {
-        "artifacts": [str(csv_path), str(plot_path), str(motion_gif)],
+        "artifacts": artifacts,
         "performance_metrics": {
             "distance_m": travel_distance,
             "runtime_s": runtime,
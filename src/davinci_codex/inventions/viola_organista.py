@@ -183,7 +183,7 @@ def _plot_sequence(path: Path, data: Dict[str, np.ndarray]) -> None:
     plt.close(fig)
 
 
-def simulate(seed: int = 0) -> Dict[str, object]:
+def simulate(seed: int = 0, *, render: bool = True) -> Dict[str, object]:
     params = _load_params()
     data = _simulate(params, seed)
     artifacts_dir = ensure_artifact_dir(SLUG, subdir="sim")
@@ -192,8 +192,10 @@ def simulate(seed: int = 0) -> Dict[str, object]:
     artifacts: List[str] = []
     if data["time_s"].size:
         _write_csv(csv_path, data)
-        _plot_sequence(plot_path, data)
-        artifacts = [str(csv_path), str(plot_path)]
+        artifacts = [str(csv_path)]
+        if render:
+            _plot_sequence(plot_path, data)
+            artifacts.append(str(plot_path))
     return {
         "artifacts": artifacts,
         "mean_frequency_hz": float(np.mean(data["ideal_frequency_hz"])) if data["ideal_frequency_hz"].size else 0.0,
@@ -1,15 +1,32 @@
-"""Utilities for discovering and interacting with invention modules."""
+"""Utilities for discovering and interacting with invention modules.
+
+Lookups are backed by a persistent slug → module manifest.  The manifest is
+built by statically parsing the invention sources (no imports), stored on disk
+and refreshed only for modules whose mtime or size changed.  Resolved specs
+are memoised in-process so repeated lookups import nothing.
+"""
 
 from __future__ import annotations
 
+import ast
+import inspect
+import json
 import os
-import pkgutil
+import threading
 from collections.abc import Iterable
 from dataclasses import dataclass
 from functools import wraps
 from importlib import import_module
+from pathlib import Path
 from types import ModuleType
-from typing import Callable, Dict, List, Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol
+
+_INVENTIONS_PACKAGE = "davinci_codex.inventions"
+_REQUIRED_HOOKS = ("plan", "simulate", "build", "evaluate")
+_BATCH_HOOK = "simulate_batch"  # optional: simulate_batch(seeds) -> one payload per seed
+_METADATA_FIELDS = ("SLUG", "TITLE", "STATUS", "SUMMARY")
+_MANIFEST_VERSION = 1
+_MANIFEST_ENV = "DAVINCI_REGISTRY_MANIFEST"
 
 
 class InventionModule(Protocol):
@@ -21,7 +38,7 @@ class InventionModule(Protocol):
     SUMMARY: str
 
     plan: Callable[[], Dict[str, object]]
-    simulate: Callable[[int], Dict[str, object]]
+    simulate: Callable[..., Dict[str, object]]  # simulate(seed, *, render=True)
     build: Callable[[], None]
     evaluate: Callable[[], Dict[str, object]]
 
@@ -38,84 +55,353 @@ class InventionSpec:
         return hook(self.module)
 
 
-def _iter_invention_modules() -> Iterable[ModuleType]:
-    package = import_module("davinci_codex.inventions")
-    package_path = getattr(package, "__path__", None)
+@dataclass
+class ManifestEntry:
+    """Statically extracted metadata for a single invention module."""
+
+    slug: str
+    module: str
+    title: str
+    status: str
+    summary: str
+    path: str
+    mtime_ns: int
+    size: int
+
+
+_LOCK = threading.RLock()
+_SPECS: Dict[str, InventionSpec] = {}
+_MANIFEST: Optional[Dict[str, ManifestEntry]] = None
+_ALL_LOADED = False
+
+
+def _package_root() -> Path:
+    package = import_module(_INVENTIONS_PACKAGE)
+    package_path = list(getattr(package, "__path__", []))
     if not package_path:
-        return []
-    modules: List[ModuleType] = []
-    for module_info in pkgutil.walk_packages(package_path, package.__name__ + "."):
-        if module_info.name.rsplit(".", 1)[-1].startswith("_"):
+        raise RuntimeError(f"{_INVENTIONS_PACKAGE} is not a package")
+    return Path(package_path[0])
+
+
+def manifest_path() -> Path:
+    """Return the on-disk location of the persistent registry manifest."""
+    override = os.getenv(_MANIFEST_ENV)
+    if override:
+        return Path(override)
+    cache_home = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "davinci_codex" / "registry_manifest.json"
+
+
+def _iter_module_files(root: Path, prefix: str) -> Iterable[tuple[str, Path]]:
+    """Yield ``(module_name, path)`` pairs mirroring ``pkgutil.walk_packages``."""
+    for path in sorted(root.iterdir()):
+        name = path.stem if path.suffix == ".py" else path.name
+        if name.startswith("_"):
             continue
-        module = import_module(module_info.name)
-        modules.append(module)
-    return modules
+        if path.is_dir() and (path / "__init__.py").exists():
+            yield f"{prefix}.{name}", path / "__init__.py"
+            yield from _iter_module_files(path, f"{prefix}.{name}")
+        elif path.suffix == ".py":
+            yield f"{prefix}.{name}", path
+
+
+def _static_metadata(path: Path) -> Optional[Dict[str, Any]]:
+    """Extract contract metadata without importing the module.
+
+    Returns ``None`` when the source cannot be resolved statically, in which
+    case the caller falls back to importing the module.
+    """
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+    constants: Dict[str, str] = {}
+    names: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                names.add(target.id)
+                value = node.value
+                if (
+                    target.id in _METADATA_FIELDS
+                    and isinstance(value, ast.Constant)
+                    and isinstance(value.value, str)
+                ):
+                    constants[target.id] = value.value
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                names.add((alias.asname or alias.name).split(".")[0])
+    if not all(hook in names for hook in _REQUIRED_HOOKS):
+        # Hooks might be injected dynamically; let the import fallback decide.
+        return None
+    if "SLUG" in names and "SLUG" not in constants:
+        return None
+    return {"hooks": True, **constants}
+
+
+def _imported_metadata(module_name: str) -> Dict[str, Any]:
+    module = import_module(module_name)
+    metadata: Dict[str, Any] = {
+        "hooks": all(hasattr(module, attr) for attr in _REQUIRED_HOOKS),
+    }
+    for field in _METADATA_FIELDS:
+        value = getattr(module, field, None)
+        if isinstance(value, str):
+            metadata[field] = value
+    return metadata
+
+
+def _manifest_entry(module_name: str, path: Path, stat: os.stat_result) -> Optional[ManifestEntry]:
+    metadata = _static_metadata(path)
+    if metadata is None:
+        metadata = _imported_metadata(module_name)
+    if not metadata.get("hooks"):
+        return None
+    slug = metadata.get("SLUG", module_name.rsplit(".", 1)[-1])
+    return ManifestEntry(
+        slug=slug,
+        module=module_name,
+        title=metadata.get("TITLE", slug.replace("_", " ").title()),
+        status=metadata.get("STATUS", "unknown"),
+        summary=metadata.get("SUMMARY", ""),
+        path=str(path),
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+    )
+
+
+def _read_manifest_file(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _MANIFEST_VERSION:
+        return {}
+    modules = payload.get("modules")
+    return modules if isinstance(modules, dict) else {}
+
+
+def _write_manifest_file(path: Path, modules: Dict[str, Dict[str, Any]]) -> None:
+    payload = {"version": _MANIFEST_VERSION, "modules": modules}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError:  # pragma: no cover - read-only home directories
+        pass
+
+
+def load_manifest(*, refresh: bool = False) -> Dict[str, ManifestEntry]:
+    """Return the slug → :class:`ManifestEntry` map, rebuilding stale entries.
+
+    Only the invention sources are ``stat``-ed on a warm start; modules whose
+    mtime or size changed since the manifest was written are re-parsed.  Pass
+    ``refresh=True`` to re-validate against disk within a running process.
+    """
+    global _MANIFEST
+    with _LOCK:
+        if _MANIFEST is not None and not refresh:
+            return _MANIFEST
+
+        location = manifest_path()
+        stored = _read_manifest_file(location)
+        modules: Dict[str, Dict[str, Any]] = {}
+        dirty = not stored
+        for module_name, path in _iter_module_files(_package_root(), _INVENTIONS_PACKAGE):
+            stat = path.stat()
+            cached = stored.get(module_name)
+            if (
+                isinstance(cached, dict)
+                and cached.get("path") == str(path)
+                and cached.get("mtime_ns") == stat.st_mtime_ns
+                and cached.get("size") == stat.st_size
+            ):
+                modules[module_name] = cached
+                continue
+            dirty = True
+            entry = _manifest_entry(module_name, path, stat)
+            # Non-invention modules are still recorded so they are not re-parsed.
+            modules[module_name] = (
+                entry.__dict__
+                if entry is not None
+                else {"path": str(path), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            )
+        if dirty or set(modules) != set(stored):
+            _write_manifest_file(location, modules)
+
+        manifest: Dict[str, ManifestEntry] = {}
+        for record in modules.values():
+            if "slug" in record:
+                entry = ManifestEntry(**record)
+                manifest[entry.slug] = entry
+        _MANIFEST = manifest
+        return manifest
+
+
+def clear_registry_cache() -> None:
+    """Forget memoised specs and the in-process manifest (mainly for tests)."""
+    global _MANIFEST, _ALL_LOADED
+    with _LOCK:
+        _SPECS.clear()
+        _MANIFEST = None
+        _ALL_LOADED = False
+
+
+def _iter_invention_modules() -> Iterable[ModuleType]:
+    return [import_module(entry.module) for entry in load_manifest().values()]
+
+
+def _fast_payload(seed: object) -> Dict[str, object]:
+    return {
+        "status": "success-fast",
+        "performance": {
+            "mode": "fast",
+            "seed": seed,
+        },
+        "artifacts": {},
+    }
+
+
+def _normalise_result(result: object) -> Dict[str, object]:
+    if not isinstance(result, dict):
+        raise TypeError("Simulation must return a dictionary")
+    result.setdefault("status", "success")
+    performance = result.setdefault("performance", {})
+    if not isinstance(performance, dict):
+        result["performance"] = {"summary": performance}
+    return result
+
+
+def _accepts_render(function: Callable[..., object]) -> bool:
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        parameter.name == "render" or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
 
 
 def _wrap_simulation(simulate: Callable[..., Dict[str, object]]) -> Callable[..., Dict[str, object]]:
-    """Ensure simulation outputs include the standard contract expected by CI."""
+    """Ensure simulation outputs include the standard contract expected by CI.
+
+    Every wrapped ``simulate`` accepts ``render``.  ``render=False`` asks for
+    full physics results without figures; it is dropped for inventions that
+    produce no figures and therefore do not declare it.
+    """
 
     if getattr(simulate, "__wrapped__", None):  # avoid double wrapping
         return simulate
 
+    accepts_render = _accepts_render(simulate)
+
     @wraps(simulate)
     def wrapper(*args, **kwargs) -> Dict[str, object]:
+        if not accepts_render:
+            kwargs.pop("render", None)
         if os.getenv("DAVINCI_FAST_SIM"):
             seed = kwargs.get("seed")
             if seed is None and args:
                 seed = args[0]
-            return {
-                "status": "success-fast",
-                "performance": {
-                    "mode": "fast",
-                    "seed": seed,
-                },
-                "artifacts": {},
-            }
-        result = simulate(*args, **kwargs)
-        if not isinstance(result, dict):
-            raise TypeError("Simulation must return a dictionary")
-        result.setdefault("status", "success")
-        performance = result.setdefault("performance", {})
-        if not isinstance(performance, dict):
-            result["performance"] = {"summary": performance}
-        return result
+            return _fast_payload(seed)
+        return _normalise_result(simulate(*args, **kwargs))
 
     return wrapper
 
 
+def _wrap_batch_simulation(
+    simulate_batch: Callable[..., List[Dict[str, object]]]
+) -> Callable[..., List[Dict[str, object]]]:
+    """Apply the ``simulate`` contract to each payload of a batch entry point."""
+
+    if getattr(simulate_batch, "__wrapped__", None):
+        return simulate_batch
+
+    @wraps(simulate_batch)
+    def wrapper(seeds, *args, **kwargs) -> List[Dict[str, object]]:
+        seeds = list(seeds)
+        if os.getenv("DAVINCI_FAST_SIM"):
+            return [_fast_payload(seed) for seed in seeds]
+        results = list(simulate_batch(seeds, *args, **kwargs))
+        if len(results) != len(seeds):
+            raise ValueError(
+                f"Batch simulation returned {len(results)} results for {len(seeds)} seeds"
+            )
+        return [_normalise_result(result) for result in results]
+
+    return wrapper
+
+
+def _build_spec(module: ModuleType) -> Optional[InventionSpec]:
+    if not all(hasattr(module, attr) for attr in _REQUIRED_HOOKS):
+        return None
+    simulate = module.simulate  # type: ignore[attr-defined]
+    if callable(simulate):
+        wrapped = _wrap_simulation(simulate)
+        module.simulate = wrapped  # type: ignore[attr-defined]
+    simulate_batch = getattr(module, _BATCH_HOOK, None)
+    if callable(simulate_batch):
+        setattr(module, _BATCH_HOOK, _wrap_batch_simulation(simulate_batch))
+    slug = getattr(module, "SLUG", module.__name__.rsplit(".", 1)[-1])
+    title = getattr(module, "TITLE", slug.replace("_", " ").title())
+    status = getattr(module, "STATUS", "unknown")
+    summary = getattr(module, "SUMMARY", "")
+    return InventionSpec(
+        slug=slug,
+        title=title,
+        status=status,
+        summary=summary,
+        module=module,  # type: ignore[arg-type]
+    )
+
+
+def _load_spec(entry: ManifestEntry) -> Optional[InventionSpec]:
+    spec = _SPECS.get(entry.slug)
+    if spec is not None:
+        return spec
+    spec = _build_spec(import_module(entry.module))
+    if spec is not None:
+        _SPECS[spec.slug] = spec
+    return spec
+
+
 def discover_inventions() -> Dict[str, InventionSpec]:
     """Discover all invention modules available in the package."""
-    specs: Dict[str, InventionSpec] = {}
-    for module in _iter_invention_modules():
-        required_attrs = ["plan", "simulate", "build", "evaluate"]
-        if not all(hasattr(module, attr) for attr in required_attrs):
-            continue
-        simulate = module.simulate  # type: ignore[attr-defined]
-        if callable(simulate):
-            wrapped = _wrap_simulation(simulate)
-            module.simulate = wrapped  # type: ignore[attr-defined]
-        slug = getattr(module, "SLUG", module.__name__.rsplit(".", 1)[-1])
-        title = getattr(module, "TITLE", slug.replace("_", " ").title())
-        status = getattr(module, "STATUS", "unknown")
-        summary = getattr(module, "SUMMARY", "")
-        spec = InventionSpec(
-            slug=slug,
-            title=title,
-            status=status,
-            summary=summary,
-            module=module,  # type: ignore[arg-type]
-        )
-        specs[slug] = spec
-    return specs
+    global _ALL_LOADED
+    with _LOCK:
+        if not _ALL_LOADED:
+            for entry in load_manifest().values():
+                _load_spec(entry)
+            _ALL_LOADED = True
+        return dict(_SPECS)
 
 
 def get_invention(slug: str) -> InventionSpec:
-    try:
-        return discover_inventions()[slug]
-    except KeyError as exc:  # pragma: no cover - user input guard
-        available = ", ".join(sorted(discover_inventions()))
-        raise ValueError(f"Unknown invention slug '{slug}'. Available: {available}") from exc
+    """Resolve a single invention, importing only the module that defines it."""
+    with _LOCK:
+        spec = _SPECS.get(slug)
+        if spec is not None:
+            return spec
+        manifest = load_manifest()
+        entry = manifest.get(slug)
+        if entry is None:
+            # The file may have been added since the manifest was loaded.
+            manifest = load_manifest(refresh=True)
+            entry = manifest.get(slug)
+        spec = _load_spec(entry) if entry is not None else None
+        if spec is None or spec.slug != slug:
+            available = ", ".join(sorted(manifest))
+            raise ValueError(f"Unknown invention slug '{slug}'. Available: {available}")
+        return spec
 
 
 def list_inventions() -> List[InventionSpec]:
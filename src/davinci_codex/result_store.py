@@ -0,0 +1,314 @@
+"""Columnar storage backends for sweep run results and metric tables.
+
+Two backends are available:
+
+``json``
+    The original layout: a pretty-printed ``result.json`` per run plus wide
+    ``runs.csv`` tables, streamed from a ``runs.jsonl`` row log.
+``npz``
+    Numeric arrays are stored natively in an uncompressed ``result.npz`` per
+    run alongside the pre-flattened metric names/values, so cache hits never
+    re-parse or re-flatten the result document.  Sweep metrics are appended
+    in fixed-size column blocks while the sweep runs and merged, one block at
+    a time, into a ``(n_runs, n_metrics)`` float64 table of ``.npy`` files
+    that can be memory-mapped.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import shutil
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .artifacts import ARTIFACT_STORE
+
+STORE_BACKENDS = ("json", "npz")
+
+_ARRAY_MARKER = "__array__"
+_DOCUMENT_KEY = "__document__"
+_METRIC_NAMES_KEY = "__metric_names__"
+_METRIC_VALUES_KEY = "__metric_values__"
+_TABLE_COLUMNS = "columns.json"
+_TABLE_SEEDS = "seeds.npy"
+_TABLE_VALUES = "values.npy"
+_TABLE_BLOCKS = ".blocks"
+_TABLE_BLOCK_ROWS = 256
+_ROW_SEED = "seed"
+
+
+def _is_numeric_list(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in value)
+    )
+
+
+def _split_arrays(payload: Any, arrays: Dict[str, np.ndarray], prefix: str = "") -> Any:
+    """Replace numeric lists with markers, collecting them as native arrays."""
+    if isinstance(payload, dict):
+        return {
+            key: _split_arrays(value, arrays, f"{prefix}.{key}" if prefix else str(key))
+            for key, value in payload.items()
+        }
+    if _is_numeric_list(payload):
+        key = f"array:{prefix}"
+        arrays[key] = np.asarray(payload)
+        return {_ARRAY_MARKER: key}
+    if isinstance(payload, list):
+        return [
+            _split_arrays(value, arrays, f"{prefix}[{index}]")
+            for index, value in enumerate(payload)
+        ]
+    return payload
+
+
+def _join_arrays(document: Any, archive: Any) -> Any:
+    if isinstance(document, dict):
+        if set(document) == {_ARRAY_MARKER}:
+            return archive[document[_ARRAY_MARKER]].tolist()
+        return {key: _join_arrays(value, archive) for key, value in document.items()}
+    if isinstance(document, list):
+        return [_join_arrays(value, archive) for value in document]
+    return document
+
+
+@dataclass(frozen=True)
+class MetricsTable:
+    """A sweep's metrics as a dense table (missing values are NaN)."""
+
+    seeds: np.ndarray
+    columns: List[str]
+    values: np.ndarray
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[:, self.columns.index(name)]
+
+    def row(self, index: int) -> Dict[str, float]:
+        return {
+            name: float(value)
+            for name, value in zip(self.columns, self.values[index])
+            if not np.isnan(value)
+        }
+
+
+def run_artifact_name(store: str) -> str:
+    if store not in STORE_BACKENDS:
+        raise ValueError(f"Unknown result store '{store}'. Available: {', '.join(STORE_BACKENDS)}")
+    return "result.npz" if store == "npz" else "result.json"
+
+
+def write_run_npz(path: Path, result: Dict[str, Any], metrics: Dict[str, float]) -> None:
+    """Write a run result with native arrays and its flattened metrics."""
+    arrays: Dict[str, Any] = {}
+    document = _split_arrays(result, arrays)
+    arrays[_DOCUMENT_KEY] = np.asarray(json.dumps(document, separators=(",", ":")))
+    arrays[_METRIC_NAMES_KEY] = np.asarray(list(metrics), dtype=np.str_)
+    arrays[_METRIC_VALUES_KEY] = np.fromiter(metrics.values(), dtype=np.float64, count=len(metrics))
+    ARTIFACT_STORE.write_with(path, lambda handle: np.savez(handle, **arrays))
+
+
+def read_run_metrics(path: Path) -> Dict[str, float]:
+    """Load only the flattened metrics of an ``.npz`` run artifact."""
+    with np.load(path, allow_pickle=False) as archive:
+        names = archive[_METRIC_NAMES_KEY].tolist()
+        values = archive[_METRIC_VALUES_KEY].tolist()
+    return dict(zip(names, values))
+
+
+def load_run_result(path: Path) -> Dict[str, Any]:
+    """Reconstruct the full result document from a run artifact of either backend."""
+    path = Path(path)
+    if path.suffix == ".json":
+        with path.open("r", encoding="utf-8") as handle:
+            document: Dict[str, Any] = json.load(handle)
+        return document
+    with np.load(path, allow_pickle=False) as archive:
+        document = _join_arrays(json.loads(str(archive[_DOCUMENT_KEY])), archive)
+    return document
+
+
+def _write_npy_stream(
+    path: Path, dtype: np.dtype, shape: Tuple[int, ...], chunks: Iterable[np.ndarray]
+) -> int:
+    """Write an ``.npy`` file whose rows arrive chunk by chunk."""
+
+    def _write(stream: IO[bytes]) -> None:
+        header = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": shape}
+        np.lib.format.write_array_header_1_0(stream, header)
+        for chunk in chunks:
+            stream.write(np.ascontiguousarray(chunk, dtype=dtype).tobytes())
+
+    return ARTIFACT_STORE.write_with(path, _write)
+
+
+class MetricsTableWriter:
+    """Append sweep rows to a metrics table without holding the table in memory.
+
+    Rows are buffered up to ``block_rows`` and then flushed as a column block
+    (seeds, that block's column names and a dense value matrix).  Leaving the
+    ``with`` block merges the blocks into the table read by
+    :func:`load_metrics_table`, one block at a time; if the block raises the
+    partial table is discarded.
+    """
+
+    def __init__(self, directory: Path, *, block_rows: int = _TABLE_BLOCK_ROWS) -> None:
+        self.directory = Path(directory)
+        self.block_rows = block_rows
+        self.columns: Set[str] = set()
+        self.rows = 0
+        self._blocks: List[Path] = []
+        self._seeds: List[int] = []
+        self._buffer: List[Dict[str, float]] = []
+
+    def __enter__(self) -> MetricsTableWriter:
+        shutil.rmtree(self.directory / _TABLE_BLOCKS, ignore_errors=True)
+        (self.directory / _TABLE_BLOCKS).mkdir(parents=True)
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        try:
+            if exc_type is None:
+                self._flush()
+                self._merge()
+        finally:
+            shutil.rmtree(self.directory / _TABLE_BLOCKS, ignore_errors=True)
+
+    def append(self, seed: int, metrics: Dict[str, float]) -> None:
+        self.columns.update(metrics)
+        self._seeds.append(seed)
+        self._buffer.append(metrics)
+        self.rows += 1
+        if len(self._buffer) >= self.block_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        columns = sorted({name for row in self._buffer for name in row})
+        index = {name: position for position, name in enumerate(columns)}
+        values = np.full((len(self._buffer), len(columns)), np.nan, dtype=np.float64)
+        for row_index, row in enumerate(self._buffer):
+            for name, value in row.items():
+                values[row_index, index[name]] = value
+        block = self.directory / _TABLE_BLOCKS / f"block-{len(self._blocks):06d}.npz"
+        np.savez(
+            block,
+            seeds=np.asarray(self._seeds, dtype=np.int64),
+            columns=np.asarray(columns, dtype=np.str_),
+            values=values,
+        )
+        self._blocks.append(block)
+        self._seeds = []
+        self._buffer = []
+
+    def _iter_blocks(self) -> Iterator[Tuple[np.ndarray, List[str], np.ndarray]]:
+        for block in self._blocks:
+            with np.load(block, allow_pickle=False) as archive:
+                yield archive["seeds"], archive["columns"].tolist(), archive["values"]
+
+    def _merge(self) -> None:
+        columns = sorted(self.columns)
+        index = {name: position for position, name in enumerate(columns)}
+
+        def _aligned() -> Iterator[np.ndarray]:
+            for _, block_columns, values in self._iter_blocks():
+                aligned = np.full((values.shape[0], len(columns)), np.nan, dtype=np.float64)
+                aligned[:, [index[name] for name in block_columns]] = values
+                yield aligned
+
+        _write_npy_stream(
+            self.directory / _TABLE_SEEDS,
+            np.dtype(np.int64),
+            (self.rows,),
+            (seeds for seeds, _, _ in self._iter_blocks()),
+        )
+        _write_npy_stream(
+            self.directory / _TABLE_VALUES,
+            np.dtype(np.float64),
+            (self.rows, len(columns)),
+            _aligned(),
+        )
+        ARTIFACT_STORE.write_json(self.directory / _TABLE_COLUMNS, columns, indent=None)
+
+
+def write_metrics_table(
+    directory: Path, seeds: Sequence[int], rows: Sequence[Dict[str, float]]
+) -> Path:
+    """Write per-run metrics as one dense, memory-mappable table."""
+    with MetricsTableWriter(directory) as table:
+        for seed, row in zip(seeds, rows):
+            table.append(seed, row)
+    return directory
+
+
+def load_metrics_table(directory: Path, *, mmap: bool = True) -> MetricsTable:
+    """Load a metrics table, memory-mapping the value matrix by default."""
+    directory = Path(directory)
+    mode: Optional[Literal["r"]] = "r" if mmap else None
+    columns = json.loads((directory / _TABLE_COLUMNS).read_text(encoding="utf-8"))
+    return MetricsTable(
+        seeds=np.load(directory / _TABLE_SEEDS, mmap_mode=mode),
+        columns=columns,
+        values=np.load(directory / _TABLE_VALUES, mmap_mode=mode),
+    )
+
+
+class RunRowWriter:
+    """Append per-run metric rows to a JSON-lines log as runs complete.
+
+    Use as a context manager: the log is published atomically when the block
+    exits cleanly and discarded if it raises.  Only the set of column names
+    stays in memory; :func:`write_rows_csv` turns the log into a wide CSV
+    without loading it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.columns: Set[str] = set()
+        self.rows = 0
+        self._stack = ExitStack()
+        self._handle: IO[bytes] | None = None
+
+    def __enter__(self) -> RunRowWriter:
+        self._handle = self._stack.enter_context(ARTIFACT_STORE.open_write(self.path))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return bool(self._stack.__exit__(*exc_info))
+
+    def append(self, seed: int, metrics: Dict[str, float]) -> None:
+        assert self._handle is not None, "RunRowWriter used outside its with block"
+        self.columns.update(metrics)
+        row = {_ROW_SEED: seed, **metrics}
+        self._handle.write(json.dumps(row, separators=(",", ":")).encode("utf-8") + b"\n")
+        self.rows += 1
+
+
+def iter_run_rows(path: Path) -> Iterator[Dict[str, float]]:
+    """Yield the ``{"seed": ..., <metric>: ...}`` rows of a run log in order."""
+    with Path(path).open("r", encoding="utf-8") as handle:
+        for line in handle:
+            yield json.loads(line)
+
+
+def write_rows_csv(path: Path, rows_path: Path, columns: Set[str]) -> int:
+    """Stream a run log into a wide CSV whose header covers ``columns``."""
+    fieldnames = sorted(columns | {_ROW_SEED})
+
+    def _write(stream: IO[bytes]) -> None:
+        text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        writer = csv.DictWriter(text, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(iter_run_rows(rows_path))
+        text.flush()
+        text.detach()
+
+    return ARTIFACT_STORE.write_with(path, _write)
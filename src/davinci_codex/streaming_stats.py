@@ -0,0 +1,171 @@
+"""Constant-memory running statistics for sweep aggregation.
+
+``RunningStats`` combines Welford's online mean/variance with P² quantile
+estimators (Jain & Chlamtac, 1985), so summarising a metric costs a fixed
+handful of floats no matter how many samples stream through it.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_QUANTILES: Tuple[float, ...] = (0.05, 0.5, 0.95)
+
+
+def _interpolated_quantile(ordered: Sequence[float], probability: float) -> float:
+    """Linear-interpolation quantile (matches ``numpy.quantile`` defaults)."""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = probability * (len(ordered) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = position - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+class P2Quantile:
+    """Streaming estimate of a single quantile using five markers.
+
+    The first five observations are kept verbatim so small sweeps report exact
+    quantiles; afterwards the marker heights are adjusted with the piecewise
+    parabolic update of the P² algorithm.
+    """
+
+    __slots__ = ("probability", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, probability: float) -> None:
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError("Quantile probability must lie in [0, 1]")
+        self.probability = probability
+        self._heights: List[float] = []
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+        self._increments = (0.0, probability / 2.0, probability, (1.0 + probability) / 2.0, 1.0)
+
+    def update(self, value: float) -> None:
+        heights = self._heights
+        if len(self._positions) < 5:
+            heights.append(value)
+            heights.sort()
+            if len(heights) == 5:
+                p = self.probability
+                self._positions = [1, 2, 3, 4, 5]
+                self._desired = [1.0, 1.0 + 2.0 * p, 1.0 + 4.0 * p, 3.0 + 2.0 * p, 5.0]
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        desired = self._desired
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            desired[index] += self._increments[index]
+
+        for index in (1, 2, 3):
+            offset = desired[index] - positions[index]
+            if (offset >= 1.0 and positions[index + 1] - positions[index] > 1) or (
+                offset <= -1.0 and positions[index - 1] - positions[index] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(index, step)
+                if not heights[index - 1] < candidate < heights[index + 1]:
+                    candidate = heights[index] + step * (
+                        heights[index + step] - heights[index]
+                    ) / (positions[index + step] - positions[index])
+                heights[index] = candidate
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        q = self._heights
+        n = self._positions
+        return q[index] + step / (n[index + 1] - n[index - 1]) * (
+            (n[index] - n[index - 1] + step) * (q[index + 1] - q[index]) / (n[index + 1] - n[index])
+            + (n[index + 1] - n[index] - step) * (q[index] - q[index - 1]) / (n[index] - n[index - 1])
+        )
+
+    def value(self) -> float:
+        if not self._heights:
+            return math.nan
+        if len(self._positions) < 5:
+            return _interpolated_quantile(self._heights, self.probability)
+        return self._heights[2]
+
+
+class RunningStats:
+    """Welford mean/variance, extrema and P² quantiles for one metric."""
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum", "_quantiles")
+
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._quantiles = [P2Quantile(probability) for probability in quantiles]
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        for estimator in self._quantiles:
+            estimator.update(value)
+
+    @property
+    def pstdev(self) -> float:
+        """Population standard deviation (``statistics.pstdev`` semantics)."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(max(self._m2, 0.0) / self.count)
+
+    def quantiles(self) -> Dict[str, float]:
+        return {
+            f"p{round(estimator.probability * 100):g}": estimator.value()
+            for estimator in self._quantiles
+        }
+
+    def summary(self) -> Dict[str, float]:
+        payload: Dict[str, float] = {
+            "mean": self.mean,
+            "stdev": self.pstdev,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "samples": self.count,
+        }
+        payload.update(self.quantiles())
+        return payload
+
+
+class MetricAccumulator:
+    """Per-metric ``RunningStats`` keyed by flattened metric name."""
+
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> None:
+        self._quantiles = tuple(quantiles)
+        self._stats: Dict[str, RunningStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def update(self, metrics: Dict[str, float]) -> None:
+        for name, value in metrics.items():
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = RunningStats(self._quantiles)
+            stats.update(value)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {name: self._stats[name].summary() for name in sorted(self._stats)}
@@ -2,27 +2,37 @@
 
 from __future__ import annotations
 
-import csv
 import json
-import statistics
-from dataclasses import dataclass
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.queues import SimpleQueue
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
-
-from .cache import alias_output_path, ensure_cached_result
-from .registry import InventionSpec
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .artifacts import ARTIFACT_STORE, write_csv_artifact
+from .cache import (
+    CacheEntry,
+    cache_budget,
+    enforce_cache_budget,
+    ensure_cached_result,
+    invention_fingerprint,
+)
+from .registry import InventionSpec, get_invention
+from .result_store import (
+    MetricsTableWriter,
+    RunRowWriter,
+    read_run_metrics,
+    run_artifact_name,
+    write_rows_csv,
+    write_run_npz,
+)
+from .streaming_stats import MetricAccumulator
 
 _NUMERIC_TYPES = (int, float)
 
-
-@dataclass
-class SweepResult:
-    """Holds flattened metrics for a single simulation run."""
-
-    seed: int
-    fidelity: str | None
-    metrics: Dict[str, float]
-    artifact_path: Path
+# How many times a seed is resubmitted after its worker process died.
+_MAX_WORKER_RESTARTS = 2
 
 
 def _invoke_simulation(
@@ -30,10 +40,11 @@ def _invoke_simulation(
     *,
     seed: int,
     fidelity: str | None,
+    render: bool = False,
 ) -> Dict[str, Any]:
     """Invoke the invention's simulation with optional fidelity control."""
     simulate = spec.module.simulate
-    kwargs: Dict[str, Any] = {"seed": seed}
+    kwargs: Dict[str, Any] = {"seed": seed, "render": render}
     if fidelity is not None:
         kwargs["fidelity"] = fidelity
     try:
@@ -44,6 +55,193 @@ def _invoke_simulation(
         return simulate(**kwargs)  # type: ignore[misc]
 
 
+def _invoke_batch_simulation(
+    spec: InventionSpec,
+    *,
+    seeds: List[int],
+    fidelity: str | None,
+) -> List[Dict[str, Any]]:
+    """Run ``seeds`` through the module's ``simulate_batch`` entry point."""
+    simulate_batch: Callable[..., List[Dict[str, Any]]] = spec.module.simulate_batch  # type: ignore[attr-defined]
+    if fidelity is not None:
+        try:
+            return simulate_batch(seeds, fidelity=fidelity)
+        except TypeError:
+            pass  # Batch entry points without fidelity control
+    return simulate_batch(seeds)
+
+
+def _supports_batch(spec: InventionSpec) -> bool:
+    return callable(getattr(spec.module, "simulate_batch", None))
+
+
+# Set in owned pool workers so each task announces itself before it runs.
+_STARTED: Optional[SimpleQueue] = None
+
+
+def _init_worker(started: SimpleQueue) -> None:
+    global _STARTED
+    _STARTED = started
+
+
+def _announce(task: Tuple[int, ...]) -> None:
+    # ``SimpleQueue.put`` writes straight to the pipe, so the record survives
+    # even when the run then kills its worker outright.
+    if _STARTED is not None:
+        _STARTED.put(task)
+
+
+def _simulate_seed(slug: str, seed: int, fidelity: str | None, render: bool = False) -> Dict[str, Any]:
+    """Process-pool entry point; resolves the invention inside the worker."""
+    _announce((seed,))
+    return _invoke_simulation(get_invention(slug), seed=seed, fidelity=fidelity, render=render)
+
+
+def _simulate_seed_batch(slug: str, seeds: List[int], fidelity: str | None) -> List[Dict[str, Any]]:
+    """Process-pool entry point for inventions exposing ``simulate_batch``."""
+    _announce(tuple(seeds))
+    return _invoke_batch_simulation(get_invention(slug), seeds=seeds, fidelity=fidelity)
+
+
+def _submit_task(
+    pool: Executor,
+    spec: InventionSpec,
+    task: Tuple[int, ...],
+    fidelity: str | None,
+    batched: bool,
+    render: bool,
+) -> Future:
+    if batched:
+        return pool.submit(_simulate_seed_batch, spec.slug, list(task), fidelity)
+    return pool.submit(_simulate_seed, spec.slug, task[0], fidelity, render)
+
+
+def _drain(started: Optional[SimpleQueue], into: Set[Tuple[int, ...]]) -> None:
+    while started is not None and not started.empty():
+        into.add(tuple(started.get()))
+
+
+def _execute_runs(
+    spec: InventionSpec,
+    seeds: List[int],
+    *,
+    fidelity: str | None,
+    workers: int,
+    executor: Optional[Executor],
+    render: bool = False,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(seed, result)`` pairs in completion order.
+
+    Runs serially unless ``workers > 1`` or an executor is supplied.  When a
+    worker process dies in an owned pool, the pool is rebuilt: runs that had
+    not started yet are resubmitted as they were, and runs that were in flight
+    are retried one at a time in a single-worker pool so the crash is pinned
+    on the seed that caused it.  Only those isolated crashes count towards
+    ``_MAX_WORKER_RESTARTS``.  Seeds that still fail are reported together
+    once every other run has finished, so completed runs are cached and a
+    rerun resumes from them.
+
+    Inventions exposing ``simulate_batch(seeds)`` receive their seeds in
+    batches instead: one batch when serial, otherwise one per worker.  Batch
+    entry points never render, so ``render=True`` runs seeds one at a time.
+    """
+    batched = _supports_batch(spec) and not render
+    if executor is None and workers <= 1:
+        if batched and seeds:
+            yield from zip(seeds, _invoke_batch_simulation(spec, seeds=seeds, fidelity=fidelity))
+            return
+        for seed in seeds:
+            yield seed, _invoke_simulation(spec, seed=seed, fidelity=fidelity, render=render)
+        return
+
+    if batched:
+        chunks = max(1, min(workers, len(seeds)))
+        tasks = [tuple(seeds[index::chunks]) for index in range(chunks) if seeds[index::chunks]]
+    else:
+        tasks = [(seed,) for seed in seeds]
+
+    owned = executor is None
+    restarts = dict.fromkeys(tasks, 0)
+    failures: Dict[int, BaseException] = {}
+    remaining = list(tasks)
+    suspects: List[Tuple[int, ...]] = []
+    while remaining or suspects:
+        isolated = bool(suspects)
+        if isolated:
+            batch = [suspects.pop(0)]
+        else:
+            batch, remaining = remaining, []
+        started: Optional[SimpleQueue] = None
+        if owned:
+            started = multiprocessing.SimpleQueue()
+            pool: Executor = ProcessPoolExecutor(
+                max_workers=1 if isolated else workers,
+                initializer=_init_worker,
+                initargs=(started,),
+            )
+        else:
+            pool = executor  # type: ignore[assignment]
+        futures: Dict[Future, Tuple[int, ...]] = {}
+        broken: List[Tuple[int, ...]] = []
+        ran: Set[Tuple[int, ...]] = set()
+        try:
+            try:
+                for task in batch:
+                    futures[_submit_task(pool, spec, task, fidelity, batched, render)] = task
+            except BrokenProcessPool as exc:
+                submitted = set(futures.values())
+                for task in batch:
+                    if task in submitted:
+                        continue
+                    if owned:
+                        broken.append(task)
+                    else:
+                        failures.update(dict.fromkeys(task, exc))
+            for future in as_completed(futures):
+                task = futures[future]
+                _drain(started, ran)  # keep the pipe from filling on long sweeps
+                try:
+                    result = future.result()
+                except BrokenProcessPool as exc:
+                    if not owned:
+                        failures.update(dict.fromkeys(task, exc))
+                    elif isolated:
+                        restarts[task] += 1
+                        if restarts[task] <= _MAX_WORKER_RESTARTS:
+                            suspects.append(task)
+                        else:
+                            failures.update(dict.fromkeys(task, exc))
+                    else:
+                        broken.append(task)
+                    continue
+                except Exception as exc:  # surfaced once the other runs are drained
+                    failures.update(dict.fromkeys(task, exc))
+                    continue
+                if batched:
+                    yield from zip(task, result)
+                else:
+                    yield task[0], result
+        finally:
+            if owned:
+                pool.shutdown(wait=True, cancel_futures=True)
+        if broken:
+            _drain(started, ran)
+            in_flight = [task for task in broken if task in ran]
+            # A pool that broke before any run started cannot blame one, so
+            # every task is retried in isolation rather than resubmitted forever.
+            suspects.extend(sorted(in_flight or broken, key=tasks.index))
+            remaining.extend(sorted(set(broken) - set(suspects), key=tasks.index))
+        if started is not None:
+            started.close()
+
+    if failures:
+        failed = sorted(failures, key=seeds.index)
+        first = failures[failed[0]]
+        raise RuntimeError(
+            f"Sweep runs failed for seeds {failed}: {type(first).__name__}: {first}"
+        ) from first
+
+
 def _flatten_metrics(payload: Any, prefix: str = "") -> Dict[str, float]:
     """Extract numeric metrics from nested dictionaries."""
     metrics: Dict[str, float] = {}
@@ -71,56 +269,16 @@ def _flatten_metrics(payload: Any, prefix: str = "") -> Dict[str, float]:
     return metrics
 
 
-def _write_run_artifact(path: Path, result: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(result, handle, indent=2, sort_keys=True)
-    alias = alias_output_path(path)
-    if alias is not None:
-        alias.parent.mkdir(parents=True, exist_ok=True)
-        with alias.open("w", encoding="utf-8") as handle:
-            json.dump(result, handle, indent=2, sort_keys=True)
+def _write_run_artifact(path: Path, result: Dict[str, Any]) -> int:
+    return ARTIFACT_STORE.write_json(path, result)
 
 
-def _write_csv(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
+def _write_csv(path: Path, rows: Iterable[Dict[str, Any]]) -> int:
     rows = list(rows)
     if not rows:
-        return
+        return 0
     fieldnames = sorted({key for row in rows for key in row})
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    alias = alias_output_path(path)
-    if alias is not None:
-        alias.parent.mkdir(parents=True, exist_ok=True)
-        with alias.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-
-
-def _aggregate_metrics(results: List[SweepResult]) -> Dict[str, Dict[str, float]]:
-    aggregates: Dict[str, Dict[str, float]] = {}
-    if not results:
-        return aggregates
-
-    metric_names = {name for result in results for name in result.metrics}
-
-    for name in sorted(metric_names):
-        series = [r.metrics[name] for r in results if name in r.metrics]
-        if not series:
-            continue
-        aggregates[name] = {
-            "mean": statistics.fmean(series),
-            "stdev": statistics.pstdev(series) if len(series) > 1 else 0.0,
-            "minimum": min(series),
-            "maximum": max(series),
-            "samples": len(series),
-        }
-
-    return aggregates
+    return write_csv_artifact(path, fieldnames, rows)
 
 
 def run_parameter_sweep(
@@ -130,15 +288,48 @@ def run_parameter_sweep(
     seeds: Iterable[int],
     label: str | None = None,
     reuse_cache: bool = True,
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+    store: str = "json",
+    render: bool = False,
 ) -> Dict[str, Any]:
-    """Execute a sweep of simulations and collect summary statistics."""
+    """Execute a sweep of simulations and collect summary statistics.
+
+    ``workers > 1`` runs uncached seeds on a process pool of that size; an
+    explicit ``executor`` (process or thread pool) is used as-is and left
+    running.  Each run is cached as soon as it finishes, and the summary lists
+    runs in seed order whatever the completion order was.
+
+    Per-run metrics never stay in memory: each row is written to disk as it is
+    released and ``summary["runs"]`` lists only seeds and artifact paths.  The
+    ``json`` store logs rows to ``runs.jsonl`` (``summary["run_rows"]``) and
+    streams them into a wide ``runs.csv``.  ``store="npz"`` selects the
+    columnar backend from :mod:`.result_store`: runs are cached as
+    ``result.npz`` and rows are appended in column blocks to a single
+    memory-mappable table referenced by ``summary["metrics_table"]``.
+
+    Runs are headless (``render=False``) unless ``render=True`` asks for each
+    invention's figures as well; metrics are identical either way.
+    """
+    artifact_name = run_artifact_name(store)
+    columnar = store == "npz"
     seeds = list(dict.fromkeys(seeds))  # Preserve order but remove duplicates
-    sweep_payload = {
+    max_cache_bytes = cache_budget()  # fail on a malformed budget before running anything
+    # Keys cover the module source, the first-party code and packaged data it
+    # imports, its YAML inputs and the package version so edits invalidate
+    # cached runs instead of returning stale results.
+    code = invention_fingerprint(spec.module, spec.slug)  # type: ignore[arg-type]
+    sweep_payload: Dict[str, Any] = {
         "slug": spec.slug,
         "fidelity": fidelity,
         "seeds": seeds,
         "label": label,
+        "code": code,
     }
+    if columnar:
+        sweep_payload["store"] = store
+    if render:
+        sweep_payload["render"] = True
 
     cache_entry, cache_hit = ensure_cached_result(spec.slug, sweep_payload, label="sweep")
     summary_json = cache_entry.path / "summary.json"
@@ -147,69 +338,91 @@ def run_parameter_sweep(
         with summary_json.open("r", encoding="utf-8") as handle:
             return json.load(handle)
 
-    run_results: List[SweepResult] = []
+    run_entries: Dict[int, Tuple[CacheEntry, Path]] = {}
+    cached: Set[int] = set()
+    ready: Dict[int, Dict[str, float]] = {}
+    pending: List[int] = []
     for seed in seeds:
-        run_payload = {
+        run_payload: Dict[str, Any] = {
             "seed": seed,
             "fidelity": fidelity,
+            "code": code,
         }
+        if render:
+            run_payload["render"] = True
         run_cache_entry, run_hit = ensure_cached_result(spec.slug, run_payload, label="sweep-run")
-        run_artifact = run_cache_entry.path / "result.json"
+        run_artifact = run_cache_entry.path / artifact_name
+        run_entries[seed] = (run_cache_entry, run_artifact)
 
         if reuse_cache and run_hit and run_artifact.exists():
-            with run_artifact.open("r", encoding="utf-8") as handle:
-                result = json.load(handle)
+            cached.add(seed)  # Loaded when released so only one row is resident
         else:
-            result = _invoke_simulation(spec, seed=seed, fidelity=fidelity)
-            _write_run_artifact(run_artifact, result)
-            run_cache_entry.write_metadata({"seed": seed, "fidelity": fidelity})
-
-        metrics = _flatten_metrics(result)
-        run_results.append(
-            SweepResult(
-                seed=seed,
-                fidelity=fidelity,
-                metrics=metrics,
-                artifact_path=run_artifact,
-            )
-        )
-
-    aggregates = _aggregate_metrics(run_results)
-
-    summary = {
+            pending.append(seed)
+
+    accumulator = MetricAccumulator()
+    rows_path = cache_entry.path / "runs.jsonl"
+    table_dir = cache_entry.path / "runs"
+    position = 0
+
+    def _cached_metrics(path: Path) -> Dict[str, float]:
+        if columnar:
+            return read_run_metrics(path)
+        with path.open("r", encoding="utf-8") as handle:
+            return _flatten_metrics(json.load(handle))
+
+    def _release_in_order(rows: Union[RunRowWriter, MetricsTableWriter]) -> None:
+        # Results arrive in completion order; consume them in seed order so the
+        # summary is identical regardless of scheduling.  Each row goes straight
+        # to disk, leaving only the accumulators resident.
+        nonlocal position
+        while position < len(seeds):
+            seed = seeds[position]
+            if seed in ready:
+                metrics = ready.pop(seed)
+            elif seed in cached:
+                metrics = _cached_metrics(run_entries[seed][1])
+            else:
+                break
+            accumulator.update(metrics)
+            rows.append(seed, metrics)
+            position += 1
+
+    rows_writer = MetricsTableWriter(table_dir) if columnar else RunRowWriter(rows_path)
+    with rows_writer as rows:
+        _release_in_order(rows)
+        for seed, result in _execute_runs(
+            spec, pending, fidelity=fidelity, workers=workers, executor=executor, render=render
+        ):
+            run_cache_entry, run_artifact = run_entries[seed]
+            metrics = _flatten_metrics(result)
+            if columnar:
+                write_run_npz(run_artifact, result, metrics)
+            else:
+                _write_run_artifact(run_artifact, result)
+            run_cache_entry.write_metadata({"seed": seed, "fidelity": fidelity, "code": code})
+            ready[seed] = metrics
+            _release_in_order(rows)
+
+    aggregates = accumulator.summary()
+
+    summary: Dict[str, Any] = {
         "slug": spec.slug,
         "fidelity": fidelity,
         "seeds": seeds,
         "label": label,
-        "runs": [
-            {
-                "seed": result.seed,
-                "fidelity": result.fidelity,
-                "artifact": str(result.artifact_path),
-                "metrics": result.metrics,
-            }
-            for result in run_results
-        ],
+        "runs": [{"seed": seed, "artifact": str(run_entries[seed][1])} for seed in seeds],
         "aggregates": aggregates,
     }
+    if columnar:
+        summary["store"] = store
+        summary["metrics_table"] = str(table_dir)
+    else:
+        summary["run_rows"] = str(rows_path)
+        if rows.rows:
+            write_rows_csv(cache_entry.path / "runs.csv", rows_path, rows.columns)
 
     cache_entry.write_metadata(sweep_payload)
-    summary_json.parent.mkdir(parents=True, exist_ok=True)
-    with summary_json.open("w", encoding="utf-8") as handle:
-        json.dump(summary, handle, indent=2, sort_keys=True)
-    alias_summary = alias_output_path(summary_json)
-    if alias_summary is not None:
-        alias_summary.parent.mkdir(parents=True, exist_ok=True)
-        with alias_summary.open("w", encoding="utf-8") as handle:
-            json.dump(summary, handle, indent=2, sort_keys=True)
-
-    csv_rows: List[Dict[str, Any]] = []
-    for result in run_results:
-        row: Dict[str, Any] = {"seed": result.seed}
-        row.update(result.metrics)
-        csv_rows.append(row)
-
-    _write_csv(cache_entry.path / "runs.csv", csv_rows)
+    ARTIFACT_STORE.write_json(summary_json, summary)
 
     agg_rows = [
         {
@@ -219,9 +432,13 @@ def run_parameter_sweep(
             "min": values["minimum"],
             "max": values["maximum"],
             "samples": values["samples"],
+            "p5": values["p5"],
+            "p50": values["p50"],
+            "p95": values["p95"],
         }
         for name, values in aggregates.items()
     ]
     _write_csv(cache_entry.path / "summary.csv", agg_rows)
 
+    enforce_cache_budget(max_cache_bytes)
     return summary
@@ -13,21 +13,52 @@ This framework enables high-fidelity simulation of Renaissance engineering
 concepts using modern computational methods.
 """
 
-from .aerodynamics import AerodynamicsModule
-from .core import MultiPhysicsSimulator
-from .materials import MaterialsModule
-from .optimization import OptimizationEngine
-from .structures import StructuralModule
-from .validation import ValidationSuite
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from .aerodynamics import AerodynamicsModule
+    from .airfoil_polar import AirfoilPolar
+    from .core import MultiPhysicsSimulator, SimulationParameters
+    from .history import SimulationHistoryWriter, load_history
+    from .structures import StructuralModule
 
 __version__ = "1.0.0"
 __author__ = "DaVinci Codex Research Team"
 
 __all__ = [
     "MultiPhysicsSimulator",
+    "SimulationParameters",
     "AerodynamicsModule",
     "StructuralModule",
-    "MaterialsModule",
-    "OptimizationEngine",
-    "ValidationSuite"
+    "AirfoilPolar",
+    "SimulationHistoryWriter",
+    "load_history",
 ]
+
+# Submodules are imported on first attribute access so that light consumers
+# (e.g. ``multiphysics.airfoil_polar``) do not pay for the coupled solvers.
+_EXPORTS = {
+    "MultiPhysicsSimulator": "core",
+    "SimulationParameters": "core",
+    "AerodynamicsModule": "aerodynamics",
+    "StructuralModule": "structures",
+    "AirfoilPolar": "airfoil_polar",
+    "SimulationHistoryWriter": "history",
+    "load_history": "history",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -9,16 +9,180 @@ Implements computational fluid dynamics with emphasis on:
 - Bio-inspired aerodynamic mechanisms
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import numpy as np
+import scipy.linalg as la
 import scipy.sparse as sp
 
 from .core import PhysicsModule, SimulationParameters
 
 logger = logging.getLogger(__name__)
 
+# Point/panel/edge evaluations per tile of the batched Biot-Savart kernel;
+# 2**18 keeps each temporary array of a tile around 6 MB.
+INFLUENCE_TILE_SIZE = 1 << 18
+
+# Distances below this are treated as lying on the vortex filament
+VORTEX_CORE_RADIUS = 1e-10
+
+# Wake panels per Barnes-Hut leaf (leaves are always summed directly)
+WAKE_TREE_LEAF_SIZE = 16
+
+
+def vortex_ring_velocities(panel_coordinates: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Velocity induced at every point by every unit-strength quadrilateral vortex ring.
+
+    Evaluates the Biot-Savart law for all point/panel/edge combinations as
+    broadcast array operations.
+
+    Args:
+        panel_coordinates: Panel corners, shape (n_panels, 4, 3)
+        points: Target points, shape (n_points, 3)
+
+    Returns:
+        Induced velocities, shape (n_points, n_panels, 3)
+    """
+    # r1 = point - edge start; rolling the corners gives r2 = point - edge end
+    r1 = points[:, None, None, :] - panel_coordinates[None, :, :, :]
+    r2 = np.roll(r1, -1, axis=2)
+    r1_mag = np.sqrt(np.einsum("...k,...k->...", r1, r1))
+    r2_mag = np.roll(r1_mag, -1, axis=2)
+
+    cross_product = np.cross(r1, r2)
+    cross_sq = np.einsum("...k,...k->...", cross_product, cross_product)
+    r1_dot_r2 = np.einsum("...k,...k->...", r1, r2)
+
+    valid = (
+        (r1_mag > VORTEX_CORE_RADIUS)
+        & (r2_mag > VORTEX_CORE_RADIUS)
+        & (cross_sq > VORTEX_CORE_RADIUS * VORTEX_CORE_RADIUS)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # (r1/|r1| - r2/|r2|) . (r1 - r2), with r1 - r2 the edge vector
+        dot_product = (r1_mag + r2_mag) * (1.0 - r1_dot_r2 / (r1_mag * r2_mag))
+        coeff = np.where(valid, dot_product / (4.0 * np.pi * cross_sq), 0.0)
+
+    return np.asarray(np.einsum("pne,pnek->pnk", coeff, cross_product))
+
+
+def influence_tiles(num_points: int, num_panels: int,
+                    tile_size: int = INFLUENCE_TILE_SIZE) -> Iterator[slice]:
+    """Split target points into row blocks that keep kernel temporaries bounded."""
+    rows = max(1, tile_size // max(1, 4 * num_panels))
+    for start in range(0, num_points, rows):
+        yield slice(start, min(start + rows, num_points))
+
+
+def vortex_ring_area_vectors(panel_coordinates: np.ndarray) -> np.ndarray:
+    """Vector areas of quadrilateral rings, oriented by the corner ordering."""
+    diagonal_a = panel_coordinates[:, 2] - panel_coordinates[:, 0]
+    diagonal_b = panel_coordinates[:, 3] - panel_coordinates[:, 1]
+    return 0.5 * np.cross(diagonal_a, diagonal_b)
+
+
+def doublet_cluster_velocities(moment: np.ndarray, quadrupole: np.ndarray,
+                               centre: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Far-field velocity of a cluster of vortex rings.
+
+    Each ring acts as a point doublet of moment m_k = strength * area vector at
+    its centroid c_k.  The cluster is expanded about ``centre`` using its total
+    moment and the first moment Q = sum_k m_k (c_k - centre)^T.
+    """
+    r = points - centre
+    distance_sq = np.einsum("pk,pk->p", r, r)
+    inv_r3 = distance_sq ** -1.5
+    inv_r5 = inv_r3 / distance_sq
+    projection = r @ moment
+    dipole = 3.0 * (projection * inv_r5)[:, None] * r - moment * inv_r3[:, None]
+
+    q_r = r @ quadrupole.T
+    qt_r = r @ quadrupole
+    r_q_r = np.einsum("pk,pk->p", r, q_r)
+    shift = (
+        3.0 * inv_r5[:, None] * (q_r + qt_r + np.trace(quadrupole) * r)
+        - 15.0 * (r_q_r * inv_r5 / distance_sq)[:, None] * r
+    )
+    return np.asarray((dipole - shift) / (4.0 * np.pi))
+
+
+class WakeTree:
+    """
+    Barnes-Hut tree over wake vortex rings.
+
+    Wake panels are split recursively at the median centroid along the widest
+    axis.  Each node stores the doublet moments of its rings, so a cluster that
+    looks small from a target point (radius / distance < theta) is evaluated
+    as one multipole expansion instead of panel by panel.
+    """
+
+    def __init__(self, panel_coordinates: np.ndarray, strengths: np.ndarray,
+                 leaf_size: int = WAKE_TREE_LEAF_SIZE):
+        self.panel_coordinates = panel_coordinates
+        self.strengths = strengths
+        self.leaf_size = leaf_size
+        self.centroids = panel_coordinates.mean(axis=1)
+        self.moments = strengths[:, None] * vortex_ring_area_vectors(panel_coordinates)
+        self.direct_interactions = 0
+        self.multipole_interactions = 0
+        self.root = self._build(np.arange(len(strengths)))
+
+    def _build(self, indices: np.ndarray) -> Dict[str, Any]:
+        centre = self.centroids[indices].mean(axis=0)
+        moments = self.moments[indices]
+        corners = self.panel_coordinates[indices].reshape(-1, 3)
+        node = {
+            'indices': indices,
+            'centre': centre,
+            'radius': float(np.max(np.linalg.norm(corners - centre, axis=1))),
+            'moment': moments.sum(axis=0),
+            'quadrupole': moments.T @ (self.centroids[indices] - centre),
+            'children': (),
+        }
+        if len(indices) > self.leaf_size:
+            centroids = self.centroids[indices]
+            axis = int(np.argmax(np.ptp(centroids, axis=0)))
+            order = indices[np.argsort(centroids[:, axis], kind="stable")]
+            half = len(order) // 2
+            node['children'] = (self._build(order[:half]), self._build(order[half:]))
+        return node
+
+    def velocities(self, points: np.ndarray, theta: float) -> np.ndarray:
+        """Wake-induced velocity at each point; theta = 0 gives direct summation."""
+        velocity = np.zeros((len(points), 3))
+        if len(self.strengths):
+            self._accumulate(self.root, points, np.arange(len(points)), theta, velocity)
+        return velocity
+
+    def _accumulate(self, node: Dict[str, Any], points: np.ndarray, targets: np.ndarray,
+                    theta: float, velocity: np.ndarray):
+        distance = np.linalg.norm(points[targets] - node['centre'], axis=1)
+        far = node['radius'] < theta * distance
+        if np.any(far):
+            velocity[targets[far]] += doublet_cluster_velocities(
+                node['moment'], node['quadrupole'], node['centre'], points[targets[far]]
+            )
+            self.multipole_interactions += int(np.count_nonzero(far))
+            targets = targets[~far]
+        if len(targets) == 0:
+            return
+
+        if not node['children']:
+            indices = node['indices']
+            for rows in influence_tiles(len(targets), len(indices)):
+                block = targets[rows]
+                induced = vortex_ring_velocities(self.panel_coordinates[indices], points[block])
+                velocity[block] += np.einsum("pnk,n->pk", induced, self.strengths[indices])
+            self.direct_interactions += len(targets) * len(indices)
+            return
+
+        for child in node['children']:
+            self._accumulate(child, points, targets, theta, velocity)
+
 
 class AerodynamicsModule(PhysicsModule):
     """
@@ -44,16 +208,34 @@ class AerodynamicsModule(PhysicsModule):
         # Numerical parameters
         self.num_panels = 0
         self.num_wake_panels = 0
-        self.panel_coordinates = None
-        self.panel_normals = None
-        self.panel_areas = None
-        self.control_points = None
+        self.panel_coordinates: Optional[np.ndarray] = None
+        self.panel_normals: Optional[np.ndarray] = None
+        self.panel_areas: Optional[np.ndarray] = None
+        self.control_points: Optional[np.ndarray] = None
+        self.influence_tile_size = INFLUENCE_TILE_SIZE
+
+        # Influence matrix and LU factors, keyed on a hash of the panel geometry.
+        # A positive refactor tolerance [m] keeps them while flapping moves no
+        # panel corner further than that from the factorised geometry.
+        self.refactor_tolerance = 0.0
+        self._influence_cache: Dict[str, Any] = {
+            'key': None,
+            'matrix': None,
+            'lu': None,
+            'reference_coordinates': None,
+        }
+        self.influence_cache_stats = {
+            'matrix_hits': 0,
+            'matrix_builds': 0,
+            'lu_hits': 0,
+            'refactorizations': 0,
+        }
 
         # Flow solution
-        self.panel_strengths = None
-        self.wake_strengths = None
-        self.velocity_field = None
-        self.pressure_field = None
+        self.panel_strengths: Optional[np.ndarray] = None
+        self.wake_strengths: Optional[np.ndarray] = None
+        self.velocity_field: Optional[np.ndarray] = None
+        self.pressure_field: Optional[np.ndarray] = None
 
         # Flapping wing parameters
         self.wing_kinematics = None
@@ -64,6 +246,14 @@ class AerodynamicsModule(PhysicsModule):
         # Wake modeling
         self.wake_history = []
         self.max_wake_length = 100
+        self.wake_stations: Optional[np.ndarray] = None
+        self.wake_statistics = {
+            'panels': 0,
+            'amalgamated': 0,
+            'pruned': 0,
+            'direct_interactions': 0,
+            'multipole_interactions': 0,
+        }
 
         logger.info("Aerodynamics module initialized")
 
@@ -176,6 +366,7 @@ class AerodynamicsModule(PhysicsModule):
         self.num_wake_panels = self.max_wake_length
         self.wake_coordinates = np.zeros((self.num_wake_panels, 4, 3))
         self.wake_strengths = np.zeros(self.num_wake_panels)
+        self.wake_stations = np.full(self.num_wake_panels, -1)
 
         # Initialize wake as extension of trailing edge
         if self.panel_coordinates is not None:
@@ -190,6 +381,7 @@ class AerodynamicsModule(PhysicsModule):
                     # Shift wake panels downstream
                     wake_panel[:, 0] += 0.1 * (i + 1)  # Move in x-direction
                     self.wake_coordinates[i] = wake_panel
+                    self.wake_stations[i] = te_panel_idx
 
         logger.info(f"Initialized wake with {self.num_wake_panels} panels")
 
@@ -235,6 +427,26 @@ class AerodynamicsModule(PhysicsModule):
 
         logger.info(f"Flapping kinematics: {self.flapping_frequency} Hz, {self.flapping_amplitude}° amplitude")
 
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Checkpoint state with the (unpicklable) kinematics closure replaced by its parameters."""
+        state = super().get_checkpoint_state()
+        if state.pop('wing_kinematics') is not None:
+            state['flapping_kinematics'] = {
+                'amplitude': self.flapping_amplitude,
+                'frequency': self.flapping_frequency,
+                'phase_lag': self.phase_lag,
+            }
+        return state
+
+    def set_checkpoint_state(self, state: Dict[str, Any]):
+        """Restore checkpointed attributes and rebuild the flapping kinematics."""
+        state = dict(state)
+        flapping = state.pop('flapping_kinematics', None)
+        super().set_checkpoint_state(state)
+        self.wing_kinematics = None
+        if flapping is not None:
+            self._setup_flapping_kinematics(flapping)
+
     def _initialize_flow_field(self):
         """Initialize flow field variables."""
 
@@ -273,7 +485,7 @@ class AerodynamicsModule(PhysicsModule):
             self._update_wing_position(time)
 
         # Compute influence coefficients
-        influence_matrix = self._compute_influence_matrix()
+        influence_matrix = self._cached_influence_matrix()
 
         # Right-hand side (boundary conditions)
         rhs = self._compute_boundary_conditions(time)
@@ -292,36 +504,79 @@ class AerodynamicsModule(PhysicsModule):
         """Compute Jacobian matrix for aerodynamic system."""
 
         # For panel method, Jacobian is the influence coefficient matrix
-        influence_matrix = self._compute_influence_matrix()
+        influence_matrix = self._cached_influence_matrix()
 
         # Convert to sparse matrix for efficiency
         return sp.csr_matrix(influence_matrix)
 
+    def solve_linear_system(self, state: np.ndarray, time: float,
+                            rhs: np.ndarray) -> Optional[np.ndarray]:
+        """Solve with the influence matrix's cached LU factors."""
+
+        if len(state) != self.num_panels or len(rhs) != self.num_panels:
+            return None
+
+        cache = self._influence_cache
+        matrix = self._cached_influence_matrix()
+        if cache['lu'] is None:
+            cache['lu'] = la.lu_factor(matrix, check_finite=False)
+            self.influence_cache_stats['refactorizations'] += 1
+        else:
+            self.influence_cache_stats['lu_hits'] += 1
+
+        return np.asarray(la.lu_solve(cache['lu'], rhs, check_finite=False))
+
+    def _geometry_hash(self) -> str:
+        """Digest of the panel geometry that determines the influence matrix."""
+
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (self.panel_coordinates, self.control_points, self.panel_normals):
+            digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def _cached_influence_matrix(self) -> np.ndarray:
+        """Return the influence matrix, rebuilding it only when the geometry changed."""
+
+        cache = self._influence_cache
+        key = self._geometry_hash()
+        if key == cache['key']:
+            self.influence_cache_stats['matrix_hits'] += 1
+        else:
+            cache['key'] = key
+            cache['matrix'] = self._compute_influence_matrix()
+            cache['lu'] = None
+            cache['reference_coordinates'] = self._panel_geometry()[0].copy()
+            self.influence_cache_stats['matrix_builds'] += 1
+
+        matrix: np.ndarray = cache['matrix']
+        return matrix
+
+    def _panel_geometry(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Panel corners, control points and normals of the generated mesh."""
+
+        if self.panel_coordinates is None or self.control_points is None or self.panel_normals is None:
+            raise RuntimeError("Aerodynamics panel mesh has not been generated")
+        return self.panel_coordinates, self.control_points, self.panel_normals
+
     def _compute_influence_matrix(self) -> np.ndarray:
         """
         Compute influence coefficient matrix for panel method.
 
         A[i,j] represents the velocity induced at control point i by panel j.
+        Rows are evaluated in tiles with the batched Biot-Savart kernel.
         """
 
-        A = np.zeros((self.num_panels, self.num_panels))
+        panel_coordinates, control_points, panel_normals = self._panel_geometry()
+        A = np.empty((self.num_panels, self.num_panels))
 
-        for i in range(self.num_panels):
-            control_point = self.control_points[i]
-            panel_normal = self.panel_normals[i]
+        for rows in influence_tiles(self.num_panels, self.num_panels, self.influence_tile_size):
+            induced_velocity = vortex_ring_velocities(panel_coordinates, control_points[rows])
 
-            for j in range(self.num_panels):
-                if i == j:
-                    # Self-influence (analytical)
-                    A[i, j] = 0.5
-                else:
-                    # Influence of panel j on control point i
-                    induced_velocity = self._compute_panel_influence(
-                        self.panel_coordinates[j], control_point
-                    )
+            # Dot with normal to get normal velocity component
+            A[rows] = np.einsum("pnk,pk->pn", induced_velocity, panel_normals[rows])
 
-                    # Dot with normal to get normal velocity component
-                    A[i, j] = np.dot(induced_velocity, panel_normal)
+        # Self-influence (analytical)
+        np.fill_diagonal(A, 0.5)
 
         return A
 
@@ -332,33 +587,7 @@ class AerodynamicsModule(PhysicsModule):
         Uses vortex panel method with constant strength distribution.
         """
 
-        # Panel corners
-        p1, p2, p3, p4 = panel_coords
-
-        # Compute influence of each edge vortex
-        velocity = np.zeros(3)
-
-        edges = [(p1, p2), (p2, p3), (p3, p4), (p4, p1)]
-
-        for edge_start, edge_end in edges:
-            # Biot-Savart law for straight vortex segment
-            r1 = target_point - edge_start
-            r2 = target_point - edge_end
-
-            r1_mag = np.linalg.norm(r1)
-            r2_mag = np.linalg.norm(r2)
-
-            if r1_mag > 1e-10 and r2_mag > 1e-10:
-                cross_product = np.cross(r1, r2)
-                cross_mag = np.linalg.norm(cross_product)
-
-                if cross_mag > 1e-10:
-                    # Biot-Savart formula
-                    coeff = 1.0 / (4.0 * np.pi * cross_mag * cross_mag)
-                    dot_product = np.dot(r1 / r1_mag - r2 / r2_mag, edge_end - edge_start)
-                    velocity += coeff * dot_product * cross_product
-
-        return velocity
+        return np.asarray(vortex_ring_velocities(panel_coords[None], target_point[None])[0, 0])
 
     def _compute_boundary_conditions(self, time: float) -> np.ndarray:
         """Compute right-hand side vector for boundary conditions."""
@@ -448,24 +677,28 @@ class AerodynamicsModule(PhysicsModule):
             # Update normal
             self.panel_normals[i] = rotation_matrix @ self.panel_normals[i]
 
+        # Keep the cached factors while the motion stays within tolerance
+        reference = self._influence_cache['reference_coordinates']
+        if self.refactor_tolerance > 0.0 and reference is not None:
+            displacement = np.max(np.linalg.norm(self.panel_coordinates - reference, axis=-1))
+            if displacement <= self.refactor_tolerance:
+                self._influence_cache['key'] = self._geometry_hash()
+
     def _compute_wake_influence(self) -> np.ndarray:
         """Compute influence of wake panels on wing boundary conditions."""
 
-        wake_influence = np.zeros(self.num_panels)
+        if self.wake_strengths is None or not np.any(self.wake_strengths):
+            return np.zeros(self.num_panels)
+        active = self.wake_strengths != 0
+        _, control_points, panel_normals = self._panel_geometry()
 
-        for wake_panel_idx, wake_strength in enumerate(self.wake_strengths):
-            if wake_strength != 0:
-                wake_coords = self.wake_coordinates[wake_panel_idx]
+        # Distant wake clusters are evaluated as point doublets (Barnes-Hut)
+        tree = WakeTree(self.wake_coordinates[active], self.wake_strengths[active])
+        induced_velocity = tree.velocities(control_points, self.parameters.wake_tree_theta)
+        self.wake_statistics['direct_interactions'] += tree.direct_interactions
+        self.wake_statistics['multipole_interactions'] += tree.multipole_interactions
 
-                for i in range(self.num_panels):
-                    control_point = self.control_points[i]
-                    panel_normal = self.panel_normals[i]
-
-                    # Compute wake panel influence
-                    induced_velocity = self._compute_panel_influence(wake_coords, control_point)
-                    wake_influence[i] += wake_strength * np.dot(induced_velocity, panel_normal)
-
-        return wake_influence
+        return np.asarray(np.einsum("pk,pk->p", induced_velocity, panel_normals))
 
     def update_coupling_variables(self, coupled_data: Dict[str, Any]):
         """Update aerodynamics based on structural deformation."""
@@ -500,36 +733,35 @@ class AerodynamicsModule(PhysicsModule):
             'total_force': total_force,
             'total_moment': total_moment,
             'control_points': self.control_points.copy(),
-            'panel_areas': self.panel_areas.copy()
+            'panel_areas': self.panel_areas.copy(),
+            'influence_cache': dict(self.influence_cache_stats),
+            'wake': dict(self.wake_statistics)
         }
 
     def _compute_pressure_distribution(self):
         """Compute pressure distribution from panel strengths using Bernoulli's equation."""
 
-        # Compute velocity at each panel
-        for i in range(self.num_panels):
-            # Total velocity = freestream + induced
-            total_velocity = self.freestream_velocity.copy()
+        # Total velocity = freestream + induced from all other panels
+        induced_velocity = np.zeros((self.num_panels, 3))
+        for rows in influence_tiles(self.num_panels, self.num_panels, self.influence_tile_size):
+            velocities = vortex_ring_velocities(self.panel_coordinates, self.control_points[rows])
+            targets = np.arange(rows.start, rows.stop)
+            velocities[targets - rows.start, targets] = 0.0
+            induced_velocity[rows] = np.einsum("pnk,n->pk", velocities, self.panel_strengths)
 
-            # Add induced velocities from all panels
-            for j in range(self.num_panels):
-                if i != j:
-                    induced_vel = self._compute_panel_influence(
-                        self.panel_coordinates[j], self.control_points[i]
-                    )
-                    total_velocity += self.panel_strengths[j] * induced_vel
+        total_velocity = self.freestream_velocity + induced_velocity
 
-            # Velocity magnitude
-            vel_magnitude = np.linalg.norm(total_velocity)
+        # Velocity magnitude
+        vel_magnitude = np.linalg.norm(total_velocity, axis=1)
 
-            # Bernoulli's equation: p + 0.5*rho*V^2 = constant
-            freestream_speed = np.linalg.norm(self.freestream_velocity)
-            pressure_coefficient = 1.0 - (vel_magnitude / freestream_speed) ** 2
+        # Bernoulli's equation: p + 0.5*rho*V^2 = constant
+        freestream_speed = np.linalg.norm(self.freestream_velocity)
+        pressure_coefficient = 1.0 - (vel_magnitude / freestream_speed) ** 2
 
-            # Dynamic pressure
-            dynamic_pressure = 0.5 * self.air_density * freestream_speed * freestream_speed
+        # Dynamic pressure
+        dynamic_pressure = 0.5 * self.air_density * freestream_speed * freestream_speed
 
-            self.pressure_field[i] = pressure_coefficient * dynamic_pressure
+        self.pressure_field[:] = pressure_coefficient * dynamic_pressure
 
     def _compute_integrated_forces(self) -> Tuple[np.ndarray, np.ndarray]:
         """Compute total force and moment on the wing."""
@@ -558,20 +790,23 @@ class AerodynamicsModule(PhysicsModule):
 
         # Convect existing wake panels
         convection_velocity = self.freestream_velocity[0]  # Simplified
+        self.wake_coordinates[:, :, 0] += convection_velocity * time_step
 
-        for i in range(self.num_wake_panels):
-            self.wake_coordinates[i, :, 0] += convection_velocity * time_step
+        # Shed a new wake panel behind each trailing edge panel
+        trailing_edge_panels = np.asarray(self._find_trailing_edge_panels(), dtype=int)
 
-        # Add new wake panel at trailing edge
-        trailing_edge_panels = self._find_trailing_edge_panels()
+        if len(trailing_edge_panels):
+            # Upstream edge on the trailing edge, downstream edge one step behind it
+            trailing_edges = self.panel_coordinates[trailing_edge_panels][:, [1, 1, 2, 2]]
+            trailing_edges[:, 1:3, 0] += convection_velocity * time_step
 
-        if trailing_edge_panels:
-            # Set wake strength based on circulation
-            new_wake_strength = np.mean([self.panel_strengths[idx] for idx in trailing_edge_panels])
+            self.wake_coordinates = np.concatenate([trailing_edges, self.wake_coordinates])
+            self.wake_strengths = np.concatenate([
+                self.panel_strengths[trailing_edge_panels], self.wake_strengths
+            ])
+            self.wake_stations = np.concatenate([trailing_edge_panels, self.wake_stations])
 
-            # Shift wake strengths
-            self.wake_strengths[1:] = self.wake_strengths[:-1]
-            self.wake_strengths[0] = new_wake_strength
+        self._apply_wake_policy()
 
         # Store wake history for analysis
         self.wake_history.append({
@@ -584,6 +819,62 @@ class AerodynamicsModule(PhysicsModule):
         if len(self.wake_history) > self.max_wake_length:
             self.wake_history.pop(0)
 
+    def _apply_wake_policy(self):
+        """
+        Bound the wake by pruning negligible panels and amalgamating old ones.
+
+        Panels whose circulation is below ``wake_prune_tolerance`` times the
+        peak are dropped.  Beyond ``max_wake_panels`` the two oldest panels
+        shed from the same trailing-edge station are merged into one ring
+        spanning both, with the strength that preserves their doublet moment.
+        """
+
+        peak = np.max(np.abs(self.wake_strengths), initial=0.0)
+        keep = np.abs(self.wake_strengths) > self.parameters.wake_prune_tolerance * peak
+        self.wake_statistics['pruned'] += int(np.count_nonzero(~keep))
+        coordinates = self.wake_coordinates[keep]
+        strengths = self.wake_strengths[keep]
+        stations = self.wake_stations[keep]
+
+        excess = len(strengths) - self.parameters.max_wake_panels
+        if excess > 0:
+            # Panels are stored newest first, so the oldest are at the back
+            removed = np.zeros(len(strengths), dtype=bool)
+            while excess > 0:
+                alive = np.flatnonzero(~removed)
+                station_counts = np.bincount(stations[alive] - stations.min())
+                station = int(np.argmax(station_counts)) + stations.min()
+                members = alive[stations[alive] == station]
+                if len(members) < 2:
+                    break
+                newer, older = members[-2], members[-1]
+
+                merged = np.array([
+                    coordinates[newer, 0], coordinates[older, 1],
+                    coordinates[older, 2], coordinates[newer, 3],
+                ])
+                area = vortex_ring_area_vectors(merged[None])[0]
+                moment = (
+                    strengths[newer] * vortex_ring_area_vectors(coordinates[newer][None])[0]
+                    + strengths[older] * vortex_ring_area_vectors(coordinates[older][None])[0]
+                )
+                area_sq = float(np.dot(area, area))
+                coordinates[older] = merged
+                strengths[older] = np.dot(moment, area) / area_sq if area_sq > 0.0 else 0.0
+                removed[newer] = True
+                excess -= 1
+
+            self.wake_statistics['amalgamated'] += int(np.count_nonzero(removed))
+            coordinates = coordinates[~removed]
+            strengths = strengths[~removed]
+            stations = stations[~removed]
+
+        self.wake_coordinates = coordinates
+        self.wake_strengths = strengths
+        self.wake_stations = stations
+        self.num_wake_panels = len(strengths)
+        self.wake_statistics['panels'] = self.num_wake_panels
+
     def compute_performance_metrics(self) -> Dict[str, float]:
         """Compute aerodynamic performance metrics."""
 
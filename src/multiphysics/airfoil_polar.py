@@ -0,0 +1,167 @@
+"""
+Tabulated airfoil polars shared by the rotor and wing solvers.
+
+An :class:`AirfoilPolar` stores lift and drag coefficients on an
+(angle of attack, Reynolds number) grid and interpolates them bilinearly for
+whole arrays of query points. Polars are built once from a closed-form model
+(:meth:`AirfoilPolar.from_function`) or loaded from a CSV table shipped as
+package data under ``multiphysics/data/airfoils`` (:meth:`AirfoilPolar.load`),
+so a new airfoil is a data change rather than a code change.
+
+CSV tables use long format with one row per grid point::
+
+    # comment lines start with '#'
+    alpha_deg,reynolds,cl,cd
+    -10.0,50000,-0.61,0.052
+    ...
+"""
+
+from __future__ import annotations
+
+import csv
+from importlib import resources
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+AIRFOIL_DATA_DIR = resources.files(__package__) / "data" / "airfoils"
+
+_CSV_COLUMNS = ("alpha_deg", "reynolds", "cl", "cd")
+
+Grid = Union[Sequence[float], np.ndarray]
+
+
+def _bracket(grid: np.ndarray, values: np.ndarray, uniform: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower grid index and linear weight for each value, clamped to the grid."""
+    if len(grid) == 1:
+        return np.zeros(values.shape, dtype=np.intp), np.zeros(values.shape)
+    if uniform:
+        position = (values - grid[0]) / (grid[1] - grid[0])
+        lower = np.clip(np.floor(position), 0, len(grid) - 2).astype(np.intp)
+    else:
+        lower = np.clip(np.searchsorted(grid, values, side='right') - 1, 0, len(grid) - 2)
+    weight = (values - grid[lower]) / (grid[lower + 1] - grid[lower])
+    return lower, np.clip(weight, 0.0, 1.0)
+
+
+def _is_uniform(grid: np.ndarray) -> bool:
+    if len(grid) < 3:
+        return True
+    spacing = np.diff(grid)
+    return bool(np.allclose(spacing, spacing[0], rtol=1e-9, atol=0.0))
+
+
+class AirfoilPolar:
+    """
+    Lift and drag coefficients tabulated on an (alpha, Re) grid.
+
+    Lookups clamp to the tabulated range. Uniform grids are indexed
+    arithmetically; grids with extra nodes (e.g. at stall breaks) use a
+    vectorised binary search.
+
+    Args:
+        alpha: Strictly increasing angles of attack [rad], shape (n_alpha,)
+        reynolds: Strictly increasing Reynolds numbers, shape (n_re,)
+        cl: Lift coefficients, shape (n_alpha, n_re)
+        cd: Drag coefficients, shape (n_alpha, n_re)
+        name: Airfoil name
+    """
+
+    def __init__(self, alpha: Grid, reynolds: Grid,
+                 cl: np.ndarray, cd: np.ndarray, name: str = "airfoil"):
+        self.alpha = np.asarray(alpha, dtype=float)
+        self.reynolds = np.asarray(reynolds, dtype=float)
+        self.cl = np.asarray(cl, dtype=float).reshape(len(self.alpha), len(self.reynolds))
+        self.cd = np.asarray(cd, dtype=float).reshape(len(self.alpha), len(self.reynolds))
+        self.name = name
+
+        for label, grid in (("alpha", self.alpha), ("reynolds", self.reynolds)):
+            if grid.ndim != 1 or len(grid) == 0 or np.any(np.diff(grid) <= 0):
+                raise ValueError(f"AirfoilPolar {label} grid must be non-empty and strictly increasing")
+        self._alpha_uniform = _is_uniform(self.alpha)
+        self._reynolds_uniform = _is_uniform(self.reynolds)
+
+    @classmethod
+    def from_function(cls, function: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]],
+                      alpha: Grid, reynolds: Grid = (0.0,),
+                      name: str = "airfoil") -> AirfoilPolar:
+        """Tabulate a vectorised ``function(alpha, Re) -> (cl, cd)`` on a grid."""
+        alpha_grid, reynolds_grid = np.meshgrid(np.asarray(alpha, dtype=float),
+                                                np.asarray(reynolds, dtype=float), indexing='ij')
+        cl, cd = function(alpha_grid, reynolds_grid)
+        return cls(alpha, reynolds, np.broadcast_to(cl, alpha_grid.shape),
+                   np.broadcast_to(cd, alpha_grid.shape), name=name)
+
+    @classmethod
+    def from_csv(cls, path, name: Optional[str] = None) -> AirfoilPolar:
+        """Load a long-format ``alpha_deg,reynolds,cl,cd`` table covering a full grid."""
+        path = Path(path)
+        with path.open(newline='', encoding='utf-8') as handle:
+            rows = [line for line in handle if line.strip() and not line.lstrip().startswith('#')]
+        reader = csv.DictReader(rows)
+        missing = set(_CSV_COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path} is missing polar columns: {', '.join(sorted(missing))}")
+        table = np.array([[float(row[column]) for column in _CSV_COLUMNS] for row in reader])
+
+        alpha_deg, alpha_index = np.unique(table[:, 0], return_inverse=True)
+        reynolds, reynolds_index = np.unique(table[:, 1], return_inverse=True)
+        if len(table) != len(alpha_deg) * len(reynolds):
+            raise ValueError(f"{path} does not tabulate every (alpha, Re) combination exactly once")
+        cl = np.full((len(alpha_deg), len(reynolds)), np.nan)
+        cd = np.full_like(cl, np.nan)
+        cl[alpha_index, reynolds_index] = table[:, 2]
+        cd[alpha_index, reynolds_index] = table[:, 3]
+        if np.isnan(cl).any():
+            raise ValueError(f"{path} does not tabulate every (alpha, Re) combination exactly once")
+        return cls(np.radians(alpha_deg), reynolds, cl, cd, name=name or path.stem)
+
+    @classmethod
+    def load(cls, name: str, directory=None) -> AirfoilPolar:
+        """Load ``<name>.csv`` from the packaged airfoil tables (or ``directory``)."""
+        if directory is not None:
+            return cls.from_csv(Path(directory) / f"{name}.csv", name=name)
+        with resources.as_file(AIRFOIL_DATA_DIR / f"{name}.csv") as path:
+            return cls.from_csv(path, name=name)
+
+    def to_csv(self, path, comment: Optional[str] = None):
+        """Write the polar in the long format read by :meth:`from_csv`."""
+        alpha_grid, reynolds_grid = np.meshgrid(np.degrees(self.alpha), self.reynolds, indexing='ij')
+        with Path(path).open('w', newline='', encoding='utf-8') as handle:
+            if comment:
+                for line in comment.splitlines():
+                    handle.write(f"# {line}\n")
+            writer = csv.writer(handle)
+            writer.writerow(_CSV_COLUMNS)
+            for row in zip(alpha_grid.ravel(), reynolds_grid.ravel(), self.cl.ravel(), self.cd.ravel()):
+                writer.writerow([f"{value:.10g}" for value in row])
+
+    def coefficients(self, alpha, reynolds=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolated (cl, cd) for broadcastable arrays of alpha [rad] and Re.
+
+        Scalar inputs return NumPy scalars; ``reynolds`` may be omitted for
+        single-Reynolds-number polars. NaN inputs give NaN coefficients.
+        """
+        alpha = np.asarray(alpha, dtype=float)
+        reynolds = np.asarray(self.reynolds[0] if reynolds is None else reynolds, dtype=float)
+        alpha, reynolds = np.broadcast_arrays(alpha, reynolds)
+        # Look NaN points up at the first grid node (their index would be
+        # undefined) and blank them afterwards
+        invalid = np.isnan(alpha) | np.isnan(reynolds)
+        if invalid.any():
+            alpha = np.where(invalid, self.alpha[0], alpha)
+            reynolds = np.where(invalid, self.reynolds[0], reynolds)
+
+        i, wa = _bracket(self.alpha, alpha, self._alpha_uniform)
+        j, wr = _bracket(self.reynolds, reynolds, self._reynolds_uniform)
+        i1 = np.minimum(i + 1, len(self.alpha) - 1)
+        j1 = np.minimum(j + 1, len(self.reynolds) - 1)
+
+        def interpolate(table: np.ndarray) -> np.ndarray:
+            low = (1.0 - wa) * table[i, j] + wa * table[i1, j]
+            high = (1.0 - wa) * table[i, j1] + wa * table[i1, j1]
+            return np.where(invalid, np.nan, (1.0 - wr) * low + wr * high)[()]
+
+        return interpolate(self.cl), interpolate(self.cd)
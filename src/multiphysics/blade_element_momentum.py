@@ -15,12 +15,60 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from .airfoil_polar import AirfoilPolar
 
 logger = logging.getLogger(__name__)
 
+# Tabulation grid of the historical airfoil polar. Stall breaks fall on nodes and the
+# drag jump at stall gets a second node just past the break.
+_STALL_JUMP = np.radians(12.0) + 1e-9
+HISTORICAL_POLAR_ALPHA = np.union1d(np.radians(np.arange(-180.0, 180.25, 0.25)), [-_STALL_JUMP, _STALL_JUMP])
+HISTORICAL_POLAR_REYNOLDS = np.array([0.0, 50000.0])  # Re correction is linear below 50000
+
+
+def historical_airfoil_coefficients(alpha, Re) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lift and drag coefficients for historical airfoil shape.
+
+    Based on Leonardo's observations of bird wings and simple curved surfaces.
+    Accepts scalars or arrays of angle of attack [rad] and Reynolds number.
+    """
+
+    alpha = np.asarray(alpha, dtype=float)
+    Re = np.asarray(Re, dtype=float)
+
+    # Stall angle (historical airfoils stall early)
+    alpha_stall = np.radians(12.0)
+    cl_alpha = 2 * np.pi * 0.7  # Reduced effectiveness vs. ideal
+    excess = np.abs(alpha) - alpha_stall
+    attached = excess <= 0.0
+
+    # Linear region (thin airfoil theory) and deep-stall lift
+    cl_stall = cl_alpha * alpha_stall * np.sign(alpha)
+    cl = np.where(attached, cl_alpha * alpha, cl_stall * (1.0 - 0.3 * excess / alpha_stall))
+
+    # Drag polar (historical high drag, very high drag in stall)
+    cd0 = 0.015  # Profile drag
+    cd2 = 0.05   # Induced drag factor
+    cd = np.where(attached, cd0 + cd2 * alpha**2, 0.1 + 0.5 * excess**2)
+
+    # Reynolds number corrections (low Re degradation)
+    re_factor = np.where(Re < 50000, 0.5 + 0.5 * Re / 50000, 1.0)
+    return (cl * re_factor)[()], (cd * (2.0 - re_factor))[()]
+
+
+@lru_cache(maxsize=1)
+def historical_airfoil_polar() -> AirfoilPolar:
+    """The historical airfoil model tabulated once as an :class:`AirfoilPolar`."""
+    return AirfoilPolar.from_function(historical_airfoil_coefficients, HISTORICAL_POLAR_ALPHA,
+                                      HISTORICAL_POLAR_REYNOLDS, name="historical_cambered_surface")
+
 
 @dataclass
 class AerialScrewGeometry:
@@ -59,16 +107,20 @@ class BladeElementMomentumTheory:
     - Power prediction with historical constraints
     """
 
-    def __init__(self, geometry: AerialScrewGeometry):
+    def __init__(self, geometry: AerialScrewGeometry, num_elements: int = 20,
+                 polar: Optional[AirfoilPolar] = None):
         self.geometry = geometry
 
+        # Blade airfoil (historical cambered surface unless a tabulated polar is given)
+        self.polar = polar if polar is not None else historical_airfoil_polar()
+
         # Atmospheric conditions
         self.air_density = 1.225  # kg/m³
         self.air_viscosity = 1.81e-5  # Pa·s
         self.sound_speed = 343.0  # m/s
 
         # Discretization
-        self.num_elements = 20
+        self.num_elements = num_elements
         self.radial_positions = np.linspace(
             geometry.inner_radius, geometry.rotor_radius, self.num_elements
         )
@@ -82,11 +134,13 @@ class BladeElementMomentumTheory:
         )
 
         # Flow variables
-        self.induced_velocity = np.zeros(self.num_elements)
-        self.tangential_induced_velocity = np.zeros(self.num_elements)
-        self.angle_of_attack = np.zeros(self.num_elements)
-        self.local_lift = np.zeros(self.num_elements)
-        self.local_drag = np.zeros(self.num_elements)
+        self.induced_velocity: np.ndarray = np.zeros(self.num_elements)
+        self.tangential_induced_velocity: np.ndarray = np.zeros(self.num_elements)
+        self.angle_of_attack: np.ndarray = np.zeros(self.num_elements)
+        self.local_lift: np.ndarray = np.zeros(self.num_elements)
+        self.local_drag: np.ndarray = np.zeros(self.num_elements)
+        self.local_reynolds: np.ndarray = np.zeros(self.num_elements)
+        self.local_resultant_velocity: np.ndarray = np.zeros(self.num_elements)
 
         # Convergence parameters
         self.tolerance = 1e-6
@@ -113,7 +167,7 @@ class BladeElementMomentumTheory:
         # Initialize induced velocities (momentum theory first guess)
         self._initialize_induced_velocities(rpm, collective_pitch)
 
-        # Iterative BEMT solution
+        # Iterative BEMT solution, every blade element updated at once
         for iteration in range(self.max_iterations):
             # Store old values for convergence check
             old_induced = self.induced_velocity.copy()
@@ -186,158 +240,88 @@ class BladeElementMomentumTheory:
         self.tangential_induced_velocity = np.zeros(self.num_elements)
 
     def _update_flow_conditions(self, rpm: float, collective_pitch: float):
-        """Update flow conditions at each blade element."""
+        """Update flow conditions at every blade element."""
 
         omega = 2 * np.pi * rpm / 60.0
 
-        for i in range(self.num_elements):
-            r = self.radial_positions[i]
-
-            # Velocities at blade element
-            tangential_velocity = omega * r + self.tangential_induced_velocity[i]
-            axial_velocity = self.induced_velocity[i]
-
-            # Resultant velocity
-            resultant_velocity = np.sqrt(tangential_velocity**2 + axial_velocity**2)
-
-            # Inflow angle
-            inflow_angle = np.arctan2(axial_velocity, tangential_velocity)
-
-            # Blade geometric angle (including twist and collective)
-            geometric_angle = np.radians(self.twist_distribution[i] + collective_pitch)
+        # Velocities at blade elements
+        tangential_velocity = omega * self.radial_positions + self.tangential_induced_velocity
+        axial_velocity = self.induced_velocity
 
-            # Angle of attack
-            self.angle_of_attack[i] = geometric_angle - inflow_angle
+        # Resultant velocity and inflow angle
+        self.local_resultant_velocity = np.hypot(tangential_velocity, axial_velocity)
+        inflow_angle = np.arctan2(axial_velocity, tangential_velocity)
 
-            # Local Reynolds number
-            chord = self.chord_distribution[i]
-            local_re = self.air_density * resultant_velocity * chord / self.air_viscosity
+        # Blade geometric angle (including twist and collective)
+        geometric_angle = np.radians(self.twist_distribution + collective_pitch)
+        self.angle_of_attack = geometric_angle - inflow_angle
 
-            # Store local conditions for force calculation
-            self.local_reynolds[i] = local_re if hasattr(self, 'local_reynolds') else 0
-            self.local_resultant_velocity[i] = resultant_velocity if hasattr(self, 'local_resultant_velocity') else 0
-
-        # Initialize arrays if not present
-        if not hasattr(self, 'local_reynolds'):
-            self.local_reynolds = np.zeros(self.num_elements)
-        if not hasattr(self, 'local_resultant_velocity'):
-            self.local_resultant_velocity = np.zeros(self.num_elements)
+        # Local Reynolds number
+        self.local_reynolds = (self.air_density * self.local_resultant_velocity *
+                               self.chord_distribution / self.air_viscosity)
 
     def _compute_blade_element_forces(self):
-        """Compute aerodynamic forces on each blade element."""
-
-        for i in range(self.num_elements):
-            alpha = self.angle_of_attack[i]
-            V = self.local_resultant_velocity[i]
-            Re = self.local_reynolds[i]
-
-            # Lift and drag coefficients (historical airfoil)
-            cl, cd = self._get_airfoil_coefficients(alpha, Re)
-
-            # Dynamic pressure
-            q = 0.5 * self.air_density * V**2
-
-            # Blade element area
-            dr = (self.geometry.rotor_radius - self.geometry.inner_radius) / self.num_elements
-            element_area = self.chord_distribution[i] * dr
+        """Compute aerodynamic forces on every blade element."""
 
-            # Forces per blade
-            lift_per_blade = q * element_area * cl
-            drag_per_blade = q * element_area * cd
+        # Lift and drag coefficients (historical airfoil)
+        cl, cd = self._get_airfoil_coefficients(self.angle_of_attack, self.local_reynolds)
 
-            # Total forces (all blades)
-            self.local_lift[i] = lift_per_blade * self.geometry.num_blades
-            self.local_drag[i] = drag_per_blade * self.geometry.num_blades
+        # Dynamic pressure and blade element area
+        q = 0.5 * self.air_density * self.local_resultant_velocity**2
+        dr = (self.geometry.rotor_radius - self.geometry.inner_radius) / self.num_elements
+        element_area = self.chord_distribution * dr
 
-    def _get_airfoil_coefficients(self, alpha: float, Re: float) -> Tuple[float, float]:
-        """
-        Get lift and drag coefficients for historical airfoil shape.
-
-        Based on Leonardo's observations of bird wings and simple curved surfaces.
-        """
+        # Total forces (all blades)
+        self.local_lift = q * element_area * cl * self.geometry.num_blades
+        self.local_drag = q * element_area * cd * self.geometry.num_blades
 
-        # Stall angle (historical airfoils stall early)
-        alpha_stall = np.radians(12.0)
+    def _get_airfoil_coefficients(self, alpha, Re) -> Tuple[np.ndarray, np.ndarray]:
+        """Lift and drag coefficients from the blade airfoil polar (scalars or arrays)."""
+        return self.polar.coefficients(alpha, Re)
 
-        if abs(alpha) <= alpha_stall:
-            # Linear region (thin airfoil theory with historical corrections)
-            cl_alpha = 2 * np.pi * 0.7  # Reduced effectiveness vs. ideal
-            cl = cl_alpha * alpha
-
-            # Drag polar (historical high drag)
-            cd0 = 0.015  # Profile drag
-            cd2 = 0.05   # Induced drag factor
-            cd = cd0 + cd2 * alpha**2
-        else:
-            # Post-stall (deep stall characteristics)
-            cl_stall = cl_alpha * alpha_stall * np.sign(alpha)
-            cl = cl_stall * (1.0 - 0.3 * (abs(alpha) - alpha_stall) / alpha_stall)
-
-            # Very high drag in stall
-            cd = 0.1 + 0.5 * (abs(alpha) - alpha_stall)**2
-
-        # Reynolds number corrections (low Re effects)
-        if Re < 50000:
-            # Low Reynolds number degradation
-            re_factor = 0.5 + 0.5 * Re / 50000
-            cl *= re_factor
-            cd *= (2.0 - re_factor)
-
-        return cl, cd
+    def _element_thrust_and_torque(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Thrust and torque of every blade element."""
+        cos_alpha = np.cos(self.angle_of_attack)
+        sin_alpha = np.sin(self.angle_of_attack)
+        thrust = self.local_lift * cos_alpha - self.local_drag * sin_alpha
+        torque = (self.local_lift * sin_alpha + self.local_drag * cos_alpha) * self.radial_positions
+        return thrust, torque
 
     def _update_induced_velocities_momentum(self):
         """Update induced velocities using momentum theory."""
 
-        for i in range(self.num_elements):
-            r = self.radial_positions[i]
-            dr = (self.geometry.rotor_radius - self.geometry.inner_radius) / self.num_elements
-
-            # Annular area
-            area = 2 * np.pi * r * dr
-
-            # Momentum theory: T = 2 * rho * A * v_i * (v_i + V0)
-            # For hover: T = 2 * rho * A * v_i^2
-            thrust_element = self.local_lift[i] * np.cos(self.angle_of_attack[i]) - \
-                           self.local_drag[i] * np.sin(self.angle_of_attack[i])
+        dr = (self.geometry.rotor_radius - self.geometry.inner_radius) / self.num_elements
+        r = self.radial_positions
+        relaxation = 0.3  # Relaxation for stability
 
-            if thrust_element > 0:
-                # Induced velocity from momentum theory
-                v_i_new = np.sqrt(thrust_element / (2 * self.air_density * area))
+        # Annular area
+        area = 2 * np.pi * r * dr
 
-                # Relaxation for stability
-                relaxation = 0.3
-                self.induced_velocity[i] = (1 - relaxation) * self.induced_velocity[i] + \
-                                          relaxation * v_i_new
-
-            # Tangential induced velocity from torque balance
-            torque_element = (self.local_lift[i] * np.sin(self.angle_of_attack[i]) +
-                            self.local_drag[i] * np.cos(self.angle_of_attack[i])) * r
-
-            if torque_element > 0 and self.induced_velocity[i] > 0:
-                # Angular momentum conservation
-                v_t_new = torque_element / (2 * self.air_density * area * r * self.induced_velocity[i])
+        # Momentum theory: T = 2 * rho * A * v_i * (v_i + V0)
+        # For hover: T = 2 * rho * A * v_i^2
+        thrust_element, torque_element = self._element_thrust_and_torque()
+        loaded = thrust_element > 0
+        v_i_new = np.sqrt(np.where(loaded, thrust_element, 0.0) / (2 * self.air_density * area))
+        self.induced_velocity = np.where(
+            loaded, (1 - relaxation) * self.induced_velocity + relaxation * v_i_new, self.induced_velocity
+        )
 
-                relaxation = 0.3
-                self.tangential_induced_velocity[i] = (1 - relaxation) * self.tangential_induced_velocity[i] + \
-                                                     relaxation * v_t_new
+        # Tangential induced velocity from torque balance (angular momentum conservation)
+        swirling = (torque_element > 0) & (self.induced_velocity > 0)
+        safe_induced = np.where(swirling, self.induced_velocity, 1.0)
+        v_t_new = torque_element / (2 * self.air_density * area * r * safe_induced)
+        self.tangential_induced_velocity = np.where(
+            swirling,
+            (1 - relaxation) * self.tangential_induced_velocity + relaxation * v_t_new,
+            self.tangential_induced_velocity,
+        )
 
     def _integrate_forces(self, omega: float) -> Tuple[float, float, float]:
         """Integrate forces and moments over all blade elements."""
 
-        total_thrust = 0.0
-        total_torque = 0.0
-
-        for i in range(self.num_elements):
-            # Thrust contribution
-            thrust_element = self.local_lift[i] * np.cos(self.angle_of_attack[i]) - \
-                           self.local_drag[i] * np.sin(self.angle_of_attack[i])
-            total_thrust += thrust_element
-
-            # Torque contribution
-            r = self.radial_positions[i]
-            torque_element = (self.local_lift[i] * np.sin(self.angle_of_attack[i]) +
-                            self.local_drag[i] * np.cos(self.angle_of_attack[i])) * r
-            total_torque += torque_element
+        thrust_element, torque_element = self._element_thrust_and_torque()
+        total_thrust = np.sum(thrust_element, axis=-1)
+        total_torque = np.sum(torque_element, axis=-1)
 
         # Power required
         total_power = total_torque * omega
@@ -366,28 +350,22 @@ class BladeElementMomentumTheory:
         # Average induced velocity
         avg_induced_velocity = np.mean(self.induced_velocity)
 
-        # Ideal induced velocity from total thrust
-        total_thrust = np.sum(self.local_lift * np.cos(self.angle_of_attack) -
-                            self.local_drag * np.sin(self.angle_of_attack))
+        # Ideal induced velocity from total thrust; an unloaded rotor has none
+        thrust_element, _ = self._element_thrust_and_torque()
+        total_thrust = float(np.sum(thrust_element))
+        if total_thrust <= 0:
+            return 0.0
         disk_area = np.pi * (self.geometry.rotor_radius**2 - self.geometry.inner_radius**2)
         ideal_induced_velocity = np.sqrt(total_thrust / (2 * self.air_density * disk_area))
 
-        if ideal_induced_velocity > 0:
-            induced_efficiency = ideal_induced_velocity / avg_induced_velocity
-            return min(induced_efficiency, 1.0)
-        else:
-            return 0.0
+        induced_efficiency = ideal_induced_velocity / avg_induced_velocity
+        return float(min(induced_efficiency, 1.0))
 
     def _analyze_wake_structure(self) -> Dict[str, float]:
         """Analyze vortex wake structure for complex flow patterns."""
 
-        # Compute vortex circulation distribution
-        circulation_distribution = np.zeros(self.num_elements)
-
-        for i in range(self.num_elements):
-            # Circulation from Kutta-Joukowski theorem
-            V = self.local_resultant_velocity[i]
-            circulation_distribution[i] = self.local_lift[i] / (self.air_density * V)
+        # Vortex circulation distribution (Kutta-Joukowski theorem)
+        circulation_distribution = self.local_lift / (self.air_density * self.local_resultant_velocity)
 
         # Total circulation
         total_circulation = np.sum(circulation_distribution)
@@ -408,47 +386,178 @@ class BladeElementMomentumTheory:
             'tip_vortex_strength': circulation_distribution[-1] if len(circulation_distribution) > 0 else 0.0
         }
 
+    def solve_operating_points(self, rpm, collective_pitch,
+                               initial_inflow: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Converge the BEMT iteration for many operating points at once.
+
+        Operating points form a leading array axis over the blade elements;
+        points drop out of the active set as soon as they converge, so the
+        remaining iterations only touch unconverged rows. Points whose seed
+        or iterate stops being finite drop out unconverged.
+
+        Args:
+            rpm: Rotor speeds, shape (num_points,)
+            collective_pitch: Collective pitch [degrees], broadcast against ``rpm``
+            initial_inflow: Optional warm start, shape (num_points, 2, num_elements)
+                of axial and tangential induced velocity over tip speed
+
+        Returns:
+            Dictionary of per-point thrust, torque, power, iteration count,
+            convergence flag and converged inflow
+        """
+
+        rpm, collective_pitch = np.broadcast_arrays(np.atleast_1d(np.asarray(rpm, dtype=float)),
+                                                    np.asarray(collective_pitch, dtype=float))
+        num_points = len(rpm)
+        omega = 2 * np.pi * rpm / 60.0
+        tip_speed = omega[:, None] * self.geometry.rotor_radius
+
+        if initial_inflow is None:
+            # Momentum theory first guess, as in _initialize_induced_velocities
+            induced = np.repeat(np.sqrt(0.1) * tip_speed, self.num_elements, axis=1)
+            tangential = np.zeros((num_points, self.num_elements))
+        else:
+            induced = initial_inflow[:, 0] * tip_speed
+            tangential = initial_inflow[:, 1] * tip_speed
+
+        lift, drag, alpha, speed, reynolds = (np.full((num_points, self.num_elements), np.nan) for _ in range(5))
+        iterations = np.zeros(num_points, dtype=int)
+        converged = np.zeros(num_points, dtype=bool)
+        active = np.flatnonzero(np.isfinite(induced).all(axis=1) & np.isfinite(tangential).all(axis=1))
+
+        for _ in range(self.max_iterations):
+            self.induced_velocity = induced[active]
+            self.tangential_induced_velocity = tangential[active]
+            old_induced = self.induced_velocity
+
+            self._update_flow_conditions(rpm[active, None], collective_pitch[active, None])
+            self._compute_blade_element_forces()
+            lift[active], drag[active], alpha[active] = self.local_lift, self.local_drag, self.angle_of_attack
+            speed[active], reynolds[active] = self.local_resultant_velocity, self.local_reynolds
+            self._update_induced_velocities_momentum()
+
+            induced[active] = self.induced_velocity
+            tangential[active] = self.tangential_induced_velocity
+            iterations[active] += 1
+
+            # NaN forces leave the inflow frozen, which would pass the convergence test
+            finite = (np.isfinite(self.local_lift).all(axis=1) & np.isfinite(self.local_drag).all(axis=1)
+                      & np.isfinite(self.induced_velocity).all(axis=1)
+                      & np.isfinite(self.tangential_induced_velocity).all(axis=1))
+            done = finite & (np.max(np.abs(self.induced_velocity - old_induced), axis=1) < self.tolerance)
+            converged[active[done]] = True
+            active = active[finite & ~done]
+            if active.size == 0:
+                break
+        else:
+            logger.warning(f"BEMT did not converge at {active.size} of {num_points} operating points")
+        dropped = num_points - int(converged.sum()) - active.size
+        if dropped:
+            logger.warning(f"BEMT diverged at {dropped} of {num_points} operating points")
+
+        # Leave the solver state holding every point's converged fields
+        self.induced_velocity, self.tangential_induced_velocity = induced, tangential
+        self.local_lift, self.local_drag, self.angle_of_attack = lift, drag, alpha
+        self.local_resultant_velocity, self.local_reynolds = speed, reynolds
+
+        total_thrust, total_torque, total_power = self._integrate_forces(omega)
+        return {
+            'thrust_N': total_thrust,
+            'torque_Nm': total_torque,
+            'power_W': total_power,
+            'iterations': iterations,
+            'converged': converged,
+            'inflow': np.stack([induced, tangential], axis=1) / tip_speed[:, :, None],
+        }
+
     def compute_performance_map(self, rpm_range: Tuple[float, float],
-                              collective_range: Tuple[float, float]) -> Dict[str, np.ndarray]:
+                              collective_range: Tuple[float, float],
+                              num_rpm: int = 20, num_collective: int = 10,
+                              warm_start: bool = True) -> Dict[str, np.ndarray]:
         """
         Compute comprehensive performance map over operating envelope.
 
+        All (collective, rpm) points are solved as one batch. With
+        ``warm_start`` a coarse sub-grid is converged first and its
+        non-dimensional inflow interpolated to seed the remaining points,
+        which makes dense maps (e.g. 200 x 100) cheap.
+
         Args:
             rpm_range: (min_rpm, max_rpm)
             collective_range: (min_collective, max_collective) in degrees
+            num_rpm: Number of RPM values
+            num_collective: Number of collective values
+            warm_start: Seed the map from a converged coarse grid
 
         Returns:
             Dictionary with performance arrays
         """
 
-        rpm_values = np.linspace(rpm_range[0], rpm_range[1], 20)
-        collective_values = np.linspace(collective_range[0], collective_range[1], 10)
+        rpm_values = np.linspace(rpm_range[0], rpm_range[1], num_rpm)
+        collective_values = np.linspace(collective_range[0], collective_range[1], num_collective)
+        collective_grid, rpm_grid = np.meshgrid(collective_values, rpm_values, indexing='ij')
 
-        # Initialize result arrays
-        thrust_map = np.zeros((len(collective_values), len(rpm_values)))
-        power_map = np.zeros((len(collective_values), len(rpm_values)))
-        torque_map = np.zeros((len(collective_values), len(rpm_values)))
-        fm_map = np.zeros((len(collective_values), len(rpm_values)))
+        initial_inflow = None
+        if warm_start and min(num_rpm, num_collective) > 2:
+            initial_inflow = self._coarse_grid_inflow(rpm_values, collective_values)
 
-        # Compute performance at each condition
-        for i, collective in enumerate(collective_values):
-            for j, rpm in enumerate(rpm_values):
-                performance = self.compute_rotor_performance(rpm, collective)
+        solution = self.solve_operating_points(rpm_grid.ravel(), collective_grid.ravel(), initial_inflow)
 
-                thrust_map[i, j] = performance['thrust_N']
-                power_map[i, j] = performance['power_W']
-                torque_map[i, j] = performance['torque_Nm']
-                fm_map[i, j] = performance['figure_of_merit']
+        shape = collective_grid.shape
+        thrust_map = solution['thrust_N'].reshape(shape)
+        power_map = solution['power_W'].reshape(shape)
+
+        # Figure of merit, as in _compute_figure_of_merit
+        disk_area = np.pi * (self.geometry.rotor_radius**2 - self.geometry.inner_radius**2)
+        loaded = (thrust_map > 0) & (power_map > 0)
+        ideal_power = np.where(loaded, thrust_map, 0.0) ** 1.5 / np.sqrt(2 * self.air_density * disk_area)
+        fm_map = np.where(loaded, np.minimum(ideal_power / np.where(loaded, power_map, 1.0), 1.0), 0.0)
 
         return {
             'rpm_values': rpm_values,
             'collective_values': collective_values,
             'thrust_map': thrust_map,
             'power_map': power_map,
-            'torque_map': torque_map,
-            'figure_of_merit_map': fm_map
+            'torque_map': solution['torque_Nm'].reshape(shape),
+            'figure_of_merit_map': fm_map,
+            'iterations_map': solution['iterations'].reshape(shape),
+            'converged_map': solution['converged'].reshape(shape),
         }
 
+    def _coarse_grid_inflow(self, rpm_values: np.ndarray, collective_values: np.ndarray) -> np.ndarray:
+        """Inflow ratios on the full map interpolated from a converged coarse sub-grid."""
+
+        def coarse(values: np.ndarray) -> np.ndarray:
+            index = np.linspace(0, len(values) - 1, min(len(values), 5)).round().astype(int)
+            return np.asarray(values[np.unique(index)])
+
+        coarse_rpm, coarse_collective = coarse(rpm_values), coarse(collective_values)
+        collective_grid, rpm_grid = np.meshgrid(coarse_collective, coarse_rpm, indexing='ij')
+        solution = self.solve_operating_points(rpm_grid.ravel(), collective_grid.ravel())
+        # Only converged coarse points seed the map; NaN spreads to every cell they touch
+        inflow = np.where(solution['converged'][:, None, None], solution['inflow'], np.nan)
+        inflow = inflow.reshape(collective_grid.shape + inflow.shape[1:])
+
+        interpolator = RegularGridInterpolator((coarse_collective, coarse_rpm), inflow)
+        collective_fine, rpm_fine = np.meshgrid(collective_values, rpm_values, indexing='ij')
+        warm: np.ndarray = interpolator(np.column_stack([collective_fine.ravel(), rpm_fine.ravel()]))
+
+        # Elements unloaded at the cold guess never update their induced velocity,
+        # so they keep the cold guess to land on the same solution as a cold start
+        rpm_fine, collective_fine = rpm_fine.ravel(), collective_fine.ravel()
+        self.induced_velocity = np.full((len(rpm_fine), self.num_elements), np.sqrt(0.1)) * (
+            2 * np.pi * rpm_fine[:, None] / 60.0 * self.geometry.rotor_radius
+        )
+        self.tangential_induced_velocity = np.zeros_like(self.induced_velocity)
+        self._update_flow_conditions(rpm_fine[:, None], collective_fine[:, None])
+        self._compute_blade_element_forces()
+        unloaded = self._element_thrust_and_torque()[0] <= 0
+        cold = unloaded | ~np.isfinite(warm).all(axis=1)
+        warm[:, 0][cold] = np.sqrt(0.1)
+        warm[:, 1][cold] = 0.0
+        return warm
+
     def assess_historical_feasibility(self, performance: Dict[str, float]) -> Dict[str, bool]:
         """
         Assess feasibility against historical constraints.
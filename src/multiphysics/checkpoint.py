@@ -0,0 +1,85 @@
+"""
+Checkpoint/restart files for long multi-physics runs.
+
+A checkpoint is a single pickle holding everything the time loop needs to
+continue bit-for-bit: the global state vector, each module's attributes
+(including wake structures and cached geometry), coupling-accelerator
+history, reusable Jacobians, the offset into the streamed run history and
+the NumPy/Python RNG states. Results themselves stay in the history, so a
+checkpoint's size does not grow with run length. Files are replaced
+atomically so a preempted node never leaves a half-written checkpoint behind.
+"""
+
+from __future__ import annotations
+
+import pickle
+import random
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .history import _atomic_write
+
+CHECKPOINT_FORMAT = "multiphysics-checkpoint"
+CHECKPOINT_VERSION = 2
+
+_CHECKPOINT_GLOB = "checkpoint_*.pkl"
+
+
+def checkpoint_filename(step: int) -> str:
+    return f"checkpoint_{step:08d}.pkl"
+
+
+def capture_rng_state() -> Dict[str, Any]:
+    """Global NumPy and Python random-number generator states."""
+    return {'numpy': np.random.get_state(), 'python': random.getstate()}
+
+
+def restore_rng_state(state: Dict[str, Any]):
+    np.random.set_state(state['numpy'])
+    random.setstate(state['python'])
+
+
+def write_checkpoint(directory, step: int, payload: Dict[str, Any], keep: int = 2) -> Path:
+    """
+    Atomically write ``payload`` as the checkpoint for ``step``.
+
+    Only the ``keep`` most recent checkpoints in ``directory`` are retained
+    (``keep <= 0`` keeps them all).
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path: Path = directory / checkpoint_filename(step)
+    document = {'format': CHECKPOINT_FORMAT, 'version': CHECKPOINT_VERSION, 'step': step, **payload}
+    _atomic_write(path, lambda stream: pickle.dump(document, stream, protocol=pickle.HIGHEST_PROTOCOL))
+
+    if keep > 0:
+        for stale in sorted(directory.glob(_CHECKPOINT_GLOB))[:-keep]:
+            stale.unlink()
+    return path
+
+
+def latest_checkpoint(directory) -> Optional[Path]:
+    """Most recent checkpoint file in ``directory``, or None."""
+    checkpoints = sorted(Path(directory).glob(_CHECKPOINT_GLOB))
+    return checkpoints[-1] if checkpoints else None
+
+
+def load_checkpoint(path) -> Dict[str, Any]:
+    """Load a checkpoint file, or the latest checkpoint of a directory."""
+    path = Path(path)
+    if path.is_dir():
+        latest = latest_checkpoint(path)
+        if latest is None:
+            raise FileNotFoundError(f"No checkpoints found in {path}")
+        path = latest
+
+    # Checkpoints are pickles: only resume from files written by trusted runs
+    with path.open("rb") as stream:
+        document = pickle.load(stream)
+    if not isinstance(document, dict) or document.get('format') != CHECKPOINT_FORMAT:
+        raise ValueError(f"{path} is not a multi-physics checkpoint")
+    if document.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {document.get('version')} in {path}")
+    return document
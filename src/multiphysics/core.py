@@ -5,16 +5,27 @@ Integrates multiple physics domains for comprehensive analysis of Leonardo's inv
 Handles coupling between aerodynamics, structures, materials, and thermal effects.
 """
 
+import csv
 import logging
+import os
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .checkpoint import capture_rng_state, load_checkpoint, restore_rng_state, write_checkpoint
+from .history import SimulationHistoryWriter, iter_history_chunks, load_history
 
 logger = logging.getLogger(__name__)
 
+# "staggered", "monolithic" and "partitioned" exchange coupling data unrelaxed
+# after a block Jacobi sweep; the accelerated schemes use block Gauss-Seidel sweeps
+COUPLING_SCHEMES = ("staggered", "monolithic", "partitioned", "aitken", "iqn_ils")
+
 
 @dataclass
 class SimulationParameters:
@@ -41,11 +52,28 @@ class SimulationParameters:
     nonlinear_solver: str = "newton"  # newton, quasi_newton, fixed_point
     linear_solver: str = "spsolve"  # spsolve, cg, gmres
     preconditioner: str = "ilu"  # none, jacobi, ilu
+    jacobian_reuse: bool = True  # modified Newton: keep factorisations between iterations
+    jacobian_refresh_ratio: float = 0.5  # refresh when |r_k+1| / |r_k| exceeds this
+
+    # Wake modelling
+    wake_tree_theta: float = 0.0  # Barnes-Hut opening angle; 0 = exact direct summation, ~0.3 for long runs
+    max_wake_panels: int = 200  # older panels are amalgamated beyond this count
+    wake_prune_tolerance: float = 1e-6  # relative to the peak wake circulation
 
     # Output control
     output_frequency: int = 10
     save_intermediate: bool = True
     export_format: str = "vtk"  # vtk, hdf5, csv
+    history_path: Optional[str] = None  # stream snapshots to disk instead of keeping them in memory
+    history_backend: str = "auto"  # auto, npz, hdf5
+    history_chunk_size: int = 64  # snapshots per compressed chunk
+    history_memory_limit_mb: Optional[float] = None  # flush early once the buffer exceeds this
+
+    # Checkpoint/restart
+    checkpoint_path: Optional[str] = None  # directory for periodic restart checkpoints (and, without
+    # history_path, the streamed history they point into)
+    checkpoint_interval: int = 0  # timesteps between checkpoints; 0 disables them
+    checkpoint_keep: int = 2  # most recent checkpoints retained; 0 keeps all
 
 
 @dataclass
@@ -75,12 +103,24 @@ class MaterialProperties:
 class PhysicsModule(ABC):
     """Abstract base class for physics modules."""
 
+    # Linear modules have a state-independent Jacobian that is factorised once per run
+    is_linear = False
+
+    # Attributes supplied by the run configuration rather than restored from checkpoints
+    checkpoint_exclude = ('parameters',)
+
     def __init__(self, name: str, parameters: SimulationParameters):
         self.name = name
         self.parameters = parameters
         self.is_initialized = False
         self.state_variables = {}
         self.coupling_variables = {}
+        # Bumped whenever the Jacobian changes outside the Newton state
+        self.jacobian_version = 0
+
+    def invalidate_jacobian(self):
+        """Mark cached Jacobians and factorisations of this module as stale."""
+        self.jacobian_version += 1
 
     @abstractmethod
     def initialize(self, geometry, materials, boundary_conditions):
@@ -107,6 +147,116 @@ class PhysicsModule(ABC):
         """Return variables to be sent to other physics modules."""
         pass
 
+    def solve_linear_system(self, state: np.ndarray, time: float,
+                            rhs: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Solve J(state) @ dx = rhs with a module-specific method.
+
+        Modules that can reuse factorisations override this; returning None
+        falls back to assembling the Jacobian and using the configured solver.
+        """
+        return None
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """
+        Module attributes needed to resume a run (state, wakes, caches).
+
+        The mapping is pickled immediately; modules holding resources that
+        cannot be pickled override this and ``set_checkpoint_state``.
+        """
+        return {key: value for key, value in vars(self).items() if key not in self.checkpoint_exclude}
+
+    def set_checkpoint_state(self, state: Dict[str, Any]):
+        """Restore attributes captured by ``get_checkpoint_state``."""
+        vars(self).update(state)
+
+
+class AitkenRelaxation:
+    """
+    Dynamic Aitken under-relaxation of the coupling fixed-point iteration.
+
+    The relaxation factor is updated every iteration from the two most recent
+    interface residuals r_k = G(y_k) - y_k.
+    """
+
+    def __init__(self, initial_relaxation: float = 0.5):
+        self.initial_relaxation = initial_relaxation
+        self.relaxation = initial_relaxation
+        self._previous_residual: Optional[np.ndarray] = None
+
+    def start_timestep(self):
+        self.relaxation = self.initial_relaxation
+        self._previous_residual = None
+
+    def end_timestep(self):
+        pass
+
+    def next_iterate(self, current: np.ndarray, mapped: np.ndarray) -> np.ndarray:
+        residual = mapped - current
+        if self._previous_residual is not None and len(self._previous_residual) == len(residual):
+            residual_change = residual - self._previous_residual
+            denominator = float(residual_change @ residual_change)
+            if denominator > 0.0:
+                self.relaxation = -self.relaxation * float(self._previous_residual @ residual_change) / denominator
+        self._previous_residual = residual
+        return np.asarray(current + self.relaxation * residual)
+
+
+class IQNILSAccelerator:
+    """
+    Interface quasi-Newton with an inverse Jacobian from least squares (IQN-ILS).
+
+    Differences of interface residuals (V) and of mapped iterates (W) from
+    the current and up to ``reuse_timesteps`` previous timesteps approximate
+    the inverse Jacobian of the residual; the first iteration of a timestep
+    without history falls back to constant under-relaxation.
+    """
+
+    def __init__(self, initial_relaxation: float = 0.1, max_columns: int = 30,
+                 reuse_timesteps: int = 0):
+        self.initial_relaxation = initial_relaxation
+        self.max_columns = max_columns
+        self._previous_steps: Deque[Tuple[List[np.ndarray], List[np.ndarray]]] = deque(maxlen=reuse_timesteps)
+        self._residual_differences: List[np.ndarray] = []
+        self._mapped_differences: List[np.ndarray] = []
+        self._previous_residual: Optional[np.ndarray] = None
+        self._previous_mapped: Optional[np.ndarray] = None
+
+    def start_timestep(self):
+        self._residual_differences = []
+        self._mapped_differences = []
+        self._previous_residual = None
+        self._previous_mapped = None
+
+    def end_timestep(self):
+        if self._residual_differences and self._previous_steps.maxlen:
+            self._previous_steps.append((self._residual_differences, self._mapped_differences))
+
+    def next_iterate(self, current: np.ndarray, mapped: np.ndarray) -> np.ndarray:
+        residual = mapped - current
+        if self._previous_residual is not None and len(self._previous_residual) == len(residual):
+            self._residual_differences.insert(0, residual - self._previous_residual)
+            self._mapped_differences.insert(0, mapped - self._previous_mapped)
+        self._previous_residual = residual
+        self._previous_mapped = mapped
+
+        # Newest columns first, then those kept from previous timesteps
+        columns_v = list(self._residual_differences)
+        columns_w = list(self._mapped_differences)
+        for step_v, step_w in reversed(self._previous_steps):
+            columns_v.extend(step_v)
+            columns_w.extend(step_w)
+        pairs = [(v, w) for v, w in zip(columns_v, columns_w) if len(v) == len(residual)]
+        pairs = pairs[:self.max_columns]
+
+        if not pairs:
+            return np.asarray(current + self.initial_relaxation * residual)
+
+        V = np.column_stack([v for v, _ in pairs])
+        W = np.column_stack([w for _, w in pairs])
+        coefficients = np.linalg.lstsq(V, -residual, rcond=None)[0]
+        return np.asarray(mapped + W @ coefficients)
+
 
 class MultiPhysicsSimulator:
     """
@@ -120,6 +270,10 @@ class MultiPhysicsSimulator:
         self.parameters = parameters
         self.physics_modules: Dict[str, PhysicsModule] = {}
         self.coupling_matrix = None
+        self.coupling_scheme = "staggered"
+        self.coupling_accelerator: Optional[Union[AitkenRelaxation, IQNILSAccelerator]] = None
+        self.solver_statistics: Dict[str, Dict[str, int]] = {}
+        self._linear_solver_cache: Dict[str, Dict[str, Any]] = {}
         self.solution_history = []
         self.convergence_history = []
 
@@ -132,13 +286,34 @@ class MultiPhysicsSimulator:
         self.physics_modules[module.name] = module
         self.logger.info(f"Added physics module: {module.name}")
 
-    def setup_coupling(self, coupling_scheme: str = "staggered"):
+    def setup_coupling(self, coupling_scheme: str = "staggered", *,
+                       relaxation: Optional[float] = None, max_columns: int = 30,
+                       reuse_timesteps: int = 0):
         """
         Set up coupling between physics modules.
 
         Args:
-            coupling_scheme: 'staggered', 'monolithic', or 'partitioned'
+            coupling_scheme: 'staggered', 'monolithic', 'partitioned', 'aitken'
+                (dynamic Aitken relaxation) or 'iqn_ils' (interface quasi-Newton)
+            relaxation: Initial under-relaxation factor for 'aitken'/'iqn_ils'
+            max_columns: Maximum secant pairs kept by 'iqn_ils'
+            reuse_timesteps: Previous timesteps whose secant pairs 'iqn_ils' reuses
         """
+        if coupling_scheme not in COUPLING_SCHEMES:
+            raise ValueError(
+                f"Unknown coupling scheme '{coupling_scheme}'. Available: {', '.join(COUPLING_SCHEMES)}"
+            )
+
+        self.coupling_scheme = coupling_scheme
+        if coupling_scheme == "aitken":
+            self.coupling_accelerator = AitkenRelaxation(0.5 if relaxation is None else relaxation)
+        elif coupling_scheme == "iqn_ils":
+            self.coupling_accelerator = IQNILSAccelerator(
+                0.1 if relaxation is None else relaxation, max_columns, reuse_timesteps
+            )
+        else:
+            self.coupling_accelerator = None
+
         num_modules = len(self.physics_modules)
         self.coupling_matrix = np.zeros((num_modules, num_modules))
 
@@ -168,7 +343,13 @@ class MultiPhysicsSimulator:
         """
         converged = False
         iteration = 0
+        module_solves = 0
         coupling_residual = float('inf')
+        residual_history = []
+        accelerator = self.coupling_accelerator
+        gauss_seidel = accelerator is not None
+        if accelerator is not None:
+            accelerator.start_timestep()
 
         # Store initial coupling variables
         prev_coupling = {}
@@ -178,9 +359,10 @@ class MultiPhysicsSimulator:
         while not converged and iteration < self.parameters.max_coupling_iterations:
             iteration += 1
 
-            # Solve each physics module
+            # Solve each physics module (block Jacobi, or Gauss-Seidel when accelerated)
             new_state = state.copy()
             state_offset = 0
+            current_coupling: Dict[str, Dict[str, Any]] = {}
 
             for name, module in self.physics_modules.items():
                 # Extract state for this module
@@ -195,31 +377,39 @@ class MultiPhysicsSimulator:
                     self.logger.error(f"Failed to solve {name}: {e}")
                     return state, False
 
+                module_solves += 1
                 state_offset += dof_count
 
-            # Update coupling variables
-            current_coupling = {}
-            for name, module in self.physics_modules.items():
-                # Update module with new state
-                module.state_variables = self._extract_module_state(module, new_state)
-
-                # Get updated coupling variables
-                current_coupling[name] = module.get_coupling_variables()
+                # Gauss-Seidel: later modules in the sweep see this module's new data
+                if gauss_seidel:
+                    self._exchange_coupling(name, module, new_state, current_coupling)
 
-                # Send coupling data to other modules
-                for other_name, other_module in self.physics_modules.items():
-                    if other_name != name:
-                        other_module.update_coupling_variables(current_coupling[name])
+            # Jacobi: exchange coupling data once every module has been solved
+            if not gauss_seidel:
+                for name, module in self.physics_modules.items():
+                    self._exchange_coupling(name, module, new_state, current_coupling)
 
             # Check coupling convergence
             coupling_residual = self._compute_coupling_residual(prev_coupling, current_coupling)
+            residual_history.append(float(coupling_residual))
             converged = coupling_residual < self.parameters.coupling_tolerance
 
+            # Relax or quasi-Newton update the interface data for the next sweep
+            if accelerator is not None and not converged:
+                current_coupling = self._accelerate_coupling(accelerator, prev_coupling, current_coupling)
+                for name in self.physics_modules:
+                    for other_name, other_module in self.physics_modules.items():
+                        if other_name != name:
+                            other_module.update_coupling_variables(current_coupling[name])
+
             prev_coupling = current_coupling
 
             if iteration % 10 == 0:
                 self.logger.debug(f"Coupling iteration {iteration}, residual: {coupling_residual:.2e}")
 
+        if accelerator is not None:
+            accelerator.end_timestep()
+
         if converged:
             self.logger.debug(f"Coupling converged in {iteration} iterations")
         else:
@@ -229,13 +419,71 @@ class MultiPhysicsSimulator:
             'time': time,
             'iterations': iteration,
             'residual': coupling_residual,
-            'converged': converged
+            'converged': converged,
+            'scheme': self.coupling_scheme,
+            'module_solves': module_solves,
+            'residual_history': residual_history
         })
 
         return new_state, converged
 
+    def _exchange_coupling(self, name: str, module: PhysicsModule, new_state: np.ndarray,
+                           current_coupling: Dict):
+        """Store a solved module's state and send its coupling variables to the others."""
+        module.state_variables = self._extract_module_state(module, new_state)
+        current_coupling[name] = module.get_coupling_variables()
+        for other_name, other_module in self.physics_modules.items():
+            if other_name != name:
+                other_module.update_coupling_variables(current_coupling[name])
+
+    def _accelerate_coupling(self, accelerator, prev_coupling: Dict, current_coupling: Dict) -> Dict:
+        """Apply the coupling accelerator to the numeric interface variables."""
+
+        layout = []
+        for module_name, variables in current_coupling.items():
+            for var_name, value in variables.items():
+                previous = prev_coupling.get(module_name, {}).get(var_name)
+                if isinstance(value, dict) or previous is None:
+                    continue
+                value = np.asarray(value)
+                if value.dtype.kind not in "biuf" or np.shape(previous) != value.shape:
+                    continue
+                layout.append((module_name, var_name, value.shape))
+
+        if not layout:
+            return current_coupling
+
+        current = np.concatenate([
+            np.asarray(prev_coupling[module_name][var_name], dtype=float).ravel()
+            for module_name, var_name, _ in layout
+        ])
+        mapped = np.concatenate([
+            np.asarray(current_coupling[module_name][var_name], dtype=float).ravel()
+            for module_name, var_name, _ in layout
+        ])
+        relaxed = accelerator.next_iterate(current, mapped)
+
+        accelerated = {name: dict(variables) for name, variables in current_coupling.items()}
+        offset = 0
+        for module_name, var_name, shape in layout:
+            size = int(np.prod(shape))
+            value = relaxed[offset:offset + size].reshape(shape)
+            accelerated[module_name][var_name] = value if shape else float(value)
+            offset += size
+        return accelerated
+
     def _solve_module(self, module: PhysicsModule, state: np.ndarray, time: float) -> np.ndarray:
-        """Solve individual physics module using Newton's method."""
+        """
+        Solve individual physics module using (modified) Newton's method.
+
+        With ``jacobian_reuse`` the Jacobian and its factorisation or Krylov
+        preconditioner are kept between Newton iterations and timesteps until
+        the residual stops contracting by ``jacobian_refresh_ratio``; if the
+        first step of a call, taken with an earlier call's Jacobian, does not
+        contract it is undone and redone with a fresh one.  Modules declaring
+        ``is_linear`` are factorised once per ``jacobian_version``; modules bump
+        it when they reassemble.
+        """
 
         def residual_func(x):
             return module.compute_residual(x, time)
@@ -243,32 +491,131 @@ class MultiPhysicsSimulator:
         def jacobian_func(x):
             return module.compute_jacobian(x, time)
 
+        stats = self.solver_statistics.setdefault(module.name, {
+            'newton_iterations': 0,
+            'jacobian_evaluations': 0,
+            'factorizations': 0,
+            'factor_reuses': 0,
+            'stall_refreshes': 0,
+            'krylov_iterations': 0,
+            'module_solves': 0,
+            'rejected_steps': 0,
+            'unconverged_solves': 0,
+        })
+        stats['module_solves'] += 1
+        cache = self._linear_solver_cache.setdefault(module.name, {})
+        if not self.parameters.jacobian_reuse:
+            cache.clear()
+
         # Newton-Raphson iteration
         x = state.copy()
+        converged = False
+        residual_norm = float('inf')
+        previous_norm = float('inf')
+        carried_step_from: Optional[Tuple[np.ndarray, np.ndarray, float]] = None  # iterate before a first step with an earlier call's Jacobian
         for _newton_iter in range(20):  # Max Newton iterations
             residual = residual_func(x)
+            residual_norm = float(np.linalg.norm(residual))
 
-            if np.linalg.norm(residual) < 1e-10:
+            if residual_norm < 1e-10:
+                converged = True
                 break
 
-            jacobian = jacobian_func(x)
+            stats['newton_iterations'] += 1
 
-            try:
-                if self.parameters.linear_solver == "spsolve":
-                    delta_x = sp.linalg.spsolve(jacobian, -residual)
-                elif self.parameters.linear_solver == "cg":
-                    delta_x, _ = sp.linalg.cg(jacobian, -residual)
-                else:  # gmres
-                    delta_x, _ = sp.linalg.gmres(jacobian, -residual)
+            # Modules with reusable factorisations solve the Newton step themselves
+            delta_x = module.solve_linear_system(x, time, -residual)
+            if delta_x is not None:
+                x += delta_x
+                continue
+
+            # Refresh a reused Jacobian once convergence stalls.  The first step
+            # of a call taken with an earlier call's Jacobian is undone as well,
+            # so a stale Jacobian never moves the iterate unchecked.
+            stalled = residual_norm > self.parameters.jacobian_refresh_ratio * previous_norm
+            if cache and not module.is_linear and stalled:
+                cache.clear()
+                stats['stall_refreshes'] += 1
+                if carried_step_from is not None:
+                    x, residual, residual_norm = carried_step_from
+                    stats['rejected_steps'] += 1
+            carried_step_from = None
+            previous_norm = residual_norm
 
+            try:
+                if cache.get('size') != len(residual) or cache.get('version') != module.jacobian_version:
+                    cache.clear()
+                    jacobian = jacobian_func(x)
+                    stats['jacobian_evaluations'] += 1
+                    cache.update(self._prepare_linear_solver(jacobian), size=len(residual),
+                                 version=module.jacobian_version)
+                    stats['factorizations'] += 1
+                else:
+                    stats['factor_reuses'] += 1
+                    if _newton_iter == 0 and not module.is_linear:
+                        carried_step_from = (x.copy(), residual, residual_norm)
+
+                delta_x = self._apply_linear_solver(cache, -residual, stats)
                 x += delta_x
 
             except Exception as e:
+                cache.clear()
                 self.logger.warning(f"Linear solver failed: {e}")
                 break
 
+            if not self.parameters.jacobian_reuse:
+                cache.clear()
+
+        if not converged:
+            stats['unconverged_solves'] += 1
+            self.logger.warning(
+                f"Newton solve for module '{module.name}' did not converge at t = {time:.3f} "
+                f"(last residual norm {residual_norm:.3e})"
+            )
         return x
 
+    def _prepare_linear_solver(self, jacobian: sp.spmatrix) -> Dict[str, Any]:
+        """Factorise the Jacobian (spsolve) or build its Krylov preconditioner."""
+
+        jacobian = sp.csc_matrix(jacobian)
+        if self.parameters.linear_solver == "spsolve":
+            return {'jacobian': jacobian, 'factor': spla.splu(jacobian)}
+
+        if self.parameters.preconditioner == "ilu":
+            ilu = spla.spilu(jacobian)
+            preconditioner = spla.LinearOperator(jacobian.shape, ilu.solve)
+        elif self.parameters.preconditioner == "jacobi":
+            diagonal = jacobian.diagonal()
+            inverse = np.divide(1.0, diagonal, out=np.ones_like(diagonal), where=diagonal != 0)
+            preconditioner = spla.LinearOperator(jacobian.shape, lambda v: inverse * v)
+        else:
+            preconditioner = None
+        return {'jacobian': jacobian, 'preconditioner': preconditioner}
+
+    def _apply_linear_solver(self, cache: Dict[str, Any], rhs: np.ndarray,
+                             stats: Dict[str, int]) -> np.ndarray:
+        """Solve with the cached factorisation or preconditioned CG/GMRES."""
+
+        if 'factor' in cache:
+            return np.asarray(cache['factor'].solve(rhs))
+
+        def count_iteration(_):
+            stats['krylov_iterations'] += 1
+
+        if self.parameters.linear_solver == "cg":
+            delta_x, info = spla.cg(cache['jacobian'], rhs, M=cache['preconditioner'],
+                                    callback=count_iteration)
+        else:  # gmres
+            delta_x, info = spla.gmres(cache['jacobian'], rhs, M=cache['preconditioner'],
+                                       callback=count_iteration, callback_type='pr_norm')
+        if info > 0:
+            self.logger.debug(f"Krylov solver stopped after {info} iterations without converging")
+        return np.asarray(delta_x)
+
+    def reset_solver_cache(self):
+        """Drop cached Jacobians, factorisations and preconditioners."""
+        self._linear_solver_cache.clear()
+
     def _extract_module_state(self, module: PhysicsModule, global_state: np.ndarray) -> Dict[str, np.ndarray]:
         """Extract state variables for a specific module from global state vector."""
         # This would need to be implemented based on specific module structure
@@ -284,6 +631,9 @@ class MultiPhysicsSimulator:
             curr_vars = current_coupling[module_name]
 
             for var_name in prev_vars:
+                # Nested dictionaries carry diagnostics, not coupled fields
+                if isinstance(prev_vars[var_name], dict):
+                    continue
                 if var_name in curr_vars:
                     prev_val = np.array(prev_vars[var_name])
                     curr_val = np.array(curr_vars[var_name])
@@ -292,14 +642,19 @@ class MultiPhysicsSimulator:
 
         return np.sqrt(total_residual)
 
-    def run_simulation(self) -> Dict[str, Any]:
+    def run_simulation(self, resume_from: Optional[str] = None) -> Dict[str, Any]:
         """
         Run the complete multi-physics simulation.
 
+        Args:
+            resume_from: Checkpoint file, or checkpoint directory whose latest
+                checkpoint is used, to continue an interrupted run from
+
         Returns:
             Simulation results dictionary
         """
         self.logger.info("Starting multi-physics simulation")
+        self.reset_solver_cache()
 
         # Initialize state vector
         total_dof = sum(len(module.state_variables) for module in self.physics_modules.values())
@@ -318,38 +673,76 @@ class MultiPhysicsSimulator:
             'convergence': [],
             'performance': {}
         }
+        totals = {'coupling_iterations': 0, 'converged_steps': 0}
 
         current_state = initial_state
-
-        for i, t in enumerate(time_points):
+        start_index = 0
+        resume_time = None
+        if resume_from is not None:
+            checkpoint = load_checkpoint(resume_from)
+            current_state, results, totals = self._restore_checkpoint(checkpoint, time_points)
+            start_index = checkpoint['step'] + 1
+            resume_time = float(time_points[checkpoint['step']])
+            self.logger.info(f"Resuming from checkpoint at t = {resume_time:.3f}")
+
+        history_path, implicit_history = self._history_target()
+        if resume_from is not None:
+            history_path = checkpoint['history']['path']  # the offset refers to this file
+        history = self._open_history_writer(history_path, resume_after=resume_time) if history_path else None
+
+        for i in range(start_index, len(time_points)):
+            t = time_points[i]
             self.logger.debug(f"Solving at time t = {t:.3f}")
 
             # Solve coupled system
             new_state, converged = self.solve_coupled_system(t, current_state)
+            totals['coupling_iterations'] += self.convergence_history[-1]['iterations']
+            totals['converged_steps'] += int(converged)
 
             if not converged:
                 self.logger.warning(f"Failed to converge at time t = {t:.3f}")
 
             # Store results
-            if i % self.parameters.output_frequency == 0:
+            if history is not None:
+                history.append_convergence(self.convergence_history.pop())
+                if i % self.parameters.output_frequency == 0:
+                    history.append_snapshot(t, new_state, converged, self._collect_coupling_variables())
+            elif i % self.parameters.output_frequency == 0:
                 results['time'].append(t)
                 results['state'].append(new_state.copy())
                 results['convergence'].append(converged)
 
             current_state = new_state
 
+            if self._checkpoint_due(i, len(time_points)):
+                assert history is not None  # checkpointed runs always stream their history
+                history.flush()  # on-disk history must not lag the checkpoint
+                self._write_checkpoint(i, current_state, history, totals)
+
             # Progress reporting
             if i % 100 == 0:
                 progress = (i / len(time_points)) * 100
                 self.logger.info(f"Simulation progress: {progress:.1f}%")
 
+        if history is not None:
+            history.close()
+            results['history_path'] = str(history.path)
+            if implicit_history:
+                # Streamed only so checkpoints stay small; hand back the usual in-memory results
+                stored = load_history(history.path)
+                results['time'] = list(stored['time'])
+                results['state'] = list(stored['state'])
+                results['convergence'] = stored['converged'].tolist()
+                self.convergence_history = stored['convergence']
+
         # Compute performance metrics
-        converged_steps = sum(results['convergence'])
+        converged_steps = totals['converged_steps']
         results['performance'] = {
             'total_time_steps': len(time_points),
             'converged_steps': converged_steps,
             'convergence_rate': converged_steps / len(time_points),
-            'average_coupling_iterations': np.mean([h['iterations'] for h in self.convergence_history])
+            'average_coupling_iterations': totals['coupling_iterations'] / len(time_points),
+            'solver_statistics': {name: dict(stats) for name, stats in self.solver_statistics.items()}
         }
 
         self.solution_history = results
@@ -357,6 +750,121 @@ class MultiPhysicsSimulator:
 
         return results
 
+    def _history_target(self) -> Tuple[Optional[str], bool]:
+        """History path for this run and whether it was implied by checkpointing.
+
+        Checkpoints store only an offset into the streamed history, so a
+        checkpointed run without ``history_path`` streams to
+        ``<checkpoint_path>/history`` instead of re-pickling its results.
+        """
+        if self.parameters.history_path is not None:
+            return self.parameters.history_path, False
+        if self.parameters.checkpoint_path is not None and self.parameters.checkpoint_interval > 0:
+            return os.path.join(self.parameters.checkpoint_path, "history"), True
+        return None, False
+
+    def _open_history_writer(self, path: Optional[str] = None,
+                             resume_after: Optional[float] = None) -> Optional[SimulationHistoryWriter]:
+        """Streaming history writer for ``path`` (default: this run's history target), if any."""
+        path = path if path is not None else self._history_target()[0]
+        if path is None:
+            return None
+        return SimulationHistoryWriter(
+            path,
+            backend=self.parameters.history_backend,
+            chunk_size=self.parameters.history_chunk_size,
+            memory_limit_mb=self.parameters.history_memory_limit_mb,
+            resume_after=resume_after,
+        )
+
+    def _checkpoint_due(self, step: int, num_steps: int) -> bool:
+        interval = self.parameters.checkpoint_interval
+        if self.parameters.checkpoint_path is None or interval <= 0:
+            return False
+        return (step + 1) % interval == 0 and step + 1 < num_steps
+
+    def _write_checkpoint(self, step: int, state: np.ndarray, history: SimulationHistoryWriter,
+                          totals: Dict[str, int]):
+        """Atomically checkpoint everything the time loop needs to continue after ``step``.
+
+        Results already live in the flushed history, so only its path and
+        offset are stored and checkpoint size does not grow with run length.
+        """
+        # Factorisations are rebuilt from the cached Jacobians on restart
+        jacobians = {
+            name: (cache['jacobian'], cache['size'], cache['version'])
+            for name, cache in self._linear_solver_cache.items() if 'jacobian' in cache
+        }
+        payload = {
+            'time_start': self.parameters.time_start,
+            'time_step': self.parameters.time_step,
+            'state': state,
+            'history': {'path': str(history.path), 'snapshots': history.snapshots_written},
+            'totals': totals,
+            'modules': {name: module.get_checkpoint_state() for name, module in self.physics_modules.items()},
+            'coupling_scheme': self.coupling_scheme,
+            'coupling_accelerator': self.coupling_accelerator,
+            'coupling_matrix': self.coupling_matrix,
+            'solver_statistics': self.solver_statistics,
+            'jacobians': jacobians,
+            'rng': capture_rng_state(),
+        }
+        path = write_checkpoint(self.parameters.checkpoint_path, step, payload, keep=self.parameters.checkpoint_keep)
+        self.logger.debug(f"Wrote checkpoint {path}")
+
+    def _restore_checkpoint(self, checkpoint: Dict[str, Any], time_points: np.ndarray) -> Tuple:
+        """Restore simulator and module state; returns (state, results, totals).
+
+        Stored results are not restored: the history writer reopens the
+        checkpoint's history and truncates it back to the checkpoint time.
+        """
+        if (not np.isclose(checkpoint['time_start'], self.parameters.time_start)
+                or not np.isclose(checkpoint['time_step'], self.parameters.time_step)):
+            raise ValueError("Checkpoint was written with a different time discretisation")
+        if checkpoint['step'] >= len(time_points):
+            raise ValueError(f"Checkpoint step {checkpoint['step']} lies beyond time_end")
+        if set(checkpoint['modules']) != set(self.physics_modules):
+            raise ValueError(
+                f"Checkpoint modules {sorted(checkpoint['modules'])} do not match "
+                f"{sorted(self.physics_modules)}"
+            )
+
+        for name, module in self.physics_modules.items():
+            module.set_checkpoint_state(checkpoint['modules'][name])
+        self.coupling_scheme = checkpoint['coupling_scheme']
+        self.coupling_accelerator = checkpoint['coupling_accelerator']
+        self.coupling_matrix = checkpoint['coupling_matrix']
+        self.convergence_history = []  # streamed to the history with every step
+        self.solver_statistics = checkpoint['solver_statistics']
+        for name, (jacobian, size, version) in checkpoint['jacobians'].items():
+            self._linear_solver_cache[name] = dict(self._prepare_linear_solver(jacobian), size=size,
+                                                   version=version)
+        restore_rng_state(checkpoint['rng'])
+        results: Dict[str, Any] = {'time': [], 'state': [], 'convergence': [], 'performance': {}}
+        return checkpoint['state'], results, checkpoint['totals']
+
+    def _collect_coupling_variables(self) -> Dict[str, Dict[str, Any]]:
+        return {name: module.get_coupling_variables() for name, module in self.physics_modules.items()}
+
+    def _iter_solution_chunks(self):
+        """Stored results as (time, state, converged, convergence entries) blocks.
+
+        Blocks are streamed from the history file when the run wrote one; a
+        block may carry convergence entries but no snapshots (empty ``time``).
+        """
+        history_path = self.solution_history.get('history_path')
+        if history_path is not None:
+            for chunk in iter_history_chunks(history_path):
+                times = chunk.get('time', np.zeros(0))
+                yield times, chunk.get('state'), chunk.get('converged'), chunk['convergence']
+        else:
+            yield (
+                np.asarray(self.solution_history['time']),
+                np.asarray(self.solution_history['state']),
+                np.asarray(self.solution_history['convergence']),
+                self.convergence_history,
+            )
+
     def export_results(self, filename: str, format: str = "vtk"):
         """Export simulation results to file."""
         if not self.solution_history:
@@ -381,36 +889,52 @@ class MultiPhysicsSimulator:
         """Export results in HDF5 format for data analysis."""
         import h5py
 
-        with h5py.File(filename, 'w') as f:
-            f.create_dataset('time', data=self.solution_history['time'])
-            f.create_dataset('state', data=self.solution_history['state'])
-            f.create_dataset('convergence', data=self.solution_history['convergence'])
+        def append(handle, name, data):
+            if name not in handle:
+                handle.create_dataset(name, shape=(0,) + data.shape[1:], maxshape=(None,) + data.shape[1:],
+                                      dtype=data.dtype, chunks=True)
+            dataset = handle[name]
+            start = dataset.shape[0]
+            dataset.resize(start + len(data), axis=0)
+            dataset[start:] = data
 
-            # Store convergence history
+        with h5py.File(filename, 'w') as f:
+            # Copy one block at a time so a streamed history never has to fit in memory
             conv_group = f.create_group('convergence_history')
-            for i, entry in enumerate(self.convergence_history):
-                entry_group = conv_group.create_group(f'step_{i}')
-                for key, value in entry.items():
-                    entry_group.create_dataset(key, data=value)
+            step = 0
+            for times, states, converged, entries in self._iter_solution_chunks():
+                if len(times):
+                    append(f, 'time', np.asarray(times, dtype=np.float64))
+                    append(f, 'state', np.asarray(states, dtype=np.float64))
+                    append(f, 'convergence', np.asarray(converged, dtype=bool))
+
+                # Store convergence history
+                for entry in entries:
+                    entry_group = conv_group.create_group(f'step_{step}')
+                    for key, value in entry.items():
+                        entry_group.create_dataset(key, data=value)
+                    step += 1
+
+            for name, empty in (('time', np.zeros(0)), ('state', np.zeros((0, 0))),
+                                ('convergence', np.zeros(0, dtype=bool))):
+                if name not in f:
+                    f.create_dataset(name, data=empty, maxshape=(None,) + empty.shape[1:])
 
         self.logger.info(f"Exported HDF5 results to {filename}")
 
     def _export_csv(self, filename: str):
         """Export results in CSV format for simple analysis."""
-        import pandas as pd
-
-        # Create DataFrame with time series data
-        df_data = {
-            'time': self.solution_history['time'],
-            'converged': self.solution_history['convergence']
-        }
-
-        # Add state variables (simplified)
-        for i in range(min(10, len(self.solution_history['state'][0]))):
-            df_data[f'state_{i}'] = [state[i] for state in self.solution_history['state']]
-
-        df = pd.DataFrame(df_data)
-        df.to_csv(filename, index=False)
+        with open(filename, 'w', newline='', encoding='utf-8') as handle:
+            writer = csv.writer(handle)
+            header_written = False
+            for times, states, converged, _ in self._iter_solution_chunks():
+                if not len(times):
+                    continue
+                if not header_written:
+                    writer.writerow(['time', 'converged'] + [f'state_{i}' for i in range(states.shape[1])])
+                    header_written = True
+                for t, state, flag in zip(times, states, converged):
+                    writer.writerow([repr(float(t)), bool(flag)] + [repr(float(value)) for value in state])
 
         self.logger.info(f"Exported CSV results to {filename}")
 
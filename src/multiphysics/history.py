@@ -0,0 +1,403 @@
+"""
+Streaming on-disk history for long multi-physics runs.
+
+State snapshots, per-timestep convergence entries and coupling variables are
+buffered in memory only until a chunk is full (or a memory ceiling is hit) and
+are then appended to a chunked, compressed dataset:
+
+- ``npz``: a directory of ``chunk_NNNNNN.npz`` files written with
+  ``numpy.savez_compressed`` plus a ``manifest.json`` index
+- ``hdf5``: one file of resizable, gzip-compressed datasets (requires h5py)
+
+Every file is replaced atomically, so a crashed run leaves a readable history
+that can be truncated back to a checkpoint time and appended to again.
+
+Coupling variables always have one row per snapshot: snapshots that lack a
+variable (including those written before it first appeared) hold NaN, and a
+variable whose shape changes mid-run is rejected with a ``ValueError``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import h5py  # type: ignore
+except ImportError:  # pragma: no cover - fallback when h5py is unavailable
+    h5py = None
+
+HISTORY_BACKENDS = ("auto", "npz", "hdf5")
+HISTORY_FORMAT = "multiphysics-history"
+HISTORY_VERSION = 1
+
+_MANIFEST = "manifest.json"
+_COUPLING_PREFIX = "coupling/"
+
+
+def flatten_coupling_variables(coupling: Dict[str, Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Numeric coupling variables keyed as ``module.variable``; diagnostics are skipped."""
+    flat = {}
+    for module_name, variables in coupling.items():
+        for var_name, value in variables.items():
+            if isinstance(value, dict):
+                continue
+            array = np.asarray(value)
+            if array.dtype.kind in "biuf":
+                flat[f"{module_name}.{var_name}"] = array.astype(np.float64)
+    return flat
+
+
+def _atomic_write(path: Path, writer: Callable[[Any], None]):
+    """Write ``path`` through a temporary file replaced in one step."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as stream:
+            writer(stream)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _resolve_backend(path: Path, backend: str) -> str:
+    if backend not in HISTORY_BACKENDS:
+        raise ValueError(f"Unknown history backend '{backend}'. Available: {', '.join(HISTORY_BACKENDS)}")
+    if backend == "auto":
+        backend = "hdf5" if path.suffix in (".h5", ".hdf5") else "npz"
+    if backend == "hdf5" and h5py is None:
+        raise ImportError("The hdf5 history backend requires h5py; use backend='npz'")
+    return backend
+
+
+class SimulationHistoryWriter:
+    """
+    Append-only, chunked history writer with a bounded in-memory buffer.
+
+    Args:
+        path: History directory (npz) or ``.h5``/``.hdf5`` file (hdf5)
+        backend: 'auto', 'npz' or 'hdf5'
+        chunk_size: Snapshots per chunk
+        memory_limit_mb: Flush early once buffered data exceeds this size
+        resume_after: Reopen an existing history, drop every record later
+            than this time and continue appending after it
+    """
+
+    def __init__(self, path, *, backend: str = "auto", chunk_size: int = 64,
+                 memory_limit_mb: Optional[float] = None,
+                 resume_after: Optional[float] = None):
+        self.path = Path(path)
+        self.backend = _resolve_backend(self.path, backend)
+        self.chunk_size = max(1, int(chunk_size))
+        self.memory_limit_bytes = None if memory_limit_mb is None else int(memory_limit_mb * 2**20)
+        self.snapshots_written = 0
+        self.chunks_written = 0
+        self._buffer: Dict[str, List[Any]] = {'time': [], 'state': [], 'converged': [], 'coupling': []}
+        self._convergence: List[str] = []
+        self._buffered_bytes = 0
+        self._coupling_shapes: Dict[str, Tuple[int, ...]] = {}
+
+        if resume_after is None:
+            self._create()
+        else:
+            self._truncate(resume_after)
+
+    # ------------------------------------------------------------------ public API
+
+    def append_snapshot(self, time: float, state: np.ndarray, converged: bool,
+                        coupling: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Buffer one state snapshot (and its coupling variables)."""
+        state = np.array(state, dtype=np.float64)
+        flat = flatten_coupling_variables(coupling or {})
+        self._register_coupling_shapes(time, flat)
+        self._buffer['time'].append(float(time))
+        self._buffer['state'].append(state)
+        self._buffer['converged'].append(bool(converged))
+        self._buffer['coupling'].append(flat)
+        self._buffered_bytes += state.nbytes + sum(value.nbytes for value in flat.values())
+        self._maybe_flush()
+
+    def append_convergence(self, entry: Dict[str, Any]):
+        """Buffer one convergence-history entry."""
+        encoded = json.dumps(entry, default=_json_default, separators=(",", ":"))
+        self._convergence.append(encoded)
+        self._buffered_bytes += len(encoded)
+        self._maybe_flush()
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._buffered_bytes
+
+    def flush(self):
+        """Write the buffered records as one chunk."""
+        if not self._buffer['time'] and not self._convergence:
+            return
+        if self.backend == "npz":
+            self._flush_npz()
+        else:
+            self._flush_hdf5()
+        self.snapshots_written += len(self._buffer['time'])
+        self.chunks_written += 1
+        self._buffer = {'time': [], 'state': [], 'converged': [], 'coupling': []}
+        self._convergence = []
+        self._buffered_bytes = 0
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> SimulationHistoryWriter:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ------------------------------------------------------------------ internals
+
+    def _maybe_flush(self):
+        full = len(self._buffer['time']) >= self.chunk_size or len(self._convergence) >= 16 * self.chunk_size
+        over_limit = self.memory_limit_bytes is not None and self._buffered_bytes >= self.memory_limit_bytes
+        if full or over_limit:
+            self.flush()
+
+    def _register_coupling_shapes(self, time: float, flat: Dict[str, np.ndarray]):
+        for key, value in flat.items():
+            shape = self._coupling_shapes.setdefault(key, value.shape)
+            if value.shape != shape:
+                raise ValueError(
+                    f"Coupling variable {key} changed shape from {shape} to {value.shape} "
+                    f"at t = {time:g}; history rows must keep a fixed shape"
+                )
+
+    def _chunk_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {
+            'time': np.asarray(self._buffer['time'], dtype=np.float64),
+            'converged': np.asarray(self._buffer['converged'], dtype=bool),
+            'convergence': np.asarray(self._convergence, dtype=np.str_),
+        }
+        if self._buffer['state']:
+            arrays['state'] = np.stack(self._buffer['state'])
+            rows = len(self._buffer['coupling'])
+            # Every known variable gets one row per snapshot so it stays aligned with time
+            for key, shape in self._coupling_shapes.items():
+                data = np.full((rows,) + shape, np.nan)
+                for row, record in enumerate(self._buffer['coupling']):
+                    if key in record:
+                        data[row] = record[key]
+                arrays[_COUPLING_PREFIX + key] = data
+        return arrays
+
+    # npz backend
+
+    def _manifest(self) -> Dict[str, Any]:
+        with (self.path / _MANIFEST).open("r", encoding="utf-8") as handle:
+            manifest: Dict[str, Any] = json.load(handle)
+        return manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        payload = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+        _atomic_write(self.path / _MANIFEST, lambda stream: stream.write(payload))
+
+    def _create(self):
+        if self.backend == "npz":
+            self.path.mkdir(parents=True, exist_ok=True)
+            for stale in self.path.glob("chunk_*.npz"):
+                stale.unlink()
+            self._write_manifest({'format': HISTORY_FORMAT, 'version': HISTORY_VERSION, 'chunks': []})
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with h5py.File(self.path, "w") as handle:
+                handle.attrs['format'] = HISTORY_FORMAT
+                handle.attrs['version'] = HISTORY_VERSION
+
+    def _flush_npz(self):
+        manifest = self._manifest()
+        index = max((chunk['index'] for chunk in manifest['chunks']), default=-1) + 1
+        filename = f"chunk_{index:06d}.npz"
+        arrays = self._chunk_arrays()
+        _atomic_write(self.path / filename, lambda stream: np.savez_compressed(stream, **arrays))
+        manifest['chunks'].append({
+            'index': index,
+            'file': filename,
+            'snapshots': len(arrays['time']),
+            'convergence_entries': len(arrays['convergence']),
+        })
+        manifest['coupling'] = {key: list(shape) for key, shape in self._coupling_shapes.items()}
+        self._write_manifest(manifest)
+
+    # hdf5 backend
+
+    def _flush_hdf5(self):  # pragma: no cover - requires h5py
+        arrays = self._chunk_arrays()
+        with h5py.File(self.path, "a") as handle:
+            # Variables that first appear now are NaN for the snapshots already written
+            existing = handle['time'].shape[0] if 'time' in handle else 0
+            for name, data in arrays.items():
+                if name == 'convergence':
+                    data = data.astype(object)
+                    dtype = h5py.string_dtype()
+                else:
+                    dtype = data.dtype
+                if len(data) == 0:
+                    continue
+                if name not in handle:
+                    backfill = existing if name.startswith(_COUPLING_PREFIX) else 0
+                    handle.create_dataset(
+                        name, shape=(backfill,) + data.shape[1:], maxshape=(None,) + data.shape[1:],
+                        dtype=dtype, chunks=(self.chunk_size,) + data.shape[1:],
+                        compression="gzip", shuffle=True,
+                        fillvalue=np.nan if name.startswith(_COUPLING_PREFIX) else None,
+                    )
+                dataset = handle[name]
+                start = dataset.shape[0]
+                dataset.resize(start + len(data), axis=0)
+                dataset[start:] = data
+        # h5py writes in place; fsync the file so a crash keeps flushed chunks
+        with self.path.open("rb+") as stream:
+            os.fsync(stream.fileno())
+
+    # restart
+
+    def _truncate(self, resume_after: float):
+        """Drop records after ``resume_after`` so appending continues from a checkpoint."""
+        if not self.path.exists():
+            self._create()
+            return
+
+        if self.backend == "hdf5":  # pragma: no cover - requires h5py
+            with h5py.File(self.path, "a") as handle:
+                self._truncate_hdf5(handle, resume_after)
+                coupling = handle.get(_COUPLING_PREFIX.rstrip("/"), {})
+                self._coupling_shapes = {key: dataset.shape[1:] for key, dataset in coupling.items()}
+            return
+
+        manifest = self._manifest()
+        self._coupling_shapes = {key: tuple(shape) for key, shape in manifest.get('coupling', {}).items()}
+        kept = []
+        for chunk in manifest['chunks']:
+            chunk_path = self.path / chunk['file']
+            with np.load(chunk_path, allow_pickle=False) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+            keep = arrays['time'] <= resume_after
+            entries = [json.loads(item) for item in arrays['convergence'].tolist()]
+            keep_entries = np.array([entry.get('time', -np.inf) <= resume_after for entry in entries], dtype=bool)
+            if keep.all() and keep_entries.all():
+                kept.append(chunk)
+                continue
+            if not keep.any() and not keep_entries.any():
+                chunk_path.unlink()
+                continue
+            for name, data in arrays.items():
+                mask = keep_entries if name == 'convergence' else keep
+                if len(data) == len(mask):
+                    arrays[name] = data[mask]
+            _atomic_write(chunk_path, functools.partial(np.savez_compressed, **arrays))
+            kept.append(dict(chunk, snapshots=int(keep.sum()), convergence_entries=int(keep_entries.sum())))
+        manifest['chunks'] = kept
+        self._write_manifest(manifest)
+
+    @staticmethod
+    def _truncate_hdf5(handle, resume_after: float):  # pragma: no cover - requires h5py
+        if 'time' in handle:
+            count = int(np.count_nonzero(handle['time'][...] <= resume_after))
+            for name in list(handle):
+                if name == 'convergence':
+                    continue
+                node = handle[name]
+                if hasattr(node, 'resize'):
+                    node.resize(count, axis=0)
+                else:
+                    for dataset in node.values():
+                        dataset.resize(count, axis=0)
+        if 'convergence' in handle:
+            entries = [json.loads(item) for item in handle['convergence'].asstr()[...]]
+            keep = sum(1 for entry in entries if entry.get('time', -np.inf) <= resume_after)
+            handle['convergence'].resize(keep, axis=0)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serialisable")
+
+
+def iter_history_chunks(path) -> Iterator[Dict[str, Any]]:
+    """Yield a history one chunk at a time without loading the whole run."""
+    path = Path(path)
+    if path.suffix in (".h5", ".hdf5"):  # pragma: no cover - requires h5py
+        if h5py is None:
+            raise ImportError("Reading an hdf5 history requires h5py")
+        with h5py.File(path, "r") as handle:
+            # Coupling variables live in a 'coupling' group; collect datasets by full path
+            datasets = {}
+
+            def collect(name, node):
+                if isinstance(node, h5py.Dataset) and name != 'convergence':
+                    datasets[name] = node
+
+            handle.visititems(collect)
+            total = handle['time'].shape[0] if 'time' in handle else 0
+            step = handle['time'].chunks[0] if total else 1
+            for start in range(0, total, step):
+                chunk = {name: dataset[start:start + step] for name, dataset in datasets.items()}
+                chunk['convergence'] = []
+                yield chunk
+            if 'convergence' in handle:
+                yield {'convergence': [json.loads(item) for item in handle['convergence'].asstr()[...]]}
+        return
+
+    with (path / _MANIFEST).open("r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    for chunk in manifest['chunks']:
+        with np.load(path / chunk['file'], allow_pickle=False) as archive:
+            data = {name: archive[name] for name in archive.files}
+        data['convergence'] = [json.loads(item) for item in data['convergence'].tolist()]
+        yield data
+
+
+def load_history(path) -> Dict[str, Any]:
+    """Concatenate a streamed history into arrays (time, state, converged, coupling, convergence).
+
+    Coupling variables are NaN for snapshots written before they first appeared.
+    """
+    times, states, converged, convergence = [], [], [], []
+    coupling: Dict[str, List[Tuple[int, np.ndarray]]] = {}
+    rows = 0
+    for chunk in iter_history_chunks(path):
+        convergence.extend(chunk['convergence'])
+        if 'time' not in chunk or len(chunk['time']) == 0:
+            continue
+        times.append(chunk['time'])
+        states.append(chunk['state'])
+        converged.append(chunk['converged'])
+        for name, data in chunk.items():
+            if name.startswith(_COUPLING_PREFIX):
+                coupling.setdefault(name[len(_COUPLING_PREFIX):], []).append((rows, data))
+        rows += len(chunk['time'])
+
+    return {
+        'time': np.concatenate(times) if times else np.zeros(0),
+        'state': np.concatenate(states) if states else np.zeros((0, 0)),
+        'converged': np.concatenate(converged) if converged else np.zeros(0, dtype=bool),
+        'coupling': {name: _align_coupling(name, parts, rows) for name, parts in coupling.items()},
+        'convergence': convergence,
+    }
+
+
+def _align_coupling(name: str, parts: List[Tuple[int, np.ndarray]], rows: int) -> np.ndarray:
+    """Place each chunk's rows at its snapshot offset, NaN elsewhere."""
+    shape = parts[0][1].shape[1:]
+    aligned = np.full((rows,) + shape, np.nan)
+    for offset, data in parts:
+        if data.shape[1:] != shape:
+            raise ValueError(f"Coupling variable {name} changes shape from {shape} to {data.shape[1:]}")
+        aligned[offset:offset + len(data)] = data
+    return aligned
@@ -5,7 +5,8 @@ Implements finite element analysis for Renaissance engineering structures.
 """
 
 import logging
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import scipy.sparse as sp
@@ -30,47 +31,112 @@ class BeamElement:
             raise ValueError("Beam element must have exactly 2 nodes")
 
     def compute_stiffness_matrix(self, coordinates: np.ndarray) -> np.ndarray:
-        """Compute beam element stiffness matrix."""
+        """Compute beam element stiffness matrix in global coordinates."""
 
-        node1 = coordinates[self.node_ids[0]]
-        node2 = coordinates[self.node_ids[1]]
-        length = np.linalg.norm(node2 - node1)
+        return np.asarray(BeamElementBatch.from_elements([self]).stiffness_matrices(coordinates)[0])
 
-        E = self.material.young_modulus
-        A = self.cross_section_area
-        moment_of_inertia = self.moment_of_inertia
+    def compute_mass_matrix(self, coordinates: np.ndarray) -> np.ndarray:
+        """Compute mass matrix."""
+
+        return np.asarray(BeamElementBatch.from_elements([self]).mass_matrices(coordinates)[0])
+
+
+@dataclass
+class BeamElementBatch:
+    """
+    Struct-of-arrays view of many beam elements.
+
+    Element properties are stored as arrays so local matrices and their
+    rotation to global axes are computed for all elements at once as stacked
+    (n_elem, 12, 12) tensors.
+    """
+
+    node_ids: np.ndarray  # (n_elem, 2)
+    young_modulus: np.ndarray
+    density: np.ndarray
+    cross_section_area: np.ndarray
+    moment_of_inertia: np.ndarray
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[BeamElement]) -> "BeamElementBatch":
+        elements = list(elements)
+        return cls(
+            node_ids=np.array([element.node_ids for element in elements], dtype=np.int64).reshape(-1, 2),
+            young_modulus=np.array([element.material.young_modulus for element in elements], dtype=float),
+            density=np.array([element.material.density for element in elements], dtype=float),
+            cross_section_area=np.array([element.cross_section_area for element in elements], dtype=float),
+            moment_of_inertia=np.array([element.moment_of_inertia for element in elements], dtype=float),
+        )
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def geometry(self, coordinates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Element lengths and direction cosine matrices.
+
+        Returns:
+            lengths (n_elem,) and rotations (n_elem, 3, 3) whose rows are the
+            local x (along the beam), y and z axes in global components
+        """
+
+        axis = coordinates[self.node_ids[:, 1]] - coordinates[self.node_ids[:, 0]]
+        lengths = np.linalg.norm(axis, axis=1)
+        local_x = axis / lengths[:, None]
+
+        # Local y is perpendicular to global z, or to global y for vertical beams
+        reference = np.where(np.abs(local_x[:, 2:3]) > 0.999, [[0.0, 1.0, 0.0]], [[0.0, 0.0, 1.0]])
+        local_y = np.cross(reference, local_x)
+        local_y /= np.linalg.norm(local_y, axis=1)[:, None]
+        local_z = np.cross(local_x, local_y)
+
+        return lengths, np.stack([local_x, local_y, local_z], axis=1)
+
+    def local_stiffness_matrices(self, lengths: np.ndarray) -> np.ndarray:
+        """Local stiffness matrices (12x12 for 3D beam with 6 DOF per node)."""
 
-        # Local stiffness matrix (12x12 for 3D beam with 6 DOF per node)
-        k_local = np.zeros((12, 12))
+        k_local = np.zeros((len(self), 12, 12))
 
         # Axial stiffness
-        k_axial = E * A / length
-        k_local[0, 0] = k_axial
-        k_local[0, 6] = -k_axial
-        k_local[6, 0] = -k_axial
-        k_local[6, 6] = k_axial
+        k_axial = self.young_modulus * self.cross_section_area / lengths
+        k_local[:, 0, 0] = k_axial
+        k_local[:, 0, 6] = -k_axial
+        k_local[:, 6, 0] = -k_axial
+        k_local[:, 6, 6] = k_axial
 
         # Bending stiffness (simplified)
-        k_bend = E * moment_of_inertia / (length ** 3)
-        k_local[1, 1] = 12 * k_bend
-        k_local[7, 7] = 12 * k_bend
+        k_bend = self.young_modulus * self.moment_of_inertia / lengths ** 3
+        k_local[:, 1, 1] = 12 * k_bend
+        k_local[:, 7, 7] = 12 * k_bend
 
         return k_local
 
-    def compute_mass_matrix(self, coordinates: np.ndarray) -> np.ndarray:
-        """Compute mass matrix."""
+    def stiffness_matrices(self, coordinates: np.ndarray) -> np.ndarray:
+        """Global stiffness matrices T^T k T, shape (n_elem, 12, 12)."""
+
+        lengths, rotations = self.geometry(coordinates)
+        k_local = self.local_stiffness_matrices(lengths).reshape(-1, 4, 3, 4, 3)
+
+        # T is block-diagonal with the 3x3 rotation repeated for each DOF triad
+        k_global: np.ndarray = np.einsum("npi,napbq,nqj->naibj", rotations, k_local, rotations, optimize=True)
+        return k_global.reshape(-1, 12, 12)
 
-        node1 = coordinates[self.node_ids[0]]
-        node2 = coordinates[self.node_ids[1]]
-        length = np.linalg.norm(node2 - node1)
+    def mass_matrices(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Lumped mass matrices, shape (n_elem, 12, 12).
 
-        mass_per_node = self.material.density * self.cross_section_area * length / 2
-        m_local = np.zeros((12, 12))
+        Translational lumped masses are invariant under rotation, so no
+        transformation is needed.
+        """
 
-        # Lumped mass
-        for i in range(3):
-            m_local[i, i] = mass_per_node
-            m_local[i + 6, i + 6] = mass_per_node
+        lengths = np.linalg.norm(
+            coordinates[self.node_ids[:, 1]] - coordinates[self.node_ids[:, 0]], axis=1
+        )
+        mass_per_node = self.density * self.cross_section_area * lengths / 2
+
+        m_local = np.zeros((len(self), 12, 12))
+        translational = np.array([0, 1, 2, 6, 7, 8])
+        m_local[:, translational, translational] = mass_per_node[:, None]
 
         return m_local
 
@@ -78,6 +144,9 @@ class BeamElement:
 class StructuralModule(PhysicsModule):
     """Finite Element structural analysis module."""
 
+    # Linear elastic: the Jacobian is the constant stiffness matrix
+    is_linear = True
+
     def __init__(self, parameters: SimulationParameters):
         super().__init__("structures", parameters)
 
@@ -86,6 +155,7 @@ class StructuralModule(PhysicsModule):
         self.materials = {}
         self.global_stiffness = None
         self.global_mass = None
+        self.sparsity_pattern: Optional[Dict[str, np.ndarray]] = None
         self.num_dof = 0
         self.displacements = None
         self.fixed_dof = []
@@ -171,32 +241,68 @@ class StructuralModule(PhysicsModule):
                         self.applied_loads[node_id * 6 + i] = f
 
     def _assemble_system_matrices(self):
-        """Assemble global matrices."""
+        """
+        Assemble global matrices.
+
+        Element blocks are scattered into a precomputed CSR sparsity pattern,
+        so re-assembly after a material or geometry update only refreshes the
+        data arrays.  Every assembly bumps ``jacobian_version`` so the
+        simulator drops factorisations of the previous stiffness matrix.
+        """
+
+        batch = BeamElementBatch.from_elements(self.elements.values())
+        pattern = self.sparsity_pattern
+        if pattern is None or not np.array_equal(pattern['connectivity'], batch.node_ids):
+            pattern = self.sparsity_pattern = self._build_sparsity_pattern(batch.node_ids)
+
+        coordinates = self._node_coordinate_array()
+        self.global_stiffness = self._scatter_element_matrices(pattern, batch.stiffness_matrices(coordinates))
+        self.global_mass = self._scatter_element_matrices(pattern, batch.mass_matrices(coordinates))
+        self.invalidate_jacobian()  # the constant stiffness Jacobian changed
+
+    def _node_coordinate_array(self) -> np.ndarray:
+        """Node coordinates as an (n_nodes, 3) array indexed by node id."""
+
+        coordinates = np.zeros((len(self.nodes), 3))
+        for node_id, position in self.nodes.items():
+            coordinates[node_id] = position
+        return coordinates
+
+    def _build_sparsity_pattern(self, connectivity: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Precompute the global DOF map of every element and the CSR pattern.
+
+        ``scatter`` maps each entry of the stacked (n_elem, 12, 12) element
+        blocks to its slot in the CSR data array; duplicates are summed.
+        """
+
+        element_dofs = (connectivity[:, :, None] * 6 + np.arange(6)).reshape(-1, 12)
+        rows = np.repeat(element_dofs, 12, axis=1).ravel()
+        cols = np.tile(element_dofs, (1, 12)).ravel()
+
+        # Sorted unique (row, col) keys give canonical CSR ordering
+        unique_keys, scatter = np.unique(rows * self.num_dof + cols, return_inverse=True)
+        index_dtype = np.int32 if self.num_dof < np.iinfo(np.int32).max else np.int64
+        indptr = np.zeros(self.num_dof + 1, dtype=index_dtype)
+        np.cumsum(np.bincount(unique_keys // max(self.num_dof, 1), minlength=self.num_dof),
+                  out=indptr[1:])
 
-        self.global_stiffness = sp.lil_matrix((self.num_dof, self.num_dof))
-        self.global_mass = sp.lil_matrix((self.num_dof, self.num_dof))
-
-        for element in self.elements.values():
-            elem_coords = np.array([self.nodes[node_id] for node_id in element.node_ids])
-
-            k_elem = element.compute_stiffness_matrix(elem_coords)
-            m_elem = element.compute_mass_matrix(elem_coords)
-
-            # Assembly (simplified)
-            for i, node_i in enumerate(element.node_ids):
-                for j, node_j in enumerate(element.node_ids):
-                    for dof_i in range(6):
-                        for dof_j in range(6):
-                            global_i = node_i * 6 + dof_i
-                            global_j = node_j * 6 + dof_j
-                            elem_i = i * 6 + dof_i
-                            elem_j = j * 6 + dof_j
+        return {
+            'connectivity': connectivity,
+            'element_dofs': element_dofs,
+            'scatter': scatter.ravel(),
+            'indices': (unique_keys % max(self.num_dof, 1)).astype(index_dtype),
+            'indptr': indptr,
+        }
 
-                            self.global_stiffness[global_i, global_j] += k_elem[elem_i, elem_j]
-                            self.global_mass[global_i, global_j] += m_elem[elem_i, elem_j]
+    def _scatter_element_matrices(self, pattern: Dict[str, np.ndarray],
+                                  element_matrices: np.ndarray) -> sp.csr_matrix:
+        """Sum stacked (n_elem, 12, 12) element matrices into a global CSR matrix."""
 
-        self.global_stiffness = self.global_stiffness.tocsr()
-        self.global_mass = self.global_mass.tocsr()
+        data = np.bincount(pattern['scatter'], weights=element_matrices.ravel(),
+                           minlength=len(pattern['indices']))
+        return sp.csr_matrix((data, pattern['indices'], pattern['indptr']),
+                             shape=(self.num_dof, self.num_dof))
 
     def _initialize_solution_vectors(self):
         """Initialize solution vectors."""
@@ -241,15 +347,12 @@ class StructuralModule(PhysicsModule):
     def compute_jacobian(self, state: np.ndarray, time: float) -> sp.spmatrix:
         """Compute Jacobian matrix."""
 
-        jacobian = self.global_stiffness.copy()
-
-        # Apply boundary conditions
-        for dof in self.fixed_dof:
-            jacobian[dof, :] = 0
-            jacobian[:, dof] = 0
-            jacobian[dof, dof] = 1.0
+        # Apply boundary conditions: zero fixed rows/columns, unit diagonal
+        free = np.ones(self.num_dof)
+        free[self.fixed_dof] = 0.0
+        mask = sp.diags(free)
 
-        return jacobian
+        return (mask @ self.global_stiffness @ mask + sp.diags(1.0 - free)).tocsr()
 
     def update_coupling_variables(self, coupled_data: Dict[str, Any]):
         """Update from aerodynamic coupling."""
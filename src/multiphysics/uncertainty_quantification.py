@@ -12,8 +12,9 @@ maintaining historical authenticity.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, overload
 
 import numpy as np
 import numpy.random as random
@@ -49,6 +50,41 @@ class UncertaintyResult:
     distribution_fit: Optional[Dict[str, float]] = None
 
 
+@dataclass
+class ParameterSamples:
+    """
+    Sampled uncertain parameters as an (n_samples, n_params) matrix.
+
+    Column ``j`` of ``values`` holds the samples of ``names[j]``; parameters
+    that are not sampled keep their ``nominal_parameters`` value.
+    """
+
+    names: List[str]
+    values: np.ndarray
+    nominal_parameters: Dict[str, float] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.values.shape[0])
+
+    def column(self, name: str) -> np.ndarray:
+        """Samples of one parameter, shape (n_samples,)."""
+        return self.values[:, self.names.index(name)]
+
+    def as_parameters(self) -> Dict[str, Any]:
+        """Nominal parameters with every sampled parameter replaced by its column."""
+        return {**self.nominal_parameters, **dict(zip(self.names, self.values.T))}
+
+    def sample(self, index: int) -> Dict[str, float]:
+        """Full parameter dictionary of a single sample."""
+        return {**self.nominal_parameters, **dict(zip(self.names, self.values[index].tolist()))}
+
+
+# Scalar functions map Dict[str, float] -> float and vectorised ones map
+# ParameterSamples -> np.ndarray of shape (n_samples,); callers pick the
+# calling convention from the ``vectorized`` flag.
+PerformanceFunction = Callable[[Any], Any]
+
+
 @dataclass
 class UQReport:
     """Comprehensive uncertainty quantification report."""
@@ -234,22 +270,34 @@ class HistoricalUncertaintyQuantification:
         ]
 
     def analyze_uncertainties(self, invention_slug: str, nominal_parameters: Dict[str, float],
-                            performance_function: Callable[[Dict[str, float]], float],
+                            performance_function: PerformanceFunction,
                             num_samples: int = 10000,
-                            sampling_method: str = 'monte_carlo') -> UQReport:
+                            sampling_method: str = 'monte_carlo',
+                            vectorized: Optional[bool] = None,
+                            chunk_size: int = 1024) -> UQReport:
         """
         Perform comprehensive uncertainty analysis.
 
+        A scalar performance function receives one parameter dictionary per
+        sample. A vectorised one receives all samples at once as
+        :class:`ParameterSamples` and returns an array of shape (n_samples,).
+
         Args:
             invention_slug: Unique identifier for the invention
             nominal_parameters: Nominal parameter values
             performance_function: Function mapping parameters to performance metric
             num_samples: Number of Monte Carlo samples
             sampling_method: Sampling method to use
+            vectorized: Whether ``performance_function`` takes ParameterSamples;
+                None reads its ``vectorized`` attribute (default False)
+            chunk_size: Samples converted to dictionaries at a time for
+                scalar-only performance functions
 
         Returns:
             Comprehensive uncertainty quantification report
         """
+        if vectorized is None:
+            vectorized = bool(getattr(performance_function, 'vectorized', False))
 
         # Get relevant uncertainty sources
         relevant_sources = self._get_relevant_uncertainty_sources(invention_slug)
@@ -260,17 +308,16 @@ class HistoricalUncertaintyQuantification:
         )
 
         # Evaluate performance function for all samples
-        performance_values = np.array([
-            performance_function({**nominal_parameters, **sample})
-            for sample in parameter_samples
-        ])
+        performance_values = self._evaluate_performance(
+            performance_function, parameter_samples, vectorized, chunk_size
+        )
 
         # Compute statistical metrics
         performance_stats = self._compute_performance_statistics(performance_values)
 
         # Perform sensitivity analysis
         sensitivity_results = self._perform_sensitivity_analysis(
-            relevant_sources, nominal_parameters, performance_function
+            relevant_sources, nominal_parameters, performance_function, vectorized
         )
 
         # Compute uncertainty contributions
@@ -338,43 +385,82 @@ class HistoricalUncertaintyQuantification:
 
     def _generate_parameter_samples(self, uncertainty_sources: List[UncertaintySource],
                                   nominal_parameters: Dict[str, float],
-                                  num_samples: int, sampling_method: str) -> List[Dict[str, float]]:
-        """Generate parameter samples according to uncertainty distributions."""
+                                  num_samples: int, sampling_method: str) -> ParameterSamples:
+        """
+        Generate parameter samples according to uncertainty distributions.
 
-        samples = []
+        Each parameter's column is drawn in a single call, in source order, from
+        the global NumPy RNG. A fixed ``np.random.seed`` therefore reproduces the
+        same matrix, but not the per-sample, row-major stream of the original
+        scalar implementation.
+        """
 
-        for _ in range(num_samples):
-            sample = {}
+        # One column per sampled parameter; a later source for the same
+        # parameter overrides an earlier one
+        columns: Dict[str, np.ndarray] = {}
+        winning_sources = {source.parameter_name: source for source in uncertainty_sources}
 
-            for source in uncertainty_sources:
-                if source.parameter_name in nominal_parameters:
-                    # Generate sample from distribution
-                    value = self._sample_from_distribution(source)
-                    sample[source.parameter_name] = value
+        for name, source in winning_sources.items():
+            if name in nominal_parameters:
+                # Generate all samples of this parameter in one draw
+                columns[name] = self._sample_from_distribution(source, size=num_samples)
 
-            samples.append(sample)
+        values = np.column_stack(list(columns.values())) if columns else np.empty((num_samples, 0))
+        return ParameterSamples(list(columns), values, dict(nominal_parameters))
 
-        return samples
+    @overload
+    def _sample_from_distribution(self, uncertainty_source: UncertaintySource,
+                                  size: None = None) -> float: ...
 
-    def _sample_from_distribution(self, uncertainty_source: UncertaintySource) -> float:
-        """Generate a sample from the specified distribution."""
+    @overload
+    def _sample_from_distribution(self, uncertainty_source: UncertaintySource,
+                                  size: int) -> np.ndarray: ...
+
+    def _sample_from_distribution(self, uncertainty_source: UncertaintySource,
+                                  size: Optional[int] = None) -> Union[float, np.ndarray]:
+        """Generate a sample (or ``size`` samples) from the specified distribution."""
 
         dist_type = uncertainty_source.distribution_type
         params = uncertainty_source.distribution_params
 
         if dist_type == 'normal':
-            return random.normal(params['loc'], params['scale'])
+            return random.normal(params['loc'], params['scale'], size)
         elif dist_type == 'uniform':
-            return random.uniform(params['low'], params['high'])
+            return random.uniform(params['low'], params['high'], size)
         elif dist_type == 'triangular':
-            return random.triangular(params['left'], params['mode'], params['right'])
+            return random.triangular(params['left'], params['mode'], params['right'], size)
         elif dist_type == 'lognormal':
-            return random.lognormal(mean=np.log(params['mean']), sigma=params['sigma'])
+            return random.lognormal(mean=np.log(params['mean']), sigma=params['sigma'], size=size)
         elif dist_type == 'weibull':
-            return random.weibull(params['shape']) * params['scale']
+            return random.weibull(params['shape'], size) * params['scale']
         else:
             # Default to normal
-            return random.normal(0, 1)
+            return random.normal(0, 1, size)
+
+    def _evaluate_performance(self, performance_function: PerformanceFunction,
+                              samples: ParameterSamples, vectorized: bool,
+                              chunk_size: int) -> np.ndarray:
+        """Evaluate the performance metric for every sample."""
+
+        if vectorized:
+            performance_values = np.asarray(performance_function(samples), dtype=float)
+            if performance_values.shape != (len(samples),):
+                raise ValueError(
+                    f"Vectorized performance function returned shape {performance_values.shape}, "
+                    f"expected ({len(samples)},)"
+                )
+            return performance_values
+
+        # Scalar-only function: build per-sample dictionaries one chunk at a time
+        performance_values = np.empty(len(samples))
+        nominal = samples.nominal_parameters
+        for start in range(0, len(samples), chunk_size):
+            rows = samples.values[start:start + chunk_size].tolist()
+            performance_values[start:start + len(rows)] = [
+                performance_function({**nominal, **dict(zip(samples.names, row))})
+                for row in rows
+            ]
+        return performance_values
 
     def _compute_performance_statistics(self, performance_values: np.ndarray) -> Dict[str, float]:
         """Compute statistical metrics for performance values."""
@@ -392,7 +478,8 @@ class HistoricalUncertaintyQuantification:
 
     def _perform_sensitivity_analysis(self, uncertainty_sources: List[UncertaintySource],
                                      nominal_parameters: Dict[str, float],
-                                     performance_function: Callable) -> Dict[str, float]:
+                                     performance_function: PerformanceFunction,
+                                     vectorized: bool = False) -> Dict[str, float]:
         """Perform local sensitivity analysis using finite differences."""
 
         sensitivity_coefficients = {}
@@ -400,6 +487,11 @@ class HistoricalUncertaintyQuantification:
         # Perturbation size (5% of nominal value)
         perturbation_factor = 0.05
 
+        if vectorized:
+            return self._perform_vectorized_sensitivity_analysis(
+                uncertainty_sources, nominal_parameters, performance_function, perturbation_factor
+            )
+
         # Compute nominal performance
         performance_function(nominal_parameters)
 
@@ -428,6 +520,33 @@ class HistoricalUncertaintyQuantification:
 
         return sensitivity_coefficients
 
+    def _perform_vectorized_sensitivity_analysis(self, uncertainty_sources: List[UncertaintySource],
+                                                 nominal_parameters: Dict[str, float],
+                                                 performance_function: PerformanceFunction,
+                                                 perturbation_factor: float) -> Dict[str, float]:
+        """Central differences for every parameter from a single vectorised evaluation."""
+
+        names = list(dict.fromkeys(
+            source.parameter_name for source in uncertainty_sources
+            if source.parameter_name in nominal_parameters
+        ))
+        if not names:
+            return {}
+
+        nominal = np.array([nominal_parameters[name] for name in names], dtype=float)
+        delta = np.where(nominal != 0, perturbation_factor * np.abs(nominal), perturbation_factor)
+
+        # Rows 2j and 2j+1 perturb parameter j forward and backward
+        perturbed = np.repeat(nominal[None, :], 2 * len(names), axis=0)
+        index = np.arange(len(names))
+        perturbed[2 * index, index] += delta
+        perturbed[2 * index + 1, index] -= delta
+
+        samples = ParameterSamples(names, perturbed, dict(nominal_parameters))
+        performance = self._evaluate_performance(performance_function, samples, True, len(samples))
+        sensitivity = (performance[0::2] - performance[1::2]) / (2 * delta)
+        return dict(zip(names, sensitivity.tolist()))
+
     def _compute_uncertainty_contributions(self, uncertainty_sources: List[UncertaintySource],
                                          sensitivity_results: Dict[str, float],
                                          performance_stats: Dict[str, float]) -> List[UncertaintyResult]:
@@ -485,7 +604,7 @@ class HistoricalUncertaintyQuantification:
             return params['mean'] * np.sqrt(np.exp(params['sigma']**2) - 1)
         elif dist_type == 'weibull':
             shape, scale = params['shape'], params['scale']
-            return scale * np.sqrt(np.gamma(1 + 2/shape) - np.gamma(1 + 1/shape)**2)
+            return scale * np.sqrt(math.gamma(1 + 2/shape) - math.gamma(1 + 1/shape)**2)
         else:
             return 1.0  # Default
 
@@ -653,12 +772,15 @@ if __name__ == "__main__":
     }
 
     print("Analyzing Ornithopter Lift Uncertainty...")
+    # The lift function is plain arithmetic, so it evaluates all samples at once
+    # when given whole parameter columns
     report = uq.analyze_uncertainties(
         invention_slug='ornithopter',
         nominal_parameters=nominal_params,
-        performance_function=ornithopter_lift_function,
+        performance_function=lambda samples: ornithopter_lift_function(samples.as_parameters()),
         num_samples=5000,
-        sampling_method='monte_carlo'
+        sampling_method='monte_carlo',
+        vectorized=True
     )
 
     print("\nUncertainty Analysis Results:")
@@ -19,8 +19,11 @@ from typing import Dict, Tuple
 import numpy as np
 import scipy.special as sp
 
-from ..multiphysics.aerodynamics import AerodynamicsModule
-from ..multiphysics.core import SimulationParameters
+from .aerodynamics import AerodynamicsModule
+from .core import SimulationParameters
+
+# Smoothing radius of shed point vortices (Scully core), metres
+SHED_VORTEX_CORE_RADIUS = 0.01
 
 
 @dataclass
@@ -48,6 +51,85 @@ class OrnithopterGeometry:
             self.section_chord_ratio = np.linspace(1.0, 0.5, self.num_sections)
 
 
+class ShedVortexWake:
+    """
+    Ring buffer of shed spanwise vortices stored as struct-of-arrays.
+
+    Positions, strengths and ages live in preallocated arrays; the slice of
+    live vortices runs from the oldest slot to ``head`` (exclusive) modulo the
+    capacity. Because all vortices age at the same rate, expiry only ever
+    drops the oldest entries and is a single count update.
+    """
+
+    def __init__(self, capacity: int = 256, core_radius: float = SHED_VORTEX_CORE_RADIUS):
+        self.positions = np.zeros((capacity, 3))
+        self.strengths = np.zeros(capacity)
+        self.ages = np.zeros(capacity)
+        self.core_radius = core_radius
+        self.head = 0
+        self.count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.strengths)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def live_indices(self) -> np.ndarray:
+        """Buffer slots of live vortices, oldest first."""
+        return (self.head - self.count + np.arange(self.count)) % self.capacity
+
+    def reserve(self, capacity: int):
+        """Grow the buffer to at least ``capacity`` slots, keeping live vortices in order."""
+        if capacity <= self.capacity:
+            return
+        live = self.live_indices()
+        positions = np.zeros((capacity, 3))
+        strengths = np.zeros(capacity)
+        ages = np.zeros(capacity)
+        positions[:self.count] = self.positions[live]
+        strengths[:self.count] = self.strengths[live]
+        ages[:self.count] = self.ages[live]
+        self.positions, self.strengths, self.ages = positions, strengths, ages
+        self.head = self.count % capacity
+
+    def shed(self, strength: float, position: np.ndarray):
+        """Append a newly shed vortex, growing the buffer if it is full."""
+        if self.count == self.capacity:
+            self.reserve(2 * self.capacity)
+        self.positions[self.head] = position
+        self.strengths[self.head] = strength
+        self.ages[self.head] = 0.0
+        self.head = (self.head + 1) % self.capacity
+        self.count += 1
+
+    def advance(self, velocity: np.ndarray, time_step: float, max_age: float):
+        """Convect and age every vortex, then expire those older than ``max_age``."""
+        # Dead slots are updated too: cheaper than gathering the live ones
+        self.positions += np.asarray(velocity) * time_step
+        self.ages += time_step
+        live = self.live_indices()
+        self.count -= int(np.count_nonzero(self.ages[live] >= max_age))
+
+    def induced_velocity(self, points: np.ndarray) -> np.ndarray:
+        """
+        Velocity induced at ``points`` (n, 3) by the live vortices.
+
+        Vortices are infinite spanwise (y) lines, counter-clockwise positive
+        in the x-z plane, with a Scully core to keep the kernel bounded.
+        """
+        points = np.atleast_2d(points)
+        live = self.live_indices()
+        dx = points[:, None, 0] - self.positions[live, 0]
+        dz = points[:, None, 2] - self.positions[live, 2]
+        weight = self.strengths[live] / (2.0 * np.pi * (dx * dx + dz * dz + self.core_radius**2))
+        velocity = np.zeros((len(points), 3))
+        velocity[:, 0] = -np.sum(weight * dz, axis=1)
+        velocity[:, 2] = np.sum(weight * dx, axis=1)
+        return velocity
+
+
 class TheodorsenUnsteadyAero(AerodynamicsModule):
     """
     Theodorsen unsteady aerodynamics for flapping wing flight.
@@ -60,7 +142,8 @@ class TheodorsenUnsteadyAero(AerodynamicsModule):
     """
 
     def __init__(self, parameters: SimulationParameters):
-        super().__init__("theodorsen_unsteady_aero", parameters)
+        super().__init__(parameters)
+        self.name = "theodorsen_unsteady_aero"
 
         # Theodorsen function cache
         self._theodorsen_cache = {}
@@ -72,7 +155,7 @@ class TheodorsenUnsteadyAero(AerodynamicsModule):
 
         # Unsteady flow variables
         self.bound_circulation = 0.0
-        self.wake_circulation = []
+        self.shed_wake = ShedVortexWake()
         self.added_mass_coeff = 0.0
 
         # Historical operating conditions
@@ -407,29 +490,22 @@ class TheodorsenUnsteadyAero(AerodynamicsModule):
         """Advance wake vortex system with proper convection."""
 
         # Wake convection velocity
-        convection_velocity = self.freestream_velocity * 0.8  # Downwash effect
+        convection_velocity = np.array([self.freestream_velocity * 0.8, 0.0, 0.0])  # Downwash effect
+        max_age = 5.0 / self.flapping_frequency  # 5 flapping periods
+
+        # Size the ring buffer for a full wake at this time step
+        self.shed_wake.reserve(int(np.ceil(max_age / time_step)) + 1)
 
         # Add new wake vortex from trailing edge
         trailing_edge_strength = self.bound_circulation * 0.1  # Shed circulation
+        self.shed_wake.shed(trailing_edge_strength, np.array([self.geometry.root_chord, 0.0, 0.0]))
 
-        new_wake_vortex = {
-            'strength': trailing_edge_strength,
-            'position': np.array([self.geometry.root_chord, 0, 0]),
-            'age': 0.0
-        }
-
-        self.wake_circulation.append(new_wake_vortex)
+        # Age, convect and expire the whole wake at once
+        self.shed_wake.advance(convection_velocity, time_step, max_age)
 
-        # Age and convect existing wake vortices
-        for vortex in self.wake_circulation:
-            vortex['position'][0] += convection_velocity * time_step
-            vortex['age'] += time_step
-
-        # Remove old wake vortices
-        max_age = 5.0 / self.flapping_frequency  # 5 flapping periods
-        self.wake_circulation = [
-            v for v in self.wake_circulation if v['age'] < max_age
-        ]
+    def wake_induced_velocity(self, points: np.ndarray) -> np.ndarray:
+        """Velocity induced by the shed wake at evaluation points (n, 3)."""
+        return self.shed_wake.induced_velocity(points)
 
     def compute_performance_metrics(self) -> Dict[str, float]:
         """Compute enhanced performance metrics with uncertainty bounds."""
@@ -0,0 +1,36 @@
+"""RPM-sweep benchmarks for the aerial screw helical rotor model."""
+
+import numpy as np
+import pytest
+from scalar_reference import pointwise_rotor_sweep
+
+from davinci_codex.inventions import aerial_screw
+
+SWEEP_ENGINES = {
+    "pointwise": pointwise_rotor_sweep,
+    "broadcast": lambda rotor, rpm, num_radial_points: rotor.compute_performance_sweep(rpm, num_radial_points),
+}
+
+
+def _rotor() -> aerial_screw.HelicalRotorAnalysis:
+    return aerial_screw.HelicalRotorAnalysis(
+        aerial_screw.ROTOR_RADIUS, aerial_screw.ROTOR_INNER_RADIUS, aerial_screw.HELICAL_PITCH
+    )
+
+
+class TestPerformanceSweepPerformance:
+    """Benchmark the broadcast RPM x radius sweep against per-point evaluation."""
+
+    @pytest.mark.parametrize(
+        ("engine", "num_rpm", "num_radial_points"),
+        [
+            ("pointwise", 60, 50),
+            ("broadcast", 60, 50),
+            pytest.param("broadcast", 2000, 500, marks=pytest.mark.large),
+        ],
+    )
+    def test_performance_sweep(self, benchmark, engine, num_rpm, num_radial_points):
+        rpm = np.linspace(10.0, 200.0, num_rpm)
+        result = benchmark(SWEEP_ENGINES[engine], _rotor(), rpm, num_radial_points)
+        assert result['thrust'].shape == (num_rpm,)
+        assert np.all(np.isfinite(result['power']))
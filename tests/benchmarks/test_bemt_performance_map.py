@@ -0,0 +1,40 @@
+"""Performance-map benchmarks for the aerial screw BEMT solver."""
+
+import numpy as np
+import pytest
+from scalar_reference import pointwise_performance_map
+
+from multiphysics.blade_element_momentum import create_enhanced_aerial_screw_analysis
+
+RPM_RANGE = (50.0, 150.0)
+COLLECTIVE_RANGE = (-10.0, 10.0)
+
+
+def _pointwise_thrust(analysis, num_rpm: int, num_collective: int):
+    rpm_values = np.linspace(*RPM_RANGE, num_rpm)
+    collective_values = np.linspace(*COLLECTIVE_RANGE, num_collective)
+    return pointwise_performance_map(analysis, rpm_values, collective_values)['thrust_N']
+
+
+MAP_ENGINES = {
+    "pointwise": _pointwise_thrust,
+    "batched": lambda analysis, num_rpm, num_collective: analysis.compute_performance_map(
+        RPM_RANGE, COLLECTIVE_RANGE, num_rpm, num_collective)['thrust_map'],
+}
+
+
+class TestPerformanceMapPerformance:
+    """Benchmark the batched operating-point solver against per-point solves."""
+
+    @pytest.mark.parametrize(
+        ("engine", "num_rpm", "num_collective"),
+        [
+            ("pointwise", 20, 10),
+            ("batched", 20, 10),
+            pytest.param("batched", 200, 100, marks=pytest.mark.large),
+        ],
+    )
+    def test_performance_map(self, benchmark, engine, num_rpm, num_collective):
+        analysis = create_enhanced_aerial_screw_analysis()
+        thrust = benchmark(MAP_ENGINES[engine], analysis, num_rpm, num_collective)
+        assert thrust.shape == (num_collective, num_rpm)
@@ -0,0 +1,44 @@
+"""Influence-matrix assembly benchmarks for the multiphysics panel method."""
+
+import numpy as np
+import pytest
+from scalar_reference import influence_rows
+
+from multiphysics.aerodynamics import AerodynamicsModule
+from multiphysics.core import SimulationParameters
+
+# (chord_panels, span_panels) giving 100, 1k and 5k panels
+PANEL_GRIDS = {100: (10, 10), 1000: (20, 50), 5000: (50, 100)}
+
+INFLUENCE_ENGINES = {
+    "scalar": influence_rows,
+    "batched": lambda module: module._compute_influence_matrix(),
+}
+
+
+def _build_module(num_panels: int) -> AerodynamicsModule:
+    chord_panels, span_panels = PANEL_GRIDS[num_panels]
+    module = AerodynamicsModule(SimulationParameters())
+    module.initialize(
+        {"wing_geometry": {"chord_panels": chord_panels, "span_panels": span_panels}}, {}, {}
+    )
+    return module
+
+
+class TestPanelMethodPerformance:
+    """Benchmark the batched Biot-Savart kernel at 100, 1k and 5k panels."""
+
+    @pytest.mark.parametrize(
+        ("engine", "num_panels"),
+        [
+            ("batched", 100),
+            ("batched", 1000),
+            pytest.param("batched", 5000, marks=pytest.mark.large),
+            pytest.param("scalar", 100, marks=pytest.mark.large),
+        ],
+    )
+    def test_influence_matrix_assembly(self, benchmark, engine, num_panels):
+        module = _build_module(num_panels)
+        matrix = benchmark(INFLUENCE_ENGINES[engine], module)
+        assert matrix.shape == (num_panels, num_panels)
+        assert np.all(np.isfinite(matrix))
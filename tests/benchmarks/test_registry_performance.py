@@ -0,0 +1,85 @@
+"""Cold-start and warm-lookup benchmarks for the invention registry."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from davinci_codex import registry
+
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+
+
+@pytest.fixture
+def manifest_env(tmp_path, monkeypatch):
+    manifest = tmp_path / "registry_manifest.json"
+    monkeypatch.setenv("DAVINCI_REGISTRY_MANIFEST", str(manifest))
+    registry.clear_registry_cache()
+    yield manifest
+    registry.clear_registry_cache()
+
+
+def _run_cli(*args: str, manifest: Path) -> str:
+    env = dict(os.environ)
+    env["DAVINCI_REGISTRY_MANIFEST"] = str(manifest)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_ROOT), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-m", "davinci_codex.cli", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr
+    return completed.stdout
+
+
+class TestRegistryPerformance:
+    """Benchmark manifest-backed registry lookups."""
+
+    @pytest.mark.parametrize("start", ["cold", "warm"])
+    def test_cli_list_start(self, benchmark, manifest_env, start):
+        """`davinci-codex list` without a manifest, then with a persisted one."""
+        expected = _run_cli("list", manifest=manifest_env)
+        assert manifest_env.exists()
+
+        def prepare():
+            if start == "cold":
+                manifest_env.unlink()
+
+        output = benchmark.pedantic(
+            _run_cli, args=("list",), kwargs={"manifest": manifest_env}, setup=prepare, rounds=5
+        )
+        assert output == expected
+        assert manifest_env.exists()
+
+    def test_cli_plan_warm_lookup(self, benchmark, manifest_env):
+        """`davinci-codex plan --slug` resolves one invention from the manifest."""
+        _run_cli("list", manifest=manifest_env)
+        output = benchmark.pedantic(
+            _run_cli, args=("plan", "--slug", "mechanical_drum"), kwargs={"manifest": manifest_env}, rounds=3
+        )
+        assert "(mechanical_drum)" in output
+
+    def test_warm_lookup_performance(self, benchmark, manifest_env):
+        """Memoised single-slug lookups should not touch the import system."""
+        registry.get_invention("mechanical_drum")
+
+        def lookup_many():
+            for _ in range(1000):
+                registry.get_invention("mechanical_drum")
+
+        benchmark(lookup_many)
+
+    def test_manifest_rebuild_performance(self, benchmark, manifest_env):
+        """Statically parsing all invention sources should stay well under a second."""
+
+        def rebuild():
+            registry.clear_registry_cache()
+            manifest_env.unlink(missing_ok=True)
+            return registry.load_manifest()
+
+        entries = benchmark(rebuild)
+        assert "ornithopter" in entries
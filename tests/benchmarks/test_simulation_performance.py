@@ -149,3 +149,13 @@ class TestSimulationPerformance:
 
         results = benchmark(run_concurrent_simulations)
         assert len(results) == 4
+
+
+@pytest.mark.parametrize("engine", ["reference", "vectorized"])
+def test_ornithopter_profile_engine_performance(benchmark, engine):
+    """Compare the per-step reference integrator with the vectorised engine."""
+    from davinci_codex.inventions import ornithopter
+
+    params = ornithopter._load_parameters()
+    result = benchmark(ornithopter._simulate_profile, params, 0, engine=engine)
+    assert result.time.shape == result.lift.shape
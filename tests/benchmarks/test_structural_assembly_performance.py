@@ -0,0 +1,43 @@
+"""Element-matrix construction and assembly benchmarks for the structural module."""
+
+import numpy as np
+import pytest
+from scalar_reference import beam_stiffness_matrices
+
+from multiphysics.core import SimulationParameters, create_renaissance_materials_database
+from multiphysics.structures import BeamElement, BeamElementBatch, StructuralModule
+
+STIFFNESS_ENGINES = {
+    "per_element": beam_stiffness_matrices,
+    "batched": lambda elements, coordinates: BeamElementBatch.from_elements(elements).stiffness_matrices(coordinates),
+}
+
+
+def _lattice_module(num_elements: int) -> StructuralModule:
+    """A random spar/rib lattice with ``num_elements`` beams."""
+    rng = np.random.default_rng(0)
+    oak = create_renaissance_materials_database()["oak_timber"]
+    num_nodes = num_elements // 2 + 2
+    module = StructuralModule(SimulationParameters())
+    module.nodes = {node_id: rng.uniform(-6.0, 6.0, size=3) for node_id in range(num_nodes)}
+    module.num_dof = 6 * num_nodes
+    for element_id in range(num_elements):
+        first, second = rng.choice(num_nodes, size=2, replace=False)
+        module.elements[element_id] = BeamElement(element_id, [int(first), int(second)], oak, 0.01, 1e-6)
+    return module
+
+
+class TestStructuralAssemblyPerformance:
+    """Benchmark batched element matrices and COO assembly on a 5000-beam lattice."""
+
+    @pytest.mark.parametrize("engine", sorted(STIFFNESS_ENGINES))
+    def test_element_stiffness_matrices(self, benchmark, engine):
+        module = _lattice_module(5000)
+        elements = list(module.elements.values())
+        matrices = benchmark(STIFFNESS_ENGINES[engine], elements, module._node_coordinate_array())
+        assert matrices.shape == (5000, 12, 12)
+
+    def test_batched_assembly(self, benchmark):
+        module = _lattice_module(5000)
+        benchmark(module._assemble_system_matrices)
+        assert module.global_stiffness.shape == (module.num_dof, module.num_dof)
@@ -0,0 +1,45 @@
+"""Monte Carlo benchmarks for the historical uncertainty quantification framework."""
+
+import pytest
+
+from multiphysics.uncertainty_quantification import HistoricalUncertaintyQuantification
+
+NOMINAL = {
+    "air_density": 1.225,
+    "tensile_strength": 40e6,
+    "young_modulus": 10e9,
+    "human_power": 150.0,
+}
+
+
+def _lift(params):
+    cl = 1.2 * params["tensile_strength"] / 40e6
+    return 0.5 * params["air_density"] * 10.0**2 * 18.0 * cl
+
+
+def _vectorized_lift(samples):
+    return _lift(samples.as_parameters())
+
+
+PERFORMANCE_FUNCTIONS = {
+    "per_sample": (_lift, {}),
+    "vectorized": (_vectorized_lift, {"vectorized": True}),
+}
+
+
+class TestUncertaintyQuantificationPerformance:
+    """Benchmark the vectorised performance-function contract against per-sample calls."""
+
+    @pytest.mark.parametrize(
+        ("engine", "num_samples"),
+        [
+            ("per_sample", 10_000),
+            ("vectorized", 10_000),
+            pytest.param("vectorized", 1_000_000, marks=pytest.mark.large),
+        ],
+    )
+    def test_analyze_uncertainties(self, benchmark, engine, num_samples):
+        uq = HistoricalUncertaintyQuantification()
+        function, options = PERFORMANCE_FUNCTIONS[engine]
+        report = benchmark(uq.analyze_uncertainties, "ornithopter", NOMINAL, function, num_samples, **options)
+        assert report.total_variance > 0
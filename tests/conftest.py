@@ -14,4 +14,32 @@ except ImportError:
         def _benchmark(func, *args, **kwargs):
             return func(*args, **kwargs)
 
+        def _pedantic(func, args=(), kwargs=None, setup=None, rounds=1, **_options):
+            if setup is not None:
+                setup()
+            return func(*args, **(kwargs or {}))
+
+        _benchmark.pedantic = _pedantic
         return _benchmark
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--large-benchmarks",
+        action="store_true",
+        default=False,
+        help="also run benchmarks marked 'large' (full-size workloads and slow reference engines)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "large: benchmark workload too slow for the default test run")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--large-benchmarks"):
+        return
+    skip_large = pytest.mark.skip(reason="large benchmark; run with --large-benchmarks")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip_large)
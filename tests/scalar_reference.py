@@ -0,0 +1,93 @@
+"""Scalar reference implementations shared by the tests and benchmarks."""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def beam_direction_cosines(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Rows are the local x, y and z axes of a beam, written out in closed form."""
+    cx, cy, cz = (end - start) / np.linalg.norm(end - start)
+    if abs(cz) > 0.999:
+        # Vertical beam: local y is taken perpendicular to global y
+        d = np.sqrt(cx**2 + cz**2)
+        return np.array([[cx, cy, cz], [cz / d, 0.0, -cx / d], [-cx * cy / d, d, -cy * cz / d]])
+    d = np.sqrt(cx**2 + cy**2)
+    return np.array([[cx, cy, cz], [-cy / d, cx / d, 0.0], [-cx * cz / d, -cy * cz / d, d]])
+
+
+def beam_stiffness_matrix(element, coordinates: np.ndarray) -> np.ndarray:
+    """Global 12x12 stiffness of one beam as T^T k T with an explicit transformation matrix."""
+    start, end = coordinates[element.node_ids[0]], coordinates[element.node_ids[1]]
+    length = np.linalg.norm(end - start)
+    young_modulus = element.material.young_modulus
+
+    k_local = np.zeros((12, 12))
+    k_axial = young_modulus * element.cross_section_area / length
+    k_local[0, 0] = k_local[6, 6] = k_axial
+    k_local[0, 6] = k_local[6, 0] = -k_axial
+    k_local[1, 1] = k_local[7, 7] = 12 * young_modulus * element.moment_of_inertia / length**3
+
+    rotation = beam_direction_cosines(start, end)
+    transformation = np.zeros((12, 12))
+    for block in range(4):
+        transformation[3 * block:3 * block + 3, 3 * block:3 * block + 3] = rotation
+    return transformation.T @ k_local @ transformation
+
+
+def beam_stiffness_matrices(elements, coordinates: np.ndarray) -> np.ndarray:
+    """Stacked per-element reference stiffness matrices."""
+    return np.array([beam_stiffness_matrix(element, coordinates) for element in elements])
+
+
+def panel_influence(panel_coords: np.ndarray, target_point: np.ndarray) -> np.ndarray:
+    """Edge-by-edge Biot-Savart evaluation of a single vortex ring."""
+    velocity = np.zeros(3)
+    for start, end in zip(panel_coords, np.roll(panel_coords, -1, axis=0)):
+        r1 = target_point - start
+        r2 = target_point - end
+        r1_mag = np.linalg.norm(r1)
+        r2_mag = np.linalg.norm(r2)
+        if r1_mag > 1e-10 and r2_mag > 1e-10:
+            cross_product = np.cross(r1, r2)
+            cross_mag = np.linalg.norm(cross_product)
+            if cross_mag > 1e-10:
+                coeff = 1.0 / (4.0 * np.pi * cross_mag * cross_mag)
+                velocity += coeff * np.dot(r1 / r1_mag - r2 / r2_mag, end - start) * cross_product
+    return velocity
+
+
+def influence_rows(module, rows: Optional[int] = None) -> np.ndarray:
+    """Per-entry influence matrix of a panel module, optionally only its first ``rows`` rows."""
+    rows = module.num_panels if rows is None else rows
+    matrix = np.empty((rows, module.num_panels))
+    for i in range(rows):
+        for j in range(module.num_panels):
+            velocity = panel_influence(module.panel_coordinates[j], module.control_points[i])
+            matrix[i, j] = 0.5 if i == j else np.dot(velocity, module.panel_normals[i])
+    return matrix
+
+
+def pointwise_performance_map(analysis, rpm_values, collective_values) -> Dict[str, np.ndarray]:
+    """Thrust, power and figure-of-merit maps from independent per-point rotor solves."""
+    maps = {key: np.zeros((len(collective_values), len(rpm_values))) for key in ("thrust_N", "power_W", "figure_of_merit")}
+    for i, collective in enumerate(collective_values):
+        for j, rpm in enumerate(rpm_values):
+            performance = analysis.compute_rotor_performance(rpm, collective)
+            for key, values in maps.items():
+                values[i, j] = performance[key]
+    return maps
+
+
+def pointwise_rotor_sweep(rotor, rpm_values, num_radial_points: int = 50) -> Dict[str, np.ndarray]:
+    """Thrust, torque and uncorrected power of a helical rotor from scalar element evaluations."""
+    r_points = np.linspace(rotor.inner_radius, rotor.radius, num_radial_points)
+    weight = (rotor.radius - rotor.inner_radius) / num_radial_points
+    totals = {key: np.zeros(len(rpm_values)) for key in ("thrust", "torque", "power")}
+    for i, rpm in enumerate(rpm_values):
+        for r in r_points:
+            for key, value in zip(("thrust", "torque", "power"), rotor.compute_element_forces(rpm, r)):
+                totals[key][i] += value * weight
+    return totals
@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import Optional
 
 import numpy as np
+import pytest
+from scalar_reference import pointwise_rotor_sweep
 
 from davinci_codex.inventions import aerial_screw
 
@@ -115,6 +117,42 @@ class TestHelicalRotorAnalysis:
             assert len(data[array_name]) > 0
             assert isinstance(data[array_name], np.ndarray)
 
+    def test_performance_sweep_matches_pointwise_performance(self):
+        """Broadcast RPM sweep reproduces scalar element evaluations at every speed."""
+        rotor = aerial_screw.HelicalRotorAnalysis(2.0, 1.6, 3.5)
+        rpm = np.array([0.0, 15.0, 100.0, 400.0, 1200.0])
+        sweep = rotor.compute_performance_sweep(rpm)
+        reference = pointwise_rotor_sweep(rotor, rpm)
+        np.testing.assert_allclose(sweep['thrust'], reference['thrust'], rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(sweep['torque'], reference['torque'], rtol=1e-12, atol=1e-12)
+        incompressible = sweep['tip_mach'] <= 0.3
+        assert incompressible.sum() == 4
+        np.testing.assert_allclose(sweep['power'][incompressible], reference['power'][incompressible],
+                                   rtol=1e-12, atol=1e-12)
+        for i, speed in enumerate(rpm):
+            for key, value in rotor.compute_performance(speed).items():
+                assert sweep[key][i] == pytest.approx(value, rel=1e-12, abs=1e-12)
+
+    def test_element_forces_broadcast_over_rpm_and_radius(self):
+        """Element forces on an RPM x radius grid match scalar evaluations."""
+        rotor = aerial_screw.HelicalRotorAnalysis(2.0, 1.6, 3.5)
+        rpm = np.array([40.0, 120.0])
+        radii = np.array([1.6, 1.75, 2.0])
+        dT, dQ, dP = rotor.compute_element_forces(rpm[:, None], radii[None, :])
+        assert dT.shape == (2, 3)
+        for i, speed in enumerate(rpm):
+            for j, r in enumerate(radii):
+                np.testing.assert_allclose((dT[i, j], dQ[i, j], dP[i, j]),
+                                           rotor.compute_element_forces(speed, r), rtol=1e-12)
+
+    def test_dense_performance_curve(self):
+        """Denser RPM and radial grids refine the same performance curve."""
+        coarse = aerial_screw._performance_curve()
+        dense = aerial_screw._performance_curve(num_rpm=591, num_radial_points=400)
+        assert len(dense['rpm']) == 591
+        np.testing.assert_allclose(dense['rpm'][::10], coarse['rpm'])
+        np.testing.assert_allclose(dense['thrust'][::10], coarse['thrust'], rtol=0.05)
+
 
 class TestSimulation:
     """Test comprehensive simulation functionality."""
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import davinci_codex.artifacts as artifacts
+from davinci_codex.artifacts import ArtifactStore
+
+
+def test_store_writes_once_and_links_alias(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "redirected")
+    store = ArtifactStore()
+    target = tmp_path / "redirected" / "demo" / "summary.json"
+
+    written = store.write_json(target, {"b": 1, "a": [1, 2]})
+
+    alias = tmp_path / "artifacts" / "demo" / "summary.json"
+    assert alias.read_text(encoding="utf-8") == target.read_text(encoding="utf-8")
+    assert written == target.stat().st_size
+    assert store.stats()["bytes_written"] == written
+    assert store.aliases["hardlink"] + store.aliases["reflink"] + store.aliases["symlink"] == 1
+    assert alias.is_symlink() or os.path.samefile(alias, target)
+
+    store.write_text(target, "rewritten")
+    assert alias.read_text(encoding="utf-8") == "rewritten"
+    assert store.files_written == 2
+
+
+def test_store_without_redirect_has_no_alias(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", Path("artifacts"))
+    monkeypatch.setattr(artifacts, "_DEFAULT_ALIAS_ROOT", (tmp_path / "artifacts").resolve())
+    store = ArtifactStore()
+    store.write_bytes(Path("artifacts") / "demo" / "blob.bin", b"\x00" * 16)
+    assert store.stats() == {
+        "files_written": 1,
+        "bytes_written": 16,
+        "aliases": {"hardlink": 0, "reflink": 0, "symlink": 0, "copy": 0},
+    }
+    assert not list(tmp_path.glob("artifacts/demo/.*.tmp"))
+
+
+def test_alias_lookup_and_cache_stats_create_no_directories(tmp_path: Path, monkeypatch) -> None:
+    import davinci_codex.cache as cache
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "redirected")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "redirected")
+    entry_dir = tmp_path / "redirected" / "demo" / "cache" / "unit" / "abc123"
+    entry_dir.mkdir(parents=True)
+    (entry_dir / "metadata.json").write_text("{}", encoding="utf-8")
+
+    alias = artifacts.alias_path(entry_dir, root=tmp_path / "redirected")
+    assert alias == Path("artifacts") / "demo" / "cache" / "unit" / "abc123"
+    assert cache.cache_stats()["entries"] == 1
+    assert cache.prune_cache(max_bytes=0, dry_run=True)["evicted"] == ["demo/unit/abc123"]
+    assert not (tmp_path / "artifacts").exists()
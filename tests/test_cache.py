@@ -25,3 +25,151 @@ def test_ensure_cached_result_creates_directory(tmp_path: Path, monkeypatch) ->
     _, hit_again = ensure_cached_result("demo", {"seed": 1}, label="unit")
     assert hit_again
     assert entry.metadata_path.read_text(encoding="utf-8") != ""
+
+
+def test_invention_fingerprint_tracks_inputs(tmp_path: Path, monkeypatch) -> None:
+    import types
+
+    source = tmp_path / "fake_invention.py"
+    source.write_text("SLUG = 'fake'\n", encoding="utf-8")
+    params = tmp_path / "parameters.yaml"
+    params.write_text("alpha: 1\n", encoding="utf-8")
+    module = types.ModuleType("fake_invention")
+    module.__file__ = str(source)
+    module.PARAM_FILE = params  # type: ignore[attr-defined]
+
+    first = cache.invention_fingerprint(module, "fake")
+    assert first == cache.invention_fingerprint(module, "fake")
+    params.write_text("alpha: 2\n", encoding="utf-8")
+    second = cache.invention_fingerprint(module, "fake")
+    assert second["inputs"] != first["inputs"]
+    source.write_text("SLUG = 'fake'  # edited\n", encoding="utf-8")
+    assert cache.invention_fingerprint(module, "fake")["module"] != second["module"]
+
+
+def test_invention_fingerprint_ignores_working_directory(tmp_path: Path, monkeypatch) -> None:
+    import hashlib
+    import types
+
+    repo = tmp_path / "repo"
+    sims = repo / "sims" / "fake"
+    (sims / "variants").mkdir(parents=True)
+    params = sims / "parameters.yaml"
+    params.write_text("alpha: 1\n", encoding="utf-8")
+    (sims / "variants" / "parameters.yaml").write_text("alpha: 1\n", encoding="utf-8")
+    monkeypatch.setattr(cache, "_REPO_ROOT", repo)
+    module = types.ModuleType("fake_invention")
+    module.PARAM_FILE = params  # type: ignore[attr-defined]
+
+    # Module constant and sims/ glob name the same file; it must count once.
+    assert cache._module_input_files(module, "fake") == sorted(
+        [params.resolve(), (sims / "variants" / "parameters.yaml").resolve()], key=str
+    )
+
+    monkeypatch.chdir(repo)
+    from_root = cache.invention_fingerprint(module, "fake")
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    from_elsewhere = cache.invention_fingerprint(module, "fake")
+    assert from_elsewhere == from_root
+    assert from_elsewhere["inputs"] != hashlib.sha256().hexdigest()[:16]
+
+    (sims / "variants" / "parameters.yaml").write_text("alpha: 2\n", encoding="utf-8")
+    assert cache.invention_fingerprint(module, "fake")["inputs"] != from_root["inputs"]
+
+
+def test_prune_cache_evicts_least_recently_used(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    entries = []
+    for index in range(3):
+        entry, _ = ensure_cached_result("demo", {"seed": index}, label="unit")
+        entry.write_metadata({"payload": "x" * 1000})
+        os.utime(entry.path, (1000.0 + index, 1000.0 + index))
+        entries.append(entry)
+    ensure_cached_result("demo", {"seed": 0}, label="unit")  # hit refreshes recency
+
+    stats = cache.cache_stats()
+    assert stats["entries"] == 3
+    per_entry = stats["bytes"] // 3
+
+    report = cache.prune_cache(max_bytes=per_entry * 2, dry_run=True)
+    assert report["evicted"] == [f"demo/unit/{entries[1].cache_key}"]
+    assert entries[1].path.exists()
+
+    cache.prune_cache(max_bytes=per_entry * 2)
+    assert not entries[1].path.exists()
+    assert entries[0].path.exists() and entries[2].path.exists()
+
+
+def test_invention_fingerprint_finds_sims_inputs_outside_repo(tmp_path: Path, monkeypatch) -> None:
+    import hashlib
+    import importlib
+
+    module = importlib.import_module("davinci_codex.inventions.aerial_screw")
+    from_root = cache.invention_fingerprint(module, "aerial_screw")
+    monkeypatch.chdir(tmp_path)
+    from_tmp = cache.invention_fingerprint(module, "aerial_screw")
+    assert from_tmp == from_root
+    assert from_tmp["inputs"] != hashlib.sha256().hexdigest()[:16]
+
+
+def test_invention_fingerprint_tracks_first_party_dependencies(tmp_path: Path, monkeypatch) -> None:
+    import types
+
+    package = tmp_path / "fakephysics"
+    (package / "data").mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    helper = package / "polar.py"
+    helper.write_text("from .tables import load\n", encoding="utf-8")
+    tables = package / "tables.py"
+    tables.write_text("def load():\n    return 1\n", encoding="utf-8")
+    (package / "unused.py").write_text("", encoding="utf-8")
+    table = package / "data" / "section.csv"
+    table.write_text("alpha,cl\n0,0.1\n", encoding="utf-8")
+    source = tmp_path / "fake_invention.py"
+    source.write_text("from fakephysics.polar import load\n", encoding="utf-8")
+    module = types.ModuleType("fake_invention")
+    module.__file__ = str(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cache, "_FIRST_PARTY", (*cache._FIRST_PARTY, "fakephysics"))
+
+    assert cache._first_party_sources(module) == [
+        (package / name).resolve() for name in ("__init__.py", "polar.py", "tables.py")
+    ]
+    first = cache.invention_fingerprint(module, "fake")
+    tables.write_text("def load():\n    return 2  # edited\n", encoding="utf-8")
+    second = cache.invention_fingerprint(module, "fake")
+    assert second["dependencies"] != first["dependencies"]
+    table.write_text("alpha,cl\n0,0.2\n5,0.6\n", encoding="utf-8")
+    third = cache.invention_fingerprint(module, "fake")
+    assert third["dependencies"] != second["dependencies"]
+    assert third["module"] == first["module"]
+
+
+def test_invention_fingerprint_covers_packaged_polars() -> None:
+    import importlib
+
+    import multiphysics.airfoil_polar as airfoil_polar
+
+    module = importlib.import_module("davinci_codex.inventions.aerial_screw")
+    sources = cache._first_party_sources(module)
+    assert Path(airfoil_polar.__file__).resolve() in sources
+    data = cache._package_data_files(sources)
+    assert data and all(path.suffix == ".csv" for path in data)
+
+
+def test_cache_budget_accepts_size_suffixes(monkeypatch) -> None:
+    import pytest
+
+    assert cache.parse_size("500M") == 500 * 1024**2
+    assert cache.parse_size("2GiB") == 2 * 1024**3
+    assert cache.parse_size("4096") == 4096
+    monkeypatch.setenv("DAVINCI_CACHE_MAX_BYTES", "2G")
+    assert cache.cache_budget() == 2 * 1024**3
+    monkeypatch.setenv("DAVINCI_CACHE_MAX_BYTES", "lots")
+    with pytest.raises(ValueError, match="DAVINCI_CACHE_MAX_BYTES"):
+        cache.cache_budget()
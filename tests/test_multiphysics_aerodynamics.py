@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scalar_reference import influence_rows, panel_influence
+
+from multiphysics.aerodynamics import (
+    AerodynamicsModule,
+    WakeTree,
+    vortex_ring_area_vectors,
+    vortex_ring_velocities,
+)
+from multiphysics.core import SimulationParameters
+
+
+def _build_module(chord_panels: int = 6, span_panels: int = 8, **boundary_conditions) -> AerodynamicsModule:
+    module = AerodynamicsModule(SimulationParameters())
+    geometry = {
+        "wing_geometry": {"chord_panels": chord_panels, "span_panels": span_panels, "wingspan": 12.0}
+    }
+    module.initialize(geometry, {}, boundary_conditions)
+    return module
+
+
+def test_batched_kernel_matches_edge_loop() -> None:
+    rng = np.random.default_rng(7)
+    panels = rng.normal(size=(5, 4, 3))
+    points = np.vstack([rng.normal(size=(3, 3)), panels[0, 1]])  # last point sits on a corner
+    velocities = vortex_ring_velocities(panels, points)
+    assert velocities.shape == (4, 5, 3)
+    for i, point in enumerate(points):
+        for j, panel in enumerate(panels):
+            np.testing.assert_allclose(
+                velocities[i, j], panel_influence(panel, point), rtol=1e-10, atol=1e-12
+            )
+
+
+@pytest.mark.parametrize("tile_size", [4, 97, 1 << 18])
+def test_influence_matrix_is_independent_of_tiling(tile_size: int) -> None:
+    module = _build_module()
+    expected = influence_rows(module)
+
+    module.influence_tile_size = tile_size
+    np.testing.assert_allclose(module._compute_influence_matrix(), expected, rtol=1e-10, atol=1e-12)
+
+
+def test_pressure_distribution_excludes_self_induction() -> None:
+    module = _build_module(4, 5)
+    module.panel_strengths = np.linspace(-1.0, 1.0, module.num_panels)
+    module._compute_pressure_distribution()
+
+    freestream_speed = np.linalg.norm(module.freestream_velocity)
+    expected = np.empty(module.num_panels)
+    for i in range(module.num_panels):
+        total_velocity = module.freestream_velocity.copy()
+        for j in range(module.num_panels):
+            if i != j:
+                total_velocity += module.panel_strengths[j] * panel_influence(
+                    module.panel_coordinates[j], module.control_points[i]
+                )
+        cp = 1.0 - (np.linalg.norm(total_velocity) / freestream_speed) ** 2
+        expected[i] = cp * 0.5 * module.air_density * freestream_speed**2
+    np.testing.assert_allclose(module.pressure_field, expected, rtol=1e-10)
+
+
+def test_influence_matrix_and_lu_reused_for_unchanged_geometry() -> None:
+    module = _build_module()
+    state = np.zeros(module.num_panels)
+    first = module.compute_residual(state, 0.0)
+    second = module.compute_residual(state, 0.1)
+    np.testing.assert_array_equal(first, second)
+
+    rhs = np.linspace(0.0, 1.0, module.num_panels)
+    dx = module.solve_linear_system(state, 0.0, rhs)
+    module.solve_linear_system(state, 0.1, rhs)
+    np.testing.assert_allclose(module._compute_influence_matrix() @ dx, rhs, atol=1e-10)
+
+    stats = module.get_coupling_variables()["influence_cache"]
+    assert stats["matrix_builds"] == 1
+    assert stats["refactorizations"] == 1
+    assert stats["lu_hits"] == 1
+    assert stats["matrix_hits"] >= 3
+
+
+def test_geometry_change_invalidates_cache() -> None:
+    module = _build_module()
+    module._cached_influence_matrix()
+    module.update_coupling_variables({"surface_displacement": np.full((module.num_panels, 3), 0.01)})
+    module._cached_influence_matrix()
+    assert module.influence_cache_stats["matrix_builds"] == 2
+
+
+@pytest.mark.parametrize(("tolerance", "builds"), [(0.0, 3), (10.0, 1)])
+def test_refactor_tolerance_for_flapping_motion(tolerance: float, builds: int) -> None:
+    module = _build_module(flapping={"amplitude": 5.0, "frequency": 1.0})
+    module.refactor_tolerance = tolerance
+    state = np.zeros(module.num_panels)
+    for time in (0.0, 0.05, 0.1):
+        module.compute_residual(state, time)
+        module.solve_linear_system(state, time, np.ones(module.num_panels))
+    assert module.influence_cache_stats["matrix_builds"] == builds
+    assert module.influence_cache_stats["refactorizations"] == builds
+
+
+def _strip_wake(rows: int = 60, columns: int = 8) -> tuple:
+    x = np.repeat(np.arange(rows) * 0.2 + 3.0, columns)
+    y = np.tile(np.arange(columns) * 0.6, rows)
+    ring = np.array([[0.0, 0.0, 0.0], [0.2, 0.0, 0.0], [0.2, 0.6, 0.0], [0.0, 0.6, 0.0]])
+    coordinates = ring[None] + np.stack([x, y, np.zeros_like(x)], axis=1)[:, None]
+    return coordinates, np.sin(x) + 0.3
+
+
+def test_wake_tree_matches_direct_summation() -> None:
+    coordinates, strengths = _strip_wake()
+    points = np.random.default_rng(3).uniform([0.0, 0.0, -0.5], [2.0, 4.8, 0.5], size=(40, 3))
+    exact = np.einsum("pnk,n->pk", vortex_ring_velocities(coordinates, points), strengths)
+
+    direct = WakeTree(coordinates, strengths)
+    np.testing.assert_allclose(direct.velocities(points, theta=0.0), exact, rtol=1e-10, atol=1e-14)
+    assert direct.multipole_interactions == 0
+
+    tree = WakeTree(coordinates, strengths)
+    approximate = tree.velocities(points, theta=0.3)
+    error = np.max(np.linalg.norm(approximate - exact, axis=1)) / np.max(np.linalg.norm(exact, axis=1))
+    assert error < 0.1
+    assert tree.direct_interactions < 0.5 * direct.direct_interactions
+
+
+def test_wake_influence_is_exact_by_default() -> None:
+    module = _build_module()
+    module.panel_strengths = np.linspace(0.5, 1.5, module.num_panels)
+    for _ in range(5):
+        module.advance_wake(0.01)
+    influence = module._compute_wake_influence()
+
+    active = module.wake_strengths != 0
+    _, control_points, normals = module._panel_geometry()
+    exact = np.einsum(
+        "pnk,n->pk",
+        vortex_ring_velocities(module.wake_coordinates[active], control_points),
+        module.wake_strengths[active],
+    )
+    np.testing.assert_allclose(influence, np.einsum("pk,pk->p", exact, normals), rtol=1e-10, atol=1e-14)
+    assert module.wake_statistics["multipole_interactions"] == 0
+
+
+def test_wake_policy_bounds_panel_count_and_preserves_doublet_moment() -> None:
+    module = _build_module()
+    module.parameters.max_wake_panels = 12
+    module.panel_strengths = np.linspace(0.5, 1.5, module.num_panels)
+    for _ in range(40):
+        module.advance_wake(0.01)
+    moment_before = np.sum(
+        module.wake_strengths[:, None] * vortex_ring_area_vectors(module.wake_coordinates), axis=0
+    )
+    module.advance_wake(0.01)
+
+    stats = module.get_coupling_variables()["wake"]
+    assert module.num_wake_panels == len(module.wake_strengths) == 12
+    assert stats["panels"] == 12
+    assert stats["amalgamated"] > 0
+    assert stats["pruned"] > 0  # the zero-strength starter panels
+    moment_after = np.sum(
+        module.wake_strengths[:, None] * vortex_ring_area_vectors(module.wake_coordinates), axis=0
+    )
+    newest = slice(0, len(module._find_trailing_edge_panels()))
+    shed = module.wake_strengths[newest, None] * vortex_ring_area_vectors(module.wake_coordinates[newest])
+    np.testing.assert_allclose(moment_after, moment_before + shed.sum(axis=0), rtol=1e-9)
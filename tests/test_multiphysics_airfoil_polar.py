@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from multiphysics.airfoil_polar import AirfoilPolar
+from multiphysics.blade_element_momentum import (
+    BladeElementMomentumTheory,
+    create_enhanced_aerial_screw_analysis,
+    historical_airfoil_coefficients,
+)
+
+
+def _bilinear(alpha, reynolds):
+    """Exactly representable by bilinear interpolation on any grid."""
+    return 0.1 + 5.0 * alpha + 1e-6 * reynolds + 2e-5 * alpha * reynolds, 0.02 + 1e-7 * reynolds
+
+
+@pytest.mark.parametrize(
+    "alpha_grid",
+    [np.linspace(-0.5, 0.5, 11), np.array([-0.5, -0.2, -0.19, 0.0, 0.3, 0.5])],
+    ids=["uniform", "non-uniform"],
+)
+def test_bilinear_interpolation_is_exact_for_bilinear_data(alpha_grid: np.ndarray) -> None:
+    polar = AirfoilPolar.from_function(_bilinear, alpha_grid, [1e4, 5e4, 2e5])
+    rng = np.random.default_rng(0)
+    alpha = rng.uniform(-0.5, 0.5, size=(50, 4))
+    reynolds = rng.uniform(1e4, 2e5, size=(50, 4))
+    cl, cd = polar.coefficients(alpha, reynolds)
+    expected_cl, expected_cd = _bilinear(alpha, reynolds)
+    assert cl.shape == (50, 4)
+    np.testing.assert_allclose(cl, expected_cl, rtol=1e-12)
+    np.testing.assert_allclose(cd, expected_cd, rtol=1e-12)
+
+
+def test_lookups_clamp_to_tabulated_range() -> None:
+    polar = AirfoilPolar.from_function(_bilinear, np.linspace(-0.5, 0.5, 5), [1e4, 2e5])
+    cl, _ = polar.coefficients([-2.0, 2.0], [1.0, 1e9])
+    np.testing.assert_allclose(cl, [_bilinear(-0.5, 1e4)[0], _bilinear(0.5, 2e5)[0]])
+    single = AirfoilPolar.from_function(_bilinear, np.linspace(-0.5, 0.5, 5), [1e5])
+    assert np.ndim(single.coefficients(0.1)[0]) == 0
+
+
+
+@pytest.mark.parametrize("alpha_grid", [np.linspace(-0.5, 0.5, 5), np.array([-0.5, -0.1, 0.0, 0.3, 0.5])])
+def test_nan_inputs_give_nan_coefficients(alpha_grid: np.ndarray) -> None:
+    polar = AirfoilPolar.from_function(_bilinear, alpha_grid, np.linspace(1e4, 2e5, 4))
+    cl, cd = polar.coefficients([0.1, np.nan, 0.2], [5e4, 5e4, np.nan])
+    assert np.isnan(cl[1:]).all() and np.isnan(cd[1:]).all()
+    np.testing.assert_allclose(cl[0], _bilinear(0.1, 5e4)[0], rtol=1e-12)
+    assert np.isnan(polar.coefficients(np.nan, 5e4)[0])
+
+
+def test_csv_round_trip_and_validation(tmp_path) -> None:
+    polar = AirfoilPolar.from_function(_bilinear, np.radians([-10.0, 0.0, 10.0]), [1e4, 1e5], name="plate")
+    polar.to_csv(tmp_path / "plate.csv", comment="synthetic")
+    loaded = AirfoilPolar.load("plate", directory=tmp_path)
+    assert loaded.name == "plate"
+    np.testing.assert_allclose(loaded.alpha, polar.alpha)
+    np.testing.assert_allclose(loaded.cl, polar.cl)
+
+    lines = (tmp_path / "plate.csv").read_text().splitlines()
+    (tmp_path / "partial.csv").write_text("\n".join(lines[:-1]) + "\n")
+    with pytest.raises(ValueError, match="every"):
+        AirfoilPolar.load("partial", directory=tmp_path)
+    with pytest.raises(ValueError, match="strictly increasing"):
+        AirfoilPolar([0.1, 0.0], [1e5], [0.0, 0.0], [0.0, 0.0])
+
+
+def test_bemt_runs_on_packaged_polar() -> None:
+    polar = AirfoilPolar.load("historical_cambered_surface")
+    alpha = np.radians(np.linspace(-10.0, 10.0, 7))
+    np.testing.assert_allclose(polar.coefficients(alpha, 1e5)[0], historical_airfoil_coefficients(alpha, 1e5)[0])
+
+    default = create_enhanced_aerial_screw_analysis()
+    tabulated = BladeElementMomentumTheory(default.geometry, polar=polar)
+    expected = default.compute_rotor_performance(100.0, 5.0)
+    performance = tabulated.compute_rotor_performance(100.0, 5.0)
+    np.testing.assert_allclose(performance["thrust_N"], expected["thrust_N"], rtol=1e-4)
+    np.testing.assert_allclose(performance["power_W"], expected["power_W"], rtol=1e-4)
+
+
+def test_polar_import_skips_coupled_solvers() -> None:
+    probe = (
+        "import sys; from multiphysics.airfoil_polar import AirfoilPolar; "
+        "print(sorted(name for name in sys.modules if name.startswith('multiphysics.')))"
+    )
+    src = Path(__file__).resolve().parents[1] / "src"
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(src)},
+    ).stdout
+    assert output.strip() == "['multiphysics.airfoil_polar']"
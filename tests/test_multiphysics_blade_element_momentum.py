@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scalar_reference import pointwise_performance_map
+
+from multiphysics.blade_element_momentum import (
+    BladeElementMomentumTheory,
+    create_enhanced_aerial_screw_analysis,
+    historical_airfoil_coefficients,
+)
+
+
+def _scalar_coefficients(alpha: float, re: float) -> tuple:
+    alpha_stall = np.radians(12.0)
+    cl_alpha = 2 * np.pi * 0.7
+    if abs(alpha) <= alpha_stall:
+        cl, cd = cl_alpha * alpha, 0.015 + 0.05 * alpha**2
+    else:
+        cl = cl_alpha * alpha_stall * np.sign(alpha) * (1.0 - 0.3 * (abs(alpha) - alpha_stall) / alpha_stall)
+        cd = 0.1 + 0.5 * (abs(alpha) - alpha_stall) ** 2
+    if re < 50000:
+        re_factor = 0.5 + 0.5 * re / 50000
+        cl, cd = cl * re_factor, cd * (2.0 - re_factor)
+    return cl, cd
+
+
+def _scalar_bemt(analysis: BladeElementMomentumTheory, rpm: float, collective: float) -> tuple:
+    """Per-element loops of the original solver."""
+    geometry, n, rho = analysis.geometry, analysis.num_elements, analysis.air_density
+    omega = 2 * np.pi * rpm / 60.0
+    dr = (geometry.rotor_radius - geometry.inner_radius) / n
+    v_i = np.full(n, np.sqrt(0.1) * omega * geometry.rotor_radius)
+    v_t = np.zeros(n)
+    lift, drag, alpha = np.zeros(n), np.zeros(n), np.zeros(n)
+    for _ in range(analysis.max_iterations):
+        old = v_i.copy()
+        for i, r in enumerate(analysis.radial_positions):
+            ut, ua = omega * r + v_t[i], v_i[i]
+            speed = np.sqrt(ut**2 + ua**2)
+            alpha[i] = np.radians(analysis.twist_distribution[i] + collective) - np.arctan2(ua, ut)
+            reynolds = rho * speed * analysis.chord_distribution[i] / analysis.air_viscosity
+            cl, cd = analysis.polar.coefficients(alpha[i], reynolds)
+            q_area = 0.5 * rho * speed**2 * analysis.chord_distribution[i] * dr * geometry.num_blades
+            lift[i], drag[i] = q_area * cl, q_area * cd
+        for i, r in enumerate(analysis.radial_positions):
+            area = 2 * np.pi * r * dr
+            thrust = lift[i] * np.cos(alpha[i]) - drag[i] * np.sin(alpha[i])
+            if thrust > 0:
+                v_i[i] = 0.7 * v_i[i] + 0.3 * np.sqrt(thrust / (2 * rho * area))
+            torque = (lift[i] * np.sin(alpha[i]) + drag[i] * np.cos(alpha[i])) * r
+            if torque > 0 and v_i[i] > 0:
+                v_t[i] = 0.7 * v_t[i] + 0.3 * torque / (2 * rho * area * r * v_i[i])
+        if np.max(np.abs(v_i - old)) < analysis.tolerance:
+            break
+    thrust = np.sum(lift * np.cos(alpha) - drag * np.sin(alpha))
+    torque = np.sum((lift * np.sin(alpha) + drag * np.cos(alpha)) * analysis.radial_positions)
+    return thrust, torque, v_i
+
+
+@pytest.mark.parametrize(("rpm", "collective"), [(100.0, 0.0), (100.0, 5.0), (60.0, 20.0), (150.0, -10.0)])
+def test_vectorised_bemt_matches_element_loops(rpm: float, collective: float) -> None:
+    analysis = create_enhanced_aerial_screw_analysis()
+    performance = analysis.compute_rotor_performance(rpm, collective)
+    thrust, torque, induced = _scalar_bemt(analysis, rpm, collective)
+    np.testing.assert_allclose(performance["thrust_N"], thrust, rtol=1e-10)
+    np.testing.assert_allclose(performance["torque_Nm"], torque, rtol=1e-10)
+    np.testing.assert_allclose(analysis.induced_velocity, induced, rtol=1e-10)
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_negative_thrust_gives_zero_induced_efficiency() -> None:
+    analysis = create_enhanced_aerial_screw_analysis()
+    performance = analysis.compute_rotor_performance(150.0, -10.0)
+    assert performance["thrust_N"] < 0
+    assert performance["induced_efficiency"] == 0.0
+
+
+def test_tabulated_polar_reproduces_historical_airfoil_model() -> None:
+    analysis = create_enhanced_aerial_screw_analysis()
+    alpha = np.radians([-30.0, -12.0, -5.0, 0.0, 11.0, 12.0, 12.01, 13.0, 40.0])
+    reynolds = np.array([1e4, 6e4, 2e5, 4e4, 1e6, 3e4, 3e4, 1e6, 3e4])
+    expected = np.array([_scalar_coefficients(a, re) for a, re in zip(alpha, reynolds)])
+
+    model_cl, model_cd = historical_airfoil_coefficients(alpha, reynolds)
+    np.testing.assert_allclose(model_cl, expected[:, 0])
+    np.testing.assert_allclose(model_cd, expected[:, 1])
+
+    cl, cd = analysis._get_airfoil_coefficients(alpha, reynolds)
+    np.testing.assert_allclose(cl, expected[:, 0], atol=1e-12)
+    np.testing.assert_allclose(cd, expected[:, 1], atol=1e-5)
+    assert np.ndim(analysis._get_airfoil_coefficients(0.1, 1e5)[0]) == 0
+
+
+def test_fine_discretisation_converges_to_tight_tolerance() -> None:
+    analysis = BladeElementMomentumTheory(create_enhanced_aerial_screw_analysis().geometry, num_elements=400)
+    analysis.tolerance = 1e-12
+    analysis.max_iterations = 2000
+    performance = analysis.compute_rotor_performance(100.0, 5.0)
+    induced = analysis.induced_velocity.copy()
+    analysis._update_flow_conditions(100.0, 5.0)
+    analysis._compute_blade_element_forces()
+    analysis._update_induced_velocities_momentum()
+    assert np.max(np.abs(analysis.induced_velocity - induced)) < 1e-11
+    assert performance["thrust_N"] > 0.0
+
+
+@pytest.mark.parametrize(("warm_start", "rtol"), [(False, 1e-12), (True, 1e-4)])
+def test_batched_performance_map_matches_pointwise_solves(warm_start: bool, rtol: float) -> None:
+    analysis = create_enhanced_aerial_screw_analysis()
+    performance_map = analysis.compute_performance_map((50, 150), (-10, 10), num_rpm=9, num_collective=7,
+                                                       warm_start=warm_start)
+    reference = pointwise_performance_map(analysis, performance_map["rpm_values"], performance_map["collective_values"])
+
+    assert performance_map["converged_map"].all()
+    np.testing.assert_allclose(performance_map["thrust_map"], reference["thrust_N"], rtol=rtol)
+    np.testing.assert_allclose(performance_map["power_map"], reference["power_W"], rtol=rtol)
+    np.testing.assert_allclose(performance_map["figure_of_merit_map"], reference["figure_of_merit"], rtol=rtol, atol=1e-12)
+
+
+
+@pytest.mark.parametrize("warm_start", [False, True])
+def test_performance_map_keeps_diverged_points_local(warm_start: bool) -> None:
+    analysis = create_enhanced_aerial_screw_analysis()
+    # 25 degrees collective diverges in the per-point solver as well
+    performance_map = analysis.compute_performance_map((10, 150), (5, 25), warm_start=warm_start)
+    reference = pointwise_performance_map(analysis, performance_map["rpm_values"], performance_map["collective_values"])
+
+    diverged = np.isnan(reference["thrust_N"])
+    assert diverged.any() and not diverged.all()
+    np.testing.assert_array_equal(np.isnan(performance_map["thrust_map"]), diverged)
+    np.testing.assert_array_equal(performance_map["converged_map"], ~diverged)
+    np.testing.assert_allclose(performance_map["thrust_map"], reference["thrust_N"], rtol=1e-3, atol=1e-6)
+
+
+def test_warm_start_reduces_iterations_on_dense_maps() -> None:
+    analysis = create_enhanced_aerial_screw_analysis()
+    cold = analysis.compute_performance_map((50, 150), (-10, 10), num_rpm=60, num_collective=30, warm_start=False)
+    warm = analysis.compute_performance_map((50, 150), (-10, 10), num_rpm=60, num_collective=30)
+    assert warm["thrust_map"].shape == (30, 60)
+    assert warm["iterations_map"].sum() < 0.8 * cold["iterations_map"].sum()
+    np.testing.assert_allclose(warm["thrust_map"], cold["thrust_map"], rtol=1e-4)
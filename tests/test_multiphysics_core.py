@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import csv
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from multiphysics.aerodynamics import AerodynamicsModule
+from multiphysics.checkpoint import load_checkpoint
+from multiphysics.core import MultiPhysicsSimulator, PhysicsModule, SimulationParameters
+from multiphysics.history import load_history
+
+
+class _AffineModule(PhysicsModule):
+    """Maps the interface data received from ``source`` affinely: y = M x + c."""
+
+    def __init__(self, name: str, source: str, matrix: np.ndarray, offset: np.ndarray,
+                 parameters: SimulationParameters):
+        super().__init__(name, parameters)
+        self.source = source
+        self.matrix = matrix
+        self.offset = offset
+        self.received = np.zeros(matrix.shape[1])
+        self.output = np.zeros(matrix.shape[0])
+        self.state_variables = {"value": np.zeros(1)}
+
+    def initialize(self, geometry, materials, boundary_conditions):
+        self.is_initialized = True
+
+    def compute_residual(self, state, time):
+        self.output = self.matrix @ self.received + self.offset
+        return np.zeros_like(state)
+
+    def compute_jacobian(self, state, time):
+        return sp.identity(len(state), format="csr")
+
+    def update_coupling_variables(self, coupled_data):
+        if self.source in coupled_data:
+            self.received = np.asarray(coupled_data[self.source], dtype=float)
+
+    def get_coupling_variables(self):
+        return {self.name: self.output.copy()}
+
+
+def _coupled_problem(scheme: str, **options) -> MultiPhysicsSimulator:
+    rng = np.random.default_rng(4)
+    size = 6
+    parameters = SimulationParameters(coupling_tolerance=1e-8, max_coupling_iterations=400)
+    # Added-mass-like coupling: block Gauss-Seidel contracts only by a factor 0.95
+    basis = np.linalg.qr(rng.normal(size=(size, size)))[0]
+    fluid_matrix = -basis @ np.diag(np.linspace(0.5, 0.95, size)) @ basis.T
+    solid_matrix = np.eye(size)
+    simulator = MultiPhysicsSimulator(parameters)
+    simulator.add_physics_module(_AffineModule("fluid", "solid", fluid_matrix, rng.normal(size=size), parameters))
+    simulator.add_physics_module(_AffineModule("solid", "fluid", solid_matrix, rng.normal(size=size), parameters))
+    simulator.setup_coupling(scheme, **options)
+    return simulator
+
+
+@pytest.mark.parametrize("scheme", ["aitken", "iqn_ils"])
+def test_accelerated_coupling_reduces_module_solves(scheme: str) -> None:
+    baseline = _coupled_problem("staggered")
+    accelerated = _coupled_problem(scheme)
+    baseline.solve_coupled_system(0.0, np.zeros(2))
+    _, converged = accelerated.solve_coupled_system(0.0, np.zeros(2))
+
+    reference = baseline.convergence_history[-1]
+    record = accelerated.convergence_history[-1]
+    assert converged
+    assert record["scheme"] == scheme
+    assert record["module_solves"] == 2 * record["iterations"]
+    assert len(record["residual_history"]) == record["iterations"]
+    assert record["residual_history"][-1] < 1e-8
+    assert record["module_solves"] < reference["module_solves"] / 4
+
+    fluid = accelerated.physics_modules["fluid"]
+    solid = accelerated.physics_modules["solid"]
+    np.testing.assert_allclose(fluid.output, fluid.matrix @ solid.output + fluid.offset, atol=1e-6)
+
+
+@pytest.mark.parametrize(("scheme", "gauss_seidel"), [("staggered", False), ("partitioned", False),
+                                                      ("aitken", True), ("iqn_ils", True)])
+def test_sweep_order_depends_on_scheme(scheme: str, gauss_seidel: bool) -> None:
+    simulator = _coupled_problem(scheme)
+    simulator.parameters.max_coupling_iterations = 1
+    simulator.solve_coupled_system(0.0, np.zeros(2))
+
+    fluid = simulator.physics_modules["fluid"]
+    solid = simulator.physics_modules["solid"]
+    # Jacobi solves the solid with the fluid data from before the sweep (zeros)
+    expected = fluid.output + solid.offset if gauss_seidel else solid.offset
+    np.testing.assert_allclose(solid.output, expected, atol=1e-12)
+
+
+def test_iqn_ils_reuses_previous_timesteps() -> None:
+    simulator = _coupled_problem("iqn_ils", reuse_timesteps=2)
+    simulator.solve_coupled_system(0.0, np.zeros(2))
+    simulator.physics_modules["fluid"].offset += 0.1
+    simulator.solve_coupled_system(0.01, np.zeros(2))
+    first, second = simulator.convergence_history
+    assert second["converged"]
+    assert second["iterations"] < first["iterations"]
+
+
+def test_unknown_coupling_scheme_rejected() -> None:
+    simulator = MultiPhysicsSimulator(SimulationParameters())
+    with pytest.raises(ValueError, match="Available: .*iqn_ils"):
+        simulator.setup_coupling("anderson")
+
+
+class _PolynomialModule(PhysicsModule):
+    """Residual K x + c x^3 - b; linear when c == 0."""
+
+    def __init__(self, parameters: SimulationParameters, cubic: float = 0.0, size: int = 8):
+        super().__init__("polynomial", parameters)
+        rng = np.random.default_rng(2)
+        basis = rng.normal(size=(size, size))
+        self.stiffness = basis @ basis.T + size * np.eye(size)
+        self.cubic = cubic
+        self.load = rng.normal(size=size)
+        self.is_linear = cubic == 0.0
+
+    def initialize(self, geometry, materials, boundary_conditions):
+        self.is_initialized = True
+
+    def compute_residual(self, state, time):
+        return self.stiffness @ state + self.cubic * state**3 - self.load
+
+    def compute_jacobian(self, state, time):
+        return sp.csr_matrix(self.stiffness + np.diag(3.0 * self.cubic * state**2))
+
+    def update_coupling_variables(self, coupled_data):
+        pass
+
+    def get_coupling_variables(self):
+        return {}
+
+
+def test_linear_module_is_factorised_once() -> None:
+    simulator = MultiPhysicsSimulator(SimulationParameters())
+    module = _PolynomialModule(simulator.parameters)
+    for step in range(5):
+        module.load = module.load + 0.1 * step
+        solution = simulator._solve_module(module, np.zeros(8), float(step))
+        np.testing.assert_allclose(module.stiffness @ solution, module.load, atol=1e-10)
+
+    stats = simulator.solver_statistics["polynomial"]
+    assert stats["module_solves"] == 5
+    assert stats["factorizations"] == stats["jacobian_evaluations"] == 1
+    assert stats["factor_reuses"] == 4
+
+
+def test_stale_factorisation_is_reported_and_invalidation_refactorises(caplog) -> None:
+    simulator = MultiPhysicsSimulator(SimulationParameters())
+    module = _PolynomialModule(simulator.parameters)
+    simulator._solve_module(module, np.zeros(8), 0.0)
+
+    module.stiffness = 3.0 * module.stiffness  # reassembled without telling the solver
+    with caplog.at_level("WARNING", logger=simulator.logger.name):
+        simulator._solve_module(module, np.zeros(8), 1.0)
+    assert "did not converge" in caplog.text
+    assert simulator.solver_statistics["polynomial"]["unconverged_solves"] == 1
+
+    module.invalidate_jacobian()
+    solution = simulator._solve_module(module, np.zeros(8), 2.0)
+    np.testing.assert_allclose(module.stiffness @ solution, module.load, atol=1e-10)
+    stats = simulator.solver_statistics["polynomial"]
+    assert stats["factorizations"] == 2
+    assert stats["unconverged_solves"] == 1
+
+
+def test_stalled_step_with_previous_timestep_jacobian_is_redone() -> None:
+    simulator = MultiPhysicsSimulator(SimulationParameters())
+    module = _PolynomialModule(simulator.parameters, cubic=2.0)
+    previous = simulator._solve_module(module, np.zeros(8), 0.0)
+
+    module.load = -20.0 * module.load  # far from the state the cached Jacobian was built at
+    solution = simulator._solve_module(module, previous, 1.0)
+    assert np.linalg.norm(module.compute_residual(solution, 1.0)) < 1e-10
+    stats = simulator.solver_statistics["polynomial"]
+    assert stats["rejected_steps"] == 1
+    assert stats["unconverged_solves"] == 0
+
+
+@pytest.mark.parametrize("reuse", [True, False])
+def test_modified_newton_reuses_jacobian_until_stall(reuse: bool) -> None:
+    simulator = MultiPhysicsSimulator(SimulationParameters(jacobian_reuse=reuse))
+    module = _PolynomialModule(simulator.parameters, cubic=2.0)
+    solution = simulator._solve_module(module, np.zeros(8), 0.0)
+    np.testing.assert_allclose(module.compute_residual(solution, 0.0), 0.0, atol=1e-10)
+
+    stats = simulator.solver_statistics["polynomial"]
+    if reuse:
+        assert stats["jacobian_evaluations"] < stats["newton_iterations"]
+        assert stats["factor_reuses"] > 0
+    else:
+        assert stats["jacobian_evaluations"] == stats["newton_iterations"]
+
+
+@pytest.mark.parametrize(("solver", "preconditioner"), [("gmres", "ilu"), ("cg", "ilu"), ("cg", "jacobi")])
+def test_preconditioned_krylov_solvers(solver: str, preconditioner: str) -> None:
+    parameters = SimulationParameters(linear_solver=solver, preconditioner=preconditioner)
+    simulator = MultiPhysicsSimulator(parameters)
+    module = _PolynomialModule(parameters)
+    solution = simulator._solve_module(module, np.zeros(8), 0.0)
+    np.testing.assert_allclose(module.stiffness @ solution, module.load, rtol=1e-4)
+    assert simulator.solver_statistics["polynomial"]["krylov_iterations"] > 0
+
+
+def _time_marching_problem(**options) -> MultiPhysicsSimulator:
+    parameters = SimulationParameters(time_end=0.5, time_step=0.05, output_frequency=2, **options)
+    simulator = MultiPhysicsSimulator(parameters)
+    matrix = 0.5 * np.eye(3)
+    simulator.add_physics_module(_AffineModule("fluid", "solid", matrix, np.ones(3), parameters))
+    simulator.add_physics_module(_AffineModule("solid", "fluid", matrix, np.ones(3), parameters))
+    return simulator
+
+
+def test_run_simulation_streams_history_and_exports_every_component(tmp_path) -> None:
+    in_memory = _time_marching_problem().run_simulation()
+    simulator = _time_marching_problem(history_path=str(tmp_path / "run"), history_chunk_size=2)
+    streamed = simulator.run_simulation()
+
+    assert streamed["state"] == [] and simulator.convergence_history == []
+    assert streamed["performance"] == in_memory["performance"]
+    history = load_history(streamed["history_path"])
+    np.testing.assert_allclose(history["time"], in_memory["time"])
+    np.testing.assert_allclose(history["state"], np.asarray(in_memory["state"]))
+    assert len(history["convergence"]) == in_memory["performance"]["total_time_steps"]
+    np.testing.assert_allclose(history["coupling"]["fluid.fluid"][-1], 2.0)
+
+    simulator.export_results(str(tmp_path / "run.csv"), format="csv")
+    with (tmp_path / "run.csv").open(newline="") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == ["time", "converged", "state_0", "state_1"]
+    assert len(rows) == 1 + len(in_memory["time"])
+
+
+
+@pytest.mark.parametrize("history_name", ["run", "run.h5"])
+def test_hdf5_export_of_streamed_history_matches_in_memory_run(tmp_path, history_name: str) -> None:
+    h5py = pytest.importorskip("h5py")
+    reference = _time_marching_problem()
+    reference.run_simulation()
+    reference.export_results(str(tmp_path / "reference.h5"), format="hdf5")
+    simulator = _time_marching_problem(history_path=str(tmp_path / history_name), history_chunk_size=2)
+    simulator.run_simulation()
+    simulator.export_results(str(tmp_path / "streamed.h5"), format="hdf5")
+
+    with h5py.File(tmp_path / "reference.h5", "r") as expected, h5py.File(tmp_path / "streamed.h5", "r") as actual:
+        for name in ("time", "state", "convergence"):
+            np.testing.assert_array_equal(actual[name][...], expected[name][...])
+        steps = len(expected["convergence_history"])
+        assert steps == reference.solution_history["performance"]["total_time_steps"]
+        assert len(actual["convergence_history"]) == steps
+        last = f"step_{steps - 1}"
+        for key in expected["convergence_history"][last]:
+            np.testing.assert_array_equal(actual["convergence_history"][last][key][()],
+                                          expected["convergence_history"][last][key][()])
+
+
+def test_hdf5_export_without_snapshots_writes_empty_datasets(tmp_path) -> None:
+    h5py = pytest.importorskip("h5py")
+    simulator = _time_marching_problem(history_path=str(tmp_path / "run"))
+    simulator.solution_history = {"history_path": str(tmp_path / "run")}
+    simulator._open_history_writer().close()
+    simulator.export_results(str(tmp_path / "empty.h5"), format="hdf5")
+    with h5py.File(tmp_path / "empty.h5", "r") as handle:
+        assert handle["time"].shape == (0,)
+        assert handle["state"].shape == (0, 0)
+        assert len(handle["convergence_history"]) == 0
+
+
+class _DriftingModule(_AffineModule):
+    """Affine module whose offset takes a random step at every new timestep."""
+
+    last_time = None
+
+    def compute_residual(self, state, time):
+        if time != self.last_time:
+            self.last_time = time
+            self.offset = self.offset + 0.05 * np.random.standard_normal(self.offset.shape)
+        return super().compute_residual(state, time)
+
+
+def _checkpointed_problem(tmp_path, streaming: bool) -> MultiPhysicsSimulator:
+    parameters = SimulationParameters(
+        time_end=0.5, time_step=0.05, output_frequency=2, coupling_tolerance=1e-10,
+        checkpoint_path=str(tmp_path / "checkpoints"), checkpoint_interval=3, checkpoint_keep=0,
+        history_path=str(tmp_path / "history") if streaming else None, history_chunk_size=2,
+    )
+    simulator = MultiPhysicsSimulator(parameters)
+    matrix = -0.8 * np.eye(3)
+    simulator.add_physics_module(_DriftingModule("fluid", "solid", matrix, np.ones(3), parameters))
+    simulator.add_physics_module(_AffineModule("solid", "fluid", np.eye(3), np.ones(3), parameters))
+    simulator.setup_coupling("iqn_ils", reuse_timesteps=2)
+    return simulator
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_resume_from_checkpoint_continues_run_exactly(tmp_path, streaming: bool) -> None:
+    np.random.seed(0)
+    reference_simulator = _checkpointed_problem(tmp_path, streaming)
+    reference = reference_simulator.run_simulation()
+    if streaming:
+        reference_history = load_history(reference["history_path"])
+    checkpoints = sorted(p.name for p in (tmp_path / "checkpoints").glob("*.pkl"))
+    assert checkpoints == ["checkpoint_00000002.pkl", "checkpoint_00000005.pkl", "checkpoint_00000008.pkl"]
+
+    np.random.seed(1)
+    simulator = _checkpointed_problem(tmp_path, streaming)
+    resumed = simulator.run_simulation(resume_from=str(tmp_path / "checkpoints" / "checkpoint_00000005.pkl"))
+    assert resumed["performance"] == reference["performance"]
+    assert simulator.convergence_history == reference_simulator.convergence_history
+    np.testing.assert_array_equal(
+        simulator.physics_modules["fluid"].output, reference_simulator.physics_modules["fluid"].output
+    )
+    if streaming:
+        history = load_history(resumed["history_path"])
+        np.testing.assert_array_equal(history["time"], reference_history["time"])
+        np.testing.assert_array_equal(history["state"], reference_history["state"])
+        assert history["convergence"] == reference_history["convergence"]
+    else:
+        np.testing.assert_array_equal(resumed["time"], reference["time"])
+        np.testing.assert_array_equal(np.asarray(resumed["state"]), np.asarray(reference["state"]))
+
+
+def test_checkpoints_store_a_history_offset_not_results(tmp_path) -> None:
+    simulator = _checkpointed_problem(tmp_path, streaming=False)
+    simulator.parameters.time_end = 2.0
+    result = simulator.run_simulation()
+
+    assert result["history_path"] == str(tmp_path / "checkpoints" / "history")
+    assert len(result["time"]) == len(load_history(result["history_path"])["time"]) == 21
+    first, last = load_checkpoint(tmp_path / "checkpoints" / "checkpoint_00000002.pkl"), load_checkpoint(
+        tmp_path / "checkpoints"
+    )
+    assert "results" not in last and "convergence_history" not in last
+    assert last["history"] == {"path": result["history_path"], "snapshots": 20}
+    sizes = [path.stat().st_size for path in sorted((tmp_path / "checkpoints").glob("*.pkl"))]
+    assert max(sizes) < 1.2 * min(sizes)
+    assert first["history"]["snapshots"] == 2
+
+
+def test_resume_rejects_mismatched_discretisation(tmp_path) -> None:
+    _checkpointed_problem(tmp_path, streaming=False).run_simulation()
+    simulator = _checkpointed_problem(tmp_path, streaming=False)
+    simulator.parameters.time_step = 0.1
+    with pytest.raises(ValueError, match="time discretisation"):
+        simulator.run_simulation(resume_from=str(tmp_path / "checkpoints"))
+
+
+def _flapping_problem(tmp_path) -> MultiPhysicsSimulator:
+    parameters = SimulationParameters(
+        time_end=0.1, time_step=0.02, max_coupling_iterations=3,
+        checkpoint_path=str(tmp_path / "checkpoints"), checkpoint_interval=2, checkpoint_keep=0,
+    )
+    simulator = MultiPhysicsSimulator(parameters)
+    simulator.add_physics_module(AerodynamicsModule(parameters))
+    simulator.initialize_simulation(
+        {"wing_geometry": {"chord_panels": 4, "span_panels": 6, "wingspan": 12.0}}, {},
+        {"flapping": {"amplitude": 20.0, "frequency": 2.0, "phase_lag": 45.0}},
+    )
+    return simulator
+
+
+def test_flapping_aerodynamics_checkpoints_and_resumes(tmp_path) -> None:
+    reference_simulator = _flapping_problem(tmp_path)
+    reference = reference_simulator.run_simulation()
+    checkpoint = tmp_path / "checkpoints" / "checkpoint_00000001.pkl"
+    assert checkpoint.exists()
+
+    simulator = _flapping_problem(tmp_path)
+    simulator.physics_modules["aerodynamics"].flapping_amplitude = 0.0  # must come back from the checkpoint
+    resumed = simulator.run_simulation(resume_from=str(checkpoint))
+
+    module = simulator.physics_modules["aerodynamics"]
+    expected = reference_simulator.physics_modules["aerodynamics"]
+    assert module.wing_kinematics is not None
+    assert (module.flapping_amplitude, module.phase_lag) == (20.0, 45.0)
+    assert module.wing_kinematics(0.03, 0.5) == expected.wing_kinematics(0.03, 0.5)
+    assert resumed["performance"] == reference["performance"]
+    np.testing.assert_array_equal(np.asarray(resumed["state"]), np.asarray(reference["state"]))
+    np.testing.assert_array_equal(module.panel_strengths, expected.panel_strengths)
+    np.testing.assert_array_equal(module.panel_coordinates, expected.panel_coordinates)
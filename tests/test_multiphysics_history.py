@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from multiphysics.history import SimulationHistoryWriter, load_history
+
+
+def _write_history(path, steps: int, **options) -> SimulationHistoryWriter:
+    writer = SimulationHistoryWriter(path, **options)
+    for step in range(steps):
+        t = 0.1 * step
+        writer.append_snapshot(t, np.full(5, float(step)), step % 2 == 0,
+                               {"fluid": {"force": np.array([t, -t]), "stats": {"hits": step}}})
+        writer.append_convergence({"time": t, "iterations": step, "residual_history": [1.0, 0.1]})
+    return writer
+
+
+def test_history_streams_compressed_chunks(tmp_path) -> None:
+    with _write_history(tmp_path / "run", 10, chunk_size=4) as writer:
+        assert writer.chunks_written == 2
+        assert writer.snapshots_written == 8
+    assert len(list((tmp_path / "run").glob("chunk_*.npz"))) == 3
+
+    history = load_history(tmp_path / "run")
+    np.testing.assert_allclose(history["time"], 0.1 * np.arange(10))
+    np.testing.assert_array_equal(history["state"][:, 0], np.arange(10))
+    np.testing.assert_array_equal(history["converged"], np.arange(10) % 2 == 0)
+    assert history["coupling"]["fluid.force"].shape == (10, 2)
+    assert "fluid.stats" not in history["coupling"]
+    assert [entry["iterations"] for entry in history["convergence"]] == list(range(10))
+
+
+def test_memory_limit_flushes_before_chunk_is_full(tmp_path) -> None:
+    writer = SimulationHistoryWriter(tmp_path / "run", chunk_size=1000, memory_limit_mb=1e-3)
+    for step in range(4):
+        writer.append_snapshot(float(step), np.zeros(200), True)
+        assert writer.buffered_bytes < 1e-3 * 2**20
+    assert writer.chunks_written == 4
+
+
+def test_resume_truncates_records_after_checkpoint(tmp_path) -> None:
+    _write_history(tmp_path / "run", 10, chunk_size=4).close()
+    with SimulationHistoryWriter(tmp_path / "run", chunk_size=4, resume_after=0.45) as writer:
+        writer.append_snapshot(0.5, np.full(5, -1.0), True)
+        writer.append_convergence({"time": 0.5, "iterations": -1})
+
+    history = load_history(tmp_path / "run")
+    np.testing.assert_allclose(history["time"], 0.1 * np.arange(6))
+    np.testing.assert_array_equal(history["state"][:, 0], [0, 1, 2, 3, 4, -1])
+    assert [entry["iterations"] for entry in history["convergence"]] == [0, 1, 2, 3, 4, -1]
+
+
+def test_unknown_backend_rejected(tmp_path) -> None:
+    with pytest.raises(ValueError, match="Available: auto, npz, hdf5"):
+        SimulationHistoryWriter(tmp_path / "run", backend="zarr")
+
+
+def test_hdf5_history_round_trips_coupling_variables(tmp_path) -> None:
+    pytest.importorskip("h5py")
+    path = tmp_path / "run.h5"
+    _write_history(path, 10, chunk_size=4).close()
+
+    history = load_history(path)
+    np.testing.assert_allclose(history["time"], 0.1 * np.arange(10))
+    np.testing.assert_array_equal(history["state"][:, 0], np.arange(10))
+    assert list(history["coupling"]) == ["fluid.force"]
+    np.testing.assert_allclose(history["coupling"]["fluid.force"][:, 0], 0.1 * np.arange(10))
+    assert [entry["iterations"] for entry in history["convergence"]] == list(range(10))
+
+    with SimulationHistoryWriter(path, chunk_size=4, resume_after=0.45) as writer:
+        writer.append_snapshot(0.5, np.full(5, -1.0), True, {"fluid": {"force": np.array([9.0, -9.0])}})
+    resumed = load_history(path)
+    np.testing.assert_array_equal(resumed["state"][:, 0], [0, 1, 2, 3, 4, -1])
+    np.testing.assert_allclose(resumed["coupling"]["fluid.force"][:, 0], [0.0, 0.1, 0.2, 0.3, 0.4, 9.0])
+
+
+@pytest.mark.parametrize("name", ["run", "run.h5"])
+def test_missing_coupling_variable_stays_aligned_with_time(tmp_path, name) -> None:
+    if name.endswith(".h5"):
+        pytest.importorskip("h5py")
+    with SimulationHistoryWriter(tmp_path / name, chunk_size=2) as writer:
+        for step in range(6):
+            variables = {"torque": float(step)} if step != 3 else {}
+            if step >= 2:
+                variables["lift"] = np.array([step, -step])  # first appears in the second chunk
+            writer.append_snapshot(float(step), np.zeros(2), True, {"wing": variables})
+
+    coupling = load_history(tmp_path / name)["coupling"]
+    np.testing.assert_array_equal(coupling["wing.torque"], [0.0, 1.0, 2.0, np.nan, 4.0, 5.0])
+    assert coupling["wing.lift"].shape == (6, 2)
+    assert np.isnan(coupling["wing.lift"][:2]).all()
+    np.testing.assert_array_equal(coupling["wing.lift"][2:, 0], [2, 3, 4, 5])
+
+
+@pytest.mark.parametrize("name", ["run", "run.h5"])
+def test_coupling_shape_change_is_rejected(tmp_path, name) -> None:
+    if name.endswith(".h5"):
+        pytest.importorskip("h5py")
+    writer = SimulationHistoryWriter(tmp_path / name, chunk_size=2)
+    for step in range(2):
+        writer.append_snapshot(float(step), np.zeros(2), True, {"wing": {"lift": np.zeros((2, 2))}})
+    with pytest.raises(ValueError, match=r"wing.lift changed shape from \(2, 2\) to \(2, 3\)"):
+        writer.append_snapshot(2.0, np.zeros(2), True, {"wing": {"lift": np.zeros((2, 3))}})
+    writer.close()
+
+    history = load_history(tmp_path / name)
+    assert history["coupling"]["wing.lift"].shape == (2, 2, 2)
+
+    with SimulationHistoryWriter(tmp_path / name, chunk_size=2, resume_after=1.0) as resumed, \
+            pytest.raises(ValueError, match="changed shape"):
+        resumed.append_snapshot(2.0, np.zeros(2), True, {"wing": {"lift": np.zeros(3)}})
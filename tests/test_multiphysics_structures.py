@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+from scalar_reference import beam_stiffness_matrix
+
+from multiphysics.core import SimulationParameters, create_renaissance_materials_database
+from multiphysics.structures import BeamElement, BeamElementBatch, StructuralModule
+
+
+def _build_module() -> StructuralModule:
+    materials = create_renaissance_materials_database()
+    module = StructuralModule(SimulationParameters())
+    module.initialize({"wing_geometry": {"wingspan": 12.0}}, {"oak_timber": materials["oak_timber"]}, {})
+    return module
+
+
+def _reference_assembly(module: StructuralModule) -> tuple:
+    """Scalar scatter of every element block into dense global matrices."""
+    coordinates = module._node_coordinate_array()
+    stiffness = np.zeros((module.num_dof, module.num_dof))
+    mass = np.zeros((module.num_dof, module.num_dof))
+    for element in module.elements.values():
+        k_elem = element.compute_stiffness_matrix(coordinates)
+        m_elem = element.compute_mass_matrix(coordinates)
+        for i, node_i in enumerate(element.node_ids):
+            for j, node_j in enumerate(element.node_ids):
+                for dof_i in range(6):
+                    for dof_j in range(6):
+                        stiffness[node_i * 6 + dof_i, node_j * 6 + dof_j] += k_elem[i * 6 + dof_i, j * 6 + dof_j]
+                        mass[node_i * 6 + dof_i, node_j * 6 + dof_j] += m_elem[i * 6 + dof_i, j * 6 + dof_j]
+    return stiffness, mass
+
+
+def test_coo_assembly_matches_scalar_scatter() -> None:
+    module = _build_module()
+    stiffness, mass = _reference_assembly(module)
+    assert module.global_stiffness.format == "csr"
+    assert module.global_stiffness.has_canonical_format
+    np.testing.assert_allclose(module.global_stiffness.toarray(), stiffness)
+    np.testing.assert_allclose(module.global_mass.toarray(), mass)
+
+
+def test_reassembly_reuses_sparsity_pattern() -> None:
+    module = _build_module()
+    pattern = module.sparsity_pattern
+    stiffness_before = module.global_stiffness.copy()
+    version = module.jacobian_version
+
+    for element in module.elements.values():
+        element.material = replace(element.material, young_modulus=2.0 * element.material.young_modulus)
+    module._assemble_system_matrices()
+
+    assert module.sparsity_pattern is pattern
+    assert module.jacobian_version == version + 1  # cached factorisations are dropped
+    assert module.global_stiffness.indptr is pattern["indptr"]
+    np.testing.assert_allclose(module.global_stiffness.toarray(), 2.0 * stiffness_before.toarray())
+
+
+def test_batch_matches_reference_matrices_and_rotates_to_global_axes() -> None:
+    oak = create_renaissance_materials_database()["oak_timber"]
+    coordinates = np.array(
+        [[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 1.5], [1.0, 2.0, 2.0]]
+    )
+    elements = [
+        BeamElement(index, [0, node], oak, 0.01 * index, 1e-6 * index) for index, node in enumerate((1, 2, 3, 4), 1)
+    ]
+    batch = BeamElementBatch.from_elements(elements)
+    stiffness = batch.stiffness_matrices(coordinates)
+    mass = batch.mass_matrices(coordinates)
+    assert stiffness.shape == mass.shape == (4, 12, 12)
+
+    lengths = np.array([2.0, 3.0, 1.5, 3.0])
+    translational = [0, 1, 2, 6, 7, 8]
+    for index, element in enumerate(elements):
+        np.testing.assert_allclose(stiffness[index], beam_stiffness_matrix(element, coordinates), atol=1e-6)
+        np.testing.assert_allclose(element.compute_stiffness_matrix(coordinates), stiffness[index])
+        np.testing.assert_allclose(stiffness[index], stiffness[index].T, atol=1e-6)
+
+        lumped = oak.density * element.cross_section_area * lengths[index] / 2
+        np.testing.assert_allclose(mass[index], np.diag(np.isin(np.arange(12), translational) * lumped))
+        np.testing.assert_allclose(element.compute_mass_matrix(coordinates), mass[index])
+
+    # Axial stiffness acts along each axis-aligned beam's own axis: global x, y and z
+    for index, axis in enumerate(range(3)):
+        k_axial = oak.young_modulus * batch.cross_section_area[index] / lengths[index]
+        assert np.isclose(stiffness[index, axis, axis], k_axial)
+        assert np.isclose(stiffness[index, axis, axis + 6], -k_axial)
+
+    # Bending in local y is global y for the x beam and global x for the y beam
+    for index, axis in ((0, 1), (1, 0)):
+        k_bend = 12 * oak.young_modulus * batch.moment_of_inertia[index] / lengths[index] ** 3
+        assert np.isclose(stiffness[index, axis, axis], k_bend)
+        assert np.isclose(stiffness[index, axis + 6, axis + 6], k_bend)
+
+
+def test_jacobian_applies_fixed_supports() -> None:
+    materials = create_renaissance_materials_database()
+    module = StructuralModule(SimulationParameters())
+    module.initialize(
+        {"wing_geometry": {"wingspan": 12.0}},
+        {"oak_timber": materials["oak_timber"]},
+        {"structural": {"fixed_nodes": [0, 1]}},
+    )
+    jacobian = module.compute_jacobian(np.zeros(module.num_dof), 0.0).toarray()
+    expected = module.global_stiffness.toarray()
+    expected[module.fixed_dof, :] = 0.0
+    expected[:, module.fixed_dof] = 0.0
+    expected[module.fixed_dof, module.fixed_dof] = 1.0
+    np.testing.assert_array_equal(jacobian, expected)
+    assert StructuralModule.is_linear
+
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from multiphysics.uncertainty_quantification import (
+    HistoricalUncertaintyQuantification,
+    ParameterSamples,
+)
+
+NOMINAL = {
+    "air_density": 1.225,
+    "tensile_strength": 40e6,
+    "young_modulus": 10e9,
+    "human_power": 150.0,
+}
+
+
+def _lift(params):
+    """Arithmetic only, so it works on scalars and on whole sample columns."""
+    cl = 1.2 * params["tensile_strength"] / 40e6
+    return 0.5 * params["air_density"] * 10.0**2 * 18.0 * cl + 0.01 * params["human_power"]
+
+
+def _vectorized_lift(samples: ParameterSamples) -> np.ndarray:
+    return _lift(samples.as_parameters())
+
+
+def test_samples_form_named_matrix_with_last_source_winning() -> None:
+    uq = HistoricalUncertaintyQuantification()
+    sources = uq._get_relevant_uncertainty_sources("ornithopter")
+    np.random.seed(3)
+    samples = uq._generate_parameter_samples(sources, NOMINAL, 20000, "monte_carlo")
+
+    assert samples.values.shape == (20000, len(samples.names))
+    assert sorted(samples.names) == sorted(NOMINAL)
+    # Linen (normal, 20 MPa) is the last tensile-strength source for flying machines
+    assert samples.column("tensile_strength").mean() == pytest.approx(20e6, rel=0.01)
+    assert samples.column("tensile_strength").std() == pytest.approx(5e6, rel=0.03)
+    assert samples.sample(7)["human_power"] == samples.column("human_power")[7]
+    assert samples.as_parameters()["air_density"] is not NOMINAL["air_density"]
+
+
+def test_seeded_sample_stream_is_pinned() -> None:
+    uq = HistoricalUncertaintyQuantification()
+    sources = uq._get_relevant_uncertainty_sources("ornithopter")
+    np.random.seed(2024)
+    samples = uq._generate_parameter_samples(sources, NOMINAL, 3, "monte_carlo")
+
+    # Column-wise draws in source order; changing this order changes every seeded analysis
+    assert samples.names == ["human_power", "air_density", "young_modulus", "tensile_strength"]
+    np.testing.assert_allclose(samples.values, [
+        [200.04141963935862, 1.2219817610501897, 5.9215171614689302e9, 2.0510258232871134e7],
+        [172.12043180264686, 1.2433210361487401, 7.6716075184011736e9, 2.5267763904100411e7],
+        [143.95386727884986, 1.2482065927405410, 1.0963623263975143e10, 2.8120213061274577e7],
+    ], rtol=1e-12)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_vectorized_and_chunked_scalar_evaluation_agree(chunk_size: int) -> None:
+    uq = HistoricalUncertaintyQuantification()
+    np.random.seed(11)
+    vectorized = uq.analyze_uncertainties("ornithopter", NOMINAL, _vectorized_lift,
+                                          num_samples=500, vectorized=True)
+    np.random.seed(11)
+    scalar = uq.analyze_uncertainties("ornithopter", NOMINAL, _lift,
+                                      num_samples=500, chunk_size=chunk_size)
+
+    assert vectorized.total_variance == pytest.approx(scalar.total_variance, rel=1e-12)
+    assert vectorized.reliability_metrics == pytest.approx(scalar.reliability_metrics, rel=1e-12)
+    for fast, slow in zip(vectorized.uncertainty_results, scalar.uncertainty_results):
+        assert fast.parameter_name == slow.parameter_name
+        assert fast.sensitivity_coefficient == pytest.approx(slow.sensitivity_coefficient, rel=1e-9, abs=1e-12)
+
+
+def test_vectorized_attribute_selects_matrix_contract() -> None:
+    calls = []
+
+    def performance(samples):
+        calls.append(len(samples))
+        return _vectorized_lift(samples)
+
+    performance.vectorized = True
+    HistoricalUncertaintyQuantification().analyze_uncertainties("ornithopter", NOMINAL, performance,
+                                                                num_samples=300)
+    # One call for the Monte Carlo samples and one for all finite-difference perturbations
+    assert calls == [300, 2 * len(NOMINAL)]
+
+
+def test_vectorized_function_must_return_one_value_per_sample() -> None:
+    uq = HistoricalUncertaintyQuantification()
+    with pytest.raises(ValueError, match="expected \\(50,\\)"):
+        uq.analyze_uncertainties("ornithopter", NOMINAL, lambda samples: 1.0,
+                                 num_samples=50, vectorized=True)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import numpy as np
+
+from multiphysics.core import SimulationParameters
+from multiphysics.unsteady_aerodynamics import (
+    OrnithopterGeometry,
+    ShedVortexWake,
+    TheodorsenUnsteadyAero,
+)
+
+
+def _build_module() -> TheodorsenUnsteadyAero:
+    module = TheodorsenUnsteadyAero(SimulationParameters())
+    module.initialize(OrnithopterGeometry(), {}, {})
+    module.flapping_frequency = 2.0
+    return module
+
+
+def _reference_wake(module: TheodorsenUnsteadyAero, strengths, time_step: float) -> list:
+    """The original list-of-dicts wake update."""
+    wake = []
+    for strength in strengths:
+        wake.append({"strength": 0.1 * strength, "position": np.array([module.geometry.root_chord, 0.0, 0.0]),
+                     "age": 0.0})
+        for vortex in wake:
+            vortex["position"][0] += 0.8 * module.freestream_velocity * time_step
+            vortex["age"] += time_step
+        wake = [v for v in wake if v["age"] < 5.0 / module.flapping_frequency]
+    return wake
+
+
+def test_ring_buffer_wake_matches_list_update() -> None:
+    module = _build_module()
+    strengths = np.sin(np.arange(1500) * 0.01)
+    for strength in strengths:
+        module.bound_circulation = strength
+        module.advance_wake(0.002)
+
+    reference = _reference_wake(module, strengths, 0.002)
+    wake = module.shed_wake
+    live = wake.live_indices()
+    assert len(wake) == len(reference) > 1000
+    assert wake.capacity < len(strengths)  # preallocated once, wrapped around without growing
+    np.testing.assert_allclose(wake.strengths[live], [v["strength"] for v in reference])
+    np.testing.assert_allclose(wake.ages[live], [v["age"] for v in reference])
+    np.testing.assert_allclose(wake.positions[live], [v["position"] for v in reference])
+
+
+def test_reserve_keeps_live_vortices_in_order() -> None:
+    wake = ShedVortexWake(capacity=4)
+    for index in range(6):
+        wake.shed(float(index), np.array([float(index), 0.0, 0.0]))
+        wake.advance(np.zeros(3), 1.0, max_age=3.5)
+    assert wake.head != 0 and len(wake) == 3
+
+    wake.reserve(10)
+    wake.shed(6.0, np.array([6.0, 0.0, 0.0]))
+    np.testing.assert_array_equal(wake.strengths[wake.live_indices()], [3.0, 4.0, 5.0, 6.0])
+
+
+def test_bulk_induced_velocity_matches_pairwise_sum() -> None:
+    wake = ShedVortexWake(capacity=8)
+    rng = np.random.default_rng(5)
+    for _ in range(12):
+        wake.shed(rng.normal(), rng.normal(size=3))
+        wake.advance(np.array([1.0, 0.0, 0.0]), 0.01, max_age=0.1)
+
+    points = rng.normal(size=(7, 3))
+    expected = np.zeros((7, 3))
+    for i, point in enumerate(points):
+        for slot in wake.live_indices():
+            dx, _, dz = point - wake.positions[slot]
+            scale = wake.strengths[slot] / (2.0 * np.pi * (dx * dx + dz * dz + wake.core_radius**2))
+            expected[i] += scale * np.array([-dz, 0.0, dx])
+    np.testing.assert_allclose(wake.induced_velocity(points), expected, rtol=1e-12)
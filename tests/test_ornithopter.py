@@ -43,3 +43,31 @@ def test_build_generates_files():
     artifact_dir = ensure_artifact_dir(ornithopter.SLUG, subdir="cad")
     files = list(artifact_dir.glob("*"))
     assert files  # at least one artifact (SCAD or placeholder)
+
+
+def test_vectorized_engine_matches_reference():
+    import numpy as np
+
+    params = ornithopter._load_parameters()
+    reference = ornithopter._simulate_profile(params, seed=3, engine="reference")
+    vectorized = ornithopter._simulate_profile(params, seed=3, engine="vectorized")
+    for field in (
+        "time", "altitude", "vertical_velocity", "horizontal_velocity", "lift", "thrust",
+        "drag", "power", "wing_positions", "circulation", "membrane_deformation",
+    ):
+        np.testing.assert_allclose(
+            getattr(vectorized, field), getattr(reference, field), rtol=1e-10, atol=1e-9, err_msg=field
+        )
+    assert np.isclose(vectorized.energy_used_wh, reference.energy_used_wh, rtol=1e-12)
+    assert np.isclose(vectorized.endurance_hours, reference.endurance_hours, rtol=1e-12)
+
+
+def test_simulate_batch_matches_single_seed_runs():
+    seeds = [0, 4, 7]
+    batch = ornithopter.simulate_batch(seeds)
+    assert len(batch) == len(seeds)
+    for seed, payload in zip(seeds, batch):
+        single = ornithopter.simulate(seed=seed)
+        single.pop("artifacts")
+        assert "artifacts" not in payload
+        assert payload == single
@@ -4,6 +4,7 @@ import csv
 import math
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from davinci_codex.inventions import parachute
@@ -186,3 +187,57 @@ def test_different_seeds_produce_variation():
 
     # But not exactly the same
     assert result1["aerodynamic_analysis"]["max_drag_force_N"] != result2["aerodynamic_analysis"]["max_drag_force_N"]
+
+
+def test_euler_reports_touchdown_overshoot():
+    """In calm air the descent lands and reports how far the last step went below ground."""
+    system = parachute._system_properties()
+    forcing = parachute._draw_forcing(np.random.default_rng(0), 0.0, 6002)
+    trajectory = parachute._integrate_euler(system, forcing, [], 0.02)
+
+    stats = trajectory.statistics
+    assert stats["ground_contact"]
+    assert trajectory.altitudes[-1] == 0.0
+    assert stats["steps"] == trajectory.times.size - 1
+    assert 0.0 <= stats["ground_contact_error_m"] < abs(trajectory.vertical_velocities[-1]) * parachute.REPORTING_DT
+
+
+def test_euler_records_conditions_at_the_start_of_each_step():
+    """The recorded density, temperature, Reynolds number and gust factor match the scalar models."""
+    system = parachute._system_properties()
+    gusts = parachute._SCENARIOS["gust_front_drop"]["gust_profile"]
+    forcing = parachute._draw_forcing(np.random.default_rng(5), 0.05, 400)
+    trajectory = parachute._integrate_euler(system, forcing, gusts, 0.01, max_time=19.0)
+
+    for step in range(1, trajectory.times.size, 37):
+        altitude = trajectory.altitudes[step - 1]
+        density, temperature = parachute._atmospheric_density(altitude)
+        assert trajectory.atmospheric_densities[step] == pytest.approx(density, rel=1e-14)
+        assert trajectory.temperatures[step] == pytest.approx(temperature, rel=1e-14)
+        assert trajectory.reynolds_numbers[step] == pytest.approx(
+            parachute._calculate_reynolds_number(abs(trajectory.vertical_velocities[step - 1]), parachute.CANOPY_SIZE)
+        )
+        assert trajectory.gust_factors[step] == pytest.approx(
+            parachute._gust_multiplier(gusts, trajectory.times[step - 1]), rel=1e-14
+        )
+    assert trajectory.times[-1] == pytest.approx((trajectory.times.size - 1) * parachute.REPORTING_DT)
+
+
+def test_integration_statistics_reported():
+    result = parachute.simulate(seed=42, scenario="nominal_calibration", render=False)
+
+    stats = result["integration_statistics"]
+    # The nominal scenario is still airborne when the 300 s window closes.
+    assert stats["steps"] == stats["rhs_evaluations"] == 6000
+    assert not stats["ground_contact"]
+    assert stats["ground_contact_error_m"] == 0.0
+
+
+def test_bulk_forcing_matches_scalar_draws():
+    """The bulk turbulence draw reproduces the per-step scalar RNG stream."""
+    turbulence, gusts = parachute._draw_forcing(np.random.default_rng(7), 0.1, 50)
+
+    rng = np.random.default_rng(7)
+    for turbulence_factor, gust in zip(turbulence, gusts):
+        assert turbulence_factor == pytest.approx(1.0 + 0.1 * rng.normal())
+        assert gust == pytest.approx(rng.normal(0, 0.05))
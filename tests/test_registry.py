@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from davinci_codex import registry
+
+
+@pytest.fixture
+def fresh_registry(tmp_path: Path, monkeypatch):
+    manifest = tmp_path / "manifest.json"
+    monkeypatch.setenv("DAVINCI_REGISTRY_MANIFEST", str(manifest))
+    registry.clear_registry_cache()
+    yield manifest
+    registry.clear_registry_cache()
+
+
+def test_manifest_is_persisted_without_imports(fresh_registry: Path) -> None:
+    entries = registry.load_manifest()
+    assert "ornithopter" in entries
+    assert entries["ornithopter"].module == "davinci_codex.inventions.ornithopter"
+    stored = json.loads(fresh_registry.read_text(encoding="utf-8"))
+    assert "davinci_codex.inventions.parachute" in stored["modules"]
+
+
+def test_manifest_matches_full_discovery(fresh_registry: Path) -> None:
+    manifest = registry.load_manifest()
+    specs = registry.discover_inventions()
+    assert set(manifest) == set(specs)
+    for slug, spec in specs.items():
+        assert manifest[slug].title == spec.title
+        assert manifest[slug].status == spec.status
+
+
+def test_get_invention_imports_only_requested_module(fresh_registry: Path, monkeypatch) -> None:
+    target = "davinci_codex.inventions.mechanical_drum"
+    other = "davinci_codex.inventions.programmable_flute"
+    for name in (target, other):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    spec = registry.get_invention("mechanical_drum")
+    assert spec.module.__name__ == target
+    assert other not in sys.modules
+    assert registry.get_invention("mechanical_drum") is spec
+
+
+def test_manifest_invalidated_by_mtime(fresh_registry: Path) -> None:
+    registry.load_manifest()
+    stored = json.loads(fresh_registry.read_text(encoding="utf-8"))
+    record = stored["modules"]["davinci_codex.inventions.parachute"]
+    record["title"] = "Stale title"
+    record["mtime_ns"] -= 1
+    fresh_registry.write_text(json.dumps(stored), encoding="utf-8")
+
+    registry.clear_registry_cache()
+    entries = registry.load_manifest()
+    assert entries["parachute"].title != "Stale title"
+    assert os.path.getsize(fresh_registry) > 0
+
+
+def test_unknown_slug_lists_available(fresh_registry: Path) -> None:
+    with pytest.raises(ValueError, match="Available: .*parachute"):
+        registry.get_invention("does_not_exist")
+
+
+HEADLESS_SLUGS = [
+    "aerial_screw",
+    "armored_walker",
+    "mechanical_drum",
+    "mechanical_lion",
+    "mechanical_odometer",
+    "ornithopter",
+    "parachute",
+    "revolving_bridge",
+]
+
+
+@pytest.mark.parametrize("slug", HEADLESS_SLUGS)
+def test_render_false_skips_matplotlib(slug: str, tmp_path: Path, monkeypatch) -> None:
+    import matplotlib.figure
+    import matplotlib.pyplot as plt
+
+    import davinci_codex.artifacts as artifacts
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("render=False must not draw figures")
+
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    for name in ("figure", "subplots", "subplot", "savefig"):
+        monkeypatch.setattr(plt, name, forbidden)
+    monkeypatch.setattr(matplotlib.figure.Figure, "savefig", forbidden)
+
+    result = registry.get_invention(slug).module.simulate(seed=0, render=False)
+    paths = result["artifacts"].values() if isinstance(result["artifacts"], dict) else result["artifacts"]
+    assert not [path for path in paths if str(path).endswith((".png", ".gif"))]
+
+
+def test_render_false_keeps_physics_results(tmp_path: Path, monkeypatch) -> None:
+    import davinci_codex.artifacts as artifacts
+
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    simulate = registry.get_invention("parachute").module.simulate
+    rendered = simulate(seed=3, render=True)
+    headless = simulate(seed=3, render=False)
+    assert set(rendered["artifacts"]) - set(headless["artifacts"]) == {"comprehensive_plot"}
+    rendered.pop("artifacts")
+    headless.pop("artifacts")
+    assert headless == rendered
+
+
+def test_render_dropped_for_inventions_without_figures(fresh_registry: Path) -> None:
+    result = registry.get_invention("programmable_loom").module.simulate(seed=0, render=False)
+    assert result["status"]
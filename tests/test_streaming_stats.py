@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import statistics
+
+import numpy as np
+import pytest
+
+from davinci_codex.streaming_stats import MetricAccumulator, P2Quantile, RunningStats
+
+
+def test_running_stats_match_batch_statistics() -> None:
+    values = np.random.default_rng(7).normal(3.0, 2.0, size=500).tolist()
+    stats = RunningStats()
+    for value in values:
+        stats.update(value)
+    summary = stats.summary()
+    assert summary["samples"] == 500
+    assert summary["mean"] == pytest.approx(statistics.fmean(values), rel=1e-12)
+    assert summary["stdev"] == pytest.approx(statistics.pstdev(values), rel=1e-10)
+    assert summary["minimum"] == min(values)
+    assert summary["maximum"] == max(values)
+
+
+@pytest.mark.parametrize("probability", [0.05, 0.5, 0.95])
+def test_p2_quantile_tracks_numpy(probability: float) -> None:
+    values = np.random.default_rng(11).lognormal(0.0, 0.5, size=5000)
+    estimator = P2Quantile(probability)
+    for value in values:
+        estimator.update(float(value))
+    expected = float(np.quantile(values, probability))
+    assert estimator.value() == pytest.approx(expected, rel=0.02)
+
+
+def test_small_samples_report_exact_quantiles() -> None:
+    stats = RunningStats()
+    for value in (4.0, 1.0, 3.0):
+        stats.update(value)
+    assert stats.quantiles() == {
+        "p5": pytest.approx(np.quantile([1, 3, 4], 0.05)),
+        "p50": 3.0,
+        "p95": pytest.approx(np.quantile([1, 3, 4], 0.95)),
+    }
+    assert RunningStats().summary()["stdev"] == 0.0
+
+
+def test_metric_accumulator_handles_sparse_metrics() -> None:
+    accumulator = MetricAccumulator()
+    accumulator.update({"a": 1.0, "b": 2.0})
+    accumulator.update({"a": 3.0})
+    summary = accumulator.summary()
+    assert list(summary) == ["a", "b"]
+    assert summary["a"]["mean"] == 2.0
+    assert summary["b"]["samples"] == 1
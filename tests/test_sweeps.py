@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
 from pathlib import Path
 
+import pytest
+
 import davinci_codex.artifacts as artifacts
 import davinci_codex.cache as cache
 from davinci_codex.registry import get_invention
-from davinci_codex.sweeps import run_parameter_sweep
+from davinci_codex.result_store import iter_run_rows
+from davinci_codex.sweeps import _flatten_metrics, run_parameter_sweep
+
+
+def _run_rows(summary) -> list:
+    return [
+        {key: value for key, value in row.items() if key != "seed"}
+        for row in iter_run_rows(Path(summary["run_rows"]))
+    ]
 
 
 def test_run_parameter_sweep_generates_summary(tmp_path: Path, monkeypatch) -> None:
@@ -15,10 +27,16 @@ def test_run_parameter_sweep_generates_summary(tmp_path: Path, monkeypatch) -> N
     spec = get_invention("mechanical_odometer")
     summary = run_parameter_sweep(spec, fidelity=None, seeds=[0, 1], label="pytest", reuse_cache=False)
     assert summary["slug"] == "mechanical_odometer"
-    assert len(summary["runs"]) == 2
+    assert [run["seed"] for run in summary["runs"]] == [0, 1]
+    assert all(set(run) == {"seed", "artifact"} for run in summary["runs"])
+    rows = list(iter_run_rows(Path(summary["run_rows"])))
+    assert [row["seed"] for row in rows] == [0, 1]
+    header = (Path(summary["run_rows"]).parent / "runs.csv").read_text(encoding="utf-8").splitlines()[0]
+    assert header.split(",") == sorted({"seed", *rows[0]})
     aggregates = summary["aggregates"]
     assert isinstance(aggregates, dict)
     assert aggregates  # ensure metrics were captured
+    assert {"p5", "p50", "p95"} <= set(next(iter(aggregates.values())))
 
     sweep_root = Path("artifacts") / spec.slug / "cache" / "sweep"
     assert sweep_root.exists()
@@ -27,3 +45,145 @@ def test_run_parameter_sweep_generates_summary(tmp_path: Path, monkeypatch) -> N
     assert summary_paths
     loaded = json.loads(summary_paths[0].read_text(encoding="utf-8"))
     assert loaded["slug"] == summary["slug"]
+
+
+def test_sweep_rejects_malformed_cache_budget_before_running(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setenv("DAVINCI_CACHE_MAX_BYTES", "2 gigs")
+    spec = get_invention("mechanical_odometer")
+    with pytest.raises(ValueError, match="DAVINCI_CACHE_MAX_BYTES"):
+        run_parameter_sweep(spec, fidelity=None, seeds=[0], label="pytest", reuse_cache=False)
+    assert not (tmp_path / "artifacts").exists()
+
+
+def test_parallel_sweep_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    spec = get_invention("mechanical_odometer")
+    seeds = [3, 1, 2]
+    serial = run_parameter_sweep(spec, fidelity=None, seeds=seeds, label="serial", reuse_cache=False)
+    parallel = run_parameter_sweep(
+        spec, fidelity=None, seeds=seeds, label="parallel", reuse_cache=False, workers=2
+    )
+    assert [run["seed"] for run in parallel["runs"]] == seeds
+    assert _run_rows(parallel) == _run_rows(serial)
+    assert parallel["aggregates"] == serial["aggregates"]
+
+
+def test_failed_runs_keep_completed_cache_entries(tmp_path: Path, monkeypatch) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    import davinci_codex.sweeps as sweeps
+
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setenv("DAVINCI_FAST_SIM", "1")  # pyplot is not thread-safe
+    spec = get_invention("mechanical_odometer")
+    original = sweeps._simulate_seed
+
+    def flaky(slug, seed, fidelity, render=False):
+        if seed == 1:
+            raise RuntimeError("worker exploded")
+        return original(slug, seed, fidelity, render)
+
+    monkeypatch.setattr(sweeps, "_simulate_seed", flaky)
+    with ThreadPoolExecutor(max_workers=2) as pool, pytest.raises(RuntimeError, match=r"seeds \[1\]"):
+        run_parameter_sweep(spec, fidelity=None, seeds=[0, 1, 2], executor=pool)
+
+    cached = list((tmp_path / "artifacts" / spec.slug / "cache" / "sweep-run").glob("*/result.json"))
+    assert len(cached) == 2
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched module"
+)
+def test_worker_crash_only_fails_the_crashing_seed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    spec = get_invention("mechanical_odometer")
+    original = spec.module.simulate
+
+    def crashing(seed=0, **kwargs):
+        if seed == 1:
+            os._exit(1)
+        return original(seed=seed, **kwargs)
+
+    monkeypatch.setattr(spec.module, "simulate", crashing)
+    with pytest.raises(RuntimeError, match=r"seeds \[1\]: BrokenProcessPool"):
+        run_parameter_sweep(spec, fidelity=None, seeds=range(40), workers=2)
+
+    cached = list((tmp_path / "artifacts" / spec.slug / "cache" / "sweep-run").glob("*/result.json"))
+    assert len(cached) == 39
+
+
+def test_columnar_store_matches_json(tmp_path: Path, monkeypatch) -> None:
+    from davinci_codex.result_store import load_metrics_table, load_run_result
+
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    spec = get_invention("mechanical_odometer")
+    seeds = [0, 1]
+    reference = run_parameter_sweep(spec, fidelity=None, seeds=seeds, label="cols", reuse_cache=False)
+    summary = run_parameter_sweep(spec, fidelity=None, seeds=seeds, label="cols", store="npz")
+
+    assert summary["aggregates"] == reference["aggregates"]
+    assert all("metrics" not in run for run in summary["runs"])
+    table = load_metrics_table(Path(summary["metrics_table"]))
+    assert table.seeds.tolist() == seeds
+    assert table.row(1) == _run_rows(reference)[1]
+
+    run_artifact = Path(summary["runs"][0]["artifact"])
+    assert run_artifact.suffix == ".npz"
+    restored = load_run_result(run_artifact)
+    original = load_run_result(Path(reference["runs"][0]["artifact"]))
+    assert restored == original
+
+    cached = run_parameter_sweep(spec, fidelity=None, seeds=seeds, label="cols-again", store="npz")
+    assert cached["aggregates"] == summary["aggregates"]
+
+
+def test_batch_entry_point_used_for_sweeps(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    monkeypatch.setattr(cache, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    spec = get_invention("ornithopter")
+    calls = []
+    original = spec.module.simulate_batch
+
+    def recording(seeds, **kwargs):
+        calls.append(list(seeds))
+        return original(seeds, **kwargs)
+
+    monkeypatch.setattr(spec.module, "simulate_batch", recording)
+    seeds = [2, 0, 1]
+    summary = run_parameter_sweep(spec, fidelity=None, seeds=seeds, label="batch", reuse_cache=False)
+    assert calls == [seeds]
+    assert [run["seed"] for run in summary["runs"]] == seeds
+    expected = _flatten_metrics(original([0])[0])
+    assert _run_rows(summary)[1] == expected
+
+
+def test_metrics_table_writer_merges_column_blocks(tmp_path: Path, monkeypatch) -> None:
+    import numpy as np
+
+    from davinci_codex.result_store import MetricsTableWriter, load_metrics_table
+
+    monkeypatch.setattr(artifacts, "ARTIFACTS_ROOT", tmp_path / "artifacts")
+    rows = [{"a": 1.0}, {"a": 2.0, "b": 5.0}, {"b": 6.0}, {"c": 7.0, "a": 4.0}, {"a": 5.0}]
+    directory = tmp_path / "table"
+    with MetricsTableWriter(directory, block_rows=2) as table:
+        for seed, row in enumerate(rows):
+            table.append(seed * 10, row)
+            assert len(table._buffer) < 2  # never more than one block resident
+
+    assert not (directory / ".blocks").exists()
+    loaded = load_metrics_table(directory)
+    assert loaded.columns == ["a", "b", "c"]
+    assert loaded.seeds.tolist() == [0, 10, 20, 30, 40]
+    assert [loaded.row(index) for index in range(len(rows))] == rows
+    assert np.isnan(loaded.column("c")[:3]).all()
+
+    with pytest.raises(RuntimeError), MetricsTableWriter(tmp_path / "failed") as table:
+        table.append(0, {"a": 1.0})
+        raise RuntimeError("sweep aborted")
+    assert not (tmp_path / "failed" / "values.npy").exists()